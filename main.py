@@ -10,17 +10,42 @@ import uvicorn
 from fastapi import Request
 
 import logging, time
+from contextlib import asynccontextmanager
 from api.npc_router import router as npc_router
 from api.fairy_router import router as fairy_router
 from api.dungeon_router import router as dungeon_router
 from api.common_router import router as common_router
 from db.RDBRepository import RDBRepository
+from db.async_engine import dispose_async_engine
+from db.embedding_cache import embedding_cache
+from tools.audio.tts_typecast import typecast_tts_service
+from agents.npc.heroine_agent import heroine_agent
+from tools.audio.stt_worker import stt_worker
+from tools.audio.stt_correction import domain_corrector
+from agents.fairy.intent_batch_engine import intent_batch_engine
+from agents.dungeon.event.event_pool import event_pool
+from core.model_registry import model_registry
+from core.graph_registry import graph_registry
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # STT 워커 시작 (모델 로드/워밍업은 워커 스레드에서 진행, 기동을 막지 않음)
+    stt_worker.start()
+    # 임베딩 / 의도 모델 백그라운드 로드 (MODEL_WARMUP, 나머지는 첫 사용 시 로드)
+    model_registry.start_warmup()
+    yield
+    # 종료시 비동기 DB 커넥션 풀 / Typecast 클라이언트 정리
+    await dispose_async_engine()
+    await typecast_tts_service.close()
+
 
 # FastAPI 앱 생성
 app = FastAPI(
     title="AI Agent System",
     description="AI 에이전트 시스템 API 입니다.",
-    version="1.0.0_alpha"
+    version="1.0.0_alpha",
+    lifespan=lifespan,
 )
 
 # CORS 설정 (언리얼 엔진에서 접근 허용)
@@ -93,9 +118,19 @@ async def health():
         "status": "healthy",
         "services": {
             "api": "ok",
+            "stt": stt_worker.status,
             "redis": "check required",
             "database": "check required"
-        }
+        },
+        "embedding_cache": embedding_cache.stats(),
+        "tts_cache": typecast_tts_service.cache.stats(),
+        "heroine_speculation": heroine_agent.get_speculation_stats(),
+        "stt": stt_worker.stats(),
+        "stt_correction": domain_corrector.stats(),
+        "intent_batch": intent_batch_engine.stats(),
+        "models": model_registry.stats(),
+        "event_pool": event_pool.stats(),
+        "graphs": graph_registry.stats(),
     }
 
 # if __name__ == "__main__":
@@ -34,6 +34,10 @@ class EventChoice(BaseModel):
         default=None,
         description="패널티 ID (event_rewards_penalties.py의 PENALTIES에서 선택, 없으면 null)",
     )
+    outcome: str = Field(
+        default="",
+        description="이 선택지를 골랐을 때의 결과 서술 2~3문장. 플레이어에게 직접 이야기하듯이 (예: \"당신은 ~했습니다. 그 결과...\")",
+    )
 
 
 class DungeonEventParser(BaseModel):
@@ -0,0 +1,251 @@
+"""
+이벤트 선택지 매칭 (플레이어 입력 -> 선택지 번호, 애매한 입력만 LLM)
+
+/event/select에서 플레이어가 입력한 행동을 이벤트의 선택지(choices[].action)에 연결합니다.
+
+1) 문자열 유사도: 정규화(소문자, 문장부호/공백 정리) 후
+   SequenceMatcher 비율과 글자 2-gram Dice 계수 중 큰 값
+2) 적대적 키워드가 있는데 닮은 선택지가 없으면 돌발 행동 (기존 규칙)
+3) 문자열로 애매하면 BGE-M3 코사인 유사도 (model_registry의 bge_m3 공유)
+   - 선택지 문장 벡터는 문장별로 캐시 (같은 이벤트에서 반복 선택)
+   - 1위가 EVENT_CHOICE_EMBED_THRESHOLD 이상 + 2위와 EVENT_CHOICE_EMBED_MARGIN 이상 차이 -> 매칭
+   - 1위가 EVENT_CHOICE_EMBED_REJECT 미만 -> 돌발 행동
+   - 그 사이(ambiguous)는 기존 LLM 분류 (classify_with_llm)
+   짧은 한국어 문장은 관계없는 문장끼리도 dense 유사도가 0.6을 넘기 쉬워서,
+   로컬 판정 기준은 scripts/eval_event_choice.py 평가셋 결과로 정합니다.
+   기본값은 LLM에 넘기는 쪽으로 보수적으로 잡은 값입니다.
+
+환경변수:
+- EVENT_CHOICE_LEXICAL_THRESHOLD: 문자열 유사도 매칭 기준 (기본 0.6)
+- EVENT_CHOICE_EMBED_THRESHOLD: 임베딩 유사도 매칭 기준 (기본 0.85)
+- EVENT_CHOICE_EMBED_MARGIN: 1, 2위 선택지 임베딩 유사도 최소 차이 (기본 0.05)
+- EVENT_CHOICE_EMBED_REJECT: 이 값 미만이면 LLM 없이 돌발 행동 (기본 0.3)
+
+사용 예시:
+    result = choice_matcher.match_or_classify(
+        "상인에게 말을 걸어본다", ["상인에게 말을 건다", "무시하고 지나간다"], scenario_narrative
+    )
+    # {"index": 0, "score": 0.83, "method": "lexical"}
+"""
+
+import difflib
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+EVENT_CHOICE_LEXICAL_THRESHOLD = float(os.getenv("EVENT_CHOICE_LEXICAL_THRESHOLD", "0.6"))
+EVENT_CHOICE_EMBED_THRESHOLD = float(os.getenv("EVENT_CHOICE_EMBED_THRESHOLD", "0.85"))
+EVENT_CHOICE_EMBED_MARGIN = float(os.getenv("EVENT_CHOICE_EMBED_MARGIN", "0.05"))
+EVENT_CHOICE_EMBED_REJECT = float(os.getenv("EVENT_CHOICE_EMBED_REJECT", "0.3"))
+
+# 문자열 유사도가 이보다 낮고 적대적 키워드가 있으면 바로 돌발 행동
+HOSTILE_LEXICAL_CEILING = 0.35
+
+# 선택지 문장 벡터 캐시 크기
+ACTION_VECTOR_CACHE_SIZE = 2048
+
+# Hostile / clearly out-of-scope keywords (Korean only)
+HOSTILE_KEYWORDS = [
+    "공격",
+    "죽",
+    "찔",
+    "불태",
+    "파괴",
+    "살해",
+    "도둑",
+    "훔치",
+    "팬다",
+    "좆",
+    "썅",
+]
+
+
+def normalize_choice_text(s: str) -> str:
+    """소문자 + 문장부호 제거 + 공백 정리"""
+    s = re.sub(r"[^\w\s]", " ", (s or "").lower())
+    return re.sub(r"\s+", " ", s).strip()
+
+
+def _bigrams(s: str) -> List[str]:
+    s = s.replace(" ", "")
+    return [s[i:i + 2] for i in range(len(s) - 1)] or ([s] if s else [])
+
+
+def lexical_similarity(a: str, b: str) -> float:
+    """정규화된 두 문장의 문자열 유사도 (0~1)"""
+    if not a or not b:
+        return 0.0
+    ratio = difflib.SequenceMatcher(None, a, b).ratio()
+
+    grams_a, grams_b = _bigrams(a), _bigrams(b)
+    common = 0
+    remaining = list(grams_b)
+    for g in grams_a:
+        if g in remaining:
+            remaining.remove(g)
+            common += 1
+    dice = 2 * common / (len(grams_a) + len(grams_b))
+    return max(ratio, dice)
+
+
+class ChoiceMatcher:
+    """플레이어 입력 -> 선택지 번호"""
+
+    def __init__(
+        self,
+        lexical_threshold: float = EVENT_CHOICE_LEXICAL_THRESHOLD,
+        embed_threshold: float = EVENT_CHOICE_EMBED_THRESHOLD,
+        embed_margin: float = EVENT_CHOICE_EMBED_MARGIN,
+        embed_reject: float = EVENT_CHOICE_EMBED_REJECT,
+        embedding_model=None,
+    ):
+        self.lexical_threshold = lexical_threshold
+        self.embed_threshold = embed_threshold
+        self.embed_margin = embed_margin
+        self.embed_reject = embed_reject
+        self._model = embedding_model
+        self._action_vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_model(self):
+        if self._model is None:
+            from core.model_registry import model_registry
+
+            # 기본 워밍업 대상이라 보통 이미 로드되어 있음
+            self._model = model_registry.get("bge_m3")
+        return self._model
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        vecs = np.asarray(self._get_model().encode(texts)["dense_vecs"], dtype=np.float32)
+        return vecs / (np.linalg.norm(vecs, axis=1, keepdims=True) + 1e-8)
+
+    def _action_matrix(self, actions: List[str]) -> np.ndarray:
+        with self._lock:
+            missing = [a for a in dict.fromkeys(actions) if a not in self._action_vectors]
+        if missing:
+            vecs = self._encode(missing)
+        with self._lock:
+            if missing:
+                for action, vec in zip(missing, vecs):
+                    self._action_vectors[action] = vec
+            for a in actions:
+                self._action_vectors.move_to_end(a)
+            matrix = np.stack([self._action_vectors[a] for a in actions])
+            while len(self._action_vectors) > ACTION_VECTOR_CACHE_SIZE:
+                self._action_vectors.popitem(last=False)
+        return matrix
+
+    def embedding_scores(self, choice: str, actions: List[str]) -> np.ndarray:
+        """선택지별 코사인 유사도"""
+        matrix = self._action_matrix(actions)
+        vec = self._encode([choice])[0]
+        return matrix @ vec
+
+    def match(self, choice: str, actions: List[str]) -> Dict[str, Any]:
+        """
+        Returns:
+            {"index": 선택지 번호 또는 None, "score": float,
+             "method": "lexical" | "embedding" | "hostile" | "unexpected" | "ambiguous"}
+            ambiguous면 index는 None이고 LLM 분류가 필요함 (match_or_classify)
+        """
+        choice_norm = normalize_choice_text(choice)
+        if not actions or not choice_norm:
+            return {"index": None, "score": 0.0, "method": "unexpected"}
+
+        lexical = [lexical_similarity(choice_norm, normalize_choice_text(a)) for a in actions]
+        best_idx = max(range(len(actions)), key=lambda i: lexical[i])
+        best_lexical = lexical[best_idx]
+
+        if best_lexical >= self.lexical_threshold:
+            return {"index": best_idx, "score": best_lexical, "method": "lexical"}
+
+        if best_lexical < HOSTILE_LEXICAL_CEILING and any(kw in choice_norm for kw in HOSTILE_KEYWORDS):
+            # clearly out-of-scope / hostile: unexpected
+            return {"index": None, "score": best_lexical, "method": "hostile"}
+
+        try:
+            sims = self.embedding_scores(choice, actions)
+        except Exception as e:
+            print(f"[WARN] 선택지 임베딩 매칭 실패, LLM 분류로 넘김: {e}")
+            return {"index": None, "score": best_lexical, "method": "ambiguous"}
+        return self.decide_embedding(sims, self.embed_threshold, self.embed_margin, self.embed_reject)
+
+    @staticmethod
+    def decide_embedding(
+        sims: np.ndarray, threshold: float, margin: float, reject: float
+    ) -> Dict[str, Any]:
+        """선택지별 임베딩 유사도 -> 매칭 / 돌발 행동 / 애매 (평가 스크립트에서 기준값을 바꿔 재사용)"""
+        order = np.argsort(-sims)
+        top = int(order[0])
+        top_sim = float(sims[top])
+        second_sim = float(sims[order[1]]) if len(order) > 1 else -1.0
+        if top_sim >= threshold and top_sim - second_sim >= margin:
+            return {"index": top, "score": top_sim, "method": "embedding"}
+        if top_sim < reject:
+            return {"index": None, "score": top_sim, "method": "unexpected"}
+        return {"index": None, "score": top_sim, "method": "ambiguous"}
+
+    def match_or_classify(
+        self, choice: str, actions: List[str], scenario_narrative: str = ""
+    ) -> Dict[str, Any]:
+        """match 후 애매한 입력만 LLM 분류
+
+        Returns:
+            match와 같은 형식 (LLM으로 정했으면 method는 "llm")
+        """
+        result = self.match(choice, actions)
+        if result["method"] != "ambiguous":
+            return result
+        index = classify_with_llm(scenario_narrative, choice, actions)
+        return {"index": index, "score": result["score"], "method": "llm"}
+
+
+def classify_with_llm(scenario_narrative: str, choice: str, actions: List[str]) -> Optional[int]:
+    """LLM 선택지 분류 (기존 /event/select 분류 프롬프트). 돌발 행동이거나 실패하면 None"""
+    from langchain.chat_models import init_chat_model
+    from langchain_core.messages import HumanMessage
+    from enums.LLM import LLM
+
+    llm = init_chat_model(model=LLM.GPT5_MINI, temperature=0.7)
+    options_text = "".join(f"{i}. {action}\n" for i, action in enumerate(actions))
+    classification_prompt = f"""
+    [상황]
+    {scenario_narrative}
+
+    [가능한 선택지]
+    {options_text}
+
+    [플레이어 입력]
+    {choice}
+
+    플레이어의 입력이 위 [가능한 선택지] 중 어느 것과 가장 유사한지 판단해.
+    1. 선택지와 의미가 유사하면 해당 번호(0, 1, 2...)를 반환해.
+    2. 만약 선택지에 없는 돌발 행동이거나, 적대적인 행동, 혹은 전혀 다른 행동이라면 "UNEXPECTED"라고 반환해.
+
+    오직 숫자 혹은 "UNEXPECTED" 만 출력해.
+    """
+    try:
+        result = llm.invoke([HumanMessage(content=classification_prompt)]).content.strip()
+    except Exception as e:
+        print(f"[ERROR] 선택지 분류 중 오류 발생: {e}")
+        return None
+    print(f"[DEBUG] Event Classification Result: {result}")
+    if result.isdigit() and 0 <= int(result) < len(actions):
+        return int(result)
+    return None
+
+
+def find_choice_outcome(selected: Optional[Dict[str, Any]]) -> str:
+    """선택지에 미리 생성된 결과 서술 (없으면 빈 문자열)"""
+    if not isinstance(selected, dict):
+        return ""
+    outcome = selected.get("outcome") or ""
+    return outcome.strip() if isinstance(outcome, str) else ""
+
+
+# 싱글톤 인스턴스
+choice_matcher = ChoiceMatcher()
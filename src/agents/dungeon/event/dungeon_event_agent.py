@@ -56,6 +56,22 @@ def heroine_memories_node(state: DungeonEventState) -> DungeonEventState:
     return {"heroine_memories": heroine_memories}
 
 
+def build_main_event(selected_event: dict, heroine_data: dict) -> dict:
+    """MAIN_EVENT_SCENARIOS 항목 -> selected_main_event (히로인 이름 치환)"""
+    scenario_text = selected_event["scenario_text"]
+    heroine_name = heroine_data.get("name", "그녀")
+    if "{heroine_name}" in scenario_text:
+        scenario_text = scenario_text.format(heroine_name=heroine_name)
+
+    return {
+        "event_id": selected_event.get("event_id", 0),
+        "title": selected_event["title"],
+        "event_code": selected_event["event_code"],
+        "is_personal": selected_event["is_personal"],
+        "scenario_text": scenario_text,
+    }
+
+
 def selected_main_event_node(state: DungeonEventState) -> DungeonEventState:
     """
     메인 이벤트 선택 로직
@@ -91,21 +107,7 @@ def selected_main_event_node(state: DungeonEventState) -> DungeonEventState:
 
     # 랜덤 선택
     selected_event = random.choice(available_events)
-
-    # 시나리오 텍스트 치환 (히로인 이름 등)
-    scenario_text = selected_event["scenario_text"]
-    heroine_name = state["heroine_data"].get("name", "그녀")
-    if "{heroine_name}" in scenario_text:
-        scenario_text = scenario_text.format(heroine_name=heroine_name)
-
-    # 선택된 이벤트를 구조화된 dict로 반환
-    event_data = {
-        "event_id": selected_event.get("event_id", 0),
-        "title": selected_event["title"],
-        "event_code": selected_event["event_code"],
-        "is_personal": selected_event["is_personal"],
-        "scenario_text": scenario_text,
-    }
+    event_data = build_main_event(selected_event, state["heroine_data"])
 
     print(f"[selected_main_event_node] 선택된 이벤트: {selected_event['title']}")
     print(
@@ -168,11 +170,13 @@ def create_sub_event_node(state: DungeonEventState) -> DungeonEventState:
     )
 
     parser_llm = llm.with_structured_output(DungeonEventParser)
+    is_fallback = False
     try:
         response = parser_llm.invoke(prompts)
     except Exception as e:
         # LLM 실패 시 안전한 폴백을 반환하여 그래프 전체 중단을 방지
         print(f"[create_sub_event_node] LLM invoke failed: {e}")
+        is_fallback = True
         # 간단한 폴백 내용 구성
         fallback_narrative = (
             (selected_main_event.get("scenario_text")[:200] + "...")
@@ -192,6 +196,7 @@ def create_sub_event_node(state: DungeonEventState) -> DungeonEventState:
             action: str
             reward_id: str | None = None
             penalty_id: str | None = None
+            outcome: str = ""
 
         response.event_choices = [
             _Choice(action="조용히 관찰한다"),
@@ -209,12 +214,21 @@ def create_sub_event_node(state: DungeonEventState) -> DungeonEventState:
     for choice in response.event_choices:
         reward = get_reward_dict(choice.reward_id) if choice.reward_id else None
         penalty = get_penalty_dict(choice.penalty_id) if choice.penalty_id else None
-        choices.append({"action": choice.action, "reward": reward, "penalty": penalty})
+        # outcome: /event/select에서 LLM 없이 바로 반환하는 결과 서술
+        choices.append(
+            {
+                "action": choice.action,
+                "reward": reward,
+                "penalty": penalty,
+                "outcome": choice.outcome,
+            }
+        )
 
     sub_event_data = {
         "narrative": response.sub_event_narrative,
         "choices": choices,
         "expected_outcome": response.expected_outcome,
+        "fallback": is_fallback,  # 이벤트 풀에 넣지 않음
     }
     print(f"[create_sub_event_node] 서브 이벤트 생성 완료")
     print(response)
@@ -251,4 +265,90 @@ graph_builder.add_edge("heroine_memories_node", "selected_main_event_node")
 
 graph_builder.add_edge("selected_main_event_node", "create_sub_event_node")
 graph_builder.add_edge("create_sub_event_node", END)
-graph_builder
+
+
+def build_event_json(
+    event_result: dict, room_id: int = 0, player_id=None, next_floor: int = 1
+) -> dict:
+    """그래프 결과(selected_main_event + sub_event) -> 던전 row에 저장하는 이벤트 JSON"""
+    main_event = event_result.get("selected_main_event", {})
+    sub_event = event_result.get("sub_event", {})
+
+    # sub_event가 dict가 아닐 수 있음 (문자열일 경우 처리)
+    scenario_narrative = ""
+    choices = []
+    expected_outcome = ""
+
+    if isinstance(sub_event, dict):
+        scenario_narrative = sub_event.get("narrative", "")
+        choices = sub_event.get("choices", [])
+        expected_outcome = sub_event.get("expected_outcome", "")
+
+    if not isinstance(sub_event, dict) or not choices:
+        print(
+            f"[WARN] build_event_json - missing sub_event or empty choices for room {room_id}, main_event={main_event}"
+        )
+        scenario_narrative = scenario_narrative or main_event.get("scenario_text", "")
+
+        choices = [
+            {"action": "조용히 관찰한다", "reward": None, "penalty": None},
+            {"action": "상호작용을 시도한다", "reward": None, "penalty": None},
+        ]
+
+    return {
+        "room_id": room_id,
+        "event_type": main_event.get("event_id", 0),
+        "event_title": main_event.get("title", ""),
+        "event_code": main_event.get("event_code", ""),
+        "scenario_text": main_event.get("scenario_text", ""),
+        "scenario_narrative": scenario_narrative,
+        "choices": choices,
+        "expected_outcome": expected_outcome,
+        "player_id": player_id,
+        "is_personal": main_event.get("is_personal", False),
+        "floor": next_floor,
+    }
+
+
+# 풀 이벤트는 어느 층/방에든 배정되므로 프롬프트에 층/방 번호 대신 넣는 값
+POOLED_EVENT_LOCATION = "정해지지 않음 (여러 층/방에서 재사용, 층이나 방 번호를 언급하지 말 것)"
+
+
+def generate_event_variant(
+    event_code: str,
+    heroine_data: dict,
+    room_id: int = 0,
+    next_floor: int = 1,
+    player_id=None,
+    pooled: bool = False,
+) -> dict | None:
+    """메인 이벤트를 고정하고 서브 이벤트(내러티브/선택지)만 생성 (이벤트 풀용)
+
+    그래프의 랜덤 메인 이벤트 선택을 건너뛰고 같은 노드를 순서대로 실행합니다.
+    pooled=True면 층/방 번호 없이 생성하고, LLM 실패로 폴백 이벤트가 나오면 None을 반환합니다.
+    """
+    from agents.dungeon.event.main_event_scenarios import MAIN_EVENT_SCENARIOS
+
+    selected_event = next(
+        (e for e in MAIN_EVENT_SCENARIOS if e["event_code"] == event_code), None
+    )
+    if selected_event is None:
+        return None
+
+    state: DungeonEventState = {
+        "messages": [],
+        "heroine_data": heroine_data,
+        "player_id": player_id,
+        "heroine_memories": [],
+        "event_room": POOLED_EVENT_LOCATION if pooled else room_id,
+        "next_floor": POOLED_EVENT_LOCATION if pooled else next_floor,
+        "used_events": [],
+        "selected_main_event": build_main_event(selected_event, heroine_data),
+        "sub_event": "",
+        "final_answer": "",
+    }
+    state.update(heroine_memories_node(state))
+    state.update(create_sub_event_node(state))
+    if pooled and (state["sub_event"].get("fallback") or not state["sub_event"].get("choices")):
+        return None
+    return build_event_json(state, room_id=room_id, player_id=player_id, next_floor=next_floor)
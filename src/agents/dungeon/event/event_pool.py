@@ -0,0 +1,435 @@
+"""
+던전 이벤트 풀 (미리 생성한 이벤트를 조회로 배정)
+
+입장 / 다음 층 준비 때마다 _create_event_for_floor가 이벤트 그래프(LLM)를 실행하던 것을,
+미리 만들어 둔 이벤트 재고에서 꺼내 쓰도록 합니다.
+
+- 메인 이벤트는 MAIN_EVENT_SCENARIOS의 고정 목록이고,
+  서브 이벤트(내러티브/선택지)는 (event_code, heroine_id, 해금 기억)에만 의존
+- 키: (event_code, heroine_id, memory_bucket)
+  memory_bucket = memory_progress 이하인 기억 중 가장 큰 기준값 (heroine_scenarios.py)
+  -> 같은 bucket이면 프롬프트에 들어가는 해금 기억이 같음
+- 재고는 dungeon_event_pool 테이블 (dungeon_event_pool_schema.sql), 꺼낸 이벤트는 삭제
+- 키별 재고가 EVENT_POOL_MIN_STOCK 미만이면 백그라운드로 EVENT_POOL_TARGET_STOCK까지 채움
+- 재고용 이벤트는 층/방 번호 없이 생성 (배정할 때 room_id / floor를 채움),
+  LLM 실패로 나온 폴백 이벤트는 재고에 넣지 않음
+- 재고가 없으면(콜드 스타트) 같은 이벤트 코드로 바로 생성 -> 응답은 기존과 같음
+- 테이블이 없거나 DB 오류면 경고 후 재고 없음으로 처리
+
+환경변수:
+- EVENT_POOL_ENABLED: "false"면 풀을 쓰지 않고 기존 그래프로 생성 (기본 true)
+- EVENT_POOL_MIN_STOCK: 키별 최소 재고 (기본 1)
+- EVENT_POOL_TARGET_STOCK: 채울 때 목표 재고 (기본 3)
+- EVENT_POOL_REFILL_WORKERS: 백그라운드 채우기 동시 작업 수 (기본 2)
+
+사용 예시:
+    events = event_pool.assign_floor_events(
+        floor_num=1, event_rooms=rooms, player_ids=["p1"], heroines=[{"heroine_id": 1, "memory_progress": 50}],
+        used_events=[],
+    )
+"""
+
+import json
+import os
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import text
+
+from agents.dungeon.event.heroine_scenarios import HEROINE_SCENARIOS
+from agents.dungeon.event.main_event_scenarios import MAIN_EVENT_SCENARIOS
+from db.RDBRepository import get_engine
+
+EVENT_POOL_ENABLED = os.getenv("EVENT_POOL_ENABLED", "true").lower() == "true"
+EVENT_POOL_MIN_STOCK = int(os.getenv("EVENT_POOL_MIN_STOCK", "1"))
+EVENT_POOL_TARGET_STOCK = int(os.getenv("EVENT_POOL_TARGET_STOCK", "3"))
+EVENT_POOL_REFILL_WORKERS = int(os.getenv("EVENT_POOL_REFILL_WORKERS", "2"))
+
+# 재고가 없을 때 바로 생성하는 LLM 호출 동시 수 (기존 방별 병렬 생성과 같은 상한)
+MISS_GENERATION_WORKERS = 8
+
+PoolKey = Tuple[str, int, int]  # (event_code, heroine_id, memory_bucket)
+
+_EVENTS_BY_CODE = {e["event_code"]: e for e in MAIN_EVENT_SCENARIOS}
+
+# 히로인별 기억 해금 기준값 (오름차순)
+_MEMORY_THRESHOLDS: Dict[int, List[int]] = {}
+for _scenario in HEROINE_SCENARIOS:
+    _MEMORY_THRESHOLDS.setdefault(_scenario["heroine_id"], []).append(_scenario["memory_progress"])
+for _hid in _MEMORY_THRESHOLDS:
+    _MEMORY_THRESHOLDS[_hid] = sorted(set(_MEMORY_THRESHOLDS[_hid]))
+
+
+def memory_bucket(heroine_id: int, memory_progress: int) -> int:
+    """memory_progress -> 해금 기억이 같은 구간의 기준값 (해금된 기억이 없으면 0)"""
+    bucket = 0
+    for threshold in _MEMORY_THRESHOLDS.get(heroine_id, []):
+        if threshold <= memory_progress:
+            bucket = threshold
+    return bucket
+
+
+def all_memory_buckets(heroine_id: int) -> List[int]:
+    return [0] + _MEMORY_THRESHOLDS.get(heroine_id, [])
+
+
+def _heroine_key(heroine_data: Dict[str, Any]) -> Optional[Tuple[int, int]]:
+    """히로인 데이터 -> (heroine_id, memory_bucket). 숫자가 아니면 None (풀 미사용)"""
+    try:
+        heroine_id = int(heroine_data.get("heroine_id"))
+        progress = int(
+            heroine_data.get("memory_progress") or heroine_data.get("memoryProgress") or 0
+        )
+    except (TypeError, ValueError):
+        return None
+    return heroine_id, memory_bucket(heroine_id, progress)
+
+
+class EventPool:
+    """이벤트 재고 조회 / 배정 / 백그라운드 채우기"""
+
+    def __init__(self, enabled: bool = EVENT_POOL_ENABLED):
+        self.enabled = enabled
+        self._refill_executor = ThreadPoolExecutor(
+            max_workers=EVENT_POOL_REFILL_WORKERS, thread_name_prefix="event-pool"
+        )
+        self._refilling: Set[PoolKey] = set()
+        self._lock = threading.Lock()
+        self._db_warned = False
+
+        self.hits = 0
+        self.misses = 0
+        self.generated = 0
+
+    # ============================================
+    # DB
+    # ============================================
+
+    def _db_error(self, action: str, e: Exception) -> None:
+        if not self._db_warned:
+            self._db_warned = True
+            print(f"[WARN] 이벤트 풀 {action} 실패, 재고 없음으로 처리: {e}")
+
+    def stock(self, heroine_id: int, bucket: int) -> Dict[str, int]:
+        """히로인 키의 이벤트 코드별 재고"""
+        try:
+            with get_engine().connect() as conn:
+                rows = conn.execute(
+                    text(
+                        """
+                        SELECT event_code, COUNT(*) FROM dungeon_event_pool
+                        WHERE heroine_id = :heroine_id AND memory_bucket = :bucket
+                        GROUP BY event_code
+                        """
+                    ),
+                    {"heroine_id": heroine_id, "bucket": bucket},
+                ).fetchall()
+        except Exception as e:
+            self._db_error("재고 조회", e)
+            return {}
+        return {row[0]: row[1] for row in rows}
+
+    def take(self, key: PoolKey) -> Optional[Dict[str, Any]]:
+        """재고에서 하나 꺼내기 (동시 요청끼리 같은 행을 꺼내지 않도록 SKIP LOCKED)"""
+        event_code, heroine_id, bucket = key
+        try:
+            with get_engine().begin() as conn:
+                row = conn.execute(
+                    text(
+                        """
+                        DELETE FROM dungeon_event_pool
+                        WHERE id = (
+                            SELECT id FROM dungeon_event_pool
+                            WHERE heroine_id = :heroine_id AND memory_bucket = :bucket
+                            AND event_code = :event_code
+                            ORDER BY id
+                            LIMIT 1
+                            FOR UPDATE SKIP LOCKED
+                        )
+                        RETURNING payload
+                        """
+                    ),
+                    {"heroine_id": heroine_id, "bucket": bucket, "event_code": event_code},
+                ).fetchone()
+        except Exception as e:
+            self._db_error("조회", e)
+            return None
+        if not row:
+            return None
+        payload = row[0]
+        return json.loads(payload) if isinstance(payload, str) else payload
+
+    def put(self, key: PoolKey, payload: Dict[str, Any]) -> None:
+        event_code, heroine_id, bucket = key
+        with get_engine().begin() as conn:
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO dungeon_event_pool (event_code, heroine_id, memory_bucket, payload)
+                    VALUES (:event_code, :heroine_id, :bucket, CAST(:payload AS JSONB))
+                    """
+                ),
+                {
+                    "event_code": event_code,
+                    "heroine_id": heroine_id,
+                    "bucket": bucket,
+                    "payload": json.dumps(payload, ensure_ascii=False),
+                },
+            )
+
+    def count(self, key: PoolKey) -> int:
+        event_code, heroine_id, bucket = key
+        with get_engine().connect() as conn:
+            return conn.execute(
+                text(
+                    """
+                    SELECT COUNT(*) FROM dungeon_event_pool
+                    WHERE heroine_id = :heroine_id AND memory_bucket = :bucket
+                    AND event_code = :event_code
+                    """
+                ),
+                {"heroine_id": heroine_id, "bucket": bucket, "event_code": event_code},
+            ).scalar()
+
+    # ============================================
+    # 채우기
+    # ============================================
+
+    def refill(self, key: PoolKey, target: int = EVENT_POOL_TARGET_STOCK) -> int:
+        """key의 재고를 target까지 생성 (생성 전마다 다시 세어 다른 워커와 중복 생성 최소화)
+
+        생성이 실패하면(폴백 이벤트 포함) 그 자리에서 멈추고 다음 채우기에서 다시 시도합니다.
+        """
+        from agents.dungeon.event.dungeon_event_agent import generate_event_variant
+
+        event_code, heroine_id, bucket = key
+        heroine_data = {"heroine_id": heroine_id, "memory_progress": bucket}
+        created = 0
+        while self.count(key) < target:
+            payload = generate_event_variant(event_code, heroine_data, pooled=True)
+            if not payload:
+                break
+            self.put(key, payload)
+            created += 1
+        with self._lock:
+            self.generated += created
+        return created
+
+    def schedule_refill(self, key: PoolKey) -> None:
+        """백그라운드 채우기 등록 (이미 진행 중인 키는 건너뜀)"""
+        with self._lock:
+            if key in self._refilling:
+                return
+            self._refilling.add(key)
+
+        def _run():
+            try:
+                if self.count(key) < EVENT_POOL_MIN_STOCK:
+                    created = self.refill(key)
+                    print(f"[INFO] 이벤트 풀 채움: {key} +{created}")
+            except Exception as e:
+                self._db_error("채우기", e)
+            finally:
+                with self._lock:
+                    self._refilling.discard(key)
+
+        self._refill_executor.submit(_run)
+
+    # ============================================
+    # 배정
+    # ============================================
+
+    def host_stock(self, heroines: List[Dict[str, Any]]) -> Dict[str, int]:
+        """방장(첫 번째) 히로인 키의 이벤트 코드별 재고 (풀을 쓰지 않거나 키가 없으면 빈 dict)"""
+        host_key = _heroine_key(heroines[0]) if self.enabled and heroines else None
+        return self.stock(*host_key) if host_key else {}
+
+    def pick_event_codes(
+        self, room_count: int, used_events: List[Any], stock: Dict[str, int]
+    ) -> List[str]:
+        """방마다 이벤트 코드 선택 (used_events / 같은 층 중복 제외, 재고 있는 코드 우선)
+
+        LLM 호출이 없으므로 여러 층을 동시에 생성할 때는 먼저 층마다 이 메서드로 코드를 고르고,
+        앞 층에서 고른 코드를 used_events에 더해 다음 층을 고릅니다.
+        """
+        excluded = {
+            evt.get("event_code")
+            for evt in used_events or []
+            if isinstance(evt, dict) and "event_code" in evt
+        }
+        stock = dict(stock)
+        codes = []
+        for _ in range(room_count):
+            candidates = [c for c in _EVENTS_BY_CODE if c not in excluded] or list(_EVENTS_BY_CODE)
+            stocked = [c for c in candidates if stock.get(c, 0) > 0]
+            code = random.choice(stocked or candidates)
+            codes.append(code)
+            excluded.add(code)
+            stock[code] = stock.get(code, 0) - 1
+        return codes
+
+    def _lookup_or_plan(
+        self,
+        key: Optional[PoolKey],
+        event_code: str,
+        heroine_data: Dict[str, Any],
+        room_id: int,
+        floor_num: int,
+        player_id: Any,
+        misses: List[Tuple[Callable[[], Any], Callable[[Any], None]]],
+        on_result: Callable[[Any], None],
+    ) -> None:
+        """재고에서 꺼내 on_result로 전달, 없으면 바로 생성할 작업으로 등록"""
+        # 이벤트 에이전트는 임포트 시 LLM을 초기화하므로 사용할 때 임포트
+        from agents.dungeon.event.dungeon_event_agent import build_main_event, generate_event_variant
+
+        payload = self.take(key) if key else None
+        if payload is not None:
+            with self._lock:
+                self.hits += 1
+            # 풀 이벤트는 히로인 이름 없이 생성 -> 요청 히로인 기준으로 시나리오 텍스트 다시 채움
+            main_event = build_main_event(_EVENTS_BY_CODE[event_code], heroine_data)
+            payload.update(
+                {
+                    "room_id": room_id,
+                    "floor": floor_num,
+                    "player_id": player_id,
+                    "scenario_text": main_event["scenario_text"],
+                }
+            )
+            on_result(payload)
+            return
+
+        with self._lock:
+            self.misses += 1
+        misses.append(
+            (
+                lambda: generate_event_variant(
+                    event_code, heroine_data, room_id=room_id, next_floor=floor_num, player_id=player_id
+                ),
+                on_result,
+            )
+        )
+
+    def assign_floor_events(
+        self,
+        floor_num: int,
+        event_rooms: List[Dict[str, Any]],
+        player_ids: List[Any],
+        heroines: List[Dict[str, Any]],
+        used_events: List[Any],
+        event_codes: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """한 층의 이벤트 방마다 이벤트 배정
+
+        event_codes: 방마다 미리 고른 이벤트 코드 (없으면 여기서 pick_event_codes로 선택)
+
+        메인 이벤트는 방장(첫 번째 플레이어/히로인) 기준으로 꺼내고,
+        개인 이벤트(is_personal)는 플레이어마다 같은 event_code의 히로인별 내러티브를 꺼냅니다.
+        재고가 없는 항목만 LLM으로 생성합니다(병렬).
+
+        Returns:
+            이벤트 목록 (room_id 순서 정렬 전)
+        """
+        if not event_rooms:
+            return []
+
+        host_heroine = heroines[0]
+        host_player = player_ids[0] if player_ids else None
+        host_key = _heroine_key(host_heroine)
+        stock = self.stock(*host_key) if host_key else {}
+        if event_codes is not None and len(event_codes) == len(event_rooms):
+            codes = list(event_codes)
+        else:
+            codes = self.pick_event_codes(len(event_rooms), used_events, stock)
+
+        refill_keys: Set[PoolKey] = set()
+        if host_key:
+            # 방장 히로인 키는 모든 이벤트 코드 재고를 확인
+            refill_keys.update(
+                (code, *host_key) for code in _EVENTS_BY_CODE if stock.get(code, 0) <= EVENT_POOL_MIN_STOCK
+            )
+
+        events: List[Optional[Dict[str, Any]]] = [None] * len(event_rooms)
+        misses: List[Tuple[Callable[[], Any], Callable[[Any], None]]] = []
+
+        for idx, (room, code) in enumerate(zip(event_rooms, codes)):
+            room_id = room.get("room_id")
+
+            def _set_main(payload, idx=idx):
+                events[idx] = payload
+
+            self._lookup_or_plan(
+                (code, *host_key) if host_key else None,
+                code, host_heroine, room_id, floor_num, host_player, misses, _set_main,
+            )
+
+        # 메인 이벤트 생성 후 개인 이벤트 판단이 필요 -> 메인 먼저 처리
+        self._run_misses(misses)
+        misses = []
+
+        narratives: Dict[int, List[Dict[str, Any]]] = {}
+        for idx, (room, code) in enumerate(zip(event_rooms, codes)):
+            main_event = events[idx]
+            if not main_event or not main_event.get("is_personal", False) or not player_ids:
+                continue
+            narratives[idx] = []
+            for pid, heroine in zip(player_ids, heroines):
+                key = _heroine_key(heroine)
+                if key:
+                    refill_keys.add((code, *key))
+
+                def _add_narrative(indiv_event, idx=idx, pid=pid, heroine=heroine):
+                    if indiv_event:
+                        narratives[idx].append(
+                            {
+                                "playerId": pid,
+                                "heroineId": heroine.get("heroine_id"),
+                                "memoryProgress": heroine.get("memory_progress"),
+                                "narrative": indiv_event.get("scenario_narrative", ""),
+                            }
+                        )
+
+                self._lookup_or_plan(
+                    (code, *key) if key else None,
+                    code, heroine, room.get("room_id"), floor_num, pid, misses, _add_narrative,
+                )
+        self._run_misses(misses)
+
+        for idx, items in narratives.items():
+            events[idx]["heroineNarratives"] = items
+
+        for key in refill_keys:
+            self.schedule_refill(key)
+
+        return [event for event in events if event]
+
+    def _run_misses(self, misses: List[Tuple[Callable[[], Any], Callable[[Any], None]]]) -> None:
+        if not misses:
+            return
+        with ThreadPoolExecutor(max_workers=min(MISS_GENERATION_WORKERS, len(misses))) as ex:
+            futures = [(ex.submit(generate), on_result) for generate, on_result in misses]
+            for fut, on_result in futures:
+                try:
+                    result = fut.result()
+                except Exception as e:
+                    print(f"[WARN] 이벤트 생성 실패: {e}")
+                    continue
+                on_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "generated": self.generated,
+            "refilling": len(self._refilling),
+        }
+
+
+# 싱글톤 인스턴스
+event_pool = EventPool()
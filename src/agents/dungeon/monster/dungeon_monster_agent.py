@@ -806,5 +806,4 @@ graph_builder.add_edge("calculate_combat_score_node", "llm_strategy_node")
 graph_builder.add_edge("llm_strategy_node", "select_monsters_node")
 graph_builder.add_edge("select_monsters_node", END)
 
-# 그래프 컴파일
-monster_graph = graph_builder.compile()
+# 그래프 컴파일은 graph_registry.get("dungeon_monster")
@@ -8,6 +8,7 @@ from datetime import datetime
 import copy
 from langgraph.graph import START, END, StateGraph
 from agents.dungeon.dungeon_state import SuperDungeonState
+from core.graph_registry import graph_registry
 
 
 # ===== Node 1: Event Processing =====
@@ -18,12 +19,8 @@ def event_node(state: SuperDungeonState) -> Dict[str, Any]:
     """
     print("\n[Event Node] 이벤트 생성 시작...")
 
-    # 실제 Event Agent 호출
-    from agents.dungeon.event.dungeon_event_agent import (
-        graph_builder as event_graph_builder,
-    )
-
-    event_graph = event_graph_builder.compile()
+    # 실제 Event Agent 호출 (프로세스당 한 번 컴파일한 그래프)
+    event_graph = graph_registry.get("dungeon_event")
 
     # player_id 추출 (player_ids가 있으면 첫 번째, 없으면 None)
     player_id = None
@@ -66,7 +63,7 @@ def monster_node(state: SuperDungeonState) -> Dict[str, Any]:
     print("\n[Monster Node] 몬스터 밸런싱 시작...")
 
     # 실제 Monster Agent 호출
-    from agents.dungeon.monster.dungeon_monster_agent import monster_graph
+    monster_graph = graph_registry.get("dungeon_monster")
 
     # Monster Agent 입력 state 구성
     monster_state = {
@@ -1,10 +1,12 @@
 import torch.nn as nn
 from kobert_transformers import get_kobert_model
+from transformers import BertModel
 
 class KoBertMultiLabelClassifier(nn.Module):
-    def __init__(self, num_labels):
+    def __init__(self, num_labels, pretrained_path=None):
         super().__init__()
-        self.bert = get_kobert_model()
+        # pretrained_path: 로컬에 받아 둔 monologg/kobert 경로 (없으면 허브에서 로드)
+        self.bert = BertModel.from_pretrained(pretrained_path) if pretrained_path else get_kobert_model()
         hidden_size = 768 
 
         self.classifier = nn.Linear(hidden_size, num_labels)
@@ -0,0 +1,178 @@
+"""
+KoBERT 의도 분류기 경량 변형 (int8 양자화 / ONNX Runtime)
+
+정령 의도 모델은 MODEL_CACHE_DIR에 받은 fp32 체크포인트(KoBertMultiLabelClassifier)를
+CPU에서 그대로 실행합니다. 이 모듈은 같은 체크포인트로 다음 변형을 만듭니다.
+
+- fp32: 기존 PyTorch 모델
+- int8: torch 동적 양자화 (nn.Linear 가중치 int8). 로드 시 바로 변환 (수 초)
+- onnx: ONNX로 내보낸 뒤 ONNX Runtime으로 실행 (fp32)
+- onnx-int8: ONNX 모델에 ONNX Runtime 동적 양자화 적용
+
+ONNX 파일은 INTENT_MODEL_CACHE_DIR에 한 번 만들어 두고 재사용합니다.
+파일 이름에 체크포인트 내용 식별자가 들어가므로, 허깅페이스에 새 리비전이 올라오면 새로 만듭니다.
+(미리 만들려면 src/scripts/export_kobert_variants.py)
+
+모든 변형은 model(input_ids, attention_mask) -> logits(torch.Tensor) 형태로 호출되므로
+FairyDungeonIntentModel / FairyInteractionIntentModel의 predict_batch는 그대로 동작합니다.
+
+환경변수:
+- FAIRY_INTENT_VARIANT: fp32 | int8 | onnx | onnx-int8 (기본 fp32)
+- INTENT_MODEL_CACHE_DIR: ONNX 파일 저장 경로 (기본 프로젝트 루트/model_cache)
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+import torch
+import torch.nn as nn
+
+from agents.fairy.ai_data_schema.KoBertMultiLabelClassifier import KoBertMultiLabelClassifier
+from core.model_registry import KOBERT_REPO_ID, atomic_write, hf_snapshot
+
+FAIRY_INTENT_VARIANT = os.getenv("FAIRY_INTENT_VARIANT", "fp32").lower()
+INTENT_MODEL_CACHE_DIR = Path(
+    os.getenv(
+        "INTENT_MODEL_CACHE_DIR",
+        str(Path(__file__).parent.parent.parent.parent.parent / "model_cache"),
+    )
+)
+
+VARIANTS = ("fp32", "int8", "onnx", "onnx-int8")
+ONNX_OPSET = 14
+
+
+def load_fp32(checkpoint: dict, device: str = "cpu") -> KoBertMultiLabelClassifier:
+    """체크포인트 -> fp32 PyTorch 모델 (백본 설정은 MODEL_CACHE_DIR의 monologg/kobert 사용)"""
+    model = KoBertMultiLabelClassifier(
+        num_labels=len(checkpoint["idx2label"]),
+        pretrained_path=hf_snapshot(KOBERT_REPO_ID),
+    )
+    model.load_state_dict(checkpoint["model_state_dict"])
+    model.to(device)
+    model.eval()
+    return model
+
+
+def quantize_int8(model: nn.Module) -> nn.Module:
+    """nn.Linear 동적 int8 양자화 (CPU 전용)"""
+    return torch.ao.quantization.quantize_dynamic(
+        model.to("cpu"), {nn.Linear}, dtype=torch.qint8
+    )
+
+
+def checkpoint_fingerprint(weight_path: str) -> str:
+    """체크포인트 내용 식별자 (ONNX 캐시 키)
+
+    허깅페이스 캐시의 snapshots/{리비전}/파일은 blobs/{내용 해시}를 가리키는 링크라서 그 이름을 쓰고,
+    링크가 아니면 리비전 디렉토리 이름, 그 외 경로는 실제 경로 + 크기 + 수정 시각의 해시를 씁니다.
+    """
+    real = Path(os.path.realpath(weight_path))
+    if real.parent.name == "blobs":
+        return real.name[:16]
+    path = Path(weight_path)
+    if path.parent.parent.name == "snapshots":
+        return path.parent.name[:16]
+    stat = real.stat()
+    raw = f"{real}|{stat.st_size}|{stat.st_mtime_ns}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def onnx_path(weight_path: str, variant: str) -> Path:
+    """체크포인트 기준 ONNX 경로 (model_cache/{이름}-{식별자}.onnx / .int8.onnx)"""
+    stem = Path(weight_path).stem
+    suffix = ".int8.onnx" if variant == "onnx-int8" else ".onnx"
+    return INTENT_MODEL_CACHE_DIR / f"{stem}-{checkpoint_fingerprint(weight_path)}{suffix}"
+
+
+def export_onnx(model: nn.Module, path: Path) -> Path:
+    """fp32 모델 -> ONNX (batch, 문장 길이 동적 축)"""
+    dummy_ids = torch.ones(1, 16, dtype=torch.long)
+    dummy_mask = torch.ones(1, 16, dtype=torch.long)
+
+    return atomic_write(
+        path,
+        lambda tmp: torch.onnx.export(
+            model.to("cpu").eval(),
+            (dummy_ids, dummy_mask),
+            str(tmp),
+            input_names=["input_ids", "attention_mask"],
+            output_names=["logits"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "seq"},
+                "attention_mask": {0: "batch", 1: "seq"},
+                "logits": {0: "batch"},
+            },
+            opset_version=ONNX_OPSET,
+        ),
+    )
+
+
+def quantize_onnx(src: Path, dst: Path) -> Path:
+    """ONNX Runtime 동적 int8 양자화"""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    return atomic_write(
+        dst, lambda tmp: quantize_dynamic(str(src), str(tmp), weight_type=QuantType.QInt8)
+    )
+
+
+def build_onnx(checkpoint: dict, weight_path: str, variant: str = "onnx") -> Path:
+    """ONNX 파일 생성 (이미 있으면 그대로 사용)"""
+    path = onnx_path(weight_path, variant)
+    if path.exists():
+        return path
+
+    fp32_path = onnx_path(weight_path, "onnx")
+    if not fp32_path.exists():
+        print(f"[INFO] KoBERT ONNX 내보내기: {fp32_path.name}")
+        export_onnx(load_fp32(checkpoint), fp32_path)
+    if variant == "onnx-int8":
+        print(f"[INFO] KoBERT ONNX int8 양자화: {path.name}")
+        quantize_onnx(fp32_path, path)
+    return path
+
+
+class OnnxKoBertClassifier:
+    """ONNX Runtime 세션을 KoBertMultiLabelClassifier처럼 호출하는 래퍼"""
+
+    def __init__(self, path: Path, num_threads: int = 0):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.path = path
+        self.session = ort.InferenceSession(
+            str(path), options, providers=["CPUExecutionProvider"]
+        )
+
+    def __call__(self, input_ids: torch.Tensor, attention_mask: torch.Tensor) -> torch.Tensor:
+        (logits,) = self.session.run(
+            ["logits"],
+            {
+                "input_ids": input_ids.cpu().numpy().astype("int64"),
+                "attention_mask": attention_mask.cpu().numpy().astype("int64"),
+            },
+        )
+        return torch.from_numpy(logits)
+
+
+def load_intent_classifier(
+    checkpoint: dict, weight_path: str, variant: str = FAIRY_INTENT_VARIANT, device: str = "cpu"
+):
+    """변형 이름으로 분류기 로드
+
+    Returns:
+        model(input_ids, attention_mask) -> logits 로 호출 가능한 객체
+    """
+    if variant not in VARIANTS:
+        raise ValueError(f"알 수 없는 KoBERT 변형: {variant} (사용 가능: {', '.join(VARIANTS)})")
+
+    if variant == "fp32":
+        return load_fp32(checkpoint, device)
+    if variant == "int8":
+        return quantize_int8(load_fp32(checkpoint, "cpu"))
+    return OnnxKoBertClassifier(build_onnx(checkpoint, weight_path, variant))
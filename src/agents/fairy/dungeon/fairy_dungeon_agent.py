@@ -42,7 +42,6 @@ action_llm = init_chat_model(
 )
 # small_talk_llm = init_chat_model(model=LLM.GROK_4_FAST_NON_REASONING, max_tokens=80)
 rdb_repository = RDBRepository()
-intent_model = FairyDungeonIntentModel()
 
 
 def _rdb_fairy_messages_bg(user_args, ai_args):
@@ -115,7 +114,7 @@ async def _clarify_intent(query) -> FairyDungeonIntentOutput:
     messages = [SystemMessage(content=intent_prompt), HumanMessage(content=query)]
     parser_llm = intent_llm.with_structured_output(FairyDungeonIntentOutput)
     intent_output: FairyDungeonIntentOutput = await parser_llm.ainvoke(messages)
-    # raw_labels, _ = intent_model.predict(query)
+    # raw_labels, _ = model_registry.get("fairy_dungeon_intent").predict(query)
     # enum_list = FairyDungeonIntentModel.parse_intents_to_enum(raw_labels)
     # intent_output: FairyDungeonIntentOutput = FairyDungeonIntentOutput(intents=enum_list)
     # print("전체 의도::", intent_output)
@@ -302,4 +301,3 @@ graph_builder.add_conditional_edges(
     },
 )
 graph_builder.add_edge("fairy_action", END)
-graph_builder.compile()
@@ -1,59 +1,75 @@
 import torch
 from typing import List
-from huggingface_hub import hf_hub_download
-from kobert_transformers import get_tokenizer
-from agents.fairy.ai_data_schema.KoBertMultiLabelClassifier import KoBertMultiLabelClassifier
+from core.model_registry import hf_download, model_registry
+from agents.fairy.ai_data_schema.kobert_variants import FAIRY_INTENT_VARIANT, load_intent_classifier
+from agents.fairy.intent_batch_engine import intent_batch_engine
 from agents.fairy.fairy_state import  FairyDungeonIntentType
 class FairyDungeonIntentModel:
     def __init__(
         self,
         repo_id: str = "JINSUP/ProjectML-Models",
         filename: str = "fairy_dungeon_intent_kobert_model.pt",
-        device: str = "cpu"
+        device: str = "cpu",
+        variant: str = FAIRY_INTENT_VARIANT,
     ):
         self.repo_id = repo_id
         self.filename = filename
-        self.device = device
+        self.variant = variant
+        # int8 / onnx 변형은 CPU 전용
+        self.device = device if variant == "fp32" else "cpu"
 
-        self.weight_path = hf_hub_download(
-            repo_id=self.repo_id,
-            filename=self.filename
-        )
+        # MODEL_CACHE_DIR에 캐시 (MODEL_OFFLINE=true면 네트워크 없이 로드)
+        self.weight_path = hf_download(self.repo_id, self.filename)
 
-        checkpoint = torch.load(self.weight_path, map_location=device)
+        checkpoint = torch.load(self.weight_path, map_location=self.device)
 
         self.idx2label = checkpoint["idx2label"]
-        num_labels = len(self.idx2label)
 
-        self.model = KoBertMultiLabelClassifier(num_labels=num_labels)
-        self.model.load_state_dict(checkpoint["model_state_dict"])
-        self.model.eval()
-        self.tokenizer = get_tokenizer()
+        # fp32 / int8 / onnx / onnx-int8 (kobert_variants.py 참고)
+        self.model = load_intent_classifier(
+            checkpoint, self.weight_path, variant=variant, device=self.device
+        )
+        # 두 정령 의도 모델이 같은 토크나이저 공유
+        self.tokenizer = model_registry.get("kobert_tokenizer")
 
     def predict(self, text: str):
         """
         text → labels, probabilities 반환
+        (동시 요청은 intent_batch_engine에서 모아서 한 번에 추론)
+        """
+        return intent_batch_engine.predict(self, text)
+
+    async def apredict(self, text: str):
+        """predict의 비동기 버전 (이벤트 루프를 막지 않음)"""
+        return await intent_batch_engine.apredict(self, text)
+
+    def predict_batch(self, texts: List[str]):
+        """
+        texts → [(labels, probabilities), ...]
+        배치 내 가장 긴 문장 길이로 패딩 (최대 64)
         """
 
         inputs = self.tokenizer(
-            text,
-            padding="max_length",
+            texts,
+            padding="longest",
             truncation=True,
             max_length=64,
             return_tensors="pt"
         )
 
-        input_ids = inputs["input_ids"]
-        attention_mask = inputs["attention_mask"]
+        input_ids = inputs["input_ids"].to(self.device)
+        attention_mask = inputs["attention_mask"].to(self.device)
 
-        with torch.no_grad():
+        with torch.inference_mode():
             logits = self.model(input_ids, attention_mask)
-            probs = torch.sigmoid(logits).squeeze(0)
-
-        preds = (probs > 0.5).nonzero().flatten().tolist()
-        labels = [self.idx2label[p] for p in preds]
+            probs = torch.sigmoid(logits).cpu()
 
-        return labels, probs.cpu().tolist()
+        results = []
+        for row in probs:
+            preds = (row > 0.5).nonzero().flatten().tolist()
+            labels = [self.idx2label[p] for p in preds]
+            results.append((labels, row.tolist()))
+        return results
     
     @staticmethod
     def parse_intents_to_enum(raw):
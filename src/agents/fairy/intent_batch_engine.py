@@ -0,0 +1,206 @@
+"""
+KoBERT 의도 분류 마이크로 배치 엔진
+
+정령 의도 모델(FairyDungeonIntentModel, FairyInteractionIntentModel)은
+요청마다 문장 하나씩 KoBERT forward를 실행했습니다.
+이 엔진은 동시에 들어온 요청을 몇 ms 동안 모아서 모델별로 한 번에 forward 합니다.
+
+- 전용 스레드 1개가 모든 의도 모델을 실행 (CPU 코어를 두 모델이 나눠 쓰지 않도록)
+- 첫 요청이 들어오면 INTENT_BATCH_WAIT_MS 동안 추가 요청을 모음 (최대 INTENT_MAX_BATCH개)
+- 같은 모델 요청끼리 묶어서 model.predict_batch(texts) 호출
+  (predict_batch는 배치 내 가장 긴 문장 길이로 패딩, torch.inference_mode 사용)
+- 호출자는 동기(predict) / 비동기(apredict) 모두 가능
+
+환경변수:
+- INTENT_BATCHING: "false"면 배치 없이 호출 스레드에서 바로 실행 (기본 true)
+- INTENT_MAX_BATCH: 배치 최대 크기 (기본 16)
+- INTENT_BATCH_WAIT_MS: 배치를 모으기 위해 기다리는 시간 (기본 5)
+
+사용 예시:
+    labels, probs = intent_batch_engine.predict(model, "불 좀 켜줘")
+    labels, probs = await intent_batch_engine.apredict(model, "불 좀 켜줘")
+"""
+
+import asyncio
+import os
+import queue
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+INTENT_BATCHING = os.getenv("INTENT_BATCHING", "true").lower() == "true"
+INTENT_MAX_BATCH = int(os.getenv("INTENT_MAX_BATCH", "16"))
+INTENT_BATCH_WAIT_MS = float(os.getenv("INTENT_BATCH_WAIT_MS", "5"))
+
+# 지연시간 통계에 보관할 최근 요청 수
+LATENCY_WINDOW = 2000
+
+
+@dataclass
+class _Job:
+    model: Any  # predict_batch(texts)를 가진 의도 모델
+    text: str
+    future: Future = field(default_factory=Future)
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+def _percentile(values: List[float], p: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * p / 100
+    lower = int(k)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
+
+
+class IntentBatchEngine:
+    """의도 분류 모델 공용 배치 추론 엔진"""
+
+    def __init__(
+        self,
+        enabled: bool = INTENT_BATCHING,
+        max_batch: int = INTENT_MAX_BATCH,
+        wait_ms: float = INTENT_BATCH_WAIT_MS,
+    ):
+        self.enabled = enabled
+        self.max_batch = max(1, max_batch)
+        self.wait = wait_ms / 1000
+
+        self._queue: "queue.Queue[_Job]" = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+        self.batch_sizes: Counter = Counter()
+        self._latencies: deque = deque(maxlen=LATENCY_WINDOW)  # 대기 + 추론 (초)
+        self._forward_times: deque = deque(maxlen=LATENCY_WINDOW)  # 배치 forward (초)
+
+    # ============================================
+    # 워커
+    # ============================================
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="intent-batch", daemon=True
+                )
+                self._thread.start()
+
+    def _collect(self, first: _Job) -> List[_Job]:
+        """첫 요청 이후 wait 동안 추가 요청 수집"""
+        jobs = [first]
+        deadline = time.perf_counter() + self.wait
+        while len(jobs) < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                jobs.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return jobs
+
+    def _run(self) -> None:
+        while True:
+            jobs = self._collect(self._queue.get())
+            try:
+                # 모델별로 묶어서 실행 (들어온 순서 유지)
+                groups: Dict[int, List[_Job]] = {}
+                for job in jobs:
+                    groups.setdefault(id(job.model), []).append(job)
+
+                for group in groups.values():
+                    self._run_group(group)
+            except Exception as e:
+                # 워커 스레드가 죽으면 이후 요청이 모두 멈추므로 이번 배치만 실패 처리
+                print(f"[ERROR] 의도 배치 처리 실패: {e}")
+                for job in jobs:
+                    if not job.future.done():
+                        job.future.set_exception(e)
+
+    def _run_group(self, jobs: List[_Job]) -> None:
+        # 호출자가 이미 취소한 요청은 제외 (apredict가 취소되면 Future도 취소됨)
+        # 여기서 running 상태가 된 Future는 더 이상 취소되지 않음
+        jobs = [job for job in jobs if job.future.set_running_or_notify_cancel()]
+        if not jobs:
+            return
+
+        model = jobs[0].model
+        t0 = time.perf_counter()
+        try:
+            results = model.predict_batch([job.text for job in jobs])
+        except Exception as e:
+            for job in jobs:
+                job.future.set_exception(e)
+            return
+        done = time.perf_counter()
+
+        for job, result in zip(jobs, results):
+            job.future.set_result(result)
+
+        with self._stats_lock:
+            self.batch_sizes[len(jobs)] += 1
+            self._forward_times.append(done - t0)
+            self._latencies.extend(done - job.enqueued_at for job in jobs)
+
+    # ============================================
+    # 공개 메서드
+    # ============================================
+
+    def submit(self, model, text: str) -> Future:
+        """요청 등록 (concurrent.futures.Future 반환)"""
+        self._ensure_started()
+        job = _Job(model=model, text=text)
+        self._queue.put(job)
+        return job.future
+
+    def predict(self, model, text: str) -> Tuple[List[str], List[float]]:
+        """동기 호출 (스레드에서 실행되는 그래프 노드용)"""
+        if not self.enabled:
+            t0 = time.perf_counter()
+            result = model.predict_batch([text])[0]
+            with self._stats_lock:
+                self.batch_sizes[1] += 1
+                self._latencies.append(time.perf_counter() - t0)
+            return result
+        return self.submit(model, text).result()
+
+    async def apredict(self, model, text: str) -> Tuple[List[str], List[float]]:
+        """비동기 호출 (이벤트 루프를 막지 않음)"""
+        if not self.enabled:
+            return await asyncio.to_thread(self.predict, model, text)
+        return await asyncio.wrap_future(self.submit(model, text))
+
+    def stats(self) -> Dict[str, Any]:
+        """배치 크기 분포 / 지연시간 통계 (ms)"""
+        with self._stats_lock:
+            latencies = list(self._latencies)
+            forwards = list(self._forward_times)
+            sizes = dict(sorted(self.batch_sizes.items()))
+
+        batches = sum(sizes.values())
+        requests = sum(size * count for size, count in sizes.items())
+        return {
+            "enabled": self.enabled,
+            "max_batch": self.max_batch,
+            "wait_ms": self.wait * 1000,
+            "batches": batches,
+            "requests": requests,
+            "avg_batch_size": requests / batches if batches else 0.0,
+            "batch_size_distribution": sizes,
+            "latency_p50_ms": _percentile(latencies, 50) * 1000,
+            "latency_p99_ms": _percentile(latencies, 99) * 1000,
+            "forward_p50_ms": _percentile(forwards, 50) * 1000,
+            "forward_p99_ms": _percentile(forwards, 99) * 1000,
+        }
+
+
+# 싱글톤 인스턴스
+intent_batch_engine = IntentBatchEngine()
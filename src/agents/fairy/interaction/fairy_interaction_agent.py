@@ -15,11 +15,11 @@ from agents.fairy.fairy_state import FairyItemUseOutput
 from agents.fairy.interaction.fairy_interaction_model_logics import ItemEmbeddingLogic, IsItemUseEmbeddingLogic, FairyInteractionIntentModel
 from langchain.messages import SystemMessage, HumanMessage
 from langchain.chat_models import init_chat_model
+from core.model_registry import model_registry
 
 
 item_embedding_logic = ItemEmbeddingLogic()
 is_item_use_embedding_logic = IsItemUseEmbeddingLogic()
-fairy_interaction_intent_model = FairyInteractionIntentModel()
 
 # item_use_llm = get_groq_llm_lc(model = LLM.OPENAI_GPT_OSS_20B, max_token=2)
 def _clarify_intent(query:str):
@@ -30,7 +30,8 @@ def _clarify_intent(query:str):
     # intent_output: FairyInterationIntentOutput = parser_llm.invoke(
     #     interation_intent_prompt
     # )
-    raw_labels, _ = fairy_interaction_intent_model.predict(query)
+    # 첫 호출 시 로드 (보통 lifespan 워밍업에서 미리 로드됨)
+    raw_labels, _ = model_registry.get("fairy_interaction_intent").predict(query)
     enum_list = FairyInteractionIntentModel.parse_intents_to_enum(raw_labels)    
     intent_output = FairyInterationIntentOutput(intents=enum_list)
 
@@ -144,4 +145,3 @@ graph_builder.add_edge("create_temp_use_item_id", "create_interation")
 graph_builder.add_edge("check_use_item", "create_interation")
 
 graph_builder.add_edge("create_interation", END)
-graph = graph_builder.compile()
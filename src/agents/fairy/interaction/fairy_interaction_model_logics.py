@@ -1,11 +1,21 @@
 from core.common import get_inventory_items
+import os
 from typing import List
 import numpy as np
-from FlagEmbedding import BGEM3FlagModel
 from core.game_dto.z_cache_data import cache_items
 from core.game_dto.ItemData import ItemData
+from core.model_registry import model_registry
+from core.prototype_store import knn_similarity, load_prototype_vectors, normalize_rows
+
+# 아이템 사용 판단: 가까운 예시 문장 수 / 참-거짓 유사도 차이 기준
+ITEM_USE_KNN_K = int(os.getenv("ITEM_USE_KNN_K", "5"))
+ITEM_USE_MARGIN = float(os.getenv("ITEM_USE_MARGIN", "0.05"))
+
+
+def get_emb_model():
+    """BGE-M3 임베딩 모델 (첫 호출 시 로드, model_registry에서 공유)"""
+    return model_registry.get("bge_m3")
 
-emb_model = BGEM3FlagModel("BAAI/bge-m3")
 class ItemEmbeddingLogic:
 
     def __init__(self):
@@ -20,7 +30,7 @@ class ItemEmbeddingLogic:
 
     # def _init_item_vectors(self):
     #     texts = [self._item_text(item) for item in cache_items]
-    #     vecs = emb_model.encode(texts)["dense_vecs"]
+    #     vecs = get_emb_model().encode(texts)["dense_vecs"]
     #     for item, vec in zip(cache_items, vecs):
     #         self.ITEM_VEC_CACHE[item.itemId] = vec
 
@@ -35,7 +45,7 @@ class ItemEmbeddingLogic:
     #         return []
 
     #     # 질문 임베딩 1회
-    #     q_vec = emb_model.encode([question])["dense_vecs"][0]
+    #     q_vec = get_emb_model().encode([question])["dense_vecs"][0]
     #     sims = []
 
     #     for item in items:
@@ -145,23 +155,29 @@ class IsItemUseEmbeddingLogic:
             "장비를 사용하면 부작용이 있나?",
             "장비 스탯 계산 방식을 설명해줘",
         ]
-        self.TRUE_VEC = self._mean_vec(self.TRUE_SENTENCES)
-        self.FALSE_VEC = self._mean_vec(self.FALSE_SENTENCES)
+        # 기준 벡터는 첫 판단 시 로드 (model_cache/prototypes에 저장, 문장이 바뀌면 다시 계산)
+        self.TRUE_MATRIX = None
+        self.FALSE_MATRIX = None
 
-    def _mean_vec(self, texts):
-        vecs = emb_model.encode(texts)["dense_vecs"]
-        return np.mean(vecs, axis=0)
-    
-    def _cosine(self, a, b):
-        return float(a @ b / (np.linalg.norm(a)*np.linalg.norm(b) + 1e-8))
+    def _ensure_vectors(self):
+        if self.TRUE_MATRIX is None:
+            self.FALSE_MATRIX = self._prototype_matrix(self.FALSE_SENTENCES)
+            self.TRUE_MATRIX = self._prototype_matrix(self.TRUE_SENTENCES)
+
+    def _prototype_matrix(self, texts):
+        return load_prototype_vectors(
+            "bge_m3", texts, lambda t: get_emb_model().encode(t)["dense_vecs"]
+        )
 
     def is_item_use(self, sentence: str) -> bool:
-        vec = emb_model.encode([sentence])["dense_vecs"][0]
-        sim_true = self._cosine(vec, self.TRUE_VEC)
-        sim_false = self._cosine(vec, self.FALSE_VEC)
+        self._ensure_vectors()
+        vec = normalize_rows(get_emb_model().encode([sentence])["dense_vecs"])[0]
+        # 가장 가까운 예시 문장 k개와의 평균 유사도로 비교 (ITEM_USE_KNN_K=0 이면 평균 벡터)
+        sim_true = knn_similarity(self.TRUE_MATRIX, vec, ITEM_USE_KNN_K)
+        sim_false = knn_similarity(self.FALSE_MATRIX, vec, ITEM_USE_KNN_K)
         diff = sim_true - sim_false
 
-        if abs(diff) < 0.05: 
+        if abs(diff) < ITEM_USE_MARGIN: 
             return False  # 또는 "UNKNOWN"으로 보내기
         
         return diff > 0
@@ -171,9 +187,9 @@ class IsItemUseEmbeddingLogic:
 
 import torch
 from typing import List
-from huggingface_hub import hf_hub_download
-from kobert_transformers import get_tokenizer
-from agents.fairy.ai_data_schema.KoBertMultiLabelClassifier import KoBertMultiLabelClassifier
+from core.model_registry import hf_download, model_registry
+from agents.fairy.ai_data_schema.kobert_variants import FAIRY_INTENT_VARIANT, load_intent_classifier
+from agents.fairy.intent_batch_engine import intent_batch_engine
 from agents.fairy.fairy_state import FairyInterationIntentType
 
 class FairyInteractionIntentModel:
@@ -181,51 +197,67 @@ class FairyInteractionIntentModel:
         self,
         repo_id: str = "JINSUP/ProjectML-Models",
         filename: str = "fairy_interaction_intent_kobert_classifier.pt",
-        device: str = "cpu"
+        device: str = "cpu",
+        variant: str = FAIRY_INTENT_VARIANT,
     ):
         self.repo_id = repo_id
         self.filename = filename
-        self.device = device
+        self.variant = variant
+        # int8 / onnx 변형은 CPU 전용
+        self.device = device if variant == "fp32" else "cpu"
 
-        self.weight_path = hf_hub_download(
-            repo_id=self.repo_id,
-            filename=self.filename
-        )
+        # MODEL_CACHE_DIR에 캐시 (MODEL_OFFLINE=true면 네트워크 없이 로드)
+        self.weight_path = hf_download(self.repo_id, self.filename)
 
-        checkpoint = torch.load(self.weight_path, map_location=device)
+        checkpoint = torch.load(self.weight_path, map_location=self.device)
 
         self.idx2label = checkpoint["idx2label"]
-        num_labels = len(self.idx2label)
 
-        self.model = KoBertMultiLabelClassifier(num_labels=num_labels)
-        self.model.load_state_dict(checkpoint["model_state_dict"])
-        self.model.eval()
-        self.tokenizer = get_tokenizer()
+        # fp32 / int8 / onnx / onnx-int8 (kobert_variants.py 참고)
+        self.model = load_intent_classifier(
+            checkpoint, self.weight_path, variant=variant, device=self.device
+        )
+        # 두 정령 의도 모델이 같은 토크나이저 공유
+        self.tokenizer = model_registry.get("kobert_tokenizer")
 
     def predict(self, text: str):
         """
         text → labels, probabilities 반환
+        (동시 요청은 intent_batch_engine에서 모아서 한 번에 추론)
+        """
+        return intent_batch_engine.predict(self, text)
+
+    async def apredict(self, text: str):
+        """predict의 비동기 버전 (이벤트 루프를 막지 않음)"""
+        return await intent_batch_engine.apredict(self, text)
+
+    def predict_batch(self, texts: List[str]):
+        """
+        texts → [(labels, probabilities), ...]
+        배치 내 가장 긴 문장 길이로 패딩 (최대 64)
         """
 
         inputs = self.tokenizer(
-            text,
-            padding="max_length",
+            texts,
+            padding="longest",
             truncation=True,
             max_length=64,
             return_tensors="pt"
         )
 
-        input_ids = inputs["input_ids"]
-        attention_mask = inputs["attention_mask"]
+        input_ids = inputs["input_ids"].to(self.device)
+        attention_mask = inputs["attention_mask"].to(self.device)
 
-        with torch.no_grad():
+        with torch.inference_mode():
             logits = self.model(input_ids, attention_mask)
-            probs = torch.sigmoid(logits).squeeze(0)
-
-        preds = (probs > 0.5).nonzero().flatten().tolist()
-        labels = [self.idx2label[p] for p in preds]
+            probs = torch.sigmoid(logits).cpu()
 
-        return labels, probs.cpu().tolist()
+        results = []
+        for row in probs:
+            preds = (row > 0.5).nonzero().flatten().tolist()
+            labels = [self.idx2label[p] for p in preds]
+            results.append((labels, row.tolist()))
+        return results
     
     @staticmethod
     def parse_intents_to_enum(raw):
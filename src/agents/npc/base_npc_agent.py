@@ -16,8 +16,9 @@ HeroineAgent와 SageAgent가 이 클래스를 상속받습니다.
 - calculate_sanity_change(): 정신력 변화량 계산
 """
 
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator
 from datetime import datetime, timedelta
 from langchain.chat_models import init_chat_model
 from langchain_core.messages import HumanMessage, AIMessage
@@ -26,6 +27,7 @@ from db.redis_manager import redis_manager
 from db.user_memory_manager import user_memory_manager
 from db.session_checkpoint_manager import session_checkpoint_manager
 from agents.npc.npc_state import NPCState
+from agents.npc.npc_utils import StreamingJsonFieldParser
 from enums.LLM import LLM
 
 # ============================================
@@ -89,7 +91,10 @@ class BaseNPCAgent(ABC):
     상속 클래스가 구현해야 하는 메서드:
     - _create_initial_session(): 초기 세션 생성
     - process_message(): 메시지 처리 (LangGraph 실행)
-    - generate_response_stream(): 스트리밍 응답 생성
+    - _emotion_to_int(): 감정 문자열 -> 정수 (스트리밍 emotion 이벤트용)
+
+    스트리밍 응답(generate_response_stream)은 self.graph의 "generate" 노드
+    LLM 토큰을 그대로 흘려보내므로 별도 구현이 필요 없습니다.
 
     사용 예시:
         class HeroineAgent(BaseNPCAgent):
@@ -268,7 +273,7 @@ class BaseNPCAgent(ABC):
 
         return "\n".join(formatted)
 
-    def get_time_since_last_chat(self, player_id: int, npc_id: int) -> str:
+    async def get_time_since_last_chat(self, player_id: int, npc_id: int) -> str:
         """마지막 대화로부터 경과 시간 계산
 
         프롬프트에 삽입할 시간 정보를 반환합니다.
@@ -287,7 +292,7 @@ class BaseNPCAgent(ABC):
             if last_chat_at:
                 return session_checkpoint_manager.calculate_time_diff(last_chat_at)
 
-        last_chat_at = session_checkpoint_manager.get_last_chat_at(player_id, npc_id)
+        last_chat_at = await session_checkpoint_manager.get_last_chat_at(player_id, npc_id)
         return session_checkpoint_manager.calculate_time_diff(last_chat_at)
 
     # ============================================
@@ -308,6 +313,80 @@ class BaseNPCAgent(ABC):
         """
         pass
 
+    def _emotion_to_int(self, emotion: str) -> int:
+        """감정 문자열을 정수로 변환 (서브클래스에서 NPC별 매퍼로 재정의)"""
+        return 0
+
+    # ============================================
+    # 스트리밍
+    # ============================================
+
+    async def generate_response_stream(
+        self, state: NPCState
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """메시지 처리 (스트리밍)
+
+        process_message와 같은 그래프를 astream_events로 실행하면서
+        "generate" 노드의 LLM 토큰에서 JSON "text" 값을 점진적으로 추출합니다.
+        후처리(post_process) 노드는 마지막 토큰 이후 그대로 실행되고,
+        그 결과는 마지막 done 이벤트로 전달됩니다.
+
+        Yields:
+            {"type": "token", "text": str}      - 응답 텍스트 조각
+            {"type": "emotion", "emotion": int, "emotion_intensity": float}
+                - 감정 (JSON에서 확정되는 즉시 1회)
+            {"type": "done", "result": dict, "ttft": float | None}
+                - 최종 그래프 상태 (process_message 반환값과 동일)
+        """
+        t = time.time()
+        ttft = None
+        parser = StreamingJsonFieldParser("text")
+        emotion_sent = False
+        result = None
+
+        async for event in self.graph.astream_events(state, version="v2"):
+            kind = event["event"]
+
+            if (
+                kind == "on_chat_model_stream"
+                and event.get("metadata", {}).get("langgraph_node") == "generate"
+            ):
+                content = event["data"]["chunk"].content
+                if not isinstance(content, str):
+                    continue
+
+                delta = parser.feed(content)
+                if delta:
+                    if ttft is None:
+                        ttft = time.time() - t
+                        print(f"[TIMING] 첫 토큰(TTFT): {ttft:.3f}s")
+                    yield {"type": "token", "text": delta}
+
+                # 감정 강도는 감정 바로 뒤에 오므로, 강도 또는 본문이 나올 때까지 기다림
+                if (
+                    not emotion_sent
+                    and "emotion" in parser.fields
+                    and (
+                        "emotion_intensity" in parser.fields
+                        or "text" in parser.fields
+                        or delta
+                        or parser.done
+                    )
+                ):
+                    emotion_sent = True
+                    yield {
+                        "type": "emotion",
+                        "emotion": self._emotion_to_int(parser.fields["emotion"]),
+                        "emotion_intensity": parser.fields.get("emotion_intensity", 1.0),
+                    }
+
+            elif kind == "on_chain_end" and not event.get("parent_ids"):
+                # 루트(그래프 전체) 종료 이벤트
+                result = event["data"].get("output")
+
+        print(f"[TIMING] 스트리밍 그래프 총합: {time.time() - t:.3f}s")
+        yield {"type": "done", "result": result or {}, "ttft": ttft}
+
 
 
 # ============================================
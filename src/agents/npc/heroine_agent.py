@@ -22,11 +22,14 @@
 """
 
 import asyncio
+import os
 import time
 from datetime import datetime
 from typing import Dict, Any, Optional, Tuple
 
 from langchain.chat_models import init_chat_model
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import merge_configs
 from langgraph.graph import START, END, StateGraph
 
 from agents.npc.npc_state import HeroineState
@@ -83,6 +86,11 @@ def _get_default_heroine_persona() -> Dict[str, Any]:
 PERSONA_DATA = load_persona_yaml("heroine_persona.yaml", _get_default_heroine_persona)
 HEROINE_KEY_MAP = {1: "letia", 2: "lupames", 3: "roco"}
 
+# 추측 실행 모드: 의도 분류와 동시에 모든 검색을 시작하고, 분류 결과에 맞는 것만 사용
+HEROINE_SPECULATIVE_RETRIEVAL = (
+    os.getenv("HEROINE_SPECULATIVE_RETRIEVAL", "true").lower() == "true"
+)
+
 
 class HeroineAgent(BaseNPCAgent):
     """히로인 NPC Agent (리팩토링 버전)
@@ -95,9 +103,16 @@ class HeroineAgent(BaseNPCAgent):
         result = await agent.process_message(state)
     """
 
-    def __init__(self, model_name: str = LLM.GROK_4_1_FAST_NON_REASONING):
+    def __init__(
+        self,
+        model_name: str = LLM.GROK_4_1_FAST_NON_REASONING,
+        speculative_retrieval: bool = HEROINE_SPECULATIVE_RETRIEVAL,
+    ):
         """초기화"""
         super().__init__(model_name)
+        self.speculative_retrieval = speculative_retrieval
+        # 의도별 추측 실행 통계 {intent: {"count", "saved_total"}}
+        self.speculation_stats: Dict[str, Dict[str, float]] = {}
         self.llm = init_chat_model(model=model_name, temperature=1, max_tokens=200)
         self.intent_llm = init_chat_model(model=model_name, temperature=0, max_tokens=20)
 
@@ -202,7 +217,7 @@ class HeroineAgent(BaseNPCAgent):
                 facts_parts.append(f"- {memory_text}")
 
         # 2. NPC-NPC 장기기억 검색
-        npc_memories = self.memory_retriever.search_npc_npc_memories(
+        npc_memories = await self.memory_retriever.search_npc_npc_memories(
             user_message, player_id, npc_id
         )
 
@@ -237,7 +252,7 @@ class HeroineAgent(BaseNPCAgent):
         if other_id is None:
             return "관련 대화 없음"
 
-        conversation = self.memory_retriever.get_latest_npc_conversation(
+        conversation = await self.memory_retriever.get_latest_npc_conversation(
             player_id, npc_id, other_id
         )
 
@@ -348,14 +363,25 @@ class HeroineAgent(BaseNPCAgent):
         graph = StateGraph(HeroineState)
 
         graph.add_node("keyword_analyze", self._keyword_analyze_node)
+        graph.add_node("generate", self._generate_node)
+        graph.add_node("post_process", self._post_process_node)
+
+        graph.add_edge(START, "keyword_analyze")
+        graph.add_edge("generate", "post_process")
+        graph.add_edge("post_process", END)
+
+        if self.speculative_retrieval:
+            # 의도 분류 + 3가지 검색을 한 노드에서 동시에 실행
+            graph.add_node("speculative_router", self._speculative_router_node)
+            graph.add_edge("keyword_analyze", "speculative_router")
+            graph.add_edge("speculative_router", "generate")
+            return graph.compile()
+
         graph.add_node("router", self._router_node)
         graph.add_node("memory_retrieve", self._memory_retrieve_node)
         graph.add_node("scenario_retrieve", self._scenario_retrieve_node)
         graph.add_node("heroine_retrieve", self._heroine_retrieve_node)
-        graph.add_node("generate", self._generate_node)
-        graph.add_node("post_process", self._post_process_node)
 
-        graph.add_edge(START, "keyword_analyze")
         graph.add_edge("keyword_analyze", "router")
 
         graph.add_conditional_edges(
@@ -372,8 +398,6 @@ class HeroineAgent(BaseNPCAgent):
         graph.add_edge("memory_retrieve", "generate")
         graph.add_edge("scenario_retrieve", "generate")
         graph.add_edge("heroine_retrieve", "generate")
-        graph.add_edge("generate", "post_process")
-        graph.add_edge("post_process", END)
 
         return graph.compile()
 
@@ -404,7 +428,7 @@ class HeroineAgent(BaseNPCAgent):
         )
 
         if unlocked_threshold is not None:
-            scenario = heroine_scenario_service.get_scenario_by_exact_progress(
+            scenario = await heroine_scenario_service.get_scenario_by_exact_progress(
                 heroine_id=npc_id, memory_progress=unlocked_threshold
             )
             if scenario:
@@ -431,6 +455,7 @@ class HeroineAgent(BaseNPCAgent):
             "used_liked_keyword": used_keyword,
             "newly_unlocked_scenario": newly_unlocked_scenario,
             "recently_unlocked_memory": recently_unlocked_memory,
+            "node_timings": {"keyword_analyze": time.time() - t},
         }
 
     async def _router_node(self, state: HeroineState) -> dict:
@@ -445,7 +470,107 @@ class HeroineAgent(BaseNPCAgent):
             user_id=state.get("user_id"),
         )
         print(f"[TIMING] 의도 분류: {time.time() - t:.3f}s")
-        return {"intent": intent}
+        return {"intent": intent, "node_timings": {"router": time.time() - t}}
+
+    async def _speculative_router_node(self, state: HeroineState) -> dict:
+        """추측 실행 라우터 노드
+
+        의도 분류(LLM)를 기다리는 동안 기억/시나리오/히로인 대화 검색을 모두 시작하고,
+        분류 결과에 해당하는 검색 결과만 사용합니다. 나머지 검색은 취소합니다.
+
+        순차 실행 대비 절약 시간 = (분류 + 선택된 검색) - 실제 소요시간
+        """
+        t = time.time()
+        timings: Dict[str, float] = {}
+
+        async def timed(name: str, coro):
+            start = time.time()
+            try:
+                return await coro
+            finally:
+                timings[name] = time.time() - start
+
+        intent_task = asyncio.create_task(
+            timed(
+                "router",
+                self.intent_classifier.classify(
+                    user_message=state["messages"][-1].content,
+                    conversation_buffer=state.get("conversation_buffer", []),
+                    recently_unlocked=state.get("recently_unlocked_memory"),
+                    heroine_name=state.get("heroine_name"),
+                    session_id=state.get("session_id"),
+                    user_id=state.get("user_id"),
+                ),
+            )
+        )
+        # intent -> (노드 이름, 상태 필드, 태스크)
+        retrievals = {
+            "memory_recall": (
+                "memory_retrieve",
+                "retrieved_facts",
+                asyncio.create_task(timed("memory_retrieve", self._retrieve_memory(state))),
+            ),
+            "scenario_inquiry": (
+                "scenario_retrieve",
+                "unlocked_scenarios",
+                asyncio.create_task(timed("scenario_retrieve", self._retrieve_scenario(state))),
+            ),
+            "heroine_recall": (
+                "heroine_retrieve",
+                "heroine_conversation",
+                asyncio.create_task(
+                    timed("heroine_retrieve", self._retrieve_heroine_conversation(state))
+                ),
+            ),
+        }
+
+        try:
+            intent = await intent_task
+        except BaseException:
+            for _, _, task in retrievals.values():
+                task.cancel()
+            raise
+
+        selected = retrievals.pop(intent, None)
+        for _, _, task in retrievals.values():
+            task.cancel()
+            # 취소된 태스크의 예외는 여기서 소비 (경고 로그 방지)
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+        result: Dict[str, Any] = {"intent": intent}
+        if selected is not None:
+            node_name, field, task = selected
+            result[field] = await task
+        else:
+            node_name = None
+
+        elapsed = time.time() - t
+        sequential = timings.get("router", 0.0) + timings.get(node_name, 0.0)
+        saved = max(0.0, sequential - elapsed)
+        timings["speculative_router"] = elapsed
+        timings["speculative_saved"] = saved
+
+        stats = self.speculation_stats.setdefault(intent, {"count": 0, "saved_total": 0.0})
+        stats["count"] += 1
+        stats["saved_total"] += saved
+
+        print(
+            f"[TIMING] 추측 실행 라우터: {elapsed:.3f}s "
+            f"(intent={intent}, 의도 분류 {timings.get('router', 0.0):.3f}s, "
+            f"절약 {saved:.3f}s)"
+        )
+        result["node_timings"] = dict(timings)
+        return result
+
+    def get_speculation_stats(self) -> Dict[str, Dict[str, float]]:
+        """의도별 추측 실행 통계 (평균 절약 시간 포함)"""
+        return {
+            intent: {
+                **stats,
+                "saved_avg": stats["saved_total"] / stats["count"] if stats["count"] else 0.0,
+            }
+            for intent, stats in self.speculation_stats.items()
+        }
 
     def _route_by_intent(self, state: HeroineState) -> str:
         """의도에 따라 라우팅"""
@@ -456,23 +581,29 @@ class HeroineAgent(BaseNPCAgent):
         t = time.time()
         facts = await self._retrieve_memory(state)
         print(f"[TIMING] 기억 검색: {time.time() - t:.3f}s")
-        return {"retrieved_facts": facts}
+        return {"retrieved_facts": facts, "node_timings": {"memory_retrieve": time.time() - t}}
 
     async def _scenario_retrieve_node(self, state: HeroineState) -> dict:
         """시나리오 검색 노드"""
         t = time.time()
         scenarios = await self._retrieve_scenario(state)
         print(f"[TIMING] 시나리오 검색: {time.time() - t:.3f}s")
-        return {"unlocked_scenarios": scenarios}
+        return {
+            "unlocked_scenarios": scenarios,
+            "node_timings": {"scenario_retrieve": time.time() - t},
+        }
 
     async def _heroine_retrieve_node(self, state: HeroineState) -> dict:
         """히로인 대화 검색 노드"""
         t = time.time()
         conversation = await self._retrieve_heroine_conversation(state)
         print(f"[TIMING] 히로인 대화 검색: {time.time() - t:.3f}s")
-        return {"heroine_conversation": conversation}
+        return {
+            "heroine_conversation": conversation,
+            "node_timings": {"heroine_retrieve": time.time() - t},
+        }
 
-    async def _generate_node(self, state: HeroineState) -> dict:
+    async def _generate_node(self, state: HeroineState, config: RunnableConfig) -> dict:
         """응답 생성 노드 - HeroinePromptBuilder 사용"""
         t = time.time()
 
@@ -486,7 +617,7 @@ class HeroineAgent(BaseNPCAgent):
         }
 
         npc_id = state["npc_id"]
-        time_since_last_chat = self.get_time_since_last_chat(state["player_id"], npc_id)
+        time_since_last_chat = await self.get_time_since_last_chat(state["player_id"], npc_id)
 
         prompt = self.prompt_builder.build(
             state=state,
@@ -498,7 +629,7 @@ class HeroineAgent(BaseNPCAgent):
 
         print(f"[PROMPT]\n{prompt}\n{'='*50}")
 
-        config = tracker.get_langfuse_config(
+        langfuse_config = tracker.get_langfuse_config(
             tags=["npc", "heroine", "response", state.get("heroine_name", "unknown")],
             session_id=state.get("session_id"),
             user_id=state.get("user_id"),
@@ -509,7 +640,10 @@ class HeroineAgent(BaseNPCAgent):
             }
         )
 
-        response = await self.llm.ainvoke(prompt, **config)
+        # 그래프 config(콜백)와 병합해야 astream_events로 토큰이 전달됨
+        response = await self.llm.ainvoke(
+            prompt, config=merge_configs(config, langfuse_config.get("config"))
+        )
         print(f"[TIMING] LLM 호출: {time.time() - t:.3f}s")
 
         result = parse_llm_json_response(
@@ -527,6 +661,7 @@ class HeroineAgent(BaseNPCAgent):
             "emotion": heroine_emotion_to_int(result.get("emotion", "neutral")),
             "emotion_str": result.get("emotion", "neutral"),
             "emotion_intensity": result.get("emotion_intensity", 1.0),
+            "node_timings": {"generate": time.time() - t},
         }
 
     async def _post_process_node(self, state: HeroineState) -> dict:
@@ -548,19 +683,30 @@ class HeroineAgent(BaseNPCAgent):
             "affection": result["affection"],
             "sanity": result["sanity"],
             "memoryProgress": result["memoryProgress"],
+            "node_timings": {"post_process": time.time() - t},
         }
 
     # ============================================
     # 공개 메서드
     # ============================================
 
+    def _emotion_to_int(self, emotion: str) -> int:
+        """감정 문자열 -> 정수 (스트리밍 emotion 이벤트용)"""
+        return heroine_emotion_to_int(emotion)
+
     async def process_message(self, state: HeroineState) -> HeroineState:
         """메시지 처리 (비스트리밍)"""
         t = time.time()
         result = await self.graph.ainvoke(state)
         print(f"[TIMING] graph.ainvoke 내부: {time.time() - t:.3f}s")
+        print(f"[TIMING] 노드별: {self._format_node_timings(result)}")
         return result
 
+    @staticmethod
+    def _format_node_timings(result: Dict[str, Any]) -> str:
+        timings = result.get("node_timings") or {}
+        return ", ".join(f"{name}={sec:.3f}s" for name, sec in timings.items())
+
 
 # 싱글톤 인스턴스
 heroine_agent = HeroineAgent()
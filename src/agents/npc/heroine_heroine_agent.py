@@ -528,7 +528,7 @@ JSON 배열로 출력하세요:
                     unlocked_1_text = str(latest.get("content"))
             else:
                 memory_progress_1 = int(state1.get("memoryProgress", 0) or 0)
-                latest = heroine_scenario_service.get_latest_unlocked_scenario(
+                latest = await heroine_scenario_service.get_latest_unlocked_scenario(
                     heroine_id=heroine1_id, max_memory_progress=memory_progress_1
                 )
                 if latest and latest.get("content"):
@@ -544,7 +544,7 @@ JSON 배열로 출력하세요:
                     unlocked_2_text = str(latest.get("content"))
             else:
                 memory_progress_2 = int(state2.get("memoryProgress", 0) or 0)
-                latest = heroine_scenario_service.get_latest_unlocked_scenario(
+                latest = await heroine_scenario_service.get_latest_unlocked_scenario(
                     heroine_id=heroine2_id, max_memory_progress=memory_progress_2
                 )
                 if latest and latest.get("content"):
@@ -9,18 +9,28 @@ HeroineIntentClassifier - 히로인 의도 분류 전문 클래스
 3. scenario_inquiry: 히로인 본인의 과거/신상 질문
 4. heroine_recall: 다른 히로인과 나눈 대화 내용 질문
 
+빠른 경로:
+- HeroineIntentFastClassifier(로컬 임베딩)가 확신하는 메시지는 LLM 없이 바로 반환
+- 애매하거나 맥락이 필요한 메시지만 LLM으로 분류
+
 이 클래스가 없을 경우 발생할 문제:
 - 의도 분류 프롬프트 수정 시 HeroineAgent 전체를 수정해야 함
 - 의도 분류 로직 테스트가 Agent 전체 테스트에 종속됨
 - SRP 위반으로 유지보수 어려움
 """
 
+import asyncio
+import time
 from typing import Optional, List, Dict, Any
 
 from langchain.chat_models import init_chat_model
 from langchain_core.language_models.chat_models import BaseChatModel
 
 from agents.npc.base_npc_agent import NO_DATA
+from agents.npc.heroine_intent_fast_classifier import (
+    HeroineIntentFastClassifier,
+    HEROINE_INTENT_FAST_PATH,
+)
 from utils.langfuse_tracker import tracker
 
 
@@ -48,13 +58,24 @@ class HeroineIntentClassifier:
     VALID_INTENTS = ["general", "memory_recall", "scenario_inquiry", "heroine_recall"]
     DEFAULT_INTENT = "general"
 
-    def __init__(self, intent_llm: BaseChatModel):
+    def __init__(
+        self,
+        intent_llm: BaseChatModel,
+        fast_classifier: Optional[HeroineIntentFastClassifier] = None,
+    ):
         """초기화
 
         Args:
             intent_llm: 의도 분류용 LLM (temperature=0 권장)
+            fast_classifier: 로컬 빠른 분류기 (None이면 HEROINE_INTENT_FAST_PATH에 따라 생성)
         """
         self.intent_llm = intent_llm
+        if fast_classifier is None and HEROINE_INTENT_FAST_PATH:
+            fast_classifier = HeroineIntentFastClassifier()
+        self.fast_classifier = fast_classifier
+
+        # 경로별 처리 건수
+        self.stats = {"fast": 0, "llm": 0}
 
     async def classify(
         self,
@@ -80,6 +101,62 @@ class HeroineIntentClassifier:
         Returns:
             의도 문자열 (general/memory_recall/scenario_inquiry/heroine_recall)
         """
+        intent = await self._classify_fast(user_message, recently_unlocked)
+        if intent is not None:
+            self.stats["fast"] += 1
+            return intent
+
+        self.stats["llm"] += 1
+        return await self.classify_with_llm(
+            user_message,
+            conversation_buffer,
+            recently_unlocked,
+            heroine_name=heroine_name,
+            session_id=session_id,
+            user_id=user_id,
+        )
+
+    async def _classify_fast(
+        self, user_message: str, recently_unlocked: Optional[Dict[str, Any]]
+    ) -> Optional[str]:
+        """로컬 임베딩 분류. 확신이 없거나 맥락이 필요하면 None"""
+        if self.fast_classifier is None:
+            return None
+        if self.fast_classifier.needs_context(user_message, recently_unlocked):
+            return None
+
+        t = time.time()
+        try:
+            # 임베딩 계산은 CPU 작업이므로 스레드에서 실행
+            intent, margin = await asyncio.to_thread(
+                self.fast_classifier.predict, user_message
+            )
+        except Exception as e:
+            print(f"[WARN] 빠른 의도 분류 비활성화: {e}")
+            self.fast_classifier = None
+            return None
+
+        elapsed_ms = (time.time() - t) * 1000
+        if intent is None:
+            print(f"[INTENT_FAST] 보류 (margin={margin:.3f}, {elapsed_ms:.1f}ms) -> LLM")
+            return None
+
+        print(f"[INTENT_RESULT] {intent} (fast, margin={margin:.3f}, {elapsed_ms:.1f}ms)")
+        return intent
+
+    async def classify_with_llm(
+        self,
+        user_message: str,
+        conversation_buffer: List[Dict[str, str]],
+        recently_unlocked: Optional[Dict[str, Any]] = None,
+        heroine_name: Optional[str] = None,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> str:
+        """LLM 의도 분류 (빠른 경로 없이)
+
+        Args/Returns는 classify와 같습니다.
+        """
         # 최근 3턴 대화 (6개 메시지)
         recent_turns = conversation_buffer[-6:]
         recent_dialogue = self._format_recent_turns(recent_turns)
@@ -91,9 +168,6 @@ class HeroineIntentClassifier:
             user_message, recent_dialogue, unlocked_context
         )
 
-        # 의도 분류 프롬프트 로그
-        print(f"[INTENT_PROMPT]\n{prompt}\n{'='*50}")
-
         # LangFuse 토큰 추적
         config = tracker.get_langfuse_config(
             tags=["npc", "heroine", "intent", heroine_name or "unknown"],
@@ -109,7 +183,7 @@ class HeroineIntentClassifier:
         if intent not in self.VALID_INTENTS:
             intent = self.DEFAULT_INTENT
 
-        print(f"[INTENT_RESULT] {intent}")
+        print(f"[INTENT_RESULT] {intent} (llm)")
         return intent
 
     def _format_recent_turns(self, conversation_buffer: List[Dict[str, str]]) -> str:
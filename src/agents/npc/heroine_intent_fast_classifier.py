@@ -0,0 +1,196 @@
+"""
+HeroineIntentFastClassifier - 로컬 임베딩 기반 의도 분류 (빠른 경로)
+
+HeroineIntentClassifier가 매 턴 원격 LLM을 호출하기 전에,
+BGE-M3 임베딩과 의도별 프로토타입 벡터의 코사인 유사도로 먼저 분류합니다.
+(fairy_interaction_model_logics.py의 IsItemUseEmbeddingLogic과 같은 방식)
+
+1등과 2등 의도의 유사도 차이(margin)가 기준 이상일 때만 결과를 반환하고,
+애매하면 None을 반환하여 LLM 분류로 넘깁니다.
+
+다음 경우는 맥락이 필요하므로 항상 LLM으로 넘깁니다:
+- 최근 해금된 기억이 있는 턴 (꼬리질문 판단 필요)
+- "그때", "그거" 같은 지시어가 포함된 메시지
+
+환경변수:
+- HEROINE_INTENT_FAST_PATH: "false"면 빠른 경로 비활성화 (기본 true)
+- HEROINE_INTENT_FAST_MARGIN: 1등-2등 유사도 차이 기준 (기본 0.04)
+
+사용 예시:
+    fast = HeroineIntentFastClassifier()
+    intent, margin = fast.predict("네 고향은 어디야?")
+    # -> ("scenario_inquiry", 0.07)
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.prototype_store import load_prototype_vectors
+
+HEROINE_INTENT_FAST_PATH = os.getenv("HEROINE_INTENT_FAST_PATH", "true").lower() == "true"
+HEROINE_INTENT_FAST_MARGIN = float(os.getenv("HEROINE_INTENT_FAST_MARGIN", "0.04"))
+
+# 맥락(직전 대화)을 봐야 의미가 정해지는 지시어
+DEICTIC_WORDS = ["그때", "그거", "그건", "그게", "그 얘기", "그 이야기", "방금", "아까", "그래서"]
+
+# 의도별 프로토타입 문장
+INTENT_PROTOTYPES: Dict[str, List[str]] = {
+    "general": [
+        "안녕",
+        "안녕, 오늘 기분 어때?",
+        "오늘 날씨 좋다",
+        "배고프다",
+        "같이 산책할래?",
+        "고마워",
+        "미안해",
+        "너 정말 귀엽다",
+        "오늘 던전 힘들었어",
+        "좀 쉬고 싶어",
+        "뭐 하고 있었어?",
+        "졸려",
+        "심심해",
+        "잘 자",
+        "내일 또 올게",
+        "너 좋아해",
+        "화났어?",
+        "밥 먹었어?",
+        "오늘 훈련은 어땠어?",
+        "이 검 멋지지 않아?",
+    ],
+    "memory_recall": [
+        "어제 우리 뭐 했는지 기억나?",
+        "지난번에 내가 뭐라고 했지?",
+        "우리 처음 만났을 때 기억나?",
+        "전에 내가 좋아한다고 한 음식 기억해?",
+        "저번에 같이 던전 갔던 거 기억나?",
+        "내가 예전에 했던 말 기억나?",
+        "우리 지난주에 무슨 얘기 했었지?",
+        "내 이름 기억해?",
+        "내가 전에 선물 준 거 기억나?",
+        "우리가 같이 했던 일 중에 뭐가 제일 기억에 남아?",
+        "루파메스 어때?",
+        "레티아를 어떻게 생각해?",
+        "로코는 어떤 애야?",
+        "다른 히로인들은 어때?",
+        "내가 무서워한다고 했던 거 기억나?",
+    ],
+    "scenario_inquiry": [
+        "네 고향은 어디야?",
+        "어린 시절 얘기 해줘",
+        "가족은 어떻게 됐어?",
+        "기억을 잃기 전에는 뭐 했어?",
+        "최근에 돌아온 기억 있어?",
+        "새로 기억난 거 있어?",
+        "넌 원래 어떤 사람이었어?",
+        "네 과거가 궁금해",
+        "부모님은 기억나?",
+        "왜 기억을 잃은 거야?",
+        "예전에 어디서 살았어?",
+        "너는 누구야?",
+        "검은 누구한테 배웠어?",
+        "어릴 때 꿈이 뭐였어?",
+        "잃어버린 기억 중에 떠오른 거 있어?",
+    ],
+    "heroine_recall": [
+        "루파메스랑 뭐 얘기했어?",
+        "레티아와 무슨 대화 했어?",
+        "로코한테 뭐라고 했어?",
+        "루파메스가 너한테 뭐라고 했어?",
+        "레티아랑 무슨 얘기 나눴어?",
+        "로코랑 대화했다며? 무슨 얘기였어?",
+        "아까 루파메스랑 얘기하던데 뭐였어?",
+        "다른 애들이랑 무슨 얘기 했어?",
+        "레티아가 내 얘기 했어?",
+        "로코가 너한테 무슨 말 했어?",
+        "루파메스랑 싸웠어?",
+        "히로인들끼리 무슨 얘기 해?",
+    ],
+}
+
+
+def _load_embedding_model():
+    """BGE-M3 모델 로드
+
+    model_registry의 인스턴스를 정령 상호작용(IsItemUseEmbeddingLogic)과 공유하여
+    같은 프로세스에 모델을 두 번 올리지 않습니다.
+    """
+    from core.model_registry import model_registry
+
+    return model_registry.get("bge_m3")
+
+
+class HeroineIntentFastClassifier:
+    """프로토타입 벡터 기반 히로인 의도 분류기
+
+    의도별 예시 문장의 평균 벡터(정규화)를 프로토타입으로 두고,
+    입력 문장과의 코사인 유사도가 가장 높은 의도를 고릅니다.
+    모델은 첫 predict 호출 때 로드하고, 예시 문장 벡터는 model_cache/prototypes에 저장해 재사용합니다.
+    """
+
+    def __init__(
+        self,
+        margin: float = HEROINE_INTENT_FAST_MARGIN,
+        prototypes: Optional[Dict[str, List[str]]] = None,
+        embedding_model=None,
+    ):
+        self.margin = margin
+        self.prototypes = prototypes or INTENT_PROTOTYPES
+        self._model = embedding_model
+        # 기본 BGE-M3를 쓸 때만 예시 문장 벡터를 파일로 저장/재사용 (주입된 모델은 매번 계산)
+        self._persist = embedding_model is None
+        self._labels: List[str] = list(self.prototypes.keys())
+        self._matrix: Optional[np.ndarray] = None  # (의도 수, 차원)
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        vecs = np.asarray(self._model.encode(texts)["dense_vecs"], dtype=np.float32)
+        return vecs / (np.linalg.norm(vecs, axis=1, keepdims=True) + 1e-8)
+
+    def _ensure_loaded(self) -> None:
+        if self._matrix is not None:
+            return
+        if self._model is None:
+            self._model = _load_embedding_model()
+
+        centroids = []
+        for label in self._labels:
+            sentences = self.prototypes[label]
+            if self._persist:
+                vecs = load_prototype_vectors("bge_m3", sentences, self._encode)
+            else:
+                vecs = self._encode(sentences)
+            centroid = vecs.mean(axis=0)
+            centroids.append(centroid / (np.linalg.norm(centroid) + 1e-8))
+        self._matrix = np.stack(centroids)
+
+    def scores(self, user_message: str) -> Dict[str, float]:
+        """의도별 코사인 유사도"""
+        self._ensure_loaded()
+        vec = self._encode([user_message])[0]
+        sims = self._matrix @ vec
+        return {label: float(sim) for label, sim in zip(self._labels, sims)}
+
+    def predict(self, user_message: str) -> Tuple[Optional[str], float]:
+        """의도 예측
+
+        Args:
+            user_message: 사용자 메시지
+
+        Returns:
+            (의도 또는 None, margin). margin이 기준 미만이면 의도는 None
+        """
+        ranked = sorted(self.scores(user_message).items(), key=lambda x: x[1], reverse=True)
+        (best, best_sim), (_, second_sim) = ranked[0], ranked[1]
+        margin = best_sim - second_sim
+
+        if margin < self.margin:
+            return None, margin
+        return best, margin
+
+    @staticmethod
+    def needs_context(user_message: str, recently_unlocked=None) -> bool:
+        """맥락 없이 분류하면 안 되는 메시지인지 (True면 LLM으로)"""
+        if recently_unlocked:
+            return True
+        return any(word in user_message for word in DEICTIC_WORDS)
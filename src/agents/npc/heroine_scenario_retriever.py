@@ -91,7 +91,7 @@ class HeroineScenarioRetriever:
         """
         # 1. 꼬리질문 + recently_unlocked 존재
         if recently_unlocked and self._is_follow_up_question(user_message):
-            scenario = self._get_unlocked_scenario(npc_id, recently_unlocked)
+            scenario = await self._get_unlocked_scenario(npc_id, recently_unlocked)
             if scenario:
                 print(
                     f"[DEBUG] 꼬리질문 감지 - recently_unlocked_memory 시나리오 반환: {scenario.get('title', 'N/A')}"
@@ -100,7 +100,7 @@ class HeroineScenarioRetriever:
 
         # 2. 최근 기억 질문
         if self._is_recent_memory_question(user_message):
-            latest_scenario = heroine_scenario_service.get_latest_unlocked_scenario(
+            latest_scenario = await heroine_scenario_service.get_latest_unlocked_scenario(
                 heroine_id=npc_id,
                 max_memory_progress=memory_progress,
             )
@@ -112,7 +112,7 @@ class HeroineScenarioRetriever:
             return "해금된 시나리오 없음"
 
         # 3. 일반 시나리오 질문 - PGroonga + Vector 하이브리드 검색
-        scenarios = heroine_scenario_service.search_scenarios_pgroonga(
+        scenarios = await heroine_scenario_service.search_scenarios_pgroonga(
             query=user_message,
             heroine_id=npc_id,
             max_memory_progress=memory_progress,
@@ -148,7 +148,7 @@ class HeroineScenarioRetriever:
         """
         return any(keyword in message for keyword in self.FOLLOW_UP_KEYWORDS)
 
-    def _get_unlocked_scenario(
+    async def _get_unlocked_scenario(
         self, npc_id: int, recently_unlocked: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
         """해금된 시나리오 조회
@@ -164,7 +164,7 @@ class HeroineScenarioRetriever:
         if unlocked_progress is None:
             return None
 
-        return heroine_scenario_service.get_scenario_by_exact_progress(
+        return await heroine_scenario_service.get_scenario_by_exact_progress(
             heroine_id=npc_id, memory_progress=unlocked_progress
         )
 
@@ -15,6 +15,7 @@ HeroineAgent와 SageAgent가 공통으로 사용하는 기억 검색 로직을 
 - 테스트 코드 중복
 """
 
+import asyncio
 import re
 from datetime import datetime
 from typing import Optional, List, Dict, Any
@@ -52,8 +53,8 @@ class MemoryRetriever:
         # 시간 키워드 기반 검색 (비동기)
         memories = await retriever.search_by_time_keyword("어제 뭐 했어?", player_id=1, npc_id=1)
 
-        # NPC-NPC 대화 기억 검색
-        npc_memories = retriever.search_npc_npc_memories("루파메스 어때?", player_id=1, current_npc_id=1)
+        # NPC-NPC 대화 기억 검색 (비동기)
+        npc_memories = await retriever.search_npc_npc_memories("루파메스 어때?", player_id=1, current_npc_id=1)
     """
 
     def __init__(self, weights: SearchWeights = None):
@@ -119,20 +120,23 @@ class MemoryRetriever:
         Returns:
             검색된 기억 리스트 (각 항목은 dict)
         """
+        # 시간 키워드 조회는 동기 엔진을 쓰므로 스레드에서 실행 (이벤트 루프 블로킹 방지)
         # 정규식 패턴 미리 컴파일
         days_ago_match = re.search(r"(\d+)\s*일\s*전", user_message)
 
         # 1. "어제"
         if "어제" in user_message:
             print("[MEMORY_FUNC] get_memories_days_ago_sync(1)")
-            return user_memory_manager.get_memories_days_ago_sync(
+            return await asyncio.to_thread(
+                user_memory_manager.get_memories_days_ago_sync,
                 player_id, npc_id, days_ago=1, limit=5
             )
 
         # 2. "그제", "그저께"
         if "그제" in user_message or "그저께" in user_message:
             print("[MEMORY_FUNC] get_memories_days_ago_sync(2)")
-            return user_memory_manager.get_memories_days_ago_sync(
+            return await asyncio.to_thread(
+                user_memory_manager.get_memories_days_ago_sync,
                 player_id, npc_id, days_ago=2, limit=5
             )
 
@@ -140,28 +144,32 @@ class MemoryRetriever:
         if days_ago_match:
             days = int(days_ago_match.group(1))
             print(f"[MEMORY_FUNC] get_memories_days_ago_sync({days})")
-            return user_memory_manager.get_memories_days_ago_sync(
+            return await asyncio.to_thread(
+                user_memory_manager.get_memories_days_ago_sync,
                 player_id, npc_id, days_ago=days, limit=5
             )
 
         # 4. "최근", "요즘", "며칠"
         if re.search(r"(최근|요즘|며칠)", user_message):
             print("[MEMORY_FUNC] get_recent_memories_sync(7)")
-            return user_memory_manager.get_recent_memories_sync(
+            return await asyncio.to_thread(
+                user_memory_manager.get_recent_memories_sync,
                 player_id, npc_id, days=7, limit=5
             )
 
         # 5. 취향 변화 히스토리 (SageAgent에서 사용)
         if re.search(r"(바뀌|변하|전에는|바꼈|바뀐|변했)", user_message):
             print("[MEMORY_FUNC] get_preference_history_sync")
-            return user_memory_manager.get_preference_history_sync(
+            return await asyncio.to_thread(
+                user_memory_manager.get_preference_history_sync,
                 player_id, npc_id, user_message
             )
 
         # 6. "전부", "다", "모든", "기억하는 거"
         if re.search(r"(전부|다\s|모든|기억하는\s*거)", user_message):
             print("[MEMORY_FUNC] get_valid_memories_sync")
-            return user_memory_manager.get_valid_memories_sync(
+            return await asyncio.to_thread(
+                user_memory_manager.get_valid_memories_sync,
                 player_id, npc_id, limit=10
             )
 
@@ -173,7 +181,8 @@ class MemoryRetriever:
             year = datetime.now().year
             point_in_time = datetime(year, month, day)
             print(f"[MEMORY_FUNC] get_memories_at_point_sync({month}/{day})")
-            return user_memory_manager.get_memories_at_point_sync(
+            return await asyncio.to_thread(
+                user_memory_manager.get_memories_at_point_sync,
                 player_id, npc_id, point_in_time, limit=5
             )
 
@@ -185,7 +194,8 @@ class MemoryRetriever:
             print(
                 f"[MEMORY_FUNC] get_memories_at_point_sync(지지난주 {week_match_2.group(1)}요일)"
             )
-            return user_memory_manager.get_memories_at_point_sync(
+            return await asyncio.to_thread(
+                user_memory_manager.get_memories_at_point_sync,
                 player_id, npc_id, point_in_time, limit=5
             )
 
@@ -197,7 +207,8 @@ class MemoryRetriever:
             print(
                 f"[MEMORY_FUNC] get_memories_at_point_sync(지난주 {week_match_1.group(1)}요일)"
             )
-            return user_memory_manager.get_memories_at_point_sync(
+            return await asyncio.to_thread(
+                user_memory_manager.get_memories_at_point_sync,
                 player_id, npc_id, point_in_time, limit=5
             )
 
@@ -249,7 +260,7 @@ class MemoryRetriever:
 
         return None
 
-    def search_npc_npc_memories(
+    async def search_npc_npc_memories(
         self, user_message: str, player_id: int, current_npc_id: int
     ) -> List[Dict[str, Any]]:
         """다른 NPC와의 장기 기억 검색 (npc_npc_memories 테이블)
@@ -275,7 +286,7 @@ class MemoryRetriever:
             return []
 
         print(f"[NPC_NPC_MEMORY] search_memories: current={current_npc_id}, other={other_id}")
-        return npc_npc_memory_manager.search_memories(
+        return await npc_npc_memory_manager.search_memories(
             player_id=str(player_id),
             npc1_id=int(current_npc_id),
             npc2_id=int(other_id),
@@ -283,7 +294,7 @@ class MemoryRetriever:
             limit=3,
         )
 
-    def get_latest_npc_conversation(
+    async def get_latest_npc_conversation(
         self, player_id: int, npc1_id: int, npc2_id: int
     ) -> List[Dict[str, Any]]:
         """다른 NPC와의 최근 대화 검색 (npc_npc_checkpoints 테이블)
@@ -304,7 +315,7 @@ class MemoryRetriever:
         - "다른 히로인과 뭐 얘기했어?" 질문에 구체적 답변 불가
         """
         print(f"[NPC_NPC_CHECKPOINT] get_latest: npc1={npc1_id}, npc2={npc2_id}")
-        return npc_npc_memory_manager.get_latest_checkpoint_conversation(
+        return await npc_npc_memory_manager.get_latest_checkpoint_conversation(
             player_id=str(player_id),
             npc1_id=int(npc1_id),
             npc2_id=int(npc2_id),
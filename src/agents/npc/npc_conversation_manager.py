@@ -202,7 +202,7 @@ class NPCConversationManager:
                 )
 
             # DB에 요약 저장
-            session_checkpoint_manager.save_summary(player_id, npc_id, summary_list)
+            await session_checkpoint_manager.save_summary(player_id, npc_id, summary_list)
 
             print(f"[DEBUG] 요약 생성 완료: player={player_id}, npc={npc_id}")
 
@@ -1,4 +1,4 @@
-from typing import TypedDict, List, Optional, Literal
+from typing import Annotated, Dict, TypedDict, List, Optional, Literal
 from langchain_core.messages import BaseMessage
 from enum import StrEnum
 
@@ -36,6 +36,11 @@ class EmotionType(StrEnum):
     MYSTERIOUS = "mysterious"  # 6
 
 
+def merge_timings(left: Dict[str, float], right: Dict[str, float]) -> Dict[str, float]:
+    """노드별 소요시간 병합 (LangGraph 리듀서)"""
+    return {**(left or {}), **(right or {})}
+
+
 class RecentlyUnlockedMemory(TypedDict):
     """최근 해금된 기억 정보 (꼬리질문 처리용)
 
@@ -101,6 +106,9 @@ class HeroineState(NPCState):
         RecentlyUnlockedMemory
     ]  # 최근 해금된 기억 (TTL 기반)
 
+    # 노드별 소요시간(초). 각 노드가 자기 항목만 반환하면 병합됨
+    node_timings: Annotated[Dict[str, float], merge_timings]
+
 
 class SageState(NPCState):
     """대현자 NPC 상태 (NPCState 확장)"""
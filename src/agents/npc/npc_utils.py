@@ -7,7 +7,7 @@ NPC Agent 공통 유틸리티 함수
 import json
 import yaml
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 
 def parse_llm_json_response(content: str, default: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -48,6 +48,173 @@ def parse_llm_json_response(content: str, default: Dict[str, Any] = None) -> Dic
         return default
 
 
+_SIMPLE_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+class StreamingJsonFieldParser:
+    """토큰 단위로 들어오는 LLM JSON 응답에서 필드를 점진적으로 추출합니다.
+
+    NPC 응답은 {"thought": ..., "text": ..., "emotion": ...} 형태의
+    평탄한 JSON이므로, 최상위 키만 추적하는 작은 상태 기계로 처리합니다.
+    ```json 코드 블록 등 '{' 이전의 텍스트는 무시합니다.
+
+    - feed(): 새 청크를 넣고, stream_field 값 중 새로 확정된 부분을 반환
+    - fields: 값이 완성된 최상위 필드 (문자열/숫자/불리언)
+
+    최종 결과는 기존처럼 parse_llm_json_response로 다시 파싱하고,
+    이 파서는 클라이언트에 먼저 보낼 텍스트 조각을 뽑는 용도로만 씁니다.
+
+    Examples:
+        >>> parser = StreamingJsonFieldParser("text")
+        >>> parser.feed('{"thought": "...", "text": "안녕')
+        '안녕'
+        >>> parser.feed('하세요", "emotion": "joy"}')
+        '하세요'
+        >>> parser.fields["emotion"]
+        'joy'
+    """
+
+    def __init__(self, stream_field: str = "text"):
+        self.stream_field = stream_field
+        self.fields: Dict[str, Any] = {}
+        self.done = False
+
+        self._state = "seek"  # seek/key_wait/key/colon/value_wait/string/scalar/nested
+        self._key = ""
+        self._chars: List[str] = []
+        self._escape: Optional[str] = None  # 진행 중인 escape 시퀀스 ("\\" 이후 문자들)
+        self._nested_depth = 0
+        self._nested_in_string = False
+
+    def _read_escape(self, c: str) -> Optional[str]:
+        """escape 시퀀스에 문자를 추가하고, 완성되면 디코딩된 문자를 반환"""
+        self._escape += c
+        if self._escape[0] != "u":
+            decoded = _SIMPLE_ESCAPES.get(self._escape, self._escape)
+            self._escape = None
+            return decoded
+        if len(self._escape) < 5:
+            return None
+        try:
+            decoded = chr(int(self._escape[1:], 16))
+        except ValueError:
+            decoded = ""
+        self._escape = None
+        return decoded
+
+    def _finish_scalar(self) -> None:
+        raw = "".join(self._chars).strip()
+        try:
+            self.fields[self._key] = json.loads(raw)
+        except json.JSONDecodeError:
+            self.fields[self._key] = raw
+
+    def feed(self, chunk: str) -> str:
+        """청크를 처리하고 stream_field의 새 텍스트 조각을 반환
+
+        Args:
+            chunk: LLM 스트리밍 청크 문자열
+
+        Returns:
+            이번 청크에서 새로 확정된 stream_field 텍스트 (없으면 빈 문자열)
+        """
+        delta: List[str] = []
+
+        for c in chunk:
+            if self.done:
+                break
+
+            state = self._state
+            if state == "seek":
+                if c == "{":
+                    self._state = "key_wait"
+
+            elif state == "key_wait":
+                if c == '"':
+                    self._chars = []
+                    self._state = "key"
+                elif c == "}":
+                    self.done = True
+
+            elif state in ("key", "string"):
+                if self._escape is not None:
+                    decoded = self._read_escape(c)
+                    if decoded is None:
+                        continue
+                elif c == "\\":
+                    self._escape = ""
+                    continue
+                elif c == '"':
+                    value = "".join(self._chars)
+                    if state == "key":
+                        self._key = value
+                        self._state = "colon"
+                    else:
+                        self.fields[self._key] = value
+                        self._state = "key_wait"
+                    continue
+                else:
+                    decoded = c
+
+                self._chars.append(decoded)
+                if state == "string" and self._key == self.stream_field:
+                    delta.append(decoded)
+
+            elif state == "colon":
+                if c == ":":
+                    self._state = "value_wait"
+
+            elif state == "value_wait":
+                if c == '"':
+                    self._chars = []
+                    self._state = "string"
+                elif c in "{[":
+                    self._nested_depth = 1
+                    self._nested_in_string = False
+                    self._state = "nested"
+                elif not c.isspace():
+                    self._chars = [c]
+                    self._state = "scalar"
+
+            elif state == "scalar":
+                if c in ",}":
+                    self._finish_scalar()
+                    self._state = "key_wait"
+                    if c == "}":
+                        self.done = True
+                else:
+                    self._chars.append(c)
+
+            elif state == "nested":
+                # 중첩 값은 저장하지 않고 끝까지 건너뜀
+                if self._nested_in_string:
+                    if self._escape is not None:
+                        self._escape = None
+                    elif c == "\\":
+                        self._escape = ""
+                    elif c == '"':
+                        self._nested_in_string = False
+                elif c == '"':
+                    self._nested_in_string = True
+                elif c in "{[":
+                    self._nested_depth += 1
+                elif c in "}]":
+                    self._nested_depth -= 1
+                    if self._nested_depth == 0:
+                        self._state = "key_wait"
+
+        return "".join(delta)
+
+
 def load_persona_yaml(persona_file_name: str, default_persona_func=None) -> Dict[str, Any]:
     """페르소나 YAML 파일을 로드합니다.
     
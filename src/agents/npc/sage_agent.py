@@ -27,6 +27,8 @@ from datetime import datetime
 from typing import Dict, Any
 
 from langchain.chat_models import init_chat_model
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import merge_configs
 from langgraph.graph import START, END, StateGraph
 
 from agents.npc.npc_state import SageState
@@ -316,7 +318,7 @@ class SageAgent(BaseNPCAgent):
         print(f"[TIMING] 시나리오 검색: {time.time() - t:.3f}s")
         return {"unlocked_scenarios": scenarios}
 
-    async def _generate_node(self, state: SageState) -> dict:
+    async def _generate_node(self, state: SageState, config: RunnableConfig) -> dict:
         """응답 생성 노드 - SagePromptBuilder 사용"""
         t = time.time()
 
@@ -326,7 +328,7 @@ class SageAgent(BaseNPCAgent):
         }
 
         npc_id = state["npc_id"]
-        time_since_last_chat = self.get_time_since_last_chat(state["player_id"], npc_id)
+        time_since_last_chat = await self.get_time_since_last_chat(state["player_id"], npc_id)
 
         prompt = self.prompt_builder.build(
             state=state,
@@ -338,7 +340,7 @@ class SageAgent(BaseNPCAgent):
 
         print(f"[PROMPT]\n{prompt}\n{'='*50}")
 
-        config = tracker.get_langfuse_config(
+        langfuse_config = tracker.get_langfuse_config(
             tags=["npc", "sage", "response"],
             session_id=state.get("session_id"),
             user_id=state.get("user_id"),
@@ -349,7 +351,10 @@ class SageAgent(BaseNPCAgent):
             }
         )
 
-        response = await self.llm.ainvoke(prompt, **config)
+        # 그래프 config(콜백)와 병합해야 astream_events로 토큰이 전달됨
+        response = await self.llm.ainvoke(
+            prompt, config=merge_configs(config, langfuse_config.get("config"))
+        )
         print(f"[TIMING] LLM 호출: {time.time() - t:.3f}s")
 
         result = parse_llm_json_response(
@@ -389,6 +394,10 @@ class SageAgent(BaseNPCAgent):
     # 공개 메서드
     # ============================================
 
+    def _emotion_to_int(self, emotion: str) -> int:
+        """감정 문자열 -> 정수 (스트리밍 emotion 이벤트용)"""
+        return sage_emotion_to_int(emotion)
+
     async def process_message(self, state: SageState) -> SageState:
         """메시지 처리 (비스트리밍)"""
         result = await self.graph.ainvoke(state)
@@ -1,22 +1,33 @@
 import os
 import re
+import json
 import time
+import uuid
+import asyncio
 import wave
 import logging
 from logging.handlers import RotatingFileHandler
 import tempfile
-from contextlib import asynccontextmanager
 from datetime import datetime
-import whisper
 import numpy as np
-from fastapi import FastAPI, UploadFile, File, HTTPException, Body, Request, APIRouter
+from fastapi import UploadFile, File, HTTPException, Body, Request, APIRouter, WebSocket, WebSocketDisconnect
 from fastapi.responses import JSONResponse
 
+from tools.audio.stt_worker import stt_worker, STTBusyError, STTUnavailableError
+from tools.audio.vad import EnergyVAD, SAMPLE_RATE
+from tools.audio.stt_correction import domain_corrector
+
 SAVE_UPLOADS = True                      
 UPLOAD_DIR = os.getenv("UPLOAD_DIR", "./uploads")  
 LOG_DIR = os.getenv("LOG_DIR", "./logs")
 LOG_FILE = os.path.join(LOG_DIR, "stt_app.log")
 
+# WebSocket 스트리밍 STT 설정
+STT_WS_SILENCE_MS = int(os.getenv("STT_WS_SILENCE_MS", "600"))        # 이만큼 조용하면 구간 종료
+STT_WS_PARTIAL_MS = int(os.getenv("STT_WS_PARTIAL_MS", "0"))           # 부분 인식 간격 (0이면 끔, 기본 끔)
+STT_WS_MIN_SEGMENT_MS = int(os.getenv("STT_WS_MIN_SEGMENT_MS", "300"))  # 이보다 짧은 구간은 버림 (잡음)
+STT_WS_MAX_SEGMENT_MS = int(os.getenv("STT_WS_MAX_SEGMENT_MS", "15000"))
+
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 os.makedirs(LOG_DIR, exist_ok=True)
 
@@ -51,16 +62,29 @@ def _make_save_path(prefix: str, original_name: str, ext: str) -> str:
     return os.path.join(UPLOAD_DIR, f"{prefix}_{ts}_{base}{ext}")
 
 router = APIRouter(prefix="/stt", tags=["stt"])
-model = whisper.load_model("large")
-# @asynccontextmanager
-# async def lifespan(app: FastAPI):
-#     logger.info("Starting up... warming up whisper model")
-#     dummy = np.zeros(16000, dtype=np.float32)
-#     t0 = time.perf_counter()
-#     _ = model.transcribe(dummy, language="ko")
-#     logger.info(f"Warmup done in {time.perf_counter() - t0:.3f}s")
-#     yield
-#     logger.info("Shutting down...")
+
+# whisper 모델은 stt_worker의 전용 스레드에서 로드/실행 (이벤트 루프를 막지 않음)
+# 워밍업은 main.py lifespan에서 stt_worker.start()로 수행
+
+
+async def _transcribe(rid: str, audio):
+    """STT 워커에 요청. 대기열이 가득 차면 503 (클라이언트는 Retry-After 후 재시도)"""
+    try:
+        return await stt_worker.transcribe(audio, language="ko")
+    except STTBusyError as e:
+        logger.warning(f"[{rid}] stt busy: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="STT busy, retry later",
+            headers={"Retry-After": "1"},
+        )
+    except STTUnavailableError as e:
+        logger.error(f"[{rid}] stt unavailable: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="STT unavailable",
+            headers={"Retry-After": "30"},
+        )
 
 
 _CJK_OR_KANA = re.compile(r'[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]')
@@ -93,58 +117,39 @@ def _is_suspicious_segment(seg: dict) -> bool:
         return True
     return False
 
-DOMAIN_REPLACE_MAP = {
-    # 몬스터 / 시스템
-    "공격복종": "공략법좀",
-    "저 모니터": "저 몬스터",
-    "다음 번 뭐야?": "다음방 뭐야?",
-    "인벤트로" : "인벤토리",
-
-    #아이템
-    "고급 등기": "고급 둔기",
-    "일반 등기": "일반 둔기",
-    "우리 둔질": "고급 둔기",
-    "보급 등기": "고급 둔기",
-    "9급 둔기": "고급 둔기",
-    "1반 쌍검": "일반 쌍검",
-    "1번 쌍검": "일반 쌍검",
-    '고무 누워프':'고급 드워프',
-    '고급 두업으로':'고급 드워프',
-    '고급 드로크':'고급 드워프',
-    '양솜에서':'양손 메서',
-    '고급한 손검': '고급 한손검',
-    '1번 한손검':'일반 한손검',
-    '레어스 숏소드': '레어 숏소드',
-    '쇼스토드':'숏소드',
-    '1번 도어퍼':'일반 드워프',
-    '9급':'고급',
-    '드래곤 플레이어':'드래곤 슬레이어',
-    '슬레이오':'슬레이어',
-    '레오상검': '레어 쌍검',
-    '고급 상품': '고급 쌍검',
-    '고급 더프의 망치':'고급 드워프의 망치',
-    '한 손 검':'한손검',
-    '부어프':'드워프',
-    '궁극 두어프': '고급 드워프',
-        
-    # UI / 명령
-    "물 좀 켜줄래?": "불좀 켜줄래?",
-    "불좀 구워줄래?": "불좀 켜줄래?"
-    
-    #캐릭터
-    #기타 
-}
-
+# 도메인 단어 보정 (치환 사전 data/stt_domain_replace.json + 게임 이름 퍼지 매칭)
+# 사전 파일을 수정하면 재시작 없이 반영됨
 def _domain_replace(text: str) -> str:
     if not text:
         return ""
 
-    t = text
-    for src, dst in DOMAIN_REPLACE_MAP.items():
-        if src in t:
-            t = t.replace(src, dst)
+    return domain_corrector.correct(text)
+
+def _postprocess(result: dict):
+    """whisper 결과 -> (transferText, isValid)
+
+    의심 세그먼트 제거 -> 도메인 치환 -> 유효성 검사 (wav/pcm/ws 공통)
+    """
+    final_text = " ".join(
+        seg["text"].strip()
+        for seg in result.get("segments", [])
+        if not _is_suspicious_segment(seg)
+    ).strip()
 
-    return t
+    transfer_text = _domain_replace(final_text)
+    is_valid = bool(transfer_text) and _is_valid_text(transfer_text)
+    return transfer_text, is_valid
+
+def _save_pcm_wav(rid: str, prefix: str, pcm: bytes) -> str:
+    """int16 16kHz mono PCM을 wav로 저장 (확인용)"""
+    saved_path = _make_save_path(prefix, "mic_stream", ".wav")
+    with wave.open(saved_path, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)      # int16
+        wf.setframerate(16000)  # 너희 포맷 가정 (16kHz mono)
+        wf.writeframes(pcm)
+    logger.info(f"[{rid}] saved pcm wav -> {saved_path}")
+    return saved_path
 
 @router.post("/wav")
 async def stt_wav(request: Request, file: UploadFile = File(...)):
@@ -171,23 +176,17 @@ async def stt_wav(request: Request, file: UploadFile = File(...)):
 
     # 3️⃣ STT
     t0 = time.perf_counter()
-    result = model.transcribe(tmp_path, language="ko")
-    segments = result.get("segments", [])
-
-    final_text = " ".join(
-        seg["text"].strip()
-        for seg in segments
-        if not _is_suspicious_segment(seg)
-    ).strip()
-
+    try:
+        result = await _transcribe(rid, tmp_path)
+    finally:
+        os.remove(tmp_path)
     dur = time.perf_counter() - t0
-    transfer_text = _domain_replace(final_text)
+    transfer_text, is_valid = _postprocess(result)
 
     logger.info(
-        f"[{rid}] transcribe done in {dur:.3f}s text_len={len(final_text)}"
+        f"[{rid}] transcribe done in {dur:.3f}s text_len={len(transfer_text)}"
     )
 
-    is_valid = bool(transfer_text) and _is_valid_text(transfer_text)
     saved_path = None
 
     if SAVE_UPLOADS:
@@ -214,35 +213,215 @@ async def stt_pcm(request: Request, pcm: bytes = Body(...)):
     try:
         # PCM을 wav로 저장(확인용)
         if SAVE_UPLOADS:
-            saved_path = _make_save_path("pcm", "mic_stream", ".wav")
-            with wave.open(saved_path, "wb") as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)      # int16
-                wf.setframerate(16000)  # 너희 포맷 가정 (16kHz mono)
-                wf.writeframes(pcm)
-            logger.info(f"[{rid}] saved pcm wav -> {saved_path}")
+            saved_path = _save_pcm_wav(rid, "pcm", pcm)
 
         audio = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
 
         t0 = time.perf_counter()
-        result = model.transcribe(audio, language="ko")
+        result = await _transcribe(rid, audio)
         dur = time.perf_counter() - t0
 
-        segments = result.get("segments", [])
-        final_text = " ".join(
-        seg["text"].strip()
-        for seg in segments
-            if not _is_suspicious_segment(seg)
-        ).strip()
-
-        transfer_text =  _domain_replace(final_text)
-        is_valid = bool(transfer_text) and _is_valid_text(transfer_text)
+        transfer_text, is_valid = _postprocess(result)
         logger.info(f"[{rid}] transcribe done in {dur:.3f}s text_len={len(transfer_text)}")
 
         return JSONResponse({
             "transferText": transfer_text,
             "isValid":is_valid
         })
+    except HTTPException:
+        raise
     except Exception:
         logger.exception(f"[{rid}] /stt_pcm failed")
-        raise
\ No newline at end of file
+        raise
+
+
+class _StreamSession:
+    """WebSocket STT 세션 (발화 단위 상태)
+
+    - 수신 루프: PCM 프레임을 VAD에 넣고, 닫힌 구간을 segment_queue에 넣음
+    - 구간 처리 태스크: 구간을 순서대로 전사해서 segment 이벤트 전송
+    - 부분 인식: 진행 중 구간이 STT_WS_PARTIAL_MS만큼 자랄 때마다 한 번씩 (동시에 1개만)
+    """
+
+    def __init__(self, websocket: WebSocket, rid: str):
+        self.websocket = websocket
+        self.rid = rid
+        self.send_lock = asyncio.Lock()
+        self.segment_queue: asyncio.Queue = asyncio.Queue()
+        self.reset()
+
+    def reset(self) -> None:
+        self.vad = EnergyVAD(
+            silence_ms=STT_WS_SILENCE_MS,
+            max_segment_ms=STT_WS_MAX_SEGMENT_MS,
+        )
+        self.pcm = bytearray()
+        self.texts = []
+        self.segment_index = 0
+        self.partial_task = None
+        self.partial_samples = 0
+        self.utterance_start = time.perf_counter()
+
+    async def send(self, payload: dict) -> None:
+        async with self.send_lock:
+            await self.websocket.send_text(json.dumps(payload, ensure_ascii=False))
+
+    # ============================================
+    # 수신 처리
+    # ============================================
+
+    def feed(self, pcm: bytes) -> None:
+        if SAVE_UPLOADS:
+            self.pcm.extend(pcm)
+
+        for segment in self.vad.feed(pcm):
+            self._enqueue_segment(segment)
+
+        if STT_WS_PARTIAL_MS > 0:
+            self._maybe_partial()
+
+    def _enqueue_segment(self, segment: np.ndarray) -> None:
+        if len(segment) < SAMPLE_RATE * STT_WS_MIN_SEGMENT_MS // 1000:
+            return
+        # 구간이 닫히면 진행 중이던 부분 인식 결과는 의미가 없음
+        # (대기열에 있던 부분 인식은 워커가 디코딩 전에 버림)
+        if self.partial_task and not self.partial_task.done():
+            self.partial_task.cancel()
+        self.partial_samples = 0
+        self.segment_queue.put_nowait(("segment", self.segment_index, segment, self.texts))
+        self.segment_index += 1
+
+    def finish(self) -> None:
+        """발화 종료: 남은 구간을 닫고 final 요청"""
+        rest = self.vad.flush()
+        if rest is not None:
+            self._enqueue_segment(rest)
+        if self.partial_task and not self.partial_task.done():
+            self.partial_task.cancel()
+        self.segment_queue.put_nowait(("final", bytes(self.pcm), self.texts, self.utterance_start))
+        self.reset()
+
+    def _maybe_partial(self) -> None:
+        current = self.vad.current_segment()
+        if current is None:
+            return
+        if len(current) - self.partial_samples < SAMPLE_RATE * STT_WS_PARTIAL_MS // 1000:
+            return
+        if self.partial_task and not self.partial_task.done():
+            return
+        self.partial_samples = len(current)
+        self.partial_task = asyncio.create_task(self._partial(self.segment_index, current))
+
+    async def _partial(self, index: int, audio: np.ndarray) -> None:
+        # 태스크 결과를 아무도 await 하지 않으므로 예외는 여기서 모두 처리
+        try:
+            result = await stt_worker.transcribe(audio, language="ko")
+            if index != self.segment_index:
+                return
+            text, is_valid = _postprocess(result)
+            if text and is_valid:
+                await self.send({"type": "partial", "index": index, "text": text})
+        except STTBusyError:
+            # 부분 인식은 생략 가능 (최종 구간 전사를 우선)
+            return
+        except Exception as e:
+            # 같은 구간은 닫힐 때 다시 전사하므로 로그만 남김
+            logger.warning(f"[{self.rid}] ws partial {index} failed: {e}")
+
+    # ============================================
+    # 구간 전사 (순서 보장)
+    # ============================================
+
+    async def run_segments(self) -> None:
+        while True:
+            item = await self.segment_queue.get()
+            try:
+                if item[0] == "segment":
+                    await self._transcribe_segment(*item[1:])
+                else:
+                    await self._send_final(*item[1:])
+            except Exception:
+                # 한 구간이 실패해도 세션은 유지 (다음 구간 / final은 계속 처리)
+                logger.exception(f"[{self.rid}] ws {item[0]} failed")
+                payload = {"type": "error", "message": "STT failed"}
+                if item[0] == "segment":
+                    payload["index"] = item[1]
+                try:
+                    await self.send(payload)
+                except Exception:
+                    # 연결이 끊겼으면 더 보낼 곳이 없음
+                    return
+
+    async def _transcribe_segment(self, index: int, audio: np.ndarray, texts: list) -> None:
+        # texts: 구간이 속한 발화의 텍스트 리스트 (finish 후 reset되어도 해당 발화에 누적)
+        t0 = time.perf_counter()
+        try:
+            result = await stt_worker.transcribe(audio, language="ko")
+        except STTBusyError as e:
+            logger.warning(f"[{self.rid}] ws stt busy: {e}")
+            await self.send({"type": "error", "index": index, "message": "STT busy"})
+            return
+
+        text, is_valid = _postprocess(result)
+        logger.info(
+            f"[{self.rid}] ws segment {index} "
+            f"audio={len(audio) / SAMPLE_RATE:.2f}s transcribe={time.perf_counter() - t0:.3f}s "
+            f"text_len={len(text)}"
+        )
+        if text:
+            texts.append(text)
+        await self.send({"type": "segment", "index": index, "text": text, "isValid": is_valid})
+
+    async def _send_final(self, pcm: bytes, texts: list, utterance_start: float) -> None:
+        # 구간 텍스트는 _postprocess에서 이미 도메인 치환됨
+        transfer_text = " ".join(texts).strip()
+        is_valid = bool(transfer_text) and _is_valid_text(transfer_text)
+
+        if SAVE_UPLOADS and pcm:
+            _save_pcm_wav(self.rid, "ws", pcm)
+        logger.info(
+            f"[{self.rid}] ws final segments={len(texts)} "
+            f"elapsed={time.perf_counter() - utterance_start:.3f}s text_len={len(transfer_text)}"
+        )
+        await self.send({"type": "final", "transferText": transfer_text, "isValid": is_valid})
+
+
+@router.websocket("/ws")
+async def stt_ws(websocket: WebSocket):
+    """스트리밍 STT (WebSocket)
+
+    - 클라이언트 -> 서버: 바이너리 프레임(int16, 16kHz, mono PCM)을 녹음하는 동안 계속 전송,
+      발화가 끝나면 텍스트 프레임 {"type": "end"}
+    - 서버 -> 클라이언트: partial / segment / final / error (STT_API_PROTOCOL.md 참고)
+
+    하나의 연결에서 여러 발화를 순서대로 처리할 수 있습니다.
+    """
+    await websocket.accept()
+    rid = uuid.uuid4().hex[:8]
+    logger.info(f"[{rid}] ws connected")
+
+    session = _StreamSession(websocket, rid)
+    worker = asyncio.create_task(session.run_segments())
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            if message.get("bytes"):
+                session.feed(message["bytes"])
+            elif message.get("text"):
+                try:
+                    command = json.loads(message["text"]).get("type")
+                except (json.JSONDecodeError, AttributeError):
+                    command = message["text"].strip()
+                if command == "end":
+                    session.finish()
+    except WebSocketDisconnect:
+        pass
+    except Exception:
+        logger.exception(f"[{rid}] /stt/ws failed")
+    finally:
+        worker.cancel()
+        if session.partial_task and not session.partial_task.done():
+            session.partial_task.cancel()
+        logger.info(f"[{rid}] ws closed")
@@ -43,6 +43,8 @@ class EntranceRequest(BaseModel):
     heroineData: Optional[List[Any]] = None
     rawMaps: List[RawMapRequest]
     usedEvents: Optional[List[Any]] = None
+    # True면 맵만 저장하고 바로 응답, 이벤트는 /entrance/events로 조회
+    asyncEvents: bool = False
 
 
 class EventChoice(BaseModel):
@@ -69,6 +71,18 @@ class EntranceResponse(BaseModel):
     success: bool
     playerIds: List[str]
     events: Optional[List[EventResponse]] = None
+    floorIds: List[int] = []
+    eventsReady: bool = True  # asyncEvents=True면 False (이벤트 생성 중)
+
+
+class EntranceEventsResponse(BaseModel):
+    """입장 이벤트 생성 상태 응답"""
+
+    success: bool
+    status: str  # pending | ready | failed | not_found
+    floor: int
+    floorId: Optional[int] = None
+    events: Optional[List[EventResponse]] = None
 
 
 class PlayerBalanceData(BaseModel):
@@ -151,6 +165,45 @@ class NextFloorResponse(BaseModel):
     events: Optional[List[EventResponse]] = None
 
 
+def _build_event_responses(events_data: Any, floor: int) -> List[EventResponse]:
+    """저장된 이벤트(dict 또는 list) -> 해당 층 EventResponse 목록"""
+    if isinstance(events_data, dict):
+        events_data = [events_data]
+    if not isinstance(events_data, list):
+        return []
+
+    events_list = []
+    for evt in events_data:
+        if evt.get("floor", 1) != floor:
+            continue
+        scenario_narrative = evt.get("scenario_narrative", "")
+        if evt.get("is_personal") and evt.get("heroineNarratives"):
+            scenario_narrative = {
+                str(n["playerId"]): n["narrative"]
+                for n in evt["heroineNarratives"]
+                if isinstance(n, dict) and "playerId" in n and "narrative" in n
+            }
+        events_list.append(
+            EventResponse(
+                roomId=evt.get("room_id", 0),
+                eventType=evt.get("event_type", 0),
+                eventTitle=evt.get("event_title", ""),
+                scenarioText=evt.get("scenario_text", ""),
+                scenarioNarrative=scenario_narrative,
+                choices=[
+                    EventChoice(
+                        action=c.get("action", ""),
+                        reward=c.get("reward"),
+                        penalty=c.get("penalty"),
+                    )
+                    for c in evt.get("choices", [])
+                    if isinstance(c, dict)
+                ],
+            )
+        )
+    return events_list
+
+
 # =============================================================================
 # API Endpoints
 # =============================================================================
@@ -175,74 +228,11 @@ def entrance(request: EntranceRequest):
             raw_maps=raw_maps,
             heroine_data=request.heroineData,
             used_events=request.usedEvents or [],
+            wait_for_events=not request.asyncEvents,
         )
 
-        # 이벤트 정보 매핑 (floor 구분 포함, reward/penalty dict)
-        events_list = []
-        if result.get("events"):
-            events_data = result["events"]
-            # 1층 이벤트만 추출
-            if isinstance(events_data, list):
-                for evt in events_data:
-                    if evt.get("floor", 1) != 1:
-                        continue
-                    scenario_narrative = evt.get("scenario_narrative", "")
-                    if evt.get("is_personal") and evt.get("heroineNarratives"):
-                        scenario_narrative = {
-                            str(n["playerId"]): n["narrative"]
-                            for n in evt["heroineNarratives"]
-                            if isinstance(n, dict)
-                            and "playerId" in n
-                            and "narrative" in n
-                        }
-                    events_list.append(
-                        EventResponse(
-                            roomId=evt.get("room_id", 0),
-                            eventType=evt.get("event_type", 0),
-                            eventTitle=evt.get("event_title", ""),
-                            scenarioText=evt.get("scenario_text", ""),
-                            scenarioNarrative=scenario_narrative,
-                            choices=[
-                                EventChoice(
-                                    action=c.get("action", ""),
-                                    reward=c.get("reward"),
-                                    penalty=c.get("penalty"),
-                                )
-                                for c in evt.get("choices", [])
-                                if isinstance(c, dict)
-                            ],
-                        )
-                    )
-            elif isinstance(events_data, dict):
-                evt = events_data
-                if evt.get("floor", 1) == 1:
-                    scenario_narrative = evt.get("scenario_narrative", "")
-                    if evt.get("is_personal") and evt.get("heroineNarratives"):
-                        scenario_narrative = {
-                            str(n["playerId"]): n["narrative"]
-                            for n in evt["heroineNarratives"]
-                            if isinstance(n, dict)
-                            and "playerId" in n
-                            and "narrative" in n
-                        }
-                    events_list.append(
-                        EventResponse(
-                            roomId=evt.get("room_id", 0),
-                            eventType=evt.get("event_type", 0),
-                            eventTitle=evt.get("event_title", ""),
-                            scenarioText=evt.get("scenario_text", ""),
-                            scenarioNarrative=scenario_narrative,
-                            choices=[
-                                EventChoice(
-                                    action=c.get("action", ""),
-                                    reward=c.get("reward"),
-                                    penalty=c.get("penalty"),
-                                )
-                                for c in evt.get("choices", [])
-                                if isinstance(c, dict)
-                            ],
-                        )
-                    )
+        # 이벤트 정보 매핑 (1층 이벤트만, reward/penalty dict)
+        events_list = _build_event_responses(result.get("events"), floor=1)
 
         # 최상위 배열 추출 (중복 없이)
         player_ids = request.playerIds
@@ -267,11 +257,31 @@ def entrance(request: EntranceRequest):
             success=True,
             playerIds=player_ids,
             events=events_list if events_list else None,
+            floorIds=result.get("floor_ids", []),
+            eventsReady=result.get("events_ready", True),
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"던전 입장 실패: {str(e)}")
 
 
+@router.get("/entrance/events", response_model=EntranceEventsResponse)
+def entrance_events(firstPlayerId: str, floor: int = 1):
+    """asyncEvents 입장 후 층 이벤트 생성 상태 조회 (ready가 될 때까지 폴링)"""
+    try:
+        service = get_dungeon_service()
+        result = service.get_entrance_events(firstPlayerId, floor)
+        events_list = _build_event_responses(result["events"], floor=floor)
+        return EntranceEventsResponse(
+            success=result["status"] != "not_found",
+            status=result["status"],
+            floor=floor,
+            floorId=result["floor_id"],
+            events=events_list if events_list else None,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"이벤트 조회 실패: {str(e)}")
+
+
 @router.post("/balance", response_model=BalanceResponse)
 def balance_dungeon(request: BalanceRequest):
     try:
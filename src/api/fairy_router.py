@@ -1,3 +1,4 @@
+import asyncio
 from pydantic import BaseModel, Field
 from fastapi import APIRouter
 from typing import List, Optional
@@ -167,8 +168,11 @@ async def interaction(request: InteractionRequest):
         else list(player.inventory)
     )
     weapon = _weapon_id_to_data(player.weaponId, player.stats)
-    response = fairy_interaction(
-        player.playerId, player.heroineId, player.stats, inventory_ids, question, weapon
+    # 그래프가 동기(KoBERT/임베딩 추론 포함)라서 스레드에서 실행
+    # (이벤트 루프를 막지 않아야 동시 요청이 의도 모델 배치로 묶임)
+    response = await asyncio.to_thread(
+        fairy_interaction,
+        player.playerId, player.heroineId, player.stats, inventory_ids, question, weapon,
     )
 
     useItemId = response["useItemId"]
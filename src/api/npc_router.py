@@ -5,12 +5,14 @@ NPC API 라우터
 """
 
 import asyncio
+import json
 import random
 import base64
 import time
 from datetime import datetime
 from pathlib import Path
 from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from langchain_core.messages import HumanMessage
@@ -23,6 +25,7 @@ from agents.npc.heroine_heroine_agent import heroine_heroine_agent
 from agents.npc.base_npc_agent import MAX_CONVERSATION_BUFFER_SIZE
 from agents.npc.npc_constants import NPC_ID_TO_NAME_EN
 from tools.audio.tts_typecast import typecast_tts_service
+from tools.audio.tts_pipeline import SentenceTTSPipeline
 
 # ============================================
 # TTS 음성 파일 로컬 저장 (디버그/피드백용)
@@ -255,7 +258,7 @@ async def login(request: LoginRequest):
     scenario_level = request.scenarioLevel
 
     for heroine in request.heroines:
-        checkpoint = session_checkpoint_manager.load_checkpoints(
+        checkpoint = await session_checkpoint_manager.load_checkpoints(
             player_id, heroine.heroineId
         )
 
@@ -297,7 +300,7 @@ async def login(request: LoginRequest):
         
         redis_manager.save_session(player_id, heroine.heroineId, session)
 
-    sage_checkpoint = session_checkpoint_manager.load_checkpoints(player_id, 0)
+    sage_checkpoint = await session_checkpoint_manager.load_checkpoints(player_id, 0)
 
     sage_conversation_buffer = []
     for conv in sage_checkpoint.get("conversations", []):
@@ -335,19 +338,15 @@ async def login(request: LoginRequest):
 
 
 # ============================================
-# 히로인 대화 엔드포인트
+# 대화 공통 처리 (세션 로드 / 상태 구성 / 결과 반영)
 # ============================================
 
 
-@router.post("/heroine/chat/sync", response_model=ChatResponse)
-async def heroine_chat_sync(request: ChatRequest, background_tasks: BackgroundTasks):
-    """히로인과 대화 (비스트리밍)"""
-    api_start = time.time()
-
-    player_id = request.playerId
-    heroine_id = request.heroineId
-    user_message = request.text
+def _build_heroine_state(player_id: str, heroine_id: int, user_message: str) -> dict:
+    """히로인 대화 그래프 입력 상태 구성
 
+    해당 히로인이 NPC 대화 중이면 인터럽트하고, 세션이 없으면 새로 만듭니다.
+    """
     # 해당 히로인이 NPC 대화 중이면 인터럽트
     if redis_manager.is_heroine_in_conversation(player_id, heroine_id):
         redis_manager.stop_npc_conversation(player_id)
@@ -363,8 +362,7 @@ async def heroine_chat_sync(request: ChatRequest, background_tasks: BackgroundTa
     # 상태 안전하게 가져오기
     session_state = session.get("state", {})
 
-    # 상태 구성
-    state = {
+    return {
         "player_id": player_id,
         "npc_id": heroine_id,
         "npc_type": "heroine",
@@ -378,39 +376,146 @@ async def heroine_chat_sync(request: ChatRequest, background_tasks: BackgroundTa
         "recent_used_keywords": session.get("recent_used_keywords", []),
     }
 
-    # 메시지 처리 (LangGraph 전체 파이프라인)
-    t_process = time.time()
-    result = await heroine_agent.process_message(state)
-    print(f"[TIMING] LangGraph 파이프라인 총합: {time.time() - t_process:.3f}s")
 
-    response_text = result.get("response_text", "")
-    
-    # Redis 세션에서 player_known_name 가져오기
-    session = redis_manager.load_session(player_id, heroine_id)
-    player_known_name = None
+def _build_sage_state(player_id: str, user_message: str, npc_id: int = 0) -> dict:
+    """대현자 대화 그래프 입력 상태 구성 (세션이 없으면 새로 만듦)"""
+    t_session = time.time()
+    session = redis_manager.load_session(player_id, npc_id)
+    if session is None:
+        session = sage_agent._create_initial_session(player_id, npc_id)
+        redis_manager.save_session(player_id, npc_id, session)
+    print(f"[TIMING] Redis 세션 로드: {time.time() - t_session:.3f}s")
+
+    # 상태 안전하게 가져오기
+    session_state = session.get("state", {})
+
+    return {
+        "player_id": player_id,
+        "npc_id": npc_id,
+        "npc_type": "sage",
+        "messages": [HumanMessage(content=user_message)],
+        "scenarioLevel": session_state.get("scenarioLevel", 1),
+        "emotion": session_state.get("emotion", 0),
+        "conversation_buffer": session.get("conversation_buffer", []),
+        "short_term_summary": session.get("short_term_summary", ""),
+    }
+
+
+def _with_player_known_name(player_id: str, npc_id: int, new_state: dict) -> dict:
+    """Redis 세션의 player_known_name을 new_state에 포함 (그래프 실행 중 추출될 수 있음)"""
+    session = redis_manager.load_session(player_id, npc_id)
     if session and "state" in session:
         player_known_name = session["state"].get("player_known_name")
-    
-    new_state = {
-        "affection": result.get("affection", state["affection"]),
-        "sanity": result.get("sanity", state["sanity"]),
-        "memoryProgress": result.get("memoryProgress", state["memoryProgress"]),
-        "emotion": result.get("emotion", 0),
-    }
-    
-    # player_known_name이 있으면 state에 포함
-    if player_known_name:
-        new_state["player_known_name"] = player_known_name
+        if player_known_name:
+            new_state["player_known_name"] = player_known_name
+    return new_state
+
+
+def _heroine_new_state(state: dict, result: dict) -> dict:
+    """그래프 결과 -> 체크포인트에 저장할 히로인 상태"""
+    return _with_player_known_name(
+        state["player_id"],
+        state["npc_id"],
+        {
+            "affection": result.get("affection", state["affection"]),
+            "sanity": result.get("sanity", state["sanity"]),
+            "memoryProgress": result.get("memoryProgress", state["memoryProgress"]),
+            "emotion": result.get("emotion", 0),
+        },
+    )
+
+
+def _sage_new_state(state: dict, result: dict) -> dict:
+    """그래프 결과 -> 체크포인트에 저장할 대현자 상태"""
+    return _with_player_known_name(
+        state["player_id"],
+        state["npc_id"],
+        {
+            "scenarioLevel": state["scenarioLevel"],
+            "emotion": result.get("emotion", 0),
+        },
+    )
 
+
+def _add_checkpoint_task(
+    background_tasks: BackgroundTasks,
+    state: dict,
+    user_message: str,
+    response_text: str,
+    new_state: dict,
+) -> None:
+    """대화 체크포인트 저장 (응답 전송 후 백그라운드)"""
     background_tasks.add_task(
         session_checkpoint_manager.save_checkpoint_background,
-        player_id,
-        heroine_id,
+        state["player_id"],
+        state["npc_id"],
         user_message,
         response_text,
         new_state,
     )
 
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Server-Sent Events 한 건 포맷"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _stream_chat(agent, state: dict, outcome: dict):
+    """에이전트 스트리밍 응답을 token/emotion SSE로 흘려보냄
+
+    그래프 최종 상태는 outcome["result"], 첫 토큰 시간은 outcome["ttft"]에 채웁니다.
+    """
+    outcome["result"] = {}
+    async for event in agent.generate_response_stream(state):
+        if event["type"] == "token":
+            yield _sse("token", {"text": event["text"]})
+        elif event["type"] == "emotion":
+            yield _sse(
+                "emotion",
+                {
+                    "emotion": event["emotion"],
+                    "emotion_intensity": event["emotion_intensity"],
+                },
+            )
+        else:
+            outcome["result"] = event["result"]
+            outcome["ttft"] = event["ttft"]
+
+
+def _event_stream_response(
+    event_stream, background_tasks: BackgroundTasks
+) -> StreamingResponse:
+    """SSE 응답 (버퍼링 끔, 백그라운드 작업은 스트림 종료 후 실행)"""
+    return StreamingResponse(
+        event_stream,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=background_tasks,
+    )
+
+
+# ============================================
+# 히로인 대화 엔드포인트
+# ============================================
+
+
+@router.post("/heroine/chat/sync", response_model=ChatResponse)
+async def heroine_chat_sync(request: ChatRequest, background_tasks: BackgroundTasks):
+    """히로인과 대화 (비스트리밍)"""
+    api_start = time.time()
+
+    user_message = request.text
+    state = _build_heroine_state(request.playerId, request.heroineId, user_message)
+
+    # 메시지 처리 (LangGraph 전체 파이프라인)
+    t_process = time.time()
+    result = await heroine_agent.process_message(state)
+    print(f"[TIMING] LangGraph 파이프라인 총합: {time.time() - t_process:.3f}s")
+
+    response_text = result.get("response_text", "")
+    new_state = _heroine_new_state(state, result)
+    _add_checkpoint_task(background_tasks, state, user_message, response_text, new_state)
+
     print(
         f"[TIMING] === API 총 소요시간 (heroine_chat_sync): {time.time() - api_start:.3f}s ==="
     )
@@ -423,6 +528,56 @@ async def heroine_chat_sync(request: ChatRequest, background_tasks: BackgroundTa
     )
 
 
+@router.post("/heroine/chat/stream")
+async def heroine_chat_stream(request: ChatRequest, background_tasks: BackgroundTasks):
+    """히로인과 대화 (스트리밍, SSE)
+
+    이벤트 순서:
+        token   {"text": "..."}     응답 텍스트 조각 (여러 번)
+        emotion {"emotion": 3, "emotion_intensity": 1.0}  감정이 확정되는 즉시 1회
+        done    ChatResponse 필드 + "ttft" (후처리 완료 후 1회)
+    """
+    api_start = time.time()
+
+    user_message = request.text
+    state = _build_heroine_state(request.playerId, request.heroineId, user_message)
+
+    async def event_stream():
+        outcome = {}
+        try:
+            async for item in _stream_chat(heroine_agent, state, outcome):
+                yield item
+        except Exception as e:
+            print(f"[ERROR] heroine_chat_stream 실패: {e}")
+            yield _sse("error", {"message": str(e)})
+            return
+
+        result = outcome["result"]
+        response_text = result.get("response_text", "")
+        new_state = _heroine_new_state(state, result)
+        _add_checkpoint_task(background_tasks, state, user_message, response_text, new_state)
+
+        print(
+            f"[TIMING] === API 총 소요시간 (heroine_chat_stream): {time.time() - api_start:.3f}s ==="
+        )
+        yield _sse(
+            "done",
+            {
+                **ChatResponse(
+                    text=response_text,
+                    emotion=new_state["emotion"],
+                    affection=new_state["affection"],
+                    sanity=new_state["sanity"],
+                    memoryProgress=new_state["memoryProgress"],
+                ).model_dump(),
+                "ttft": outcome.get("ttft"),
+                "node_timings": result.get("node_timings", {}),
+            },
+        )
+
+    return _event_stream_response(event_stream(), background_tasks)
+
+
 # ============================================
 # 대현자 대화 엔드포인트
 # ============================================
@@ -433,61 +588,16 @@ async def sage_chat_sync(request: SageChatRequest, background_tasks: BackgroundT
     """대현자와 대화 (비스트리밍)"""
     api_start = time.time()
 
-    player_id = request.playerId
     user_message = request.text
-    npc_id = 0
-
-    t_session = time.time()
-    session = redis_manager.load_session(player_id, npc_id)
-    if session is None:
-        session = sage_agent._create_initial_session(player_id, npc_id)
-        redis_manager.save_session(player_id, npc_id, session)
-    print(f"[TIMING] Redis 세션 로드: {time.time() - t_session:.3f}s")
-
-    # 상태 안전하게 가져오기
-    session_state = session.get("state", {})
-    scenario_level = session_state.get("scenarioLevel", 1)
-
-    state = {
-        "player_id": player_id,
-        "npc_id": npc_id,
-        "npc_type": "sage",
-        "messages": [HumanMessage(content=user_message)],
-        "scenarioLevel": scenario_level,
-        "emotion": session_state.get("emotion", 0),
-        "conversation_buffer": session.get("conversation_buffer", []),
-        "short_term_summary": session.get("short_term_summary", ""),
-    }
+    state = _build_sage_state(request.playerId, user_message)
 
     t_process = time.time()
     result = await sage_agent.process_message(state)
     print(f"[TIMING] LangGraph 파이프라인 총합: {time.time() - t_process:.3f}s")
 
     response_text = result.get("response_text", "")
-    
-    # Redis 세션에서 player_known_name 가져오기
-    session = redis_manager.load_session(player_id, npc_id)
-    player_known_name = None
-    if session and "state" in session:
-        player_known_name = session["state"].get("player_known_name")
-    
-    new_state = {
-        "scenarioLevel": scenario_level,
-        "emotion": result.get("emotion", 0),
-    }
-    
-    # player_known_name이 있으면 state에 포함
-    if player_known_name:
-        new_state["player_known_name"] = player_known_name
-
-    background_tasks.add_task(
-        session_checkpoint_manager.save_checkpoint_background,
-        player_id,
-        npc_id,
-        user_message,
-        response_text,
-        new_state,
-    )
+    new_state = _sage_new_state(state, result)
+    _add_checkpoint_task(background_tasks, state, user_message, response_text, new_state)
 
     print(
         f"[TIMING] === API 총 소요시간 (sage_chat_sync): {time.time() - api_start:.3f}s ==="
@@ -500,6 +610,51 @@ async def sage_chat_sync(request: SageChatRequest, background_tasks: BackgroundT
     )
 
 
+@router.post("/sage/chat/stream")
+async def sage_chat_stream(request: SageChatRequest, background_tasks: BackgroundTasks):
+    """대현자와 대화 (스트리밍, SSE)
+
+    이벤트 형식은 /heroine/chat/stream과 같고, done에는 SageChatResponse 필드가 담깁니다.
+    """
+    api_start = time.time()
+
+    user_message = request.text
+    state = _build_sage_state(request.playerId, user_message)
+
+    async def event_stream():
+        outcome = {}
+        try:
+            async for item in _stream_chat(sage_agent, state, outcome):
+                yield item
+        except Exception as e:
+            print(f"[ERROR] sage_chat_stream 실패: {e}")
+            yield _sse("error", {"message": str(e)})
+            return
+
+        result = outcome["result"]
+        response_text = result.get("response_text", "")
+        new_state = _sage_new_state(state, result)
+        _add_checkpoint_task(background_tasks, state, user_message, response_text, new_state)
+
+        print(
+            f"[TIMING] === API 총 소요시간 (sage_chat_stream): {time.time() - api_start:.3f}s ==="
+        )
+        yield _sse(
+            "done",
+            {
+                **SageChatResponse(
+                    text=response_text,
+                    emotion=new_state["emotion"],
+                    scenarioLevel=new_state["scenarioLevel"],
+                    infoRevealed=result.get("info_revealed", False),
+                ).model_dump(),
+                "ttft": outcome.get("ttft"),
+            },
+        )
+
+    return _event_stream_response(event_stream(), background_tasks)
+
+
 # ============================================
 # 히로인간 대화 엔드포인트
 # ============================================
@@ -650,6 +805,43 @@ async def get_active_npc_conversation(player_id: str):
 # ============================================
 
 
+async def _synthesize_response(npc_id: int, response_text: str, emotion: int, emotion_intensity: float) -> bytes:
+    """응답 전체 TTS 생성"""
+    t_tts = time.time()
+    print(f"[DEBUG] TTS 입력 텍스트: {response_text}")
+    audio_bytes = await typecast_tts_service.text_to_speech(
+        text=response_text,
+        npc_id=npc_id,
+        emotion=emotion,
+        emotion_intensity=emotion_intensity,
+    )
+    print(f"[TIMING] TTS 생성: {time.time() - t_tts:.3f}s")
+    return audio_bytes
+
+
+def _add_audio_log_tasks(
+    background_tasks: BackgroundTasks,
+    state: dict,
+    chunks: List[Dict[str, Any]],
+    emotion: int,
+    endpoint_type: str,
+) -> None:
+    """음성 파일 로컬 저장 (백그라운드, 피드백용)
+
+    chunks: [{"audio": bytes, "text": str}, ...] (스트리밍은 문장별)
+    """
+    for chunk in chunks:
+        background_tasks.add_task(
+            save_audio_file_background,
+            chunk["audio"],
+            state["player_id"],
+            state["npc_id"],
+            chunk["text"],
+            emotion,
+            endpoint_type,
+        )
+
+
 @router.post("/heroine/chat/sync/voice", response_model=ChatResponseWithVoice)
 async def heroine_chat_sync_voice(
     request: ChatRequest, background_tasks: BackgroundTasks
@@ -660,89 +852,28 @@ async def heroine_chat_sync_voice(
     """
     api_start = time.time()
 
-    player_id = request.playerId
-    heroine_id = request.heroineId
     user_message = request.text
-
-    # 해당 히로인이 NPC 대화 중이면 인터럽트
-    if redis_manager.is_heroine_in_conversation(player_id, heroine_id):
-        redis_manager.stop_npc_conversation(player_id)
-
-    # 세션 로드
-    session = redis_manager.load_session(player_id, heroine_id)
-    if session is None:
-        session = heroine_agent._create_initial_session(player_id, heroine_id)
-        redis_manager.save_session(player_id, heroine_id, session)
-
-    session_state = session.get("state", {})
-
-    state = {
-        "player_id": player_id,
-        "npc_id": heroine_id,
-        "npc_type": "heroine",
-        "messages": [HumanMessage(content=user_message)],
-        "affection": session_state.get("affection", 0),
-        "sanity": session_state.get("sanity", 100),
-        "memoryProgress": session_state.get("memoryProgress", 0),
-        "emotion": session_state.get("emotion", 0),
-        "conversation_buffer": session.get("conversation_buffer", []),
-        "short_term_summary": session.get("short_term_summary", ""),
-        "recent_used_keywords": session.get("recent_used_keywords", []),
-    }
+    state = _build_heroine_state(request.playerId, request.heroineId, user_message)
 
     # 메시지 처리
     result = await heroine_agent.process_message(state)
 
     response_text = result.get("response_text", "")
-    emotion = result.get("emotion", 0)
     emotion_intensity = result.get("emotion_intensity", 1.0)
-
-    # Redis 세션에서 player_known_name 가져오기
-    session = redis_manager.load_session(player_id, heroine_id)
-    player_known_name = None
-    if session and "state" in session:
-        player_known_name = session["state"].get("player_known_name")
-
-    new_state = {
-        "affection": result.get("affection", state["affection"]),
-        "sanity": result.get("sanity", state["sanity"]),
-        "memoryProgress": result.get("memoryProgress", state["memoryProgress"]),
-        "emotion": emotion,
-    }
-    
-    # player_known_name이 있으면 state에 포함
-    if player_known_name:
-        new_state["player_known_name"] = player_known_name
+    new_state = _heroine_new_state(state, result)
+    emotion = new_state["emotion"]
 
     # TTS 생성
-    t_tts = time.time()
-    print(f"[DEBUG] TTS 입력 텍스트: {response_text}")
-    audio_bytes = await typecast_tts_service.text_to_speech(
-        text=response_text,
-        npc_id=heroine_id,
-        emotion=emotion,
-        emotion_intensity=emotion_intensity,
-    )
-    audio_base64 = base64.b64encode(audio_bytes).decode("utf-8")
-    print(f"[TIMING] TTS 생성: {time.time() - t_tts:.3f}s")
-
-    # 데이터 저장 (백그라운드)
-    background_tasks.add_task(
-        session_checkpoint_manager.save_checkpoint_background,
-        player_id,
-        heroine_id,
-        user_message,
-        response_text,
-        new_state,
+    audio_bytes = await _synthesize_response(
+        state["npc_id"], response_text, emotion, emotion_intensity
     )
 
-    # 음성 파일 로컬 저장 (백그라운드, 피드백용)
-    background_tasks.add_task(
-        save_audio_file_background,
-        audio_bytes,
-        player_id,
-        heroine_id,
-        response_text,
+    # 데이터 저장 / 음성 파일 로컬 저장 (백그라운드)
+    _add_checkpoint_task(background_tasks, state, user_message, response_text, new_state)
+    _add_audio_log_tasks(
+        background_tasks,
+        state,
+        [{"audio": audio_bytes, "text": response_text}],
         emotion,
         "heroine_chat",
     )
@@ -758,7 +889,7 @@ async def heroine_chat_sync_voice(
         affection=new_state["affection"],
         sanity=new_state["sanity"],
         memoryProgress=new_state["memoryProgress"],
-        audio_base64=audio_base64,
+        audio_base64=base64.b64encode(audio_bytes).decode("utf-8"),
     )
 
 
@@ -772,78 +903,27 @@ async def sage_chat_sync_voice(
     """
     api_start = time.time()
 
-    player_id = request.playerId
     user_message = request.text
-    npc_id = 0
-
-    session = redis_manager.load_session(player_id, npc_id)
-    if session is None:
-        session = sage_agent._create_initial_session(player_id, npc_id)
-        redis_manager.save_session(player_id, npc_id, session)
-
-    session_state = session.get("state", {})
-    scenario_level = session_state.get("scenarioLevel", 1)
-
-    state = {
-        "player_id": player_id,
-        "npc_id": npc_id,
-        "npc_type": "sage",
-        "messages": [HumanMessage(content=user_message)],
-        "scenarioLevel": scenario_level,
-        "emotion": session_state.get("emotion", 0),
-        "conversation_buffer": session.get("conversation_buffer", []),
-        "short_term_summary": session.get("short_term_summary", ""),
-    }
+    state = _build_sage_state(request.playerId, user_message)
 
     result = await sage_agent.process_message(state)
 
     response_text = result.get("response_text", "")
-    emotion = result.get("emotion", 0)
     emotion_intensity = result.get("emotion_intensity", 1.0)
-
-    # Redis 세션에서 player_known_name 가져오기
-    session = redis_manager.load_session(player_id, npc_id)
-    player_known_name = None
-    if session and "state" in session:
-        player_known_name = session["state"].get("player_known_name")
-
-    new_state = {
-        "scenarioLevel": scenario_level,
-        "emotion": emotion,
-    }
-    
-    # player_known_name이 있으면 state에 포함
-    if player_known_name:
-        new_state["player_known_name"] = player_known_name
+    new_state = _sage_new_state(state, result)
+    emotion = new_state["emotion"]
 
     # TTS 생성
-    t_tts = time.time()
-    audio_bytes = await typecast_tts_service.text_to_speech(
-        text=response_text,
-        npc_id=npc_id,
-        emotion=emotion,
-        emotion_intensity=emotion_intensity,
+    audio_bytes = await _synthesize_response(
+        state["npc_id"], response_text, emotion, emotion_intensity
     )
-    audio_base64 = base64.b64encode(audio_bytes).decode("utf-8")
-    print(f"[TIMING] TTS 생성: {time.time() - t_tts:.3f}s")
 
-    # 데이터 저장 (백그라운드)
-    background_tasks.add_task(
-        session_checkpoint_manager.save_checkpoint_background,
-        player_id,
-        npc_id,
-        user_message,
-        response_text,
-        new_state,
-    )
-
-    # 음성 파일 로컬 저장 (백그라운드, 피드백용)
-    background_tasks.add_task(
-        save_audio_file_background,
-        audio_bytes,
-        player_id,
-        npc_id,
-        response_text,
+    # 데이터 저장 / 음성 파일 로컬 저장 (백그라운드)
+    _add_checkpoint_task(background_tasks, state, user_message, response_text, new_state)
+    _add_audio_log_tasks(
+        background_tasks,
+        state,
+        [{"audio": audio_bytes, "text": response_text}],
         emotion,
         "sage_chat",
     )
@@ -856,12 +936,201 @@ async def sage_chat_sync_voice(
         text=response_text,
         emotion=emotion,
         emotion_intensity=emotion_intensity,
-        scenarioLevel=scenario_level,
+        scenarioLevel=new_state["scenarioLevel"],
         infoRevealed=result.get("info_revealed", False),
-        audio_base64=audio_base64,
+        audio_base64=base64.b64encode(audio_bytes).decode("utf-8"),
     )
 
 
+async def _stream_with_sentence_tts(agent, state: dict, outcome: dict):
+    """스트리밍 응답을 문장 단위 TTS와 함께 SSE로 흘려보냄
+
+    LLM 스트림은 별도 태스크에서 읽어 파이프라인에 넣고,
+    이 제너레이터는 token/emotion 이벤트와 순서대로 완성된 audio 이벤트를 내보냅니다.
+    그래프 최종 상태는 outcome["result"], 음성 조각은 outcome["audio"]에 채웁니다.
+    LLM 스트림이 실패하면 진행 중인 TTS도 취소하고 예외를 그대로 올립니다.
+    """
+    pipeline = SentenceTTSPipeline(state["npc_id"])
+    events: asyncio.Queue = asyncio.Queue()
+    outcome["result"] = {}
+    outcome["audio"] = []
+
+    async def run_llm():
+        result = {}
+        async for event in agent.generate_response_stream(state):
+            if event["type"] == "token":
+                pipeline.feed(event["text"])
+                await events.put(_sse("token", {"text": event["text"]}))
+            elif event["type"] == "emotion":
+                pipeline.set_emotion(event["emotion"], event["emotion_intensity"])
+                await events.put(
+                    _sse(
+                        "emotion",
+                        {
+                            "emotion": event["emotion"],
+                            "emotion_intensity": event["emotion_intensity"],
+                        },
+                    )
+                )
+            else:
+                result = event["result"]
+                outcome["ttft"] = event["ttft"]
+
+        outcome["result"] = result
+        # JSON 파싱 실패 등으로 토큰이 없었으면 최종 텍스트를 한 번에 넣음
+        if pipeline.fed_chars == 0 and result.get("response_text"):
+            pipeline.feed(result["response_text"])
+        pipeline.close(
+            emotion=result.get("emotion", 0),
+            emotion_intensity=result.get("emotion_intensity", 1.0),
+        )
+
+    async def run_audio():
+        async for chunk in pipeline.audio_chunks():
+            outcome["audio"].append(chunk)
+            await events.put(
+                _sse(
+                    "audio",
+                    {
+                        "index": chunk["index"],
+                        "text": chunk["text"],
+                        "audio_base64": base64.b64encode(chunk["audio"]).decode("utf-8"),
+                    },
+                )
+            )
+
+    llm_task = asyncio.create_task(run_llm())
+    audio_task = asyncio.create_task(run_audio())
+    # 어느 한쪽이 실패하면 바로 끝남 (나머지는 finally에서 취소)
+    both = asyncio.gather(llm_task, audio_task)
+    both.add_done_callback(lambda _: events.put_nowait(None))
+
+    try:
+        while True:
+            item = await events.get()
+            if item is None:
+                break
+            yield item
+        await both
+    finally:
+        # 클라이언트 연결 종료 또는 LLM 실패 시 남은 LLM/TTS 작업 취소
+        unfinished = [task for task in (llm_task, audio_task) if not task.done()]
+        for task in unfinished:
+            task.cancel()
+        if unfinished:
+            pipeline.cancel()
+
+
+@router.post("/heroine/chat/stream/voice")
+async def heroine_chat_stream_voice(
+    request: ChatRequest, background_tasks: BackgroundTasks
+):
+    """히로인과 대화 (스트리밍 + 문장 단위 음성, SSE)
+
+    /heroine/chat/stream 이벤트에 더해, 문장이 완성될 때마다 TTS를 동시에 요청하고
+    audio 이벤트({"index", "text", "audio_base64"})를 문장 순서대로 보냅니다.
+    done에는 ChatResponseWithVoice 필드(audio_base64 제외)와 ttft가 담깁니다.
+    """
+    api_start = time.time()
+
+    user_message = request.text
+    state = _build_heroine_state(request.playerId, request.heroineId, user_message)
+
+    async def event_stream():
+        outcome = {}
+        try:
+            async for item in _stream_with_sentence_tts(heroine_agent, state, outcome):
+                yield item
+        except Exception as e:
+            print(f"[ERROR] heroine_chat_stream_voice 실패: {e}")
+            yield _sse("error", {"message": str(e)})
+            return
+
+        result = outcome["result"]
+        response_text = result.get("response_text", "")
+        emotion_intensity = result.get("emotion_intensity", 1.0)
+        new_state = _heroine_new_state(state, result)
+        emotion = new_state["emotion"]
+
+        # 데이터 저장 / 음성 파일 로컬 저장 (백그라운드, 문장별)
+        _add_checkpoint_task(background_tasks, state, user_message, response_text, new_state)
+        _add_audio_log_tasks(
+            background_tasks, state, outcome["audio"], emotion, "heroine_chat_stream"
+        )
+
+        print(
+            f"[TIMING] === API 총 소요시간 (heroine_chat_stream_voice): {time.time() - api_start:.3f}s ==="
+        )
+        yield _sse(
+            "done",
+            {
+                "text": response_text,
+                "emotion": emotion,
+                "emotion_intensity": emotion_intensity,
+                "affection": new_state["affection"],
+                "sanity": new_state["sanity"],
+                "memoryProgress": new_state["memoryProgress"],
+                "ttft": outcome.get("ttft"),
+            },
+        )
+
+    return _event_stream_response(event_stream(), background_tasks)
+
+
+@router.post("/sage/chat/stream/voice")
+async def sage_chat_stream_voice(
+    request: SageChatRequest, background_tasks: BackgroundTasks
+):
+    """대현자와 대화 (스트리밍 + 문장 단위 음성, SSE)
+
+    이벤트 형식은 /heroine/chat/stream/voice와 같고,
+    done에는 SageChatResponseWithVoice 필드(audio_base64 제외)와 ttft가 담깁니다.
+    """
+    api_start = time.time()
+
+    user_message = request.text
+    state = _build_sage_state(request.playerId, user_message)
+
+    async def event_stream():
+        outcome = {}
+        try:
+            async for item in _stream_with_sentence_tts(sage_agent, state, outcome):
+                yield item
+        except Exception as e:
+            print(f"[ERROR] sage_chat_stream_voice 실패: {e}")
+            yield _sse("error", {"message": str(e)})
+            return
+
+        result = outcome["result"]
+        response_text = result.get("response_text", "")
+        emotion_intensity = result.get("emotion_intensity", 1.0)
+        new_state = _sage_new_state(state, result)
+        emotion = new_state["emotion"]
+
+        # 데이터 저장 / 음성 파일 로컬 저장 (백그라운드, 문장별)
+        _add_checkpoint_task(background_tasks, state, user_message, response_text, new_state)
+        _add_audio_log_tasks(
+            background_tasks, state, outcome["audio"], emotion, "sage_chat_stream"
+        )
+
+        print(
+            f"[TIMING] === API 총 소요시간 (sage_chat_stream_voice): {time.time() - api_start:.3f}s ==="
+        )
+        yield _sse(
+            "done",
+            {
+                "text": response_text,
+                "emotion": emotion,
+                "emotion_intensity": emotion_intensity,
+                "scenarioLevel": new_state["scenarioLevel"],
+                "infoRevealed": result.get("info_revealed", False),
+                "ttft": outcome.get("ttft"),
+            },
+        )
+
+    return _event_stream_response(event_stream(), background_tasks)
+
+
 @router.post(
     "/heroine-conversation/generate/voice",
     response_model=HeroineConversationResponseWithVoice,
@@ -887,7 +1156,22 @@ async def generate_heroine_conversation_voice(
     conversation_with_voice = []
     t_tts_total = time.time()
 
-    for turn_idx, turn in enumerate(result.get("conversation", [])):
+    turns = result.get("conversation", [])
+
+    # 턴별 TTS를 동시에 요청 (동시 요청 수는 typecast_tts_service가 제한)
+    audio_list = await asyncio.gather(
+        *[
+            typecast_tts_service.text_to_speech(
+                text=turn.get("text", ""),
+                npc_id=turn.get("speaker_id"),
+                emotion=turn.get("emotion", 0),
+                emotion_intensity=turn.get("emotion_intensity", 1.0),
+            )
+            for turn in turns
+        ]
+    )
+
+    for turn_idx, (turn, audio_bytes) in enumerate(zip(turns, audio_list)):
         speaker_id = turn.get("speaker_id")
         speaker_name = turn.get("speaker_name", "")
         text = turn.get("text", "")
@@ -899,13 +1183,6 @@ async def generate_heroine_conversation_voice(
             f"[TTS DEBUG] Turn {turn_idx}: speaker={speaker_name}({speaker_id}), text_length={len(text)}, text_preview={text[:50]}..."
         )
 
-        audio_bytes = await typecast_tts_service.text_to_speech(
-            text=text,
-            npc_id=speaker_id,
-            emotion=emotion,
-            emotion_intensity=emotion_intensity,
-        )
-
         # 디버그: 생성된 오디오 크기 확인
         print(f"[TTS DEBUG] Turn {turn_idx}: audio_bytes_size={len(audio_bytes)} bytes")
 
@@ -0,0 +1,146 @@
+"""
+LangGraph 컴파일 그래프 레지스트리
+
+StateGraph.compile()은 요청마다 할 일이 아니므로(노드/엣지 검증 + Pregel 객체 구성),
+그래프마다 프로세스당 한 번만 컴파일하고 같은 객체를 공유합니다.
+컴파일된 그래프는 상태를 갖지 않아 여러 스레드에서 동시에 invoke 해도 됩니다.
+
+- 지연 컴파일: graph_registry.get("dungeon_event") 첫 호출 시 컴파일
+  (에이전트 모듈은 임포트 시 LLM 클라이언트를 만들기 때문에 빌더 임포트도 이 시점)
+- 그래프별 컴파일 시간 / 사용 횟수 기록 (/health)
+
+사용 예시:
+    event_graph = graph_registry.get("dungeon_event")
+    result = event_graph.invoke(event_state)
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class _Entry:
+    factory: Callable[[], Any]
+    description: str = ""
+    graph: Any = None
+    compiled: bool = False
+    compile_time: float = 0.0
+    uses: int = 0
+    error: Optional[str] = None
+
+
+class GraphRegistry:
+    """이름 -> 컴파일된 그래프 (스레드 안전 지연 컴파일)"""
+
+    def __init__(self):
+        self._entries: Dict[str, _Entry] = {}
+        # RLock: 그래프 팩토리 안에서 다른 그래프를 get() 해도 됨
+        self._lock = threading.RLock()
+
+    def register(self, name: str, factory: Callable[[], Any], description: str = "") -> None:
+        """그래프 등록 (factory는 컴파일된 그래프를 반환, 호출은 get() 시점)"""
+        self._entries[name] = _Entry(factory=factory, description=description)
+
+    def is_compiled(self, name: str) -> bool:
+        entry = self._entries.get(name)
+        return bool(entry and entry.compiled)
+
+    def get(self, name: str) -> Any:
+        """컴파일된 그래프 (처음 호출 시 컴파일)"""
+        entry = self._entries.get(name)
+        if entry is None:
+            raise KeyError(f"등록되지 않은 그래프: {name}")
+        entry.uses += 1
+        if entry.compiled:
+            return entry.graph
+
+        with self._lock:
+            if entry.compiled:
+                return entry.graph
+
+            t0 = time.perf_counter()
+            try:
+                entry.graph = entry.factory()
+            except Exception as e:
+                entry.error = str(e)
+                print(f"[ERROR] 그래프 컴파일 실패: {name} ({e})")
+                raise
+            entry.compile_time = time.perf_counter() - t0
+            entry.error = None
+            entry.compiled = True
+
+            print(f"[TIMING] 그래프 컴파일: {name} {entry.compile_time * 1000:.1f}ms")
+            return entry.graph
+
+    def compile_all(self, names: Optional[List[str]] = None) -> None:
+        """미리 컴파일 (실패한 그래프는 건너뜀)"""
+        for name in names or list(self._entries):
+            try:
+                self.get(name)
+            except Exception:
+                continue
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """그래프별 컴파일 상태 / 시간 / 사용 횟수"""
+        return {
+            name: {
+                "compiled": entry.compiled,
+                "compile_time_ms": round(entry.compile_time * 1000, 2),
+                "uses": entry.uses,
+                "error": entry.error,
+            }
+            for name, entry in self._entries.items()
+        }
+
+
+# ============================================
+# 그래프 팩토리
+# ============================================
+
+
+def _compile_dungeon_event():
+    from agents.dungeon.event.dungeon_event_agent import graph_builder
+
+    return graph_builder.compile()
+
+
+def _compile_dungeon_monster():
+    from agents.dungeon.monster.dungeon_monster_agent import graph_builder
+
+    return graph_builder.compile()
+
+
+def _compile_super_dungeon():
+    from agents.dungeon.super.dungeon_agent import create_super_dungeon_graph
+
+    return create_super_dungeon_graph()
+
+
+def _compile_fairy_dungeon():
+    from agents.fairy.dungeon.fairy_dungeon_agent import graph_builder
+
+    return graph_builder.compile()
+
+
+def _compile_fairy_guild():
+    from agents.fairy.guild.fairy_guild_agent import graph_builder
+
+    return graph_builder.compile()
+
+
+def _compile_fairy_interaction():
+    from agents.fairy.interaction.fairy_interaction_agent import graph_builder
+
+    return graph_builder.compile()
+
+
+# 싱글톤 인스턴스
+graph_registry = GraphRegistry()
+graph_registry.register("dungeon_event", _compile_dungeon_event, "던전 이벤트 생성 (히로인 기억 -> 메인 -> 서브 이벤트)")
+graph_registry.register("dungeon_monster", _compile_dungeon_monster, "던전 몬스터 배치 / 밸런싱")
+graph_registry.register("super_dungeon", _compile_super_dungeon, "이벤트 + 몬스터 병렬 실행 후 병합 (balance)")
+graph_registry.register("fairy_dungeon", _compile_fairy_dungeon, "정령 던전 대화")
+graph_registry.register("fairy_guild", _compile_fairy_guild, "정령 길드 대화")
+graph_registry.register("fairy_interaction", _compile_fairy_interaction, "정령 인터렉션")
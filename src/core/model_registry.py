@@ -0,0 +1,274 @@
+"""
+로컬 모델 레지스트리 (지연 로드 + 공유 + 오프라인 캐시)
+
+BGE-M3, KoBERT 의도 모델처럼 무거운 모델을 모듈 import 시점에 로드하면
+앱 기동이 느려지고, 쓰지 않는 모델까지 워커마다 메모리에 올라갑니다.
+이 레지스트리는 모델을 이름으로 등록해 두고 처음 get() 할 때 한 번만 로드합니다.
+
+- 지연 로드: model_registry.get("bge_m3") 첫 호출 시 로드, 이후 같은 인스턴스 공유
+- 워밍업: lifespan에서 start_warmup()으로 백그라운드 로드 (MODEL_WARMUP)
+- 오프라인: 가중치를 MODEL_CACHE_DIR에 받아 두고, MODEL_OFFLINE=true면 네트워크 없이 로드
+- KoBERT 공유: 두 정령 의도 모델이 같은 토크나이저를 씀
+  (백본 가중치는 모델마다 따로 파인튜닝되어 값이 달라서 공유하지 않음)
+- 모델별 로드 시간 / RSS 증가량 기록 (/health, 워밍업 완료 로그)
+
+환경변수:
+- MODEL_CACHE_DIR: 가중치 캐시 경로 (기본 프로젝트 루트/model_cache)
+- MODEL_OFFLINE: "true"면 캐시에 있는 파일만 사용 (기본 false)
+- MODEL_WARMUP: 시작 시 미리 로드할 모델 (쉼표 구분 | all | none,
+  기본 bge_m3,fairy_interaction_intent)
+
+사용 예시:
+    emb_model = model_registry.get("bge_m3")
+    vecs = emb_model.encode(texts)["dense_vecs"]
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+MODEL_CACHE_DIR = Path(
+    os.getenv(
+        "MODEL_CACHE_DIR",
+        str(Path(__file__).parent.parent.parent / "model_cache"),
+    )
+)
+MODEL_OFFLINE = os.getenv("MODEL_OFFLINE", "false").lower() == "true"
+MODEL_WARMUP = os.getenv("MODEL_WARMUP", "bge_m3,fairy_interaction_intent")
+
+HF_CACHE_DIR = MODEL_CACHE_DIR / "hf"
+
+
+def _rss_mb() -> float:
+    """현재 프로세스 RSS (MB). /proc이 없으면 최대 RSS로 대체"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# ============================================
+# 허깅페이스 다운로드 (로컬 캐시 / 오프라인)
+# ============================================
+
+
+def hf_download(repo_id: str, filename: str) -> str:
+    """허깅페이스 파일 하나 -> 로컬 경로 (MODEL_CACHE_DIR 캐시)"""
+    from huggingface_hub import hf_hub_download
+
+    return hf_hub_download(
+        repo_id=repo_id,
+        filename=filename,
+        cache_dir=str(HF_CACHE_DIR),
+        local_files_only=MODEL_OFFLINE,
+    )
+
+
+def hf_snapshot(repo_id: str) -> str:
+    """허깅페이스 저장소 전체 -> 로컬 디렉토리 (from_pretrained에 경로로 전달)"""
+    from huggingface_hub import snapshot_download
+
+    return snapshot_download(
+        repo_id=repo_id,
+        cache_dir=str(HF_CACHE_DIR),
+        local_files_only=MODEL_OFFLINE,
+    )
+
+
+def atomic_write(path: Path, write: Callable[[Path], Any]) -> Path:
+    """캐시 파일 원자적 저장 (임시 파일에 쓴 뒤 교체)
+
+    여러 워커가 같은 캐시 파일(ONNX, 프로토타입 벡터 등)을 동시에 만들어도
+    다른 프로세스가 잘린 파일을 읽지 않습니다. 쓰기에 실패하면 임시 파일은 지웁니다.
+
+    Args:
+        path: 최종 파일 경로
+        write: 임시 파일 경로를 받아 내용을 쓰는 함수
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return path
+
+
+@dataclass
+class _Entry:
+    loader: Callable[[], Any]
+    description: str = ""
+    instance: Any = None
+    loaded: bool = False
+    load_time: float = 0.0
+    rss_delta_mb: float = 0.0
+    error: Optional[str] = None
+
+
+class ModelRegistry:
+    """이름 -> 모델 인스턴스 지연 로드 레지스트리
+
+    로드는 하나의 RLock 안에서 순서대로 진행합니다.
+    (동시에 두 모델을 올리면 CPU/메모리가 겹쳐 둘 다 느려지고 RSS 측정도 섞임,
+     RLock이라 로더 안에서 다른 모델을 get() 해도 됨)
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.RLock()
+        self._warmup_thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, loader: Callable[[], Any], description: str = "") -> None:
+        """모델 등록 (로드는 get() 시점)"""
+        self._entries[name] = _Entry(loader=loader, description=description)
+
+    def is_loaded(self, name: str) -> bool:
+        entry = self._entries.get(name)
+        return bool(entry and entry.loaded)
+
+    def get(self, name: str) -> Any:
+        """모델 인스턴스 (처음 호출 시 로드)"""
+        entry = self._entries.get(name)
+        if entry is None:
+            raise KeyError(f"등록되지 않은 모델: {name}")
+        if entry.loaded:
+            return entry.instance
+
+        with self._lock:
+            if entry.loaded:
+                return entry.instance
+
+            rss_before = _rss_mb()
+            t0 = time.perf_counter()
+            try:
+                entry.instance = entry.loader()
+            except Exception as e:
+                entry.error = str(e)
+                print(f"[ERROR] 모델 로드 실패: {name} ({e})")
+                raise
+            entry.load_time = time.perf_counter() - t0
+            entry.rss_delta_mb = _rss_mb() - rss_before
+            entry.error = None
+            entry.loaded = True
+
+            print(
+                f"[TIMING] 모델 로드: {name} {entry.load_time:.1f}s "
+                f"(RSS +{entry.rss_delta_mb:.0f}MB)"
+            )
+            return entry.instance
+
+    # ============================================
+    # 워밍업
+    # ============================================
+
+    def _warmup_names(self, names: Optional[List[str]] = None) -> List[str]:
+        if names is not None:
+            return names
+        value = MODEL_WARMUP.strip().lower()
+        if value in ("", "none"):
+            return []
+        if value == "all":
+            return list(self._entries)
+        return [n.strip() for n in MODEL_WARMUP.split(",") if n.strip()]
+
+    def warmup(self, names: Optional[List[str]] = None) -> None:
+        """모델 순서대로 로드 후 요약 출력 (실패한 모델은 건너뜀)"""
+        targets = self._warmup_names(names)
+        if not targets:
+            return
+
+        t0 = time.perf_counter()
+        for name in targets:
+            try:
+                self.get(name)
+            except Exception:
+                continue
+        print(f"[INFO] 모델 워밍업 완료 ({time.perf_counter() - t0:.1f}s)")
+        self.report()
+
+    def start_warmup(self, names: Optional[List[str]] = None) -> None:
+        """백그라운드 스레드에서 워밍업 (기동을 막지 않음)"""
+        if self._warmup_thread is not None:
+            return
+        self._warmup_thread = threading.Thread(
+            target=self.warmup, args=(names,), name="model-warmup", daemon=True
+        )
+        self._warmup_thread.start()
+
+    # ============================================
+    # 통계
+    # ============================================
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """모델별 로드 상태 / 시간 / RSS 증가량"""
+        return {
+            name: {
+                "loaded": entry.loaded,
+                "load_time_s": round(entry.load_time, 2),
+                "rss_delta_mb": round(entry.rss_delta_mb, 1),
+                "error": entry.error,
+            }
+            for name, entry in self._entries.items()
+        }
+
+    def report(self) -> None:
+        """로드된 모델 요약 출력"""
+        print(f"[INFO] 모델 레지스트리 (캐시: {MODEL_CACHE_DIR}, 오프라인: {MODEL_OFFLINE})")
+        for name, entry in self._entries.items():
+            if entry.loaded:
+                status = f"{entry.load_time:6.1f}s  RSS +{entry.rss_delta_mb:6.0f}MB"
+            elif entry.error:
+                status = f"실패: {entry.error}"
+            else:
+                status = "미로드 (첫 사용 시 로드)"
+            print(f"  {name:<26} {status}")
+        print(f"  현재 RSS: {_rss_mb():.0f}MB")
+
+
+# ============================================
+# 기본 모델 로더
+# ============================================
+
+KOBERT_REPO_ID = "monologg/kobert"
+
+
+def _load_bge_m3():
+    from FlagEmbedding import BGEM3FlagModel
+
+    return BGEM3FlagModel(hf_snapshot("BAAI/bge-m3"))
+
+
+def _load_kobert_tokenizer():
+    from kobert_transformers.tokenization_kobert import KoBertTokenizer
+
+    return KoBertTokenizer.from_pretrained(hf_snapshot(KOBERT_REPO_ID))
+
+
+def _load_fairy_interaction_intent():
+    from agents.fairy.interaction.fairy_interaction_model_logics import FairyInteractionIntentModel
+
+    return FairyInteractionIntentModel()
+
+
+def _load_fairy_dungeon_intent():
+    from agents.fairy.dungeon.fairy_dungeon_model_logics import FairyDungeonIntentModel
+
+    return FairyDungeonIntentModel()
+
+
+# 싱글톤 인스턴스
+model_registry = ModelRegistry()
+model_registry.register("bge_m3", _load_bge_m3, "BGE-M3 임베딩 (정령 아이템 사용 판단, 히로인 의도 빠른 경로)")
+model_registry.register("kobert_tokenizer", _load_kobert_tokenizer, "KoBERT 토크나이저 (정령 의도 모델 공용)")
+model_registry.register("fairy_interaction_intent", _load_fairy_interaction_intent, "정령 인터렉션 의도 KoBERT")
+model_registry.register("fairy_dungeon_intent", _load_fairy_dungeon_intent, "정령 던전 의도 KoBERT")
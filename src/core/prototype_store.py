@@ -0,0 +1,101 @@
+"""
+고정 문장 임베딩(프로토타입 벡터) 저장소
+
+IsItemUseEmbeddingLogic / HeroineIntentFastClassifier처럼 코드에 하드코딩된 예시 문장을
+프로세스가 뜰 때마다 BGE-M3로 다시 인코딩하지 않도록, 한 번 계산한 벡터를 .npy로 저장합니다.
+
+- 파일 이름: {모델 이름}-{문장 목록 해시}.npy (MODEL_CACHE_DIR/prototypes)
+- 문장이 추가/수정되면 해시가 바뀌어 자동으로 다시 계산 (이전 파일은 그대로 둠)
+- 로드는 np.load(mmap_mode="r") -> 여러 워커가 같은 페이지를 공유
+- 벡터는 L2 정규화된 float32 (내적 = 코사인 유사도)
+
+사용 예시:
+    matrix = load_prototype_vectors("bge_m3", sentences, encode)
+    score = knn_similarity(matrix, query_vec, k=5)
+"""
+
+import hashlib
+import json
+import re
+from typing import Callable, List
+
+import numpy as np
+
+from core.model_registry import MODEL_CACHE_DIR, atomic_write
+
+PROTOTYPE_CACHE_DIR = MODEL_CACHE_DIR / "prototypes"
+
+# 저장 형식이 바뀌면 올려서 기존 파일을 무효화
+PROTOTYPE_FORMAT_VERSION = 1
+
+
+def normalize_rows(vecs) -> np.ndarray:
+    """(n, d) -> 행별 L2 정규화 float32"""
+    vecs = np.asarray(vecs, dtype=np.float32)
+    return vecs / (np.linalg.norm(vecs, axis=-1, keepdims=True) + 1e-8)
+
+
+def sentence_set_hash(model_name: str, sentences: List[str]) -> str:
+    """모델 이름 + 문장 목록(순서 포함) 해시"""
+    payload = json.dumps(
+        {"v": PROTOTYPE_FORMAT_VERSION, "model": model_name, "sentences": sentences},
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def prototype_path(model_name: str, sentences: List[str]):
+    safe_name = re.sub(r"[^0-9A-Za-z_.-]", "_", model_name)
+    return PROTOTYPE_CACHE_DIR / f"{safe_name}-{sentence_set_hash(model_name, sentences)}.npy"
+
+
+def load_prototype_vectors(
+    model_name: str,
+    sentences: List[str],
+    encode: Callable[[List[str]], np.ndarray],
+) -> np.ndarray:
+    """문장 목록의 정규화 벡터 (n, d)
+
+    저장된 파일이 있으면 메모리 맵으로 열고, 없으면 encode로 계산해서 저장합니다.
+    저장에 실패해도(읽기 전용 디스크 등) 계산한 벡터는 그대로 반환합니다.
+
+    Args:
+        model_name: 임베딩 모델 이름 (다른 모델의 벡터와 섞이지 않도록 파일 이름에 포함)
+        sentences: 고정 문장 목록
+        encode: 문장 목록 -> (n, d) 벡터
+    """
+    path = prototype_path(model_name, sentences)
+    if path.exists():
+        try:
+            matrix = np.load(path, mmap_mode="r")
+            if matrix.shape[0] == len(sentences):
+                return matrix
+        except (OSError, ValueError) as e:
+            print(f"[WARN] 프로토타입 벡터 파일 손상, 다시 계산: {path.name} ({e})")
+
+    matrix = normalize_rows(encode(sentences))
+    def _save(tmp):
+        with open(tmp, "wb") as f:
+            np.save(f, matrix)
+
+    try:
+        atomic_write(path, _save)
+        print(f"[INFO] 프로토타입 벡터 저장: {path.name} ({len(sentences)}문장)")
+    except OSError as e:
+        print(f"[WARN] 프로토타입 벡터 저장 실패: {e}")
+    return matrix
+
+
+def knn_similarity(matrix: np.ndarray, vec: np.ndarray, k: int) -> float:
+    """가장 가까운 k개 프로토타입과의 평균 코사인 유사도
+
+    평균 벡터 하나와 비교하면 서로 다른 표현("장착해" / "그거 써줘")이 섞여 흐려지므로,
+    입력과 가까운 예시 문장만 골라서 비교합니다. (k <= 0 이면 평균 벡터 방식)
+    """
+    if k <= 0:
+        centroid = np.asarray(matrix).mean(axis=0)
+        return float(centroid @ vec / (np.linalg.norm(centroid) + 1e-8))
+
+    sims = np.asarray(matrix) @ vec
+    k = min(k, sims.shape[0])
+    return float(np.partition(sims, -k)[-k:].mean())
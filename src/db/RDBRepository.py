@@ -104,51 +104,43 @@ class RDBRepository:
         미완료 던전 조회
 
         Args:
-            player_ids: 플레이어 ID 리스트
+            player_ids: 플레이어 ID 리스트 (모두 참여 중인 던전만)
 
         Returns:
-            미완료 던전 정보 (dict) 또는 None
+            미완료 던전 정보 (dict, 가장 낮은 층) 또는 None
+
+        Note:
+            dungeon_players 멤버십 인덱스로 조회 (dungeon_players_schema.sql)
         """
-        with self.engine.connect() as conn:
-            rows = conn.execute(
-                text(
-                    """
-                SELECT *
-                FROM dungeon
-                WHERE is_finishing = FALSE
-                ORDER BY floor ASC
+        target = list(dict.fromkeys(map(str, player_ids)))
+        if not target:
+            sql = """
+            SELECT * FROM dungeon
+            WHERE is_finishing = FALSE
+            ORDER BY floor ASC
+            LIMIT 1
+            """
+        else:
+            sql = """
+            SELECT d.*
+            FROM dungeon d
+            JOIN (
+                SELECT dungeon_id
+                FROM dungeon_players
+                WHERE player_id = ANY(:player_ids) AND is_finishing = FALSE
+                GROUP BY dungeon_id
+                HAVING COUNT(DISTINCT player_id) = :player_count
+            ) m ON m.dungeon_id = d.id
+            WHERE d.is_finishing = FALSE
+            ORDER BY d.floor ASC
+            LIMIT 1
             """
-                )
-            ).fetchall()
-
-            if not rows:
-                return None
-
-            target = set(map(str, player_ids))
-
-            for row in rows:
-                raw_map_value = row._mapping["raw_map"]
-                raw_map = (
-                    json.loads(raw_map_value)
-                    if isinstance(raw_map_value, str)
-                    else raw_map_value
-                )
-                # playerIds와 player_ids 모두 체크 (정규화 여부와 무관하게)
-                row_players = set(
-                    map(str, raw_map.get("playerIds") or raw_map.get("player_ids", []))
-                )
-
-                # raw_map에 없으면 컬럼에서 확인
-                if not row_players:
-                    for i in range(1, 5):
-                        p_id = row._mapping[f"player{i}"]
-                        if p_id:
-                            row_players.add(str(p_id))
-
-                if target.issubset(row_players):
-                    return dict(row._mapping)
 
-            return None
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                text(sql), {"player_ids": target, "player_count": len(target)}
+            ).fetchone()
+            return dict(row._mapping) if row else None
 
     def balanced_dungeon(
         self,
@@ -265,67 +257,46 @@ class RDBRepository:
         현재 진행 중인 던전을 완료 처리
 
         Args:
-            player_ids: 플레이어 ID 리스트
+            player_ids: 플레이어 ID 리스트 (한 명이라도 참여 중이면 해당 던전)
 
         Returns:
             완료 처리된 던전 정보 (dict) 또는 None
         """
+        target = list(dict.fromkeys(map(str, player_ids)))
+        if not target:
+            return None
+
         with self.engine.connect() as conn:
-            rows = conn.execute(
+            # 요청한 플레이어 중 한 명이라도 참여 중인 가장 낮은 층 던전
+            row = conn.execute(
                 text(
                     """
-                SELECT *
-                FROM dungeon
-                WHERE is_finishing = FALSE
-                ORDER BY floor ASC
-            """
+                SELECT d.id
+                FROM dungeon d
+                WHERE d.is_finishing = FALSE
+                AND d.id IN (
+                    SELECT dungeon_id FROM dungeon_players
+                    WHERE player_id = ANY(:player_ids) AND is_finishing = FALSE
                 )
-            ).fetchall()
+                ORDER BY d.floor ASC
+                LIMIT 1
+            """
+                ),
+                {"player_ids": target},
+            ).fetchone()
 
-            if not rows:
+            if not row:
                 return None
 
-            target = set(map(str, player_ids))
-
-            for row in rows:
-                raw_map_value = row._mapping["raw_map"]
-                raw_map = (
-                    json.loads(raw_map_value)
-                    if isinstance(raw_map_value, str)
-                    else raw_map_value
-                )
-                # playerIds와 player_ids 모두 체크 (정규화 여부와 무관하게)
-                row_players = set(
-                    map(str, raw_map.get("playerIds") or raw_map.get("player_ids", []))
-                )
-
-                # raw_map에 없으면 컬럼에서 확인 (get_unfinished_dungeons와 동일 로직)
-                if not row_players:
-                    for i in range(1, 5):
-                        p_id = row._mapping[f"player{i}"]
-                        if p_id:
-                            row_players.add(str(p_id))
-
-                # 부분집합(issubset) 대신 교집합(intersection) 확인으로 변경
-                # 요청한 플레이어 중 한 명이라도 던전에 포함되어 있으면 해당 던전으로 간주
-                if not target.isdisjoint(row_players):
-                    dungeon_id = row._mapping["id"]
-
-                    # 현재 던전을 완료 처리
-                    conn.execute(
-                        text("UPDATE dungeon SET is_finishing = TRUE WHERE id = :id"),
-                        {"id": dungeon_id},
-                    )
-                    conn.commit()
-
-                    # 완료 처리된 던전 조회
-                    updated = conn.execute(
-                        text("SELECT * FROM dungeon WHERE id = :id"), {"id": dungeon_id}
-                    ).fetchone()
-                    updated_dict = dict(updated._mapping)
-                    return updated_dict
-
-            return None
+            # 현재 던전을 완료 처리 (dungeon_players는 트리거로 동기화)
+            updated = conn.execute(
+                text(
+                    "UPDATE dungeon SET is_finishing = TRUE WHERE id = :id RETURNING *"
+                ),
+                {"id": row[0]},
+            ).fetchone()
+            conn.commit()
+            return dict(updated._mapping)
 
     def get_current_dungeon_by_player(
         self, player_id: str, heroine_id: int
@@ -334,12 +305,10 @@ class RDBRepository:
         SELECT *
         FROM dungeon
         WHERE is_finishing = false
-        AND (
-                (player1 = :player_id AND heroine1 = :heroine_id) OR
-                (player2 = :player_id AND heroine2 = :heroine_id) OR
-                (player3 = :player_id AND heroine3 = :heroine_id) OR
-                (player4 = :player_id AND heroine4 = :heroine_id)
-            )
+        AND id IN (
+            SELECT dungeon_id FROM dungeon_players
+            WHERE player_id = :player_id AND heroine_id = :heroine_id AND is_finishing = FALSE
+        )
         ORDER BY floor ASC
         LIMIT 1
         """
@@ -366,8 +335,9 @@ class RDBRepository:
         SELECT event
         FROM dungeon
         WHERE is_finishing = false
-        AND (
-            player1 = :player_id OR player2 = :player_id OR player3 = :player_id OR player4 = :player_id
+        AND id IN (
+            SELECT dungeon_id FROM dungeon_players
+            WHERE player_id = :player_id AND floor = :floor AND is_finishing = FALSE
         )
         AND floor = :floor
         LIMIT 1
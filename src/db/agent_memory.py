@@ -27,6 +27,9 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from db.config import CONNECTION_URL
+from db.async_engine import get_async_engine
+from db.embedding_cache import CachedQueryEmbeddings
+from db.vector_codec import register_vector_codec, to_vector_param
 
 
 # 메모리 타입 정의 (npc_memory: NPC간 기억, npc_conversation: NPC간 대화)
@@ -81,7 +84,7 @@ class AgentMemoryManager:
         manager = AgentMemoryManager()
         
         # NPC 1이 NPC 2에 대한 기억 추가
-        manager.add_npc_memory(
+        await manager.add_npc_memory(
             observer_id=1, 
             target_id=2, 
             content="오늘 레티아가 나한테 맛있는 쿠키를 줬다",
@@ -98,11 +101,16 @@ class AgentMemoryManager:
         Args:
             embedding_model: OpenAI 임베딩 모델명
         """
-        # DB 연결
-        self.engine = create_engine(CONNECTION_URL, pool_pre_ping=True)
+        # DB 연결 (동기: 조회/관리용, 비동기: 기억 추가/하이브리드 검색용 공용 풀)
+        self.engine = register_vector_codec(
+            create_engine(CONNECTION_URL, pool_pre_ping=True)
+        )
+        self.async_engine = get_async_engine()
         
-        # 임베딩 모델 (텍스트를 벡터로 변환)
-        self.embeddings = OpenAIEmbeddings(model=embedding_model)
+        # 임베딩 모델 (텍스트를 벡터로 변환, 쿼리는 프로세스 공용 캐시 경유)
+        self.embeddings = CachedQueryEmbeddings(
+            OpenAIEmbeddings(model=embedding_model)
+        )
         
         # 검색시 사용할 기본 가중치
         self.default_weights = {
@@ -118,7 +126,7 @@ class AgentMemoryManager:
     # 기억 추가 메서드
     # ============================================
     
-    def add_memory(
+    async def add_memory(
         self,
         agent_id: str,
         memory_type: MemoryType,
@@ -146,7 +154,7 @@ class AgentMemoryManager:
             metadata = {}
         
         # 텍스트를 벡터로 변환 (임베딩)
-        embedding = self.embeddings.embed_query(content)
+        embedding = await self.embeddings.aembed_query(content)
         
         # 고유 ID 생성
         memory_id = str(uuid.uuid4())
@@ -160,21 +168,20 @@ class AgentMemoryManager:
         """)
         
         # DB 실행
-        with self.engine.connect() as conn:
-            conn.execute(sql, {
+        async with self.async_engine.begin() as conn:
+            await conn.execute(sql, {
                 "id": memory_id,
                 "agent_id": agent_id,
                 "memory_type": memory_type,
                 "content": content,
-                "embedding": str(embedding),
+                "embedding": to_vector_param(embedding),
                 "importance": importance,
                 "metadata": json.dumps(metadata, ensure_ascii=False)  # JSON 문자열로 변환
             })
-            conn.commit()
         
         return memory_id
     
-    def add_npc_memory(
+    async def add_npc_memory(
         self,
         observer_id: int,
         target_id: int,
@@ -205,9 +212,9 @@ class AgentMemoryManager:
         metadata["observer_id"] = observer_id
         metadata["target_id"] = target_id
         
-        return self.add_memory(agent_id, "npc_memory", content, importance, metadata)
+        return await self.add_memory(agent_id, "npc_memory", content, importance, metadata)
     
-    def add_npc_conversation(
+    async def add_npc_conversation(
         self,
         npc1_id: int,
         npc2_id: int,
@@ -241,9 +248,9 @@ class AgentMemoryManager:
         metadata["npc1_id"] = npc1_id
         metadata["npc2_id"] = npc2_id
         
-        return self.add_memory(agent_id, "npc_conversation", content, importance, metadata)
+        return await self.add_memory(agent_id, "npc_conversation", content, importance, metadata)
     
-    def add_mutual_npc_memory(
+    async def add_mutual_npc_memory(
         self,
         npc1_id: int,
         npc2_id: int,
@@ -271,7 +278,7 @@ class AgentMemoryManager:
             (npc1의 메모리 ID, npc2의 메모리 ID) 튜플
         """
         # NPC1이 NPC2에 대해 기억
-        mem1_id = self.add_npc_memory(
+        mem1_id = await self.add_npc_memory(
             observer_id=npc1_id,
             target_id=npc2_id,
             content=npc1_perspective or content,  # 개별 관점이 없으면 공통 내용 사용
@@ -280,7 +287,7 @@ class AgentMemoryManager:
         )
         
         # NPC2가 NPC1에 대해 기억
-        mem2_id = self.add_npc_memory(
+        mem2_id = await self.add_npc_memory(
             observer_id=npc2_id,
             target_id=npc1_id,
             content=npc2_perspective or content,
@@ -294,7 +301,7 @@ class AgentMemoryManager:
     # 검색 메서드
     # ============================================
     
-    def search_memories(
+    async def search_memories(
         self,
         agent_id: str,
         query: str,
@@ -328,7 +335,7 @@ class AgentMemoryManager:
         w_relevance = w_relevance if w_relevance is not None else self.default_weights["relevance"]
         
         # 검색어를 벡터로 변환
-        query_embedding = self.embeddings.embed_query(query)
+        query_embedding = await self.embeddings.aembed_query(query)
         
         # DB의 하이브리드 검색 함수 호출
         sql = text("""
@@ -347,10 +354,10 @@ class AgentMemoryManager:
         memories = []
         memory_ids = []
         
-        with self.engine.connect() as conn:
-            result = conn.execute(sql, {
+        async with self.async_engine.begin() as conn:
+            result = await conn.execute(sql, {
                 "agent_id": agent_id,
-                "query_embedding": str(query_embedding),
+                "query_embedding": to_vector_param(query_embedding),
                 "top_k": top_k,
                 "w_recency": w_recency,
                 "w_importance": w_importance,
@@ -387,8 +394,7 @@ class AgentMemoryManager:
                     SET last_accessed_at = NOW()
                     WHERE id::text = ANY(:ids)
                 """)
-                conn.execute(update_sql, {"ids": id_strings})
-                conn.commit()
+                await conn.execute(update_sql, {"ids": id_strings})
         
         return memories
     
@@ -440,7 +446,7 @@ class AgentMemoryManager:
         with self.engine.connect() as conn:
             result = conn.execute(sql, {
                 "npc_id": npc_id,
-                "query_embedding": str(query_embedding),
+                "query_embedding": to_vector_param(query_embedding),
                 "top_k": top_k,
                 "w_recency": w_recency,
                 "w_importance": w_importance,
@@ -507,7 +513,7 @@ class AgentMemoryManager:
         with self.engine.connect() as conn:
             result = conn.execute(sql, {
                 "npc_id": npc_id,
-                "query_embedding": str(query_embedding),
+                "query_embedding": to_vector_param(query_embedding),
                 "top_k": top_k
             })
             
@@ -748,7 +754,7 @@ class AgentMemoryManager:
             conn.execute(sql_update, {
                 "id": conversation_id,
                 "content": new_content,
-                "embedding": str(new_embedding),
+                "embedding": to_vector_param(new_embedding),
                 "metadata": json.dumps(metadata, ensure_ascii=False)
             })
             conn.commit()
@@ -0,0 +1,89 @@
+"""
+비동기 DB 엔진 (SQLAlchemy AsyncEngine + asyncpg)
+
+async 메서드 안에서 동기 create_engine().connect()를 쓰면
+Postgres 응답을 기다리는 동안 uvicorn 이벤트 루프 전체가 멈춥니다.
+async 경로(기억 검색/저장, 시나리오 검색 등)는 모두 이 엔진을 await 합니다.
+
+공유 대상:
+- UserMemoryManager
+- AgentMemoryManager
+- NpcNpcMemoryManager
+- SessionCheckpointManager
+- HeroineScenarioService
+
+사용 예시:
+    engine = get_async_engine()
+    async with engine.connect() as conn:
+        result = await conn.execute(text("SELECT 1"))
+"""
+
+import os
+from typing import Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from db.config import CONNECTION_URL
+from db.vector_codec import register_vector_codec
+
+# 비동기 풀 크기 (동기 엔진과 별도로 관리)
+ASYNC_POOL_SIZE = int(os.getenv("ASYNC_DB_POOL_SIZE", "10"))
+ASYNC_MAX_OVERFLOW = int(os.getenv("ASYNC_DB_MAX_OVERFLOW", "10"))
+
+# 전역 비동기 엔진 인스턴스 (싱글톤 패턴)
+_async_engine: Optional[AsyncEngine] = None
+
+
+def to_async_url(url: str) -> str:
+    """동기 DB URL을 asyncpg 드라이버 URL로 변환
+
+    postgresql://... -> postgresql+asyncpg://...
+    asyncpg는 sslmode 파라미터를 모르므로 ssl로 바꿔서 전달합니다.
+
+    Args:
+        url: DATABASE_URL (postgresql:// 형식)
+
+    Returns:
+        postgresql+asyncpg:// 형식 URL 문자열
+    """
+    parsed = make_url(url).set(drivername="postgresql+asyncpg")
+
+    query = dict(parsed.query)
+    sslmode = query.pop("sslmode", None)
+    if sslmode:
+        query["ssl"] = sslmode
+    parsed = parsed.set(query=query)
+
+    return parsed.render_as_string(hide_password=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    """공용 비동기 엔진 반환 (최초 호출시 생성)"""
+    global _async_engine
+    if _async_engine is None:
+        if not CONNECTION_URL:
+            raise RuntimeError("DATABASE_URL이 비어있습니다 (.env 확인)")
+
+        _async_engine = create_async_engine(
+            to_async_url(CONNECTION_URL),
+            pool_pre_ping=True,  # 연결 유효성 사전 체크
+            pool_recycle=3600,  # 1시간마다 연결 재생성
+            pool_size=ASYNC_POOL_SIZE,
+            max_overflow=ASYNC_MAX_OVERFLOW,
+            pool_timeout=10,
+            # Supabase pgbouncer(transaction 모드)는 prepared statement 캐시를 지원하지 않음
+            connect_args={"statement_cache_size": 0},
+            echo=False,
+        )
+        # 임베딩 파라미터를 pgvector 바이너리 포맷으로 전송
+        register_vector_codec(_async_engine)
+    return _async_engine
+
+
+async def dispose_async_engine() -> None:
+    """앱 종료시 커넥션 풀 정리"""
+    global _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
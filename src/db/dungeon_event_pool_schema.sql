@@ -0,0 +1,22 @@
+-- ============================================
+-- 던전 이벤트 풀 (미리 생성한 이벤트 재고)
+--
+-- 목표:
+-- 1) 입장 시 LLM 대기 없이 이벤트를 조회로 배정
+-- 2) 키: (heroine_id, memory_bucket, event_code)
+--    memory_bucket = 해당 히로인의 해금 기억 기준값 (heroine_scenarios.py의 memory_progress)
+-- 3) 배정된 이벤트는 삭제 (재고 소진), 부족하면 서버가 백그라운드로 다시 채움
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS dungeon_event_pool (
+    id BIGSERIAL PRIMARY KEY,
+    event_code TEXT NOT NULL,
+    heroine_id INT NOT NULL,
+    memory_bucket INT NOT NULL,
+    payload JSONB NOT NULL,             -- build_event_json 결과 (room_id/floor/player_id는 배정 시 덮어씀)
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- 키별 재고 조회 / 오래된 것부터 꺼내기
+CREATE INDEX IF NOT EXISTS idx_dungeon_event_pool_key
+    ON dungeon_event_pool (heroine_id, memory_bucket, event_code, id);
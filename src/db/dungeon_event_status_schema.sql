@@ -0,0 +1,15 @@
+-- ============================================
+-- 던전 층 이벤트 생성 상태
+--
+-- 입장 이벤트는 맵 저장 후 백그라운드에서 생성되므로
+-- event 컬럼(NULL = 생성 중)만으로는 생성 실패를 알 수 없습니다.
+-- 상태를 row에 남겨 어느 서버 프로세스에서 조회해도 같은 결과가 나오게 합니다.
+--
+-- event_status:
+--   pending  생성 중 (event = NULL)
+--   ready    저장 완료
+--   failed   생성 실패 (event = 빈 목록이라 다른 조회에서는 이벤트 없는 층으로 보임)
+--   NULL     이 컬럼 추가 전에 만든 행 (event 값으로 판단)
+-- ============================================
+
+ALTER TABLE dungeon ADD COLUMN IF NOT EXISTS event_status TEXT;
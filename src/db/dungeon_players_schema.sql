@@ -0,0 +1,95 @@
+-- ============================================
+-- 던전 참여자 멤버십 테이블
+--
+-- 목표:
+-- 1) "이 플레이어가 참여 중인 미완료 던전" 조회를 인덱스 한 번으로 처리
+--    (기존: dungeon 전체를 읽고 raw_map JSON 파싱 / player1~4 OR 조건)
+-- 2) dungeon INSERT / UPDATE 시 트리거로 자동 동기화
+--    (dungeon에 쓰는 코드가 여러 곳이라 애플리케이션에서 맞추지 않음)
+-- 3) 완료된 던전 멤버십도 남겨 두고(is_finishing = TRUE), 조회는 부분 인덱스로 미완료만
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS dungeon_players (
+    dungeon_id BIGINT NOT NULL REFERENCES dungeon(id) ON DELETE CASCADE,
+    slot SMALLINT NOT NULL,                 -- player1~4 중 몇 번째인지 (1~4)
+    player_id TEXT NOT NULL,
+    heroine_id TEXT,
+    floor INT NOT NULL,
+    is_finishing BOOLEAN NOT NULL DEFAULT FALSE,
+    PRIMARY KEY (dungeon_id, slot)
+);
+
+-- 미완료 던전 조회: player_id (+ floor)
+CREATE INDEX IF NOT EXISTS idx_dungeon_players_active
+    ON dungeon_players (player_id, floor)
+    WHERE is_finishing = FALSE;
+
+-- ============================================
+-- dungeon -> dungeon_players 동기화 트리거
+-- ============================================
+CREATE OR REPLACE FUNCTION sync_dungeon_players()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+        AND NEW.floor IS NOT DISTINCT FROM OLD.floor
+        AND (NEW.player1, NEW.player2, NEW.player3, NEW.player4)
+            IS NOT DISTINCT FROM (OLD.player1, OLD.player2, OLD.player3, OLD.player4)
+        AND (NEW.heroine1, NEW.heroine2, NEW.heroine3, NEW.heroine4)
+            IS NOT DISTINCT FROM (OLD.heroine1, OLD.heroine2, OLD.heroine3, OLD.heroine4)
+    THEN
+        -- 완료 처리만 바뀐 경우 (가장 흔한 UPDATE)
+        UPDATE dungeon_players
+        SET is_finishing = COALESCE(NEW.is_finishing, FALSE)
+        WHERE dungeon_id = NEW.id;
+        RETURN NEW;
+    END IF;
+
+    IF TG_OP = 'UPDATE' THEN
+        DELETE FROM dungeon_players WHERE dungeon_id = NEW.id;
+    END IF;
+
+    INSERT INTO dungeon_players (dungeon_id, slot, player_id, heroine_id, floor, is_finishing)
+    SELECT NEW.id, m.slot, m.player_id, m.heroine_id, NEW.floor, COALESCE(NEW.is_finishing, FALSE)
+    FROM (
+        VALUES
+            (1, NEW.player1::TEXT, NEW.heroine1::TEXT),
+            (2, NEW.player2::TEXT, NEW.heroine2::TEXT),
+            (3, NEW.player3::TEXT, NEW.heroine3::TEXT),
+            (4, NEW.player4::TEXT, NEW.heroine4::TEXT)
+    ) AS m(slot, player_id, heroine_id)
+    WHERE m.player_id IS NOT NULL;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_dungeon_players_insert ON dungeon;
+CREATE TRIGGER trigger_dungeon_players_insert
+    AFTER INSERT ON dungeon
+    FOR EACH ROW
+    EXECUTE FUNCTION sync_dungeon_players();
+
+DROP TRIGGER IF EXISTS trigger_dungeon_players_update ON dungeon;
+CREATE TRIGGER trigger_dungeon_players_update
+    AFTER UPDATE OF is_finishing, floor,
+        player1, player2, player3, player4,
+        heroine1, heroine2, heroine3, heroine4
+    ON dungeon
+    FOR EACH ROW
+    EXECUTE FUNCTION sync_dungeon_players();
+
+-- ============================================
+-- 기존 던전 백필
+-- ============================================
+INSERT INTO dungeon_players (dungeon_id, slot, player_id, heroine_id, floor, is_finishing)
+SELECT d.id, m.slot, m.player_id, m.heroine_id, d.floor, COALESCE(d.is_finishing, FALSE)
+FROM dungeon d
+CROSS JOIN LATERAL (
+    VALUES
+        (1, d.player1::TEXT, d.heroine1::TEXT),
+        (2, d.player2::TEXT, d.heroine2::TEXT),
+        (3, d.player3::TEXT, d.heroine3::TEXT),
+        (4, d.player4::TEXT, d.heroine4::TEXT)
+) AS m(slot, player_id, heroine_id)
+WHERE m.player_id IS NOT NULL
+ON CONFLICT (dungeon_id, slot) DO NOTHING;
@@ -0,0 +1,341 @@
+"""
+쿼리 임베딩 캐시 (프로세스 공용)
+
+한 턴 안에서도 같은 유저 메시지가 기억 검색과 시나리오 검색에
+각각 embed_query로 들어가므로, (모델, 정규화된 텍스트) 단위로 캐싱합니다.
+
+구조:
+- 1차: 프로세스 메모리 LRU + TTL (float32 np.ndarray, 기본 2048개 x 1536차원 = 약 12MB)
+- 2차(선택): Redis (기존 redis_manager 연결 풀 재사용)
+- 같은 키의 동시 miss는 한 번만 임베딩 API 호출 (single-flight)
+  단, 동기 호출(embed_query)은 다른 요청의 계산을 기다리지 않음 (이벤트 루프 교착 방지)
+
+환경변수:
+- EMBEDDING_CACHE_SIZE: 1차 캐시 최대 개수 (기본 2048)
+- EMBEDDING_CACHE_TTL: 유효 시간(초) (기본 3600)
+- EMBEDDING_CACHE_REDIS: "true"면 Redis 2차 캐시 사용 (기본 false)
+
+사용 예시:
+    self.embeddings = CachedQueryEmbeddings(
+        OpenAIEmbeddings(model="text-embedding-3-small")
+    )
+    vector = await self.embeddings.aembed_query("고향 얘기 해줘")
+
+    print(embedding_cache.stats())
+"""
+
+import asyncio
+import base64
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "2048"))
+EMBEDDING_CACHE_TTL = int(os.getenv("EMBEDDING_CACHE_TTL", "3600"))
+EMBEDDING_CACHE_REDIS = os.getenv("EMBEDDING_CACHE_REDIS", "false").lower() == "true"
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (앞뒤 공백 제거 + 연속 공백 하나로)"""
+    return " ".join(text.split())
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _as_vector(vector: Sequence[float]) -> np.ndarray:
+    """임베딩 -> 읽기 전용 float32 배열 (캐시에 공유되므로 수정 금지)"""
+    array = np.array(vector, dtype=np.float32)
+    array.setflags(write=False)
+    return array
+
+
+def _encode_vector(vector: np.ndarray) -> str:
+    """벡터 -> float32(little endian) base64 문자열 (Redis 저장용)"""
+    return base64.b64encode(np.asarray(vector, dtype="<f4").tobytes()).decode("ascii")
+
+
+def _decode_vector(encoded: str) -> np.ndarray:
+    return _as_vector(np.frombuffer(base64.b64decode(encoded), dtype="<f4"))
+
+
+class _Abandoned(Exception):
+    """같은 키를 계산하던 요청이 취소됨 -> 기다리던 요청이 직접 계산"""
+
+
+class EmbeddingCache:
+    """LRU + TTL 쿼리 임베딩 캐시
+
+    - 벡터는 float32 np.ndarray로 저장 (1536차원 기준 약 6KB)
+    - 같은 키가 동시에 miss 나면 한 요청만 임베딩 API를 호출하고 나머지는 그 결과를 기다림
+    여러 스레드(동기 *_sync 경로)와 이벤트 루프에서 동시에 접근하므로 락으로 보호합니다.
+    """
+
+    def __init__(
+        self,
+        max_size: int = EMBEDDING_CACHE_SIZE,
+        ttl: int = EMBEDDING_CACHE_TTL,
+        use_redis: bool = EMBEDDING_CACHE_REDIS,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.use_redis = use_redis
+
+        # key -> (만료 시각, 벡터)
+        self._store: "OrderedDict[Tuple[str, str], Tuple[float, np.ndarray]]" = (
+            OrderedDict()
+        )
+        # key -> 계산 중인 Future (single-flight)
+        self._inflight: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.redis_hits = 0
+        self.shared = 0
+        self.misses = 0
+
+    def _get_local_locked(self, key: Tuple[str, str]) -> Optional[np.ndarray]:
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        expires_at, vector = entry
+        if expires_at < time.monotonic():
+            del self._store[key]
+            return None
+        self._store.move_to_end(key)
+        return vector
+
+    def _set_local(self, key: Tuple[str, str], vector: np.ndarray) -> None:
+        with self._lock:
+            self._store[key] = (time.monotonic() + self.ttl, vector)
+            self._store.move_to_end(key)
+            while len(self._store) > self.max_size:
+                self._store.popitem(last=False)
+
+    def _get_redis(self, model: str, text_hash: str) -> Optional[np.ndarray]:
+        from db.redis_manager import redis_manager
+
+        try:
+            encoded = redis_manager.load_embedding(model, text_hash)
+        except Exception as e:
+            print(f"[WARN] 임베딩 Redis 조회 실패: {e}")
+            return None
+        return _decode_vector(encoded) if encoded else None
+
+    def _set_redis(self, model: str, text_hash: str, vector: np.ndarray) -> None:
+        from db.redis_manager import redis_manager
+
+        try:
+            redis_manager.save_embedding(
+                model, text_hash, _encode_vector(vector), self.ttl
+            )
+        except Exception as e:
+            print(f"[WARN] 임베딩 Redis 저장 실패: {e}")
+
+    def get(self, model: str, text: str) -> Optional[np.ndarray]:
+        """캐시 조회 (1차 -> 2차). 없으면 None, miss 카운트 증가"""
+        key = (model, text)
+        with self._lock:
+            vector = self._get_local_locked(key)
+            if vector is not None:
+                self.hits += 1
+                return vector
+
+        if self.use_redis:
+            vector = self._get_redis(model, _text_hash(text))
+            if vector is not None:
+                self._set_local(key, vector)
+                with self._lock:
+                    self.redis_hits += 1
+                return vector
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, model: str, text: str, vector: Sequence[float]) -> np.ndarray:
+        """캐시 저장 (1차 + 2차)"""
+        vector = _as_vector(vector)
+        self._set_local((model, text), vector)
+        if self.use_redis:
+            self._set_redis(model, _text_hash(text), vector)
+        return vector
+
+    # ============================================
+    # single-flight 조회
+    # ============================================
+
+    def _claim(
+        self, key: Tuple[str, str], share: bool = True
+    ) -> Tuple[Optional[np.ndarray], Optional[Future], bool]:
+        """(1차 캐시 벡터, in-flight Future, 직접 계산해야 하는지)
+
+        share=False면 다른 요청이 계산 중일 때 Future 없이 (None, None, False)를 반환합니다.
+        """
+        with self._lock:
+            vector = self._get_local_locked(key)
+            if vector is not None:
+                self.hits += 1
+                return vector, None, False
+            future = self._inflight.get(key)
+            if future is not None:
+                if not share:
+                    return None, None, False
+                self.shared += 1
+                return None, future, False
+            future = Future()
+            self._inflight[key] = future
+            return None, future, True
+
+    def _finish(
+        self,
+        key: Tuple[str, str],
+        future: Future,
+        vector: Optional[np.ndarray] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+        if error is None:
+            future.set_result(vector)
+        elif isinstance(error, Exception):
+            future.set_exception(error)
+        else:
+            # 취소(CancelledError) 등: 기다리던 요청은 다시 시도
+            future.set_exception(_Abandoned())
+
+    def _load_redis_or_miss(self, model: str, text: str) -> Optional[np.ndarray]:
+        """계산 담당 요청의 2차 캐시 조회 (없으면 miss 카운트)"""
+        if self.use_redis:
+            vector = self._get_redis(model, _text_hash(text))
+            if vector is not None:
+                self._set_local((model, text), vector)
+                with self._lock:
+                    self.redis_hits += 1
+                return vector
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def get_or_compute(
+        self, model: str, text: str, compute: Callable[[str], Sequence[float]]
+    ) -> np.ndarray:
+        """캐시 조회, 없으면 compute(text)로 계산 후 저장
+
+        다른 요청이 같은 키를 계산 중이면 기다리지 않고 직접 계산합니다.
+        동기 호출은 이벤트 루프 스레드에서 올 수 있어(SageScenarioService 등),
+        같은 루프의 aget_or_compute 결과를 블로킹으로 기다리면 영원히 끝나지 않습니다.
+        계산 중인 요청이 없으면 계산을 맡아 뒤이은 비동기 요청과 결과를 공유합니다.
+        """
+        key = (model, text)
+        vector, future, leader = self._claim(key, share=False)
+        if vector is not None:
+            return vector
+        if not leader:
+            vector = self._load_redis_or_miss(model, text)
+            if vector is None:
+                vector = self.set(model, text, compute(text))
+            return vector
+
+        try:
+            vector = self._load_redis_or_miss(model, text)
+            if vector is None:
+                vector = self.set(model, text, compute(text))
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, vector=vector)
+        return vector
+
+    async def aget_or_compute(
+        self, model: str, text: str, compute: Callable[[str], Awaitable[Sequence[float]]]
+    ) -> np.ndarray:
+        """get_or_compute의 비동기 버전 (Redis는 동기 클라이언트라 스레드에서 실행)"""
+        key = (model, text)
+        while True:
+            vector, future, leader = self._claim(key)
+            if vector is not None:
+                return vector
+            if not leader:
+                try:
+                    # shield: 기다리던 요청이 취소돼도 공유 Future는 취소하지 않음
+                    return await asyncio.shield(asyncio.wrap_future(future))
+                except _Abandoned:
+                    continue
+
+            try:
+                if self.use_redis:
+                    vector = await asyncio.to_thread(self._load_redis_or_miss, model, text)
+                else:
+                    vector = self._load_redis_or_miss(model, text)
+                if vector is None:
+                    computed = await compute(text)
+                    if self.use_redis:
+                        vector = await asyncio.to_thread(self.set, model, text, computed)
+                    else:
+                        vector = self.set(model, text, computed)
+            except BaseException as e:
+                self._finish(key, future, error=e)
+                raise
+            self._finish(key, future, vector=vector)
+            return vector
+
+    def clear(self) -> None:
+        """1차 캐시 및 카운터 초기화 (Redis는 TTL로 자연 만료)"""
+        with self._lock:
+            self._store.clear()
+            self.hits = self.redis_hits = self.shared = self.misses = 0
+
+    def stats(self) -> Dict[str, float]:
+        """hit/miss 통계"""
+        with self._lock:
+            total = self.hits + self.redis_hits + self.shared + self.misses
+            return {
+                "size": len(self._store),
+                "hits": self.hits,
+                "redis_hits": self.redis_hits,
+                "shared": self.shared,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.redis_hits + self.shared) / total if total else 0.0,
+            }
+
+
+class CachedQueryEmbeddings:
+    """embed_query/aembed_query에 캐시를 씌운 임베딩 래퍼
+
+    OpenAIEmbeddings 자리에 그대로 넣어 쓸 수 있습니다.
+    embed_query/aembed_query는 float32 np.ndarray를 반환합니다 (to_vector_param에 그대로 전달).
+    embed_documents(저장용 일괄 임베딩)는 캐시 없이 그대로 위임합니다.
+    """
+
+    def __init__(self, embeddings, cache: Optional[EmbeddingCache] = None):
+        self.embeddings = embeddings
+        self.model = getattr(embeddings, "model", type(embeddings).__name__)
+        self.cache = cache or embedding_cache
+
+    def embed_query(self, text: str) -> np.ndarray:
+        return self.cache.get_or_compute(
+            self.model, normalize_text(text), self.embeddings.embed_query
+        )
+
+    async def aembed_query(self, text: str) -> np.ndarray:
+        return await self.cache.aget_or_compute(
+            self.model, normalize_text(text), self.embeddings.aembed_query
+        )
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embeddings.embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.embeddings.aembed_documents(texts)
+
+
+# 싱글톤 인스턴스
+embedding_cache = EmbeddingCache()
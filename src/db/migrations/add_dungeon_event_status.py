@@ -0,0 +1,38 @@
+"""
+dungeon.event_status 컬럼 추가
+
+dungeon_event_status_schema.sql을 실행합니다. (여러 번 실행해도 안전)
+DungeonService.entrance / get_entrance_events가 이 컬럼을 사용하므로
+새 코드를 배포하기 전에 먼저 적용해야 합니다.
+
+사용법:
+    python -m src.db.migrations.add_dungeon_event_status
+"""
+
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.db.config import CONNECTION_URL
+
+SCHEMA_PATH = Path(__file__).parent.parent / "dungeon_event_status_schema.sql"
+
+
+def main():
+    engine = create_engine(CONNECTION_URL, pool_pre_ping=True)
+    sql = SCHEMA_PATH.read_text(encoding="utf-8")
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql(sql)
+        pending = conn.execute(
+            text("SELECT COUNT(*) FROM dungeon WHERE event_status = 'pending'")
+        ).scalar()
+
+    print(f"[INFO] dungeon.event_status 적용 완료 (생성 중 {pending}개 층)")
+
+
+if __name__ == "__main__":
+    main()
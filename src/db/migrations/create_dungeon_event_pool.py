@@ -0,0 +1,36 @@
+"""
+dungeon_event_pool 테이블 생성
+
+dungeon_event_pool_schema.sql을 실행합니다. (여러 번 실행해도 안전)
+테이블이 없으면 이벤트 풀은 비어 있는 것으로 처리되어 기존처럼 LLM으로 생성합니다.
+재고 채우기는 src/scripts/fill_event_pool.py
+
+사용법:
+    python -m src.db.migrations.create_dungeon_event_pool
+"""
+
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.db.config import CONNECTION_URL
+
+SCHEMA_PATH = Path(__file__).parent.parent / "dungeon_event_pool_schema.sql"
+
+
+def main():
+    engine = create_engine(CONNECTION_URL, pool_pre_ping=True)
+    sql = SCHEMA_PATH.read_text(encoding="utf-8")
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql(sql)
+        total = conn.execute(text("SELECT COUNT(*) FROM dungeon_event_pool")).scalar()
+
+    print(f"[INFO] dungeon_event_pool 적용 완료 (재고 {total}개)")
+
+
+if __name__ == "__main__":
+    main()
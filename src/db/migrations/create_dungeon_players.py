@@ -0,0 +1,39 @@
+"""
+dungeon_players 멤버십 테이블 생성 + 기존 던전 백필
+
+dungeon_players_schema.sql을 실행합니다. (여러 번 실행해도 안전)
+RDBRepository / DungeonService의 던전 조회가 이 테이블을 사용하므로
+새 코드를 배포하기 전에 먼저 적용해야 합니다.
+
+사용법:
+    python -m src.db.migrations.create_dungeon_players
+"""
+
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.db.config import CONNECTION_URL
+
+SCHEMA_PATH = Path(__file__).parent.parent / "dungeon_players_schema.sql"
+
+
+def main():
+    engine = create_engine(CONNECTION_URL, pool_pre_ping=True)
+    sql = SCHEMA_PATH.read_text(encoding="utf-8")
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql(sql)
+        active = conn.execute(
+            text("SELECT COUNT(*) FROM dungeon_players WHERE is_finishing = FALSE")
+        ).scalar()
+        total = conn.execute(text("SELECT COUNT(*) FROM dungeon_players")).scalar()
+
+    print(f"[INFO] dungeon_players 적용 완료 (전체 {total}행, 미완료 {active}행)")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,9 @@ from langchain_openai import OpenAIEmbeddings
 from langchain.chat_models import init_chat_model
 
 from db.config import CONNECTION_URL
+from db.async_engine import get_async_engine
+from db.embedding_cache import CachedQueryEmbeddings
+from db.vector_codec import register_vector_codec, to_vector_param
 from enums.LLM import LLM
 from agents.npc.npc_constants import NPC_ID_TO_NAME_KR
 from utils.langfuse_tracker import tracker
@@ -39,6 +42,61 @@ def _normalize_pair(npc_id_1: int, npc_id_2: int) -> Tuple[int, int]:
     return npc_id_2, npc_id_1
 
 
+# npc_npc_memories 벌크 INSERT 컬럼 (CAST가 필요한 컬럼은 아래 _MEMORY_VALUE_CASTS 참고)
+_MEMORY_COLUMNS = [
+    "conversation_id",
+    "turn_index",
+    "player_id",
+    "heroine_id_1",
+    "heroine_id_2",
+    "speaker_id",
+    "subject_id",
+    "content",
+    "content_type",
+    "embedding",
+    "importance",
+    "metadata",
+]
+_MEMORY_VALUE_CASTS = {"embedding": "vector", "metadata": "jsonb"}
+
+# 한 statement에 넣을 최대 행 수 (드라이버 파라미터 개수 제한 대비)
+BULK_INSERT_CHUNK = 500
+
+
+def build_bulk_memory_insert(
+    rows: List[Dict[str, Any]],
+) -> Tuple[Any, Dict[str, Any]]:
+    """npc_npc_memories 다중 행 INSERT 문 생성
+
+    행마다 INSERT를 따로 보내지 않고 VALUES (...), (...), ... 한 문장으로 묶습니다.
+
+    Args:
+        rows: _MEMORY_COLUMNS 키를 가진 dict 리스트
+              (embedding은 to_vector_param, metadata는 JSON 문자열)
+
+    Returns:
+        (text() SQL, 파라미터 dict)
+    """
+    values_sql = []
+    params: Dict[str, Any] = {}
+    for i, row in enumerate(rows):
+        placeholders = []
+        for col in _MEMORY_COLUMNS:
+            key = f"{col}_{i}"
+            params[key] = row[col]
+            cast = _MEMORY_VALUE_CASTS.get(col)
+            placeholders.append(f"CAST(:{key} AS {cast})" if cast else f":{key}")
+        values_sql.append(f"({', '.join(placeholders)}, NOW())")
+
+    sql = text(
+        f"""
+        INSERT INTO npc_npc_memories ({', '.join(_MEMORY_COLUMNS)}, created_at)
+        VALUES {', '.join(values_sql)}
+        """
+    )
+    return sql, params
+
+
 class NpcNpcMemoryManager:
     """NPC-NPC 저장/조회 담당 클래스"""
 
@@ -46,8 +104,15 @@ class NpcNpcMemoryManager:
         if not CONNECTION_URL:
             raise RuntimeError("DATABASE_URL이 비어있습니다 (.env 확인)")
 
-        self.engine = create_engine(CONNECTION_URL, pool_pre_ping=True)
-        self.embeddings = OpenAIEmbeddings(model=embedding_model)
+        # 동기: 체크포인트 저장/조회용, 비동기: async 메서드용 공용 풀
+        self.engine = register_vector_codec(
+            create_engine(CONNECTION_URL, pool_pre_ping=True)
+        )
+        self.async_engine = get_async_engine()
+        # 쿼리 임베딩은 프로세스 공용 캐시를 거침 (db/embedding_cache.py)
+        self.embeddings = CachedQueryEmbeddings(
+            OpenAIEmbeddings(model=embedding_model)
+        )
 
         # 아주 단순한 fact 추출용 (필요 최소)
         self.extract_llm = init_chat_model(model=LLM.GPT5_MINI)
@@ -350,68 +415,49 @@ JSON 배열로 응답하세요. 저장할 사실이 없으면 빈 배열 []을 
         if not facts:
             return 0
 
-        # 2. 각 fact를 DB에 저장
-        inserted = 0
-        with self.engine.connect() as conn:
-            for idx, fact in enumerate(facts):
-                speaker_id = fact.get("speaker_id")
-                subject_id = fact.get("subject_id")
-                content = fact.get("content")
-                content_type = fact.get("content_type", "event")
-                importance = fact.get("importance", 5)
-
-                if speaker_id is None or content is None:
-                    continue
-
-                embed = self.embeddings.embed_query(str(content))
-
-                sql_insert = text(
-                    """
-                    INSERT INTO npc_npc_memories (
-                        conversation_id, turn_index,
-                        player_id, heroine_id_1, heroine_id_2,
-                        speaker_id, subject_id,
-                        content, content_type,
-                        embedding, importance,
-                        created_at,
-                        metadata
-                    )
-                    VALUES (
-                        :conversation_id, :turn_index,
-                        :player_id, :heroine_id_1, :heroine_id_2,
-                        :speaker_id, :subject_id,
-                        :content, :content_type,
-                        CAST(:embedding AS vector), :importance,
-                        NOW(),
-                        CAST(:metadata AS jsonb)
-                    )
-                    """
-                )
+        # 2. 유효한 fact만 추려서 한 번의 배치 요청으로 임베딩
+        # (turn_index는 기존과 같이 추출 순서 기준 idx + 1)
+        valid_facts = [
+            (idx, fact)
+            for idx, fact in enumerate(facts)
+            if fact.get("speaker_id") is not None and fact.get("content") is not None
+        ]
+        if not valid_facts:
+            return 0
 
-                conn.execute(
-                    sql_insert,
-                    {
-                        "conversation_id": checkpoint_id,
-                        "turn_index": idx + 1,
-                        "player_id": str(player_id),
-                        "heroine_id_1": heroine_id_1,
-                        "heroine_id_2": heroine_id_2,
-                        "speaker_id": int(speaker_id),
-                        "subject_id": int(subject_id) if subject_id else 0,
-                        "content": str(content),
-                        "content_type": content_type,
-                        "embedding": str(embed),
-                        "importance": importance,
-                        "metadata": json.dumps(
-                            {"situation": situation}, ensure_ascii=False
-                        ),
-                    },
-                )
-                inserted += 1
+        texts = [str(fact["content"]) for _, fact in valid_facts]
+        embeddings = await self.embeddings.aembed_documents(texts)
 
-            conn.commit()
+        metadata = json.dumps({"situation": situation}, ensure_ascii=False)
+        rows = []
+        for (idx, fact), embed in zip(valid_facts, embeddings):
+            subject_id = fact.get("subject_id")
+            rows.append(
+                {
+                    "conversation_id": checkpoint_id,
+                    "turn_index": idx + 1,
+                    "player_id": str(player_id),
+                    "heroine_id_1": heroine_id_1,
+                    "heroine_id_2": heroine_id_2,
+                    "speaker_id": int(fact["speaker_id"]),
+                    "subject_id": int(subject_id) if subject_id else 0,
+                    "content": str(fact["content"]),
+                    "content_type": fact.get("content_type", "event"),
+                    "embedding": to_vector_param(embed),
+                    "importance": fact.get("importance", 5),
+                    "metadata": metadata,
+                }
+            )
 
-        return inserted
+        # 3. 다중 행 INSERT (한 트랜잭션)
+        async with self.async_engine.begin() as conn:
+            for start in range(0, len(rows), BULK_INSERT_CHUNK):
+                sql, params = build_bulk_memory_insert(
+                    rows[start : start + BULK_INSERT_CHUNK]
+                )
+                await conn.execute(sql, params)
+
+        return len(rows)
 
     def save_turn_memories(
         self,
@@ -426,6 +472,7 @@ JSON 배열로 응답하세요. 저장할 사실이 없으면 빈 배열 []을 
 
         성능 최적화:
         - 배치 임베딩 API 사용 (N번 호출 → 1번 호출)
+        - 다중 행 INSERT 사용 (N번 INSERT → 1번)
 
         Args:
             player_id: 플레이어 ID
@@ -484,57 +531,34 @@ JSON 배열로 응답하세요. 저장할 사실이 없으면 빈 배열 []을 
         texts = [msg["text"] for msg in valid_messages]
         embeddings = self.embeddings.embed_documents(texts)
 
-        # 3. DB에 일괄 저장
-        inserted = 0
-        with self.engine.connect() as conn:
-            for msg, embed in zip(valid_messages, embeddings):
-                sql_insert = text(
-                    """
-                    INSERT INTO npc_npc_memories (
-                        conversation_id, turn_index,
-                        player_id, heroine_id_1, heroine_id_2,
-                        speaker_id, subject_id,
-                        content, content_type,
-                        embedding, importance,
-                        created_at,
-                        metadata
-                    )
-                    VALUES (
-                        :conversation_id, :turn_index,
-                        :player_id, :heroine_id_1, :heroine_id_2,
-                        :speaker_id, :subject_id,
-                        :content, :content_type,
-                        CAST(:embedding AS vector), :importance,
-                        NOW(),
-                        CAST(:metadata AS jsonb)
-                    )
-                    """
-                )
+        # 3. 다중 행 INSERT로 일괄 저장 (한 번의 statement)
+        metadata = json.dumps({"situation": situation}, ensure_ascii=False)
+        rows = [
+            {
+                "conversation_id": checkpoint_id,
+                "turn_index": msg["idx"] + 1,
+                "player_id": str(player_id),
+                "heroine_id_1": heroine_id_1,
+                "heroine_id_2": heroine_id_2,
+                "speaker_id": msg["speaker_id"],
+                "subject_id": msg["subject_id"],
+                "content": msg["text"],
+                "content_type": "turn",
+                "embedding": to_vector_param(embed),
+                "importance": 5,
+                "metadata": metadata,
+            }
+            for msg, embed in zip(valid_messages, embeddings)
+        ]
 
-                conn.execute(
-                    sql_insert,
-                    {
-                        "conversation_id": checkpoint_id,
-                        "turn_index": msg["idx"] + 1,
-                        "player_id": str(player_id),
-                        "heroine_id_1": heroine_id_1,
-                        "heroine_id_2": heroine_id_2,
-                        "speaker_id": msg["speaker_id"],
-                        "subject_id": msg["subject_id"],
-                        "content": msg["text"],
-                        "content_type": "turn",
-                        "embedding": str(embed),
-                        "importance": 5,
-                        "metadata": json.dumps(
-                            {"situation": situation}, ensure_ascii=False
-                        ),
-                    },
+        with self.engine.begin() as conn:
+            for start in range(0, len(rows), BULK_INSERT_CHUNK):
+                sql, params = build_bulk_memory_insert(
+                    rows[start : start + BULK_INSERT_CHUNK]
                 )
-                inserted += 1
-
-            conn.commit()
+                conn.execute(sql, params)
 
-        return inserted
+        return len(rows)
 
     def invalidate_memories_after_turn(
         self, checkpoint_id: str, interrupted_turn: int
@@ -561,7 +585,7 @@ JSON 배열로 응답하세요. 저장할 사실이 없으면 빈 배열 []을 
 
         return result.rowcount
 
-    def get_latest_checkpoint_conversation(
+    async def get_latest_checkpoint_conversation(
         self,
         player_id: str,
         npc1_id: int,
@@ -591,22 +615,23 @@ JSON 배열로 응답하세요. 저장할 사실이 없으면 빈 배열 []을 
             """
         )
 
-        with self.engine.connect() as conn:
-            row = conn.execute(
+        async with self.async_engine.connect() as conn:
+            result = await conn.execute(
                 sql,
                 {
                     "player_id": str(player_id),
                     "heroine_id_1": heroine_id_1,
                     "heroine_id_2": heroine_id_2,
                 },
-            ).fetchone()
+            )
+            row = result.fetchone()
 
             if row and row.conversation:
                 return row.conversation
 
         return None
 
-    def search_memories(
+    async def search_memories(
         self,
         player_id: str,
         npc1_id: int,
@@ -615,7 +640,7 @@ JSON 배열로 응답하세요. 저장할 사실이 없으면 빈 배열 []을 
         limit: int = 5,
     ) -> List[Dict[str, Any]]:
         heroine_id_1, heroine_id_2 = _normalize_pair(npc1_id, npc2_id)
-        query_embedding = self.embeddings.embed_query(query)
+        query_embedding = await self.embeddings.aembed_query(query)
 
         sql = text(
             """
@@ -631,18 +656,19 @@ JSON 배열로 응답하세요. 저장할 사실이 없으면 빈 배열 []을 
         )
 
         results: List[Dict[str, Any]] = []
-        with self.engine.connect() as conn:
-            for row in conn.execute(
+        async with self.async_engine.connect() as conn:
+            result = await conn.execute(
                 sql,
                 {
                     "player_id": str(player_id),
                     "heroine_id_1": heroine_id_1,
                     "heroine_id_2": heroine_id_2,
                     "query_text": query,
-                    "query_embedding": str(query_embedding),
+                    "query_embedding": to_vector_param(query_embedding),
                     "top_k": int(limit),
                 },
-            ):
+            )
+            for row in result:
                 results.append(
                     {
                         "id": str(row.id),
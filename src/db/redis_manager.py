@@ -11,6 +11,7 @@ Redis 키 구조:
 - guild:{player_id} - 길드 진입 상태
 - npc_conv:{player_id} - 진행 중인 NPC간 대화
 - npc_npc_session:{player_id}:{min_npc_id}:{max_npc_id} - NPC-NPC 세션(쌍 단위)
+- emb:{model}:{text_hash} - 쿼리 임베딩 캐시 (float32 base64)
 """
 
 import os
@@ -119,6 +120,27 @@ class RedisManager:
         max_id = npc2_id if npc1_id < npc2_id else npc1_id
         return f"npc_npc_session:{player_id}:{min_id}:{max_id}"
 
+    def _get_embedding_key(self, model: str, text_hash: str) -> str:
+        """쿼리 임베딩 캐시 키 생성
+
+        형식: emb:{model}:{text_hash}
+        """
+        return f"emb:{model}:{text_hash}"
+
+    def _get_tts_audio_key(self, key: str) -> str:
+        """TTS 결과 캐시 키 생성
+
+        형식: tts:{sha256}
+        """
+        return f"tts:{key}"
+
+    def _get_tts_audio_index_key(self) -> str:
+        """TTS 캐시 LRU 인덱스 키 (sorted set, score=마지막 접근 시각)
+
+        형식: tts_index
+        """
+        return "tts_index"
+
     # ============================================
     # 세션 관리 메서드
     # ============================================
@@ -474,6 +496,86 @@ class RedisManager:
         self.save_npc_npc_session(player_id, npc1_id, npc2_id, session)
         return session
 
+    # ============================================
+    # 쿼리 임베딩 캐시 (db/embedding_cache.py의 2차 캐시)
+    # ============================================
+
+    def load_embedding(self, model: str, text_hash: str) -> Optional[str]:
+        """캐시된 임베딩 로드
+
+        Args:
+            model: 임베딩 모델명
+            text_hash: 정규화된 텍스트의 해시
+
+        Returns:
+            float32 base64 문자열 또는 None (없으면)
+        """
+        return self.client.get(self._get_embedding_key(model, text_hash))
+
+    def save_embedding(
+        self, model: str, text_hash: str, encoded: str, ttl: int
+    ) -> None:
+        """임베딩 저장 (TTL 후 자동 삭제)
+
+        Args:
+            model: 임베딩 모델명
+            text_hash: 정규화된 텍스트의 해시
+            encoded: float32 base64 문자열
+            ttl: 유효 시간(초)
+        """
+        self.client.setex(self._get_embedding_key(model, text_hash), ttl, encoded)
+
+    # ============================================
+    # TTS 결과 캐시 (tools/audio/tts_cache.py의 redis 백엔드)
+    # ============================================
+
+    def load_tts_audio(self, key: str) -> Optional[str]:
+        """캐시된 TTS 오디오 로드 (접근 시각 갱신)
+
+        Args:
+            key: 내용 해시
+
+        Returns:
+            wav base64 문자열 또는 None (없으면)
+        """
+        encoded = self.client.get(self._get_tts_audio_key(key))
+        if encoded is not None:
+            self.client.zadd(self._get_tts_audio_index_key(), {key: datetime.now().timestamp()})
+        return encoded
+
+    def save_tts_audio(
+        self, key: str, encoded: str, ttl: int, max_entries: int
+    ) -> int:
+        """TTS 오디오 저장 후, 최대 개수를 넘으면 오래 안 쓴 것부터 삭제
+
+        Args:
+            key: 내용 해시
+            encoded: wav base64 문자열
+            ttl: 유효 시간(초)
+            max_entries: 최대 보관 개수
+
+        Returns:
+            삭제된 항목 수
+        """
+        pipe = self.client.pipeline()
+        pipe.setex(self._get_tts_audio_key(key), ttl, encoded)
+        pipe.zadd(self._get_tts_audio_index_key(), {key: datetime.now().timestamp()})
+        pipe.zcard(self._get_tts_audio_index_key())
+        count = pipe.execute()[-1]
+
+        overflow = count - max_entries
+        if overflow <= 0:
+            return 0
+
+        old_keys = self.client.zrange(self._get_tts_audio_index_key(), 0, overflow - 1)
+        if not old_keys:
+            return 0
+        pipe = self.client.pipeline()
+        pipe.delete(*[self._get_tts_audio_key(k) for k in old_keys])
+        pipe.zrem(self._get_tts_audio_index_key(), *old_keys)
+        pipe.execute()
+        return len(old_keys)
+
 
 # 싱글톤 인스턴스 (앱 전체에서 하나만 사용)
 redis_manager = RedisManager()
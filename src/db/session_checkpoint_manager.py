@@ -15,10 +15,10 @@ Session Checkpoint Manager
 import json
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from langchain.chat_models import init_chat_model
 from enums.LLM import LLM
-from db.config import CONNECTION_URL
+from db.async_engine import get_async_engine
 from utils.langfuse_tracker import tracker
 
 
@@ -27,10 +27,11 @@ class SessionCheckpointManager:
 
     def __init__(self):
         """초기화"""
-        self.engine = create_engine(CONNECTION_URL, pool_pre_ping=True)
+        # 공용 비동기 풀 (모든 DB 접근이 async 경로에서 호출됨)
+        self.async_engine = get_async_engine()
         self.llm = init_chat_model(model=LLM.GPT5_MINI)
 
-    def save_checkpoint_background(
+    async def save_checkpoint_background(
         self,
         player_id: str,
         npc_id: int,
@@ -53,7 +54,7 @@ class SessionCheckpointManager:
         try:
             conversation = {"user": user_message, "npc": npc_response}
 
-            with self.engine.connect() as conn:
+            async with self.async_engine.begin() as conn:
                 summary_list_sql = text(
                     """
                     SELECT summary_list
@@ -63,7 +64,7 @@ class SessionCheckpointManager:
                     LIMIT 1
                 """
                 )
-                result = conn.execute(
+                result = await conn.execute(
                     summary_list_sql,
                     {
                         "player_id": str(player_id),
@@ -84,7 +85,7 @@ class SessionCheckpointManager:
                 """
                 )
 
-                conn.execute(
+                await conn.execute(
                     sql,
                     {
                         "player_id": str(player_id),
@@ -94,7 +95,6 @@ class SessionCheckpointManager:
                         "summary_list": json.dumps(summary_list, ensure_ascii=False),
                     },
                 )
-                conn.commit()
 
         except Exception as e:
             print(f"[ERROR] save_checkpoint_background 실패: {e}")
@@ -167,7 +167,7 @@ class SessionCheckpointManager:
                 "created_at": datetime.now().isoformat(),
             }
 
-    def save_summary(
+    async def save_summary(
         self, player_id: str, npc_id: int, summary_list: List[Dict[str, Any]]
     ) -> None:
         """요약 리스트를 저장
@@ -192,8 +192,8 @@ class SessionCheckpointManager:
             """
             )
 
-            with self.engine.connect() as conn:
-                conn.execute(
+            async with self.async_engine.begin() as conn:
+                await conn.execute(
                     sql,
                     {
                         "player_id": str(player_id),
@@ -201,7 +201,7 @@ class SessionCheckpointManager:
                         "summary_list": json.dumps(summary_list, ensure_ascii=False),
                     },
                 )  # execute: 데이터베이스 쿼리를 실행하는 함수
-                conn.commit()  # commit: 데이터베이스 변경 사항을 영구적으로 저장하는 함수
+                # begin() 블록을 빠져나가면 자동으로 commit 됨
 
         except Exception as e:
             print(f"[ERROR] save_summary 실패: {e}")
@@ -370,7 +370,7 @@ class SessionCheckpointManager:
             print(f"[ERROR] calculate_time_diff 실패: {e}")
             return "알 수 없음"
 
-    def load_checkpoints(self, player_id: str, npc_id: int) -> Dict[str, Any]:
+    async def load_checkpoints(self, player_id: str, npc_id: int) -> Dict[str, Any]:
         """로그인시 checkpoint 로드
 
         최근 20개의 conversation과 summary_list를 로드합니다.
@@ -393,8 +393,8 @@ class SessionCheckpointManager:
             """
             )
 
-            with self.engine.connect() as conn:
-                result = conn.execute(
+            async with self.async_engine.connect() as conn:
+                result = await conn.execute(
                     sql, {"player_id": str(player_id), "npc_id": npc_id}
                 )
                 rows = result.fetchall()
@@ -435,7 +435,7 @@ class SessionCheckpointManager:
                 "last_chat_at": None,
             }
 
-    def get_last_chat_at(self, player_id: str, npc_id: int) -> Optional[str]:
+    async def get_last_chat_at(self, player_id: str, npc_id: int) -> Optional[str]:
         """마지막 대화 시간 조회
 
         Args:
@@ -456,8 +456,8 @@ class SessionCheckpointManager:
             """
             )
 
-            with self.engine.connect() as conn:
-                result = conn.execute(
+            async with self.async_engine.connect() as conn:
+                result = await conn.execute(
                     sql, {"player_id": str(player_id), "npc_id": npc_id}
                 )
                 row = result.fetchone()
@@ -23,9 +23,11 @@ PostgreSQL + pgvector + PGroonga 기반 4요소 하이브리드 검색
 
 import json
 import uuid
+import asyncio
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
+import numpy as np
 from sqlalchemy import create_engine, text
 from langchain_openai import OpenAIEmbeddings
 from langchain.chat_models import init_chat_model
@@ -38,12 +40,16 @@ load_dotenv()
 logger = logging.getLogger("user_memory")
 
 from db.config import CONNECTION_URL
+from db.async_engine import get_async_engine
+from db.embedding_cache import CachedQueryEmbeddings
+from db.vector_codec import register_vector_codec, to_vector_param
 from utils.langfuse_tracker import tracker
 from db.user_memory_models import (
     Speaker,
     Subject,
     ContentType,
     ExtractedFact,
+    ConflictCheckResult,
     SearchWeights,
     UserMemory,
     NPC_ID_TO_HEROINE,
@@ -68,11 +74,16 @@ class UserMemoryManager:
         Args:
             embedding_model: OpenAI 임베딩 모델명
         """
-        # DB 연결
-        self.engine = create_engine(CONNECTION_URL, pool_pre_ping=True)
+        # DB 연결 (동기: *_sync 메서드용, 비동기: async 메서드용 공용 풀)
+        self.engine = register_vector_codec(
+            create_engine(CONNECTION_URL, pool_pre_ping=True)
+        )
+        self.async_engine = get_async_engine()
 
-        # 임베딩 모델
-        self.embeddings = OpenAIEmbeddings(model=embedding_model)
+        # 임베딩 모델 (쿼리는 프로세스 공용 캐시 경유, db/embedding_cache.py)
+        self.embeddings = CachedQueryEmbeddings(
+            OpenAIEmbeddings(model=embedding_model)
+        )
 
         # Fact 추출용 LLM (temperature=0으로 일관된 추출)
         self.extract_llm = init_chat_model(model=LLM.GPT5_MINI)
@@ -83,6 +94,12 @@ class UserMemoryManager:
         # 중복 판정 임계값 (90% 유사도 이상이면 중복)
         self.duplicate_threshold = 0.9
 
+        # 충돌 후보 임계값 (55% 유사도 이상 + 같은 content_type이면 LLM 판단)
+        self.conflict_threshold = 0.55
+
+        # save_conversation에서 fact별 중복/충돌 판단 동시 실행 수
+        self.save_concurrency = 4
+
     # ============================================
     # Fact 추출
     # ============================================
@@ -300,18 +317,25 @@ Output:
     # ============================================
 
     async def add_memory(
-        self, player_id: str, heroine_id: str, fact: ExtractedFact
+        self,
+        player_id: str,
+        heroine_id: str,
+        fact: ExtractedFact,
+        embedding: Optional[List[float]] = None,
     ) -> dict:
         """단일 fact 저장 (중복/충돌 처리 포함)
 
         하이브리드 충돌 감지:
         1. 90% 유사도: 완전 중복으로 바로 무효화
-        2. 65% 유사도 + 같은 content_type: LLM으로 충돌 판단
+        2. 55% 유사도 + 같은 content_type: LLM으로 충돌 판단 (후보 전체를 한 번에)
+
+        DB 왕복은 조회 1번 + 쓰기 트랜잭션 1번입니다.
 
         Args:
             player_id: 플레이어 ID
             heroine_id: 히로인 ID
             fact: 저장할 fact
+            embedding: 미리 계산한 임베딩 (None이면 여기서 생성)
 
         Returns:
             dict: {
@@ -320,8 +344,42 @@ Output:
             }
         """
         # 1. 임베딩 생성 (content + keywords)
-        text_to_embed = self._combine_content_with_keywords(fact.content, fact.keywords)
-        embedding = self.embeddings.embed_query(text_to_embed)
+        if embedding is None:
+            text_to_embed = self._combine_content_with_keywords(
+                fact.content, fact.keywords
+            )
+            embedding = await self.embeddings.aembed_query(text_to_embed)
+
+        # 2~3. 중복/충돌 판단
+        invalidate_ids, invalidated = await self._resolve_conflicts(
+            player_id, heroine_id, fact, embedding
+        )
+
+        # 4. 무효화 + 새 기억 저장
+        memory_id = await self._insert_memory(
+            player_id, heroine_id, fact, embedding, invalidate_ids
+        )
+
+        return {"memory_id": memory_id, "invalidated": invalidated}
+
+    async def _resolve_conflicts(
+        self,
+        player_id: str,
+        heroine_id: str,
+        fact: ExtractedFact,
+        embedding: List[float],
+    ) -> Tuple[List[str], List[dict]]:
+        """저장 전 중복/충돌 판단 (읽기 전용, DB 변경 없음)
+
+        Args:
+            player_id: 플레이어 ID
+            heroine_id: 히로인 ID
+            fact: 저장할 fact
+            embedding: fact 임베딩
+
+        Returns:
+            (무효화할 기억 ID 리스트, 무효화된 기억 정보 리스트 [{"content": ...}])
+        """
         print(
             "[MemorySave]",
             f"player={player_id}",
@@ -330,40 +388,55 @@ Output:
             f"subject={fact.subject.value}",
             f"content={fact.content}",
             f"keywords={fact.keywords}",
-            f"embed_input={text_to_embed}",
         )
 
-        # 무효화된 기억 정보 수집
         invalidated = []
+        invalidate_ids = []
 
-        # 2. 완전 중복 검사 (90% 유사도)
-        similar = await self._find_similar_memory(player_id, heroine_id, embedding)
-
-        if similar:
-            await self._invalidate_memory(similar["id"])
-            invalidated.append({"content": similar["content"]})
-            print(f"[INFO] 완전 중복 무효화: {similar['content'][:50]}...")
-        else:
-            # 3. 충돌 후보 검색 (65% 유사도 + 같은 content_type)
-            candidates = await self._find_conflict_candidates(
-                player_id, heroine_id, embedding, fact.content_type.value
-            )
+        # 완전 중복(90%) + 충돌 후보(같은 content_type)를 한 번의 쿼리로 조회
+        duplicate, candidates = await self._find_duplicate_and_conflicts(
+            player_id, heroine_id, embedding, fact.content_type.value
+        )
 
-            # 4. LLM으로 충돌 판단
-            for candidate in candidates:
-                is_conflict = await self._check_conflict_with_llm(
-                    fact.content, candidate["content"]
+        if duplicate:
+            invalidate_ids.append(duplicate["id"])
+            invalidated.append({"content": duplicate["content"]})
+            print(f"[INFO] 완전 중복 무효화: {duplicate['content'][:50]}...")
+        elif candidates:
+            # LLM으로 충돌 판단 (후보 전체를 한 번의 호출로)
+            conflicts = await self._check_conflicts_with_llm(fact.content, candidates)
+            for candidate in conflicts:
+                invalidate_ids.append(candidate["id"])
+                invalidated.append({"content": candidate["content"]})
+                print(
+                    f"[INFO] 취향 변경 감지, 기존 무효화: {candidate['content'][:50]}..."
                 )
-                if is_conflict:
-                    await self._invalidate_memory(candidate["id"])
-                    invalidated.append({"content": candidate["content"]})
-                    print(
-                        f"[INFO] 취향 변경 감지, 기존 무효화: {candidate['content'][:50]}..."
-                    )
-
-        # 5. 새 기억 저장
+
+        return invalidate_ids, invalidated
+
+    async def _insert_memory(
+        self,
+        player_id: str,
+        heroine_id: str,
+        fact: ExtractedFact,
+        embedding: List[float],
+        invalidate_ids: List[str],
+    ) -> str:
+        """기존 기억 무효화 + 새 기억 저장 (하나의 트랜잭션)
+
+        Returns:
+            생성된 메모리 ID
+        """
         memory_id = str(uuid.uuid4())
 
+        invalidate_sql = text(
+            """
+            UPDATE user_memories
+            SET invalid_at = NOW(), updated_at = NOW()
+            WHERE id = ANY(CAST(:ids AS uuid[]))
+        """
+        )
+
         sql = text(
             """
             INSERT INTO user_memories 
@@ -374,8 +447,10 @@ Output:
         """
         )
 
-        with self.engine.connect() as conn:
-            conn.execute(
+        async with self.async_engine.begin() as conn:
+            if invalidate_ids:
+                await conn.execute(invalidate_sql, {"ids": invalidate_ids})
+            await conn.execute(
                 sql,
                 {
                     "id": memory_id,
@@ -386,13 +461,42 @@ Output:
                     "content": fact.content,
                     "keywords": fact.keywords,
                     "content_type": fact.content_type.value,
-                    "embedding": str(embedding),
+                    "embedding": to_vector_param(embedding),
                     "importance": fact.importance,
                 },
             )
-            conn.commit()
 
-        return {"memory_id": memory_id, "invalidated": invalidated}
+        return memory_id
+
+    def _dedupe_batch(
+        self, facts: List[ExtractedFact], embeddings: List[List[float]]
+    ) -> List[int]:
+        """같은 턴에서 추출된 fact끼리 완전 중복(duplicate_threshold 이상) 제거
+
+        순차 저장이라면 뒤 fact가 앞 fact를 완전 중복으로 무효화하므로,
+        같은 결과가 되도록 중복 묶음에서 가장 마지막 fact만 남깁니다.
+
+        Returns:
+            남길 fact 인덱스 (추출 순서)
+        """
+        if len(facts) < 2:
+            return list(range(len(facts)))
+
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        vectors = vectors / (np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-8)
+        similarity = vectors @ vectors.T
+
+        keep = []
+        for i in range(len(facts)):
+            later = [j for j in range(i + 1, len(facts)) if similarity[i, j] >= self.duplicate_threshold]
+            if later:
+                logger.info(
+                    f"[MEMORY] Same-turn duplicate dropped: '{facts[i].content[:50]}' "
+                    f"(kept '{facts[later[-1]].content[:50]}')"
+                )
+                continue
+            keep.append(i)
+        return keep
 
     def _extract_player_name(self, fact: ExtractedFact) -> Optional[str]:
         """ExtractedFact에서 플레이어 이름 추출
@@ -444,30 +548,67 @@ Output:
             logger.info(f"[MEMORY] ========== SAVE CONVERSATION END (0 saved) ==========")
             return {"memory_ids": [], "preference_changes": [], "extracted_player_name": None}
 
-        # 각 fact 저장
+        # 1. 모든 fact를 한 번의 배치 요청으로 임베딩
+        texts = [
+            self._combine_content_with_keywords(fact.content, fact.keywords)
+            for fact in facts
+        ]
+        embeddings = await self.embeddings.aembed_documents(texts)
+
+        # 이름 추출 (같은 턴 중복으로 빠지는 fact도 포함)
+        extracted_player_name = None
+        for fact in facts:
+            name = self._extract_player_name(fact)
+            if name:
+                extracted_player_name = name
+                logger.info(f"[MEMORY] Player name extracted: {name}")
+                break
+
+        # 2. 같은 턴 fact끼리 완전 중복 제거 (아래 DB 판단은 저장 전 상태 기준이라 서로를 보지 못함)
+        keep = self._dedupe_batch(facts, embeddings)
+        facts = [facts[i] for i in keep]
+        embeddings = [embeddings[i] for i in keep]
+
+        # 3. fact별 DB 중복/충돌 판단을 동시에 실행 (동시 실행 수 제한)
+        semaphore = asyncio.Semaphore(self.save_concurrency)
+
+        async def resolve(fact: ExtractedFact, embedding: List[float]):
+            async with semaphore:
+                return await self._resolve_conflicts(
+                    player_id, heroine_id, fact, embedding
+                )
+
+        resolutions = await asyncio.gather(
+            *[resolve(fact, embedding) for fact, embedding in zip(facts, embeddings)]
+        )
+
+        # 4. 저장은 추출 순서대로 (fact마다 트랜잭션 분리 -> created_at 순서 유지)
         memory_ids = []
         preference_changes = []
-        extracted_player_name = None
+        already_invalidated = set()
 
-        for idx, fact in enumerate(facts):
+        for idx, (fact, embedding, (invalidate_ids, invalidated)) in enumerate(
+            zip(facts, embeddings, resolutions)
+        ):
             logger.info(f"[MEMORY] Saving fact #{idx+1} to DB...")
-            result = await self.add_memory(player_id, heroine_id, fact)
-            if result["memory_id"]:
-                memory_ids.append(result["memory_id"])
-                logger.info(f"[MEMORY] Saved with ID: {result['memory_id']}")
+            # 같은 기존 기억을 여러 fact가 무효화하는 경우 한 번만 처리
+            new_ids = [mid for mid in invalidate_ids if mid not in already_invalidated]
+            already_invalidated.update(new_ids)
+
+            memory_id = await self._insert_memory(
+                player_id, heroine_id, fact, embedding, new_ids
+            )
+            if memory_id:
+                memory_ids.append(memory_id)
+                logger.info(f"[MEMORY] Saved with ID: {memory_id}")
 
-            # 무효화된 기억이 있으면 취향 변화로 기록
-            for inv in result["invalidated"]:
+            # 무효화된 기억이 있으면 취향 변화로 기록 (이번 fact가 처음 무효화한 기억만)
+            for mid, inv in zip(invalidate_ids, invalidated):
+                if mid not in new_ids:
+                    continue
                 preference_changes.append({"old": inv["content"], "new": fact.content})
                 logger.info(f"[MEMORY] Preference changed: '{inv['content'][:50]}' -> '{fact.content[:50]}'")
 
-            # 이름 추출 시도
-            if extracted_player_name is None:
-                name = self._extract_player_name(fact)
-                if name:
-                    extracted_player_name = name
-                    logger.info(f"[MEMORY] Player name extracted: {name}")
-
         logger.info(f"[MEMORY] FINAL RESULT: {len(memory_ids)} fact(s) saved to user_memories")
         logger.info(f"[MEMORY] ========== SAVE CONVERSATION END ({len(memory_ids)} saved) ==========")
         
@@ -506,7 +647,7 @@ Output:
         weights = weights or self.default_weights
 
         # 검색어 임베딩
-        query_embedding = self.embeddings.embed_query(query)
+        query_embedding = await self.embeddings.aembed_query(query)
 
         # DB 검색 함수 호출
         sql = text(
@@ -527,14 +668,14 @@ Output:
 
         memories = []
 
-        with self.engine.connect() as conn:
-            result = conn.execute(
+        async with self.async_engine.connect() as conn:
+            result = await conn.execute(
                 sql,
                 {
                     "player_id": player_id,
                     "heroine_id": heroine_id,
                     "query_text": query,
-                    "query_embedding": str(query_embedding),
+                    "query_embedding": to_vector_param(query_embedding),
                     "top_k": limit,
                     "w_recency": weights.recency,
                     "w_importance": weights.importance,
@@ -610,7 +751,7 @@ Output:
                     "player_id": player_id,
                     "heroine_id": heroine_id,
                     "query_text": query,
-                    "query_embedding": str(query_embedding),
+                    "query_embedding": to_vector_param(query_embedding),
                     "top_k": limit,
                     "w_recency": self.default_weights.recency,
                     "w_importance": self.default_weights.importance,
@@ -646,51 +787,65 @@ Output:
             return f"{content} (Keywords: {', '.join(keywords)})"
         return content
 
-    async def _find_similar_memory(
-        self, player_id: str, heroine_id: str, embedding: list
-    ) -> Optional[dict]:
-        """유사 기억 검색 (중복 검사용)"""
+    async def _find_duplicate_and_conflicts(
+        self, player_id: str, heroine_id: str, embedding: list, content_type: str
+    ) -> Tuple[Optional[dict], List[dict]]:
+        """완전 중복 + 충돌 후보를 한 번의 쿼리로 조회
+
+        find_duplicate_and_conflicts() SQL 함수 사용.
+        중복이 있으면 충돌 후보는 조회하지 않습니다 (중복 처리만 하므로).
+
+        Args:
+            player_id: 플레이어 ID
+            heroine_id: 히로인 ID
+            embedding: 새 fact의 임베딩
+            content_type: 콘텐츠 타입 (preference, trait 등)
+
+        Returns:
+            (중복 기억 dict 또는 None, 충돌 후보 dict 리스트)
+        """
         sql = text(
             """
-            SELECT * FROM find_similar_memory(
+            SELECT * FROM find_duplicate_and_conflicts(
                 :player_id,
                 :heroine_id,
                 CAST(:embedding AS vector),
-                :threshold
+                :content_type,
+                :duplicate_threshold,
+                :conflict_threshold
             )
         """
         )
 
-        with self.engine.connect() as conn:
-            result = conn.execute(
+        duplicate = None
+        candidates = []
+
+        async with self.async_engine.connect() as conn:
+            result = await conn.execute(
                 sql,
                 {
                     "player_id": player_id,
                     "heroine_id": heroine_id,
-                    "embedding": str(embedding),
-                    "threshold": self.duplicate_threshold,
+                    "embedding": to_vector_param(embedding),
+                    "content_type": content_type,
+                    "duplicate_threshold": self.duplicate_threshold,
+                    "conflict_threshold": self.conflict_threshold,
                 },
             )
 
-            row = result.fetchone()
-            # fetchone(): 1개 행 → Optional[Row] 반환
-            # for문: 여러 행 순회 → 각 행을 처리
-            if row:
-                return {
+            for row in result:
+                item = {
                     "id": str(row.id),
                     "content": row.content,
+                    "content_type": row.content_type,
                     "similarity": row.similarity,
                 }
+                if row.is_duplicate:
+                    duplicate = item
+                else:
+                    candidates.append(item)
 
-        return None
-
-    async def _invalidate_memory(self, memory_id: str) -> None:
-        """기억 무효화 (soft delete)"""
-        sql = text("SELECT invalidate_memory(:memory_id)")
-
-        with self.engine.connect() as conn:
-            conn.execute(sql, {"memory_id": memory_id})
-            conn.commit()
+        return duplicate, candidates
 
     async def _find_conflict_candidates(
         self, player_id: str, heroine_id: str, embedding: list, content_type: str
@@ -722,15 +877,15 @@ Output:
 
         candidates = []
 
-        with self.engine.connect() as conn:
-            result = conn.execute(
+        async with self.async_engine.connect() as conn:
+            result = await conn.execute(
                 sql,
                 {
                     "player_id": player_id,
                     "heroine_id": heroine_id,
-                    "embedding": str(embedding),
+                    "embedding": to_vector_param(embedding),
                     "content_type": content_type,
-                    "threshold": 0.55,
+                    "threshold": self.conflict_threshold,
                 },
             )
 
@@ -746,44 +901,65 @@ Output:
 
         return candidates
 
-    async def _check_conflict_with_llm(
-        self, new_content: str, existing_content: str
-    ) -> bool:
-        """LLM으로 두 기억이 충돌하는지 판단
+    async def _check_conflicts_with_llm(
+        self, new_content: str, candidates: List[dict]
+    ) -> List[dict]:
+        """LLM으로 새 기억과 충돌하는 후보들을 한 번에 판단
+
+        후보마다 LLM을 따로 호출하지 않고, 번호를 매긴 목록으로 한 번에 물어봅니다.
 
         Args:
             new_content: 새로 저장하려는 기억
-            existing_content: 기존에 저장된 기억
+            candidates: 충돌 후보 dict 리스트 (content 포함)
 
         Returns:
-            True면 충돌 (기존 기억 무효화 필요)
+            충돌하는 후보 dict 리스트 (기존 기억 무효화 필요)
         """
-        prompt = f"""다음 두 기억이 충돌하거나 대체 관계인지 판단하세요.
+        if not candidates:
+            return []
 
-[기존 기억]
-{existing_content}
+        existing_lines = "\n".join(
+            f"{i}. {candidate['content']}" for i, candidate in enumerate(candidates, 1)
+        )
+
+        prompt = f"""새 기억과 기존 기억들이 각각 충돌하거나 대체 관계인지 판단하세요.
 
 [새 기억]
 {new_content}
 
+[기존 기억]
+{existing_lines}
+
 [판단 기준]
 - 같은 주제에 대해 취향/선호도가 바뀌었으면 충돌
 - 새 기억이 기존 기억을 부정하거나 수정하면 충돌
 - 서로 다른 주제면 충돌 아님
 - 추가 정보면 충돌 아님
 
-충돌이면 "yes", 아니면 "no"만 응답하세요."""
+충돌하는 기존 기억의 번호만 골라주세요. 없으면 빈 목록으로 응답하세요."""
 
         # LangFuse 토큰 추적 (v3 API)
         config = tracker.get_langfuse_config(
             tags=["memory", "conflict_check"],
-            metadata={"action": "conflict_detection"}
+            metadata={
+                "action": "conflict_detection",
+                "candidate_count": len(candidates),
+            }
         )
-        
-        response = await self.extract_llm.ainvoke(prompt, **config)
-        answer = response.content.strip().lower()
 
-        return answer == "yes"
+        try:
+            parser_llm = self.extract_llm.with_structured_output(ConflictCheckResult)
+            result: ConflictCheckResult = await parser_llm.ainvoke(prompt, **config)
+        except Exception as e:
+            # 판단 실패시 기존 기억은 유지 (잘못 무효화하는 것보다 안전)
+            logger.error(f"[MEMORY] Conflict check failed: {e}")
+            return []
+
+        return [
+            candidates[number - 1]
+            for number in sorted(set(result.conflict_numbers))
+            if 1 <= number <= len(candidates)
+        ]
 
     async def detect_preference_change(
         self, player_id: str, heroine_id: str, user_message: str
@@ -822,7 +998,7 @@ Output:
             text_to_embed = self._combine_content_with_keywords(
                 fact.content, fact.keywords
             )
-            embedding = self.embeddings.embed_query(text_to_embed)
+            embedding = await self.embeddings.aembed_query(text_to_embed)
 
             # 충돌 후보 검색
             candidates = await self._find_conflict_candidates(
@@ -832,18 +1008,15 @@ Output:
                 f"[DEBUG] 충돌 후보 {len(candidates)}개: {[c['content'] for c in candidates]}"
             )
 
-            # LLM으로 충돌 판단
-            for candidate in candidates:
-                is_conflict = await self._check_conflict_with_llm(
-                    fact.content, candidate["content"]
-                )
-                print(
-                    f"[DEBUG] LLM 충돌 판단: {fact.content} vs {candidate['content']} -> {is_conflict}"
+            # LLM으로 충돌 판단 (후보 전체를 한 번에)
+            conflicts = await self._check_conflicts_with_llm(fact.content, candidates)
+            print(
+                f"[DEBUG] LLM 충돌 판단: {fact.content} -> {[c['content'] for c in conflicts]}"
+            )
+            for candidate in conflicts:
+                preference_changes.append(
+                    {"old": candidate["content"], "new": fact.content}
                 )
-                if is_conflict:
-                    preference_changes.append(
-                        {"old": candidate["content"], "new": fact.content}
-                    )
 
         return preference_changes
 
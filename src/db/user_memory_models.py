@@ -81,6 +81,15 @@ class FactExtractionResult(BaseModel):
     facts: List[ExtractedFact] = []
 
 
+class ConflictCheckResult(BaseModel):
+    """충돌 판단 결과 (후보 여러 개를 한 번에 판단하는 LLM 응답 파싱용)"""
+
+    conflict_numbers: List[int] = Field(
+        default_factory=list,
+        description="새 기억과 충돌하는 기존 기억 번호 목록 (1부터 시작, 없으면 빈 목록)",
+    )
+
+
 # ============================================
 # 검색 설정
 # ============================================
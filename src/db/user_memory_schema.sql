@@ -426,3 +426,51 @@ LANGUAGE SQL AS $$
     ORDER BY similarity DESC;
 $$;
 
+
+-- ============================================
+-- 7. 중복 + 충돌 후보 통합 조회 (add_memory 저장 경로용)
+-- find_similar_memory + find_conflict_candidates를 한 번의 왕복으로 처리
+-- 중복(is_duplicate = TRUE)이 있으면 충돌 후보는 반환하지 않음
+-- ============================================
+CREATE OR REPLACE FUNCTION find_duplicate_and_conflicts(
+    p_player_id TEXT,
+    p_heroine_id TEXT,
+    p_embedding vector(1536),
+    p_content_type TEXT,
+    p_duplicate_threshold FLOAT DEFAULT 0.9,
+    p_conflict_threshold FLOAT DEFAULT 0.55
+) RETURNS TABLE (
+    id UUID,
+    content TEXT,
+    content_type TEXT,
+    similarity FLOAT,
+    is_duplicate BOOLEAN
+)
+LANGUAGE SQL AS $$
+    WITH scored AS (
+        SELECT 
+            m.id,
+            m.content,
+            m.content_type,
+            1 - (m.embedding <=> p_embedding) AS similarity
+        FROM user_memories m
+        WHERE m.player_id = p_player_id
+          AND m.heroine_id = p_heroine_id
+          AND m.invalid_at IS NULL
+    ),
+    duplicate AS (
+        SELECT s.id, s.content, s.content_type, s.similarity, TRUE AS is_duplicate
+        FROM scored s
+        WHERE s.similarity >= p_duplicate_threshold
+        ORDER BY s.similarity DESC
+        LIMIT 1
+    )
+    SELECT * FROM duplicate
+    UNION ALL
+    SELECT s.id, s.content, s.content_type, s.similarity, FALSE AS is_duplicate
+    FROM scored s
+    WHERE s.content_type = p_content_type
+      AND s.similarity >= p_conflict_threshold
+      AND NOT EXISTS (SELECT 1 FROM duplicate)
+    ORDER BY is_duplicate DESC, similarity DESC;
+$$;
@@ -0,0 +1,77 @@
+"""
+pgvector 파라미터 전송 어댑터
+
+str(embedding) + CAST(:embedding AS vector) 방식은 1536차원 기준
+파라미터 하나당 약 30KB 텍스트를 만들고, Postgres가 이를 다시 파싱합니다.
+
+이 모듈은 엔진에 pgvector 타입 코덱을 등록하고,
+임베딩을 float32 배열 그대로 넘기도록 통일합니다.
+
+- 비동기 엔진(asyncpg): 바이너리 포맷으로 전송 (1536 * 4 = 약 6KB, 파싱 없음)
+- 동기 엔진(psycopg2): 드라이버가 텍스트 프로토콜만 지원하므로 텍스트로 전송
+  (호출 코드는 동일하게 to_vector_param 사용)
+
+SQL은 기존 그대로 CAST(:embedding AS vector)를 사용합니다.
+
+사용 예시:
+    engine = register_vector_codec(create_engine(CONNECTION_URL))
+    conn.execute(sql, {"embedding": to_vector_param(embedding)})
+"""
+
+import os
+from typing import Sequence, Union
+
+import numpy as np
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# vector 확장이 설치된 스키마 (Supabase는 extensions 스키마에 설치하는 경우가 있음)
+# 두 드라이버 모두 이 스키마의 vector 타입으로 코덱을 등록
+PGVECTOR_SCHEMA = os.getenv("PGVECTOR_SCHEMA", "public")
+
+
+def to_vector_param(embedding: Sequence[float]) -> np.ndarray:
+    """임베딩을 vector 파라미터 값으로 변환 (float32 배열)"""
+    return np.asarray(embedding, dtype=np.float32)
+
+
+def register_vector_codec(
+    engine: Union[Engine, AsyncEngine],
+) -> Union[Engine, AsyncEngine]:
+    """새 커넥션이 생길 때마다 pgvector 코덱을 등록
+
+    Args:
+        engine: 동기 Engine 또는 AsyncEngine
+
+    Returns:
+        같은 엔진 (체이닝용)
+    """
+    if isinstance(engine, AsyncEngine):
+        from pgvector.asyncpg import register_vector
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _register_async(dbapi_connection, connection_record):
+            dbapi_connection.run_async(
+                lambda conn: register_vector(conn, schema=PGVECTOR_SCHEMA)
+            )
+
+    else:
+        from pgvector.psycopg2 import register_vector
+
+        @event.listens_for(engine, "connect")
+        def _register_sync(dbapi_connection, connection_record):
+            if PGVECTOR_SCHEMA != "public":
+                # psycopg2용 register_vector는 schema 인자가 없고 search_path에서 vector 타입을 찾음
+                # -> 세션 search_path 뒤에 PGVECTOR_SCHEMA를 붙여 asyncpg(schema=)와 같은 타입을 사용
+                with dbapi_connection.cursor() as cur:
+                    cur.execute(
+                        "SELECT set_config('search_path', "
+                        "current_setting('search_path') || ', ' || quote_ident(%s), false)",
+                        (PGVECTOR_SCHEMA,),
+                    )
+                # 롤백되면 세션 설정도 되돌아가므로 바로 커밋
+                dbapi_connection.commit()
+            register_vector(dbapi_connection)
+
+    return engine
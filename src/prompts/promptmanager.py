@@ -1,6 +1,20 @@
+"""
+프롬프트 YAML 로드 / 렌더링
+
+- YAML 파일은 프로세스당 한 번만 파싱 (PromptManager를 요청마다 만들어도 파일을 다시 읽지 않음)
+- PROMPT_HOT_RELOAD=true면 파일 수정 시간(mtime)이 바뀔 때 다시 로드 (개발용)
+- 템플릿은 로드 시 {변수} 기준으로 미리 잘라 두고, get_prompt는 한 번에 이어 붙임
+- get_static_prefix(): 첫 변수 앞까지의 고정 부분 (프로바이더 프롬프트 캐싱용)
+"""
+
+import os
+import re
+import threading
 import yaml
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+PROMPT_HOT_RELOAD = os.getenv("PROMPT_HOT_RELOAD", "false").lower() == "true"
 
 
 @dataclass
@@ -8,6 +22,92 @@ class PromptTemplate:
     name: str
     prompt: str
     input_variables: List[str]
+    # (고정 문자열, 변수 이름 또는 None) 목록
+    segments: List[Tuple[str, Optional[str]]] = field(default_factory=list, repr=False)
+
+    def __post_init__(self):
+        self.segments = self._compile()
+
+    def _compile(self) -> List[Tuple[str, Optional[str]]]:
+        """{var} 위치에서 템플릿을 잘라 둠 (input_variables에 없는 {}는 그대로 유지)
+
+        {{var}}는 기존 치환과 같게 바깥 중괄호가 남아 {값}이 됩니다.
+        """
+        names = [str(v).strip().strip('"').strip("'") for v in self.input_variables]
+        names = [n for n in names if n]
+        if not names:
+            return [(self.prompt, None)]
+
+        # 긴 이름 먼저 (이름이 다른 이름의 앞부분일 때)
+        pattern = re.compile(
+            r"\{(" + "|".join(re.escape(n) for n in sorted(set(names), key=len, reverse=True)) + r")\}"
+        )
+        segments = []
+        pos = 0
+        for match in pattern.finditer(self.prompt):
+            segments.append((self.prompt[pos:match.start()], match.group(1)))
+            pos = match.end()
+        segments.append((self.prompt[pos:], None))
+        return segments
+
+    @property
+    def static_prefix(self) -> str:
+        """첫 변수 앞까지의 고정 부분 (변수가 없으면 전체)"""
+        return self.segments[0][0]
+
+    def render(self, values: Dict[str, str]) -> str:
+        parts = []
+        for text, var in self.segments:
+            parts.append(text)
+            if var is not None:
+                parts.append(values.get(var, ""))
+        return "".join(parts)
+
+
+# 파일 경로 -> (mtime, {키 이름: PromptTemplate})
+_file_cache: Dict[str, Tuple[float, Dict[str, PromptTemplate]]] = {}
+_file_cache_lock = threading.Lock()
+
+
+def _parse_file(file_path: str) -> Dict[str, PromptTemplate]:
+    with open(file_path, "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+
+    return {
+        key: PromptTemplate(
+            name=value["name"],
+            prompt=value["prompt"],
+            input_variables=value.get("input_variables", []),
+        )
+        for key, value in config.items()
+    }
+
+
+def load_prompt_file(file_path: str) -> Dict[str, PromptTemplate]:
+    """YAML 파일 -> 템플릿 (프로세스 공용 캐시)"""
+    cached = _file_cache.get(file_path)
+    if cached is not None and not PROMPT_HOT_RELOAD:
+        return cached[1]
+
+    mtime = os.path.getmtime(file_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with _file_cache_lock:
+        cached = _file_cache.get(file_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        templates = _parse_file(file_path)
+        if cached is not None:
+            print(f"[INFO] 프롬프트 다시 로드: {os.path.basename(file_path)}")
+        _file_cache[file_path] = (mtime, templates)
+        return templates
+
+
+def clear_prompt_cache() -> None:
+    """캐시 비우기 (테스트 / 수동 리로드용)"""
+    with _file_cache_lock:
+        _file_cache.clear()
 
 
 class PromptManager:
@@ -16,25 +116,22 @@ class PromptManager:
         self._templates = self._load_prompts(prompt_type.value)
 
     def _load_prompts(self, file_path: str):
-        with open(file_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
-
         templates = {}
         enum_class = self.type.__class__
 
-        for key, value in config.items():
+        for key, template in load_prompt_file(file_path).items():
             prompt_type = enum_class[key]  # YAML key → Enum key 감지
-            templates[prompt_type] = PromptTemplate(
-                name=value["name"],
-                prompt=value["prompt"],
-                input_variables=value.get("input_variables", []),
-            )
+            templates[prompt_type] = template
 
         return templates
 
     def get_template(self):
         return self._templates[self.type]
 
+    def get_static_prefix(self) -> str:
+        """요청마다 바뀌지 않는 앞부분 (프로바이더 프롬프트 캐싱 구간)"""
+        return self._templates[self.type].static_prefix
+
     def get_prompt(self, **kwargs) -> str:
         template = self._templates[self.type]
         cleaned = {k.strip('"').strip("'"): v for k, v in kwargs.items()}
@@ -44,28 +141,16 @@ class PromptManager:
                     f"Missing required variable '{var}' for {template.name}"
                 )
 
-        # 변수 치환 (JSON/{} 보존을 위해 안전 치환)
-        input_vars = [
-            str(v).strip().strip('"').strip("'") for v in template.input_variables
-        ]
-
-        prompt_text = template.prompt
-        for var in input_vars:
+        # 변수 치환 (JSON/{} 보존: input_variables에 있는 {var}만 치환, 한 번에 렌더링)
+        values = {}
+        for var in template.input_variables:
+            var = str(var).strip().strip('"').strip("'")
             value = cleaned.get(var, "")
             if not isinstance(value, str):
                 try:
                     value = str(value)
                 except Exception:
                     value = ""
-            prompt_text = prompt_text.replace(f"{{{var}}}", value)
-            prompt_text = prompt_text.replace(f"{{{{{var}}}}}", value)
-
-        # 치환 후에도 플레이스홀더가 남아있으면 에러 발생
-        for var in input_vars:
-            if f"{{{var}}}" in prompt_text or f"{{{{{var}}}}}" in prompt_text:
-                raise ValueError(
-                    f"Prompt variable '{{{var}}}' was not replaced in template '{template.name}'.\n"
-                    f"Check if you passed the correct argument and value."
-                )
+            values[var] = value
 
-        return prompt_text
+        return template.render(values)
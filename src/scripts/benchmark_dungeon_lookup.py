@@ -0,0 +1,199 @@
+"""
+플레이어 -> 진행 중인 던전 조회 벤치마크
+
+미완료 던전 N개(기본 10,000)가 있을 때 요청 1번의 조회 시간을 비교합니다.
+
+1) 기존 get_unfinished_dungeons: 미완료 던전 전체 SELECT + raw_map JSON 파싱
+2) 기존 층 조회: floor + (player1 = :p OR ... OR player4 = :p)
+3) dungeon_players 멤버십 인덱스 (RDBRepository / dungeon_service 현재 쿼리)
+
+dungeon_players_schema.sql이 적용된 DB에서 실행해야 합니다.
+bench_dp_ 접두사의 테스트 던전은 종료시 삭제됩니다.
+
+사용법:
+    # 기본 (10,000개 / 조회 200회)
+    uv run python src/scripts/benchmark_dungeon_lookup.py
+
+    # 던전 수와 조회 횟수 지정
+    uv run python src/scripts/benchmark_dungeon_lookup.py --dungeons 1000 10000 --queries 500
+"""
+
+import sys
+import argparse
+import json
+import random
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# src 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from db.RDBRepository import RDBRepository
+
+PLAYER_PREFIX = "bench_dp_"
+INSERT_BATCH = 1000
+
+
+def make_raw_map(player_ids: List[str], floor: int) -> str:
+    """실제 맵과 비슷한 크기의 raw_map (방 12개)"""
+    rooms = [
+        {"room_id": i, "room_type": "monster", "monsters": [1001, 1002], "size": 3}
+        for i in range(12)
+    ]
+    return json.dumps(
+        {"floor": floor, "player_ids": player_ids, "heroine_ids": [1] * len(player_ids), "rooms": rooms}
+    )
+
+
+def seed(repo: RDBRepository, num_dungeons: int) -> List[List[str]]:
+    """미완료 던전 생성 (던전마다 플레이어 1~4명, 1/2층) -> 파티 목록"""
+    parties = []
+    params = []
+    for i in range(num_dungeons // 2):
+        party = [f"{PLAYER_PREFIX}{i}_{slot}" for slot in range(random.randint(1, 4))]
+        parties.append(party)
+        for floor in (1, 2):
+            row = {
+                "floor": floor,
+                "raw_map": make_raw_map(party, floor),
+                "player1": None, "player2": None, "player3": None, "player4": None,
+                "heroine1": None, "heroine2": None, "heroine3": None, "heroine4": None,
+            }
+            for slot, pid in enumerate(party, start=1):
+                row[f"player{slot}"] = pid
+                row[f"heroine{slot}"] = "1"
+            params.append(row)
+
+    sql = text(
+        """
+        INSERT INTO dungeon
+        (floor, raw_map, balanced_map, is_finishing, summary_info,
+         player1, player2, player3, player4,
+         heroine1, heroine2, heroine3, heroine4)
+        VALUES
+        (:floor, :raw_map, NULL, FALSE, '',
+         :player1, :player2, :player3, :player4,
+         :heroine1, :heroine2, :heroine3, :heroine4)
+        """
+    )
+    with repo.engine.begin() as conn:
+        for start in range(0, len(params), INSERT_BATCH):
+            conn.execute(sql, params[start:start + INSERT_BATCH])
+        conn.execute(text("ANALYZE dungeon"))
+        conn.execute(text("ANALYZE dungeon_players"))
+    return parties
+
+
+def cleanup(repo: RDBRepository) -> None:
+    """테스트 던전 삭제 (dungeon_players는 ON DELETE CASCADE)"""
+    with repo.engine.begin() as conn:
+        conn.execute(
+            text("DELETE FROM dungeon WHERE player1 LIKE :prefix"),
+            {"prefix": f"{PLAYER_PREFIX}%"},
+        )
+
+
+# ============================================
+# 기존 방식 (비교용)
+# ============================================
+
+
+def legacy_get_unfinished(repo: RDBRepository, player_ids: List[str]):
+    """기존 get_unfinished_dungeons: 전체 스캔 + JSON 파싱"""
+    with repo.engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT * FROM dungeon WHERE is_finishing = FALSE ORDER BY floor ASC")
+        ).fetchall()
+        target = set(map(str, player_ids))
+        for row in rows:
+            raw_map_value = row._mapping["raw_map"]
+            raw_map = json.loads(raw_map_value) if isinstance(raw_map_value, str) else raw_map_value
+            row_players = set(map(str, raw_map.get("playerIds") or raw_map.get("player_ids", [])))
+            if target.issubset(row_players):
+                return dict(row._mapping)
+        return None
+
+
+def legacy_floor_lookup(repo: RDBRepository, player_id: str, floor: int):
+    with repo.engine.connect() as conn:
+        return conn.execute(
+            text(
+                """
+                SELECT id, event FROM dungeon WHERE floor = :floor AND is_finishing = FALSE AND (
+                    player1 = :player_id OR player2 = :player_id OR player3 = :player_id OR player4 = :player_id
+                )
+                """
+            ),
+            {"floor": floor, "player_id": player_id},
+        ).fetchone()
+
+
+def indexed_floor_lookup(repo: RDBRepository, player_id: str, floor: int):
+    """dungeon_service.entrance / next_floor_entrance의 현재 쿼리"""
+    with repo.engine.connect() as conn:
+        return conn.execute(
+            text(
+                """
+                SELECT id, event FROM dungeon WHERE floor = :floor AND is_finishing = FALSE AND id IN (
+                    SELECT dungeon_id FROM dungeon_players
+                    WHERE player_id = :player_id AND floor = :floor AND is_finishing = FALSE
+                )
+                """
+            ),
+            {"floor": floor, "player_id": player_id},
+        ).fetchone()
+
+
+def measure(fn: Callable[[List[str]], object], parties: List[List[str]], queries: int) -> Dict[str, float]:
+    """조회 queries회 -> p50 / p95 (ms)"""
+    times = []
+    for _ in range(queries):
+        party = random.choice(parties)
+        t = time.perf_counter()
+        result = fn(party)
+        times.append((time.perf_counter() - t) * 1000)
+        assert result is not None, f"던전을 찾지 못함: {party}"
+    times.sort()
+    return {
+        "p50": statistics.median(times),
+        "p95": times[int(len(times) * 0.95) - 1],
+    }
+
+
+def run_case(repo: RDBRepository, num_dungeons: int, queries: int) -> None:
+    parties = seed(repo, num_dungeons)
+    try:
+        cases = {
+            "get_unfinished (스캔+JSON)": lambda p: legacy_get_unfinished(repo, p),
+            "get_unfinished (멤버십)": lambda p: repo.get_unfinished_dungeons(p),
+            "floor 조회 (player1~4 OR)": lambda p: legacy_floor_lookup(repo, p[0], 2),
+            "floor 조회 (멤버십)": lambda p: indexed_floor_lookup(repo, p[0], 2),
+            "get_event_by_floor (멤버십)": lambda p: repo.get_event_by_floor(p[0], 1) or True,
+        }
+        print(f"\n[미완료 던전 {num_dungeons:,}개 / 조회 {queries}회]")
+        for name, fn in cases.items():
+            result = measure(fn, parties, queries)
+            print(f"  {name:<30} p50 {result['p50']:8.2f}ms  p95 {result['p95']:8.2f}ms")
+    finally:
+        cleanup(repo)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="던전 멤버십 조회 벤치마크")
+    parser.add_argument("--dungeons", type=int, nargs="+", default=[10000], help="미완료 던전 수")
+    parser.add_argument("--queries", type=int, default=200, help="케이스별 조회 횟수")
+    args = parser.parse_args()
+
+    repo = RDBRepository()
+    cleanup(repo)  # 이전 실행에서 남은 테스트 데이터
+    for num_dungeons in args.dungeons:
+        run_case(repo, num_dungeons, args.queries)
+
+
+if __name__ == "__main__":
+    main()
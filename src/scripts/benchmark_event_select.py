@@ -0,0 +1,225 @@
+"""
+/event/select 응답 시간 벤치마크 (선택 결과 사전 생성 전/후)
+
+1) 기존 방식: SequenceMatcher 매칭 -> 애매하면 LLM 분류 -> 항상 LLM 결과 서술 (LLM 1~2회)
+2) 현재 DungeonService.select_event: 로컬 매칭(문자열/임베딩) + 이벤트 생성 때 만든 outcome
+   (임베딩으로 애매한 입력만 LLM 분류, 돌발 행동만 LLM 서술)
+매칭 정확도는 이 스크립트가 아니라 src/scripts/eval_event_choice.py로 평가합니다.
+
+테스트 던전(bench_es_ 접두사)에 이벤트 방을 만들고, 선택지 원문 / 변형 입력 / 돌발 행동을
+같은 순서로 두 방식에 보내 p50 / p95 / p99를 비교합니다. 테스트 던전은 종료시 삭제됩니다.
+이벤트 생성과 기존 방식 측정에 LLM API 키가 필요합니다.
+
+사용법:
+    # 기본 (이벤트 방 3개 / 입력마다 1회)
+    uv run python src/scripts/benchmark_event_select.py
+
+    # 이벤트 방 수와 반복 횟수 지정
+    uv run python src/scripts/benchmark_event_select.py --rooms 5 --repeat 3
+"""
+
+import sys
+import argparse
+import difflib
+import json
+import random
+import re
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+# src 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from agents.dungeon.event.choice_matcher import HOSTILE_KEYWORDS
+from agents.dungeon.event.dungeon_event_agent import generate_event_variant
+from agents.dungeon.event.main_event_scenarios import MAIN_EVENT_SCENARIOS
+from core.model_registry import model_registry
+from db.RDBRepository import RDBRepository
+from services.dungeon_service import get_dungeon_service
+
+PLAYER_PREFIX = "bench_es_"
+
+# 선택지와 관계없는 행동 (돌발 행동 경로)
+UNEXPECTED_INPUTS = [
+    "갑자기 춤을 춘다",
+    "가방에서 빵을 꺼내 먹는다",
+    "벽에 낙서를 한다",
+]
+
+
+def make_inputs(events: List[Dict[str, Any]]) -> List[Tuple[int, str]]:
+    """(room_id, 입력) 목록: 선택지 원문, 조금 바꾼 표현, 돌발 행동"""
+    inputs = []
+    for evt in events:
+        room_id = evt["room_id"]
+        for c in evt.get("choices", []):
+            action = c.get("action", "")
+            inputs.append((room_id, action))
+            inputs.append((room_id, f"조심스럽게 {action}"))
+        for unexpected in UNEXPECTED_INPUTS:
+            inputs.append((room_id, unexpected))
+    return inputs
+
+
+def seed(repo: RDBRepository, num_rooms: int) -> Tuple[str, List[Dict[str, Any]]]:
+    """이벤트 방 num_rooms개짜리 1층 던전 생성 -> (플레이어 ID, 이벤트 목록)"""
+    player_id = f"{PLAYER_PREFIX}0"
+    heroine_data = {"heroine_id": 1, "memory_progress": 50}
+    codes = random.sample([e["event_code"] for e in MAIN_EVENT_SCENARIOS], num_rooms)
+
+    events = []
+    for room_id, code in enumerate(codes, start=1):
+        event = generate_event_variant(code, heroine_data, room_id=room_id, player_id=player_id)
+        if event:
+            events.append(event)
+    missing = sum(1 for e in events for c in e["choices"] if not c.get("outcome"))
+    print(f"[INFO] 이벤트 {len(events)}개 생성 (outcome 없는 선택지 {missing}개)")
+
+    raw_map = {"floor": 1, "player_ids": [player_id], "heroine_ids": [1], "rooms": []}
+    with repo.engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                INSERT INTO dungeon
+                (floor, raw_map, balanced_map, is_finishing, summary_info, event,
+                 player1, player2, player3, player4,
+                 heroine1, heroine2, heroine3, heroine4)
+                VALUES
+                (1, :raw_map, NULL, FALSE, '', :event,
+                 :player_id, NULL, NULL, NULL,
+                 '1', NULL, NULL, NULL)
+                """
+            ),
+            {
+                "raw_map": json.dumps(raw_map),
+                "event": json.dumps(events, ensure_ascii=False),
+                "player_id": player_id,
+            },
+        )
+    return player_id, events
+
+
+def cleanup(repo: RDBRepository) -> None:
+    """테스트 던전 삭제 (dungeon_players는 ON DELETE CASCADE)"""
+    with repo.engine.begin() as conn:
+        conn.execute(
+            text("DELETE FROM dungeon WHERE player1 LIKE :prefix"),
+            {"prefix": f"{PLAYER_PREFIX}%"},
+        )
+
+
+# ============================================
+# 기존 방식 (비교용)
+# ============================================
+
+
+def legacy_select(event: Dict[str, Any], choice: str) -> str:
+    """기존 select_event의 매칭 + 서술 (DB 조회/보상 처리 제외)"""
+    from langchain.chat_models import init_chat_model
+    from enums.LLM import LLM
+    from langchain_core.messages import HumanMessage
+
+    llm = init_chat_model(model=LLM.GPT5_MINI, temperature=0.7)
+    scenario_narrative = event.get("scenario_narrative", "")
+    actions = [c.get("action", "") for c in event.get("choices", [])]
+    options_text = "".join(f"{i}. {a}\n" for i, a in enumerate(actions))
+
+    def _norm(s: str) -> str:
+        return re.sub(r"\s+", " ", (s or "").strip().lower())
+
+    choice_norm = _norm(choice)
+    ratios = [difflib.SequenceMatcher(None, choice_norm, _norm(a)).ratio() for a in actions]
+    best_idx = max(range(len(actions)), key=lambda i: ratios[i])
+    contains_hostile = any(kw in choice_norm for kw in HOSTILE_KEYWORDS)
+
+    matched_action = ""
+    if ratios[best_idx] >= 0.60:
+        matched_action = actions[best_idx]
+    elif not (ratios[best_idx] < 0.35 and contains_hostile):
+        classification_prompt = f"""
+        [상황]
+        {scenario_narrative}
+
+        [가능한 선택지]
+        {options_text}
+
+        [플레이어 입력]
+        {choice}
+
+        플레이어의 입력이 위 [가능한 선택지] 중 어느 것과 가장 유사한지 판단해.
+        1. 선택지와 의미가 유사하면 해당 번호(0, 1, 2...)를 반환해.
+        2. 만약 선택지에 없는 돌발 행동이거나, 적대적인 행동, 혹은 전혀 다른 행동이라면 "UNEXPECTED"라고 반환해.
+
+        오직 숫자 혹은 "UNEXPECTED" 만 출력해.
+        """
+        result = llm.invoke([HumanMessage(content=classification_prompt)]).content.strip()
+        if result.isdigit() and 0 <= int(result) < len(actions):
+            matched_action = actions[int(result)]
+
+    prompt = f"""
+    [상황]
+    {scenario_narrative}
+
+    [플레이어 선택]
+    {choice} (의도: {matched_action or "돌발 행동"})
+
+    위 상황에서 플레이어가 선택한 행동에 대한 결과를 2~3문장으로 묘사해줘.
+    플레이어에게 직접 이야기하듯이 서술해.
+    """
+    return llm.invoke([HumanMessage(content=prompt)]).content
+
+
+def measure(fn: Callable[[int, str], object], inputs: List[Tuple[int, str]], repeat: int) -> Dict[str, float]:
+    """입력마다 repeat회 -> p50 / p95 / p99 (ms)"""
+    times = []
+    for _ in range(repeat):
+        for room_id, choice in inputs:
+            t = time.perf_counter()
+            fn(room_id, choice)
+            times.append((time.perf_counter() - t) * 1000)
+    times.sort()
+    return {
+        "p50": statistics.median(times),
+        "p95": times[max(0, int(len(times) * 0.95) - 1)],
+        "p99": times[max(0, int(len(times) * 0.99) - 1)],
+    }
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="/event/select 응답 시간 벤치마크")
+    parser.add_argument("--rooms", type=int, default=3, help="이벤트 방 수")
+    parser.add_argument("--repeat", type=int, default=1, help="입력별 반복 횟수")
+    args = parser.parse_args()
+
+    repo = RDBRepository()
+    service = get_dungeon_service()
+    cleanup(repo)  # 이전 실행에서 남은 테스트 데이터
+
+    # 서버에서는 lifespan 워밍업으로 미리 로드됨
+    model_registry.get("bge_m3")
+
+    player_id, events = seed(repo, args.rooms)
+    try:
+        events_by_room = {e["room_id"]: e for e in events}
+        inputs = make_inputs(events)
+        cases = {
+            "기존 (LLM 분류 + LLM 서술)": lambda r, c: legacy_select(events_by_room[r], c),
+            "현재 (로컬 매칭 + 사전 outcome)": lambda r, c: service.select_event(player_id, player_id, r, c),
+        }
+        print(f"\n[이벤트 방 {len(events)}개 / 입력 {len(inputs)}개 x {args.repeat}회]")
+        for name, fn in cases.items():
+            result = measure(fn, inputs, args.repeat)
+            print(
+                f"  {name:<28} p50 {result['p50']:8.1f}ms  p95 {result['p95']:8.1f}ms  p99 {result['p99']:8.1f}ms"
+            )
+    finally:
+        cleanup(repo)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+LangGraph 컴파일 비용 벤치마크 (요청마다 compile() vs graph_registry)
+
+그래프마다 StateGraph.compile()을 N번 실행한 시간과, graph_registry.get()으로
+이미 컴파일된 그래프를 가져오는 시간을 비교합니다. LLM 호출은 하지 않습니다.
+
+이전 코드에서 요청마다 컴파일하던 곳:
+- balance 1회: event_node가 이벤트 그래프 compile() 1회
+- _create_event_for_floor: 이벤트 방(+ 개인 이벤트 플레이어)마다 이벤트 그래프 compile() 1회
+- 정령 서비스: 임포트 시 컴파일 (+ fairy_dungeon_agent / fairy_interaction_agent의 사용하지 않는 compile())
+
+사용법:
+    # 기본 (그래프별 50회)
+    uv run python src/scripts/benchmark_graph_compile.py
+
+    # 반복 횟수 / 이벤트 방 수 지정
+    uv run python src/scripts/benchmark_graph_compile.py --iterations 200 --rooms 4
+"""
+
+import sys
+import argparse
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+# src 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.graph_registry import graph_registry
+
+
+def builders() -> Dict[str, Callable[[], object]]:
+    """그래프 이름 -> 매번 새로 컴파일하는 함수 (이전 방식)"""
+    from agents.dungeon.event.dungeon_event_agent import graph_builder as event_builder
+    from agents.dungeon.monster.dungeon_monster_agent import graph_builder as monster_builder
+    from agents.dungeon.super.dungeon_agent import create_super_dungeon_graph
+    from agents.fairy.dungeon.fairy_dungeon_agent import graph_builder as fairy_dungeon_builder
+    from agents.fairy.guild.fairy_guild_agent import graph_builder as fairy_guild_builder
+    from agents.fairy.interaction.fairy_interaction_agent import graph_builder as fairy_interaction_builder
+
+    return {
+        "dungeon_event": event_builder.compile,
+        "dungeon_monster": monster_builder.compile,
+        "super_dungeon": create_super_dungeon_graph,
+        "fairy_dungeon": fairy_dungeon_builder.compile,
+        "fairy_guild": fairy_guild_builder.compile,
+        "fairy_interaction": fairy_interaction_builder.compile,
+    }
+
+
+def measure(fn: Callable[[], object], iterations: int) -> Dict[str, float]:
+    """iterations회 -> p50 / p95 (ms)"""
+    times = []
+    for _ in range(iterations):
+        t = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t) * 1000)
+    times.sort()
+    return {
+        "p50": statistics.median(times),
+        "p95": times[max(0, int(len(times) * 0.95) - 1)],
+    }
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="LangGraph 컴파일 비용 벤치마크")
+    parser.add_argument("--iterations", type=int, default=50, help="그래프별 반복 횟수")
+    parser.add_argument("--rooms", type=int, default=3, help="층당 이벤트 방 수 (입장 비용 추정용)")
+    args = parser.parse_args()
+
+    compile_fns = builders()  # 에이전트 모듈 임포트 (LLM 클라이언트 생성) 비용은 제외
+
+    print(f"\n[그래프별 {args.iterations}회]")
+    print(f"  {'graph':<20} {'compile() p50':>14} {'p95':>10} {'registry p50':>14}")
+    results = {}
+    for name, compile_fn in compile_fns.items():
+        compiled = measure(compile_fn, args.iterations)
+        graph_registry.get(name)  # 첫 컴파일
+        cached = measure(lambda: graph_registry.get(name), args.iterations)
+        results[name] = (compiled, cached)
+        print(
+            f"  {name:<20} {compiled['p50']:12.2f}ms {compiled['p95']:8.2f}ms {cached['p50'] * 1000:12.2f}us"
+        )
+
+    event_compile = results["dungeon_event"][0]["p50"]
+    print("\n[요청당 절약되는 컴파일 시간 (p50 기준)]")
+    print(f"  balance 1회 (event_node):            {event_compile:8.2f}ms")
+    print(
+        f"  층 입장, 이벤트 방 {args.rooms}개 (그래프 경로): {event_compile * args.rooms:8.2f}ms"
+    )
+    print("\n[graph_registry]")
+    for name, stat in graph_registry.stats().items():
+        print(f"  {name:<20} 컴파일 {stat['compile_time_ms']:8.2f}ms  사용 {stat['uses']}회")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+히로인 채팅 부하 테스트 스크립트
+
+/api/npc/heroine/chat/sync 에 동시 요청을 보내서 처리량과 지연시간 분포를 측정합니다.
+비동기 DB 엔진 도입 전후를 같은 조건으로 비교할 때 사용합니다.
+
+사전 조건:
+    - 서버 실행 중 (uv run uvicorn main:app --port 8000)
+    - 테스트 플레이어들이 /api/npc/login 으로 로그인되어 있어야 함 (--login 옵션 사용 가능)
+
+사용법:
+    # 기본 (동시 10명, 각 5회)
+    uv run python src/scripts/benchmark_heroine_chat_load.py
+
+    # 동시 50명, 각 3회
+    uv run python src/scripts/benchmark_heroine_chat_load.py --concurrency 50 --requests 3
+
+    # 로그인 후 측정
+    uv run python src/scripts/benchmark_heroine_chat_load.py --login
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List, Tuple
+
+import httpx
+
+# 기억/시나리오 검색 경로를 모두 타도록 섞은 메시지
+SAMPLE_MESSAGES = [
+    "안녕, 오늘 기분 어때?",
+    "어제 우리 뭐 했는지 기억나?",
+    "네 고향 이야기 좀 해줘",
+    "최근에 돌아온 기억 있어?",
+    "루파메스랑 무슨 얘기 했어?",
+]
+
+
+def percentile(values: List[float], p: float) -> float:
+    """p 백분위수 (0~100)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * p / 100
+    lower = int(k)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
+
+
+async def login_player(
+    client: httpx.AsyncClient, base_url: str, player_id: str, heroine_id: int
+) -> None:
+    """테스트 플레이어 로그인 (세션 초기화)"""
+    payload = {
+        "playerId": player_id,
+        "scenarioLevel": 1,
+        "heroines": [
+            {"heroineId": heroine_id, "affection": 50, "memoryProgress": 10, "sanity": 100}
+        ],
+    }
+    resp = await client.post(f"{base_url}/api/npc/login", json=payload)
+    resp.raise_for_status()
+
+
+async def run_player(
+    client: httpx.AsyncClient,
+    base_url: str,
+    player_id: str,
+    heroine_id: int,
+    num_requests: int,
+) -> List[Tuple[float, bool]]:
+    """한 플레이어가 순차적으로 요청을 보냄 (실제 대화 흐름과 동일)"""
+    results = []
+    for i in range(num_requests):
+        payload = {
+            "playerId": player_id,
+            "heroineId": heroine_id,
+            "text": SAMPLE_MESSAGES[i % len(SAMPLE_MESSAGES)],
+        }
+        start = time.perf_counter()
+        try:
+            resp = await client.post(
+                f"{base_url}/api/npc/heroine/chat/sync", json=payload
+            )
+            ok = resp.status_code == 200
+        except httpx.HTTPError as e:
+            print(f"[ERROR] player={player_id}: {e}")
+            ok = False
+        results.append((time.perf_counter() - start, ok))
+    return results
+
+
+async def run_benchmark(args) -> None:
+    """동시 플레이어 부하 테스트 실행"""
+    player_ids = [f"{args.player_prefix}{i}" for i in range(args.concurrency)]
+
+    async with httpx.AsyncClient(timeout=args.timeout) as client:
+        if args.login:
+            await asyncio.gather(
+                *[
+                    login_player(client, args.base_url, pid, args.heroine_id)
+                    for pid in player_ids
+                ]
+            )
+            print(f"[INFO] {len(player_ids)}명 로그인 완료")
+
+        wall_start = time.perf_counter()
+        player_results = await asyncio.gather(
+            *[
+                run_player(client, args.base_url, pid, args.heroine_id, args.requests)
+                for pid in player_ids
+            ]
+        )
+        wall = time.perf_counter() - wall_start
+
+    latencies = [lat for results in player_results for lat, ok in results if ok]
+    failures = sum(1 for results in player_results for _, ok in results if not ok)
+    total = len(latencies) + failures
+
+    print("\n" + "=" * 60)
+    print("히로인 채팅 부하 테스트 결과")
+    print("=" * 60)
+    print(f"동시 플레이어: {args.concurrency}, 플레이어당 요청: {args.requests}")
+    print(f"총 요청: {total} (실패 {failures})")
+    print(f"전체 소요: {wall:.2f}s")
+    print(f"처리량: {len(latencies) / wall:.2f} req/s")
+    if latencies:
+        print(f"평균: {statistics.mean(latencies):.3f}s")
+        print(f"p50: {percentile(latencies, 50):.3f}s")
+        print(f"p95: {percentile(latencies, 95):.3f}s")
+        print(f"p99: {percentile(latencies, 99):.3f}s")
+        print(f"최대: {max(latencies):.3f}s")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="히로인 채팅 부하 테스트")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="서버 주소")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시 플레이어 수 (기본: 10)")
+    parser.add_argument("--requests", type=int, default=5, help="플레이어당 요청 수 (기본: 5)")
+    parser.add_argument("--heroine-id", type=int, default=1, help="대화할 히로인 ID (기본: 1)")
+    parser.add_argument("--player-prefix", default="loadtest_", help="테스트 플레이어 ID 접두사")
+    parser.add_argument("--timeout", type=float, default=120.0, help="요청 타임아웃(초)")
+    parser.add_argument("--login", action="store_true", help="측정 전에 로그인 수행")
+
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+NPC-NPC 장기기억 벌크 INSERT 벤치마크
+
+길드 백그라운드 대화 1회(기본 10턴)를 저장하는 상황을
+동시 길드 플레이어 1 / 10 / 100명으로 재현하여 rows/sec를 비교합니다.
+
+1) 행 단위: 턴마다 INSERT 1번 (기존 방식)
+2) 벌크:    다중 행 VALUES INSERT 1번 (build_bulk_memory_insert)
+
+임베딩은 랜덤 벡터를 사용하므로 OpenAI 호출은 없습니다.
+bench_bulk_ 접두사의 테스트 체크포인트/기억은 종료시 삭제됩니다.
+
+사용법:
+    # 기본 (1, 10, 100명 / 10턴)
+    uv run python src/scripts/benchmark_npc_memory_bulk_insert.py
+
+    # 플레이어 수와 턴 수 지정
+    uv run python src/scripts/benchmark_npc_memory_bulk_insert.py --players 1 10 50 --turns 20
+"""
+
+import sys
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List
+
+# src 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from db.async_engine import get_async_engine, dispose_async_engine
+from db.npc_npc_memory_manager import build_bulk_memory_insert
+from db.vector_codec import to_vector_param
+
+PLAYER_PREFIX = "bench_bulk_"
+EMBEDDING_DIM = 1536
+
+
+def make_rows(player_id: str, checkpoint_id: str, turns: int) -> List[Dict[str, Any]]:
+    """한 번의 NPC-NPC 대화에 해당하는 턴 행 생성"""
+    rows = []
+    for idx in range(turns):
+        speaker_id, subject_id = (1, 2) if idx % 2 == 0 else (2, 1)
+        rows.append(
+            {
+                "conversation_id": checkpoint_id,
+                "turn_index": idx + 1,
+                "player_id": player_id,
+                "heroine_id_1": 1,
+                "heroine_id_2": 2,
+                "speaker_id": speaker_id,
+                "subject_id": subject_id,
+                "content": f"벤치마크 대화 턴 {idx + 1}",
+                "content_type": "turn",
+                "embedding": to_vector_param(
+                    [random.uniform(-1, 1) for _ in range(EMBEDDING_DIM)]
+                ),
+                "importance": 5,
+                "metadata": json.dumps({"situation": "benchmark"}, ensure_ascii=False),
+            }
+        )
+    return rows
+
+
+async def create_checkpoint(engine, player_id: str) -> str:
+    """FK(conversation_id)용 테스트 체크포인트 생성"""
+    checkpoint_id = str(uuid.uuid4())
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                """
+                INSERT INTO npc_npc_checkpoints (
+                    id, player_id, heroine_id_1, heroine_id_2,
+                    situation, conversation, turn_count,
+                    created_at, updated_at, last_turn_at
+                )
+                VALUES (
+                    :id, :player_id, 1, 2,
+                    'benchmark', CAST('[]' AS jsonb), 0,
+                    NOW(), NOW(), NOW()
+                )
+                """
+            ),
+            {"id": checkpoint_id, "player_id": player_id},
+        )
+    return checkpoint_id
+
+
+async def save_row_by_row(engine, rows: List[Dict[str, Any]]) -> None:
+    """기존 방식: 턴마다 INSERT"""
+    async with engine.begin() as conn:
+        for row in rows:
+            sql, params = build_bulk_memory_insert([row])
+            await conn.execute(sql, params)
+
+
+async def save_bulk(engine, rows: List[Dict[str, Any]]) -> None:
+    """벌크 방식: 다중 행 INSERT 1번"""
+    async with engine.begin() as conn:
+        sql, params = build_bulk_memory_insert(rows)
+        await conn.execute(sql, params)
+
+
+async def run_case(engine, mode: str, num_players: int, turns: int) -> float:
+    """동시 플레이어 num_players명이 대화 1회씩 저장, rows/sec 반환"""
+    player_ids = [f"{PLAYER_PREFIX}{mode}_{num_players}_{i}" for i in range(num_players)]
+    checkpoint_ids = await asyncio.gather(
+        *[create_checkpoint(engine, pid) for pid in player_ids]
+    )
+    batches = [
+        make_rows(pid, cid, turns) for pid, cid in zip(player_ids, checkpoint_ids)
+    ]
+
+    save = save_bulk if mode == "bulk" else save_row_by_row
+    start = time.perf_counter()
+    await asyncio.gather(*[save(engine, rows) for rows in batches])
+    elapsed = time.perf_counter() - start
+
+    return (num_players * turns) / elapsed
+
+
+async def cleanup(engine) -> None:
+    """테스트 데이터 삭제 (기억은 FK CASCADE로 함께 삭제)"""
+    async with engine.begin() as conn:
+        await conn.execute(
+            text("DELETE FROM npc_npc_checkpoints WHERE player_id LIKE :prefix"),
+            {"prefix": f"{PLAYER_PREFIX}%"},
+        )
+
+
+async def run_benchmark(args) -> None:
+    engine = get_async_engine()
+    results = []
+
+    try:
+        for num_players in args.players:
+            row_rate = await run_case(engine, "row", num_players, args.turns)
+            bulk_rate = await run_case(engine, "bulk", num_players, args.turns)
+            results.append((num_players, row_rate, bulk_rate))
+            print(
+                f"[INFO] players={num_players}: "
+                f"row {row_rate:,.0f} rows/s, bulk {bulk_rate:,.0f} rows/s"
+            )
+    finally:
+        await cleanup(engine)
+        await dispose_async_engine()
+
+    print("\n" + "=" * 60)
+    print(f"npc_npc_memories 저장 처리량 (대화당 {args.turns}턴)")
+    print("=" * 60)
+    print(f"{'플레이어':>8} | {'행 단위 rows/s':>14} | {'벌크 rows/s':>12} | {'배율':>6}")
+    for num_players, row_rate, bulk_rate in results:
+        print(
+            f"{num_players:>8} | {row_rate:>14,.0f} | {bulk_rate:>12,.0f} | "
+            f"{bulk_rate / row_rate:>5.1f}x"
+        )
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="NPC-NPC 기억 벌크 INSERT 벤치마크")
+    parser.add_argument(
+        "--players", type=int, nargs="+", default=[1, 10, 100], help="동시 길드 플레이어 수 목록"
+    )
+    parser.add_argument("--turns", type=int, default=10, help="대화당 턴 수 (기본: 10)")
+
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
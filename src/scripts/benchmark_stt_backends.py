@@ -0,0 +1,235 @@
+"""
+STT 백엔드 / 모델 크기 비교 벤치마크
+
+audio_logs, uploads에 저장된 wav 클립을 백엔드별로 전사하여
+1) 실시간 배율 (RTF = 전사 시간 / 오디오 길이, 1보다 작을수록 빠름)
+2) 메모리 사용량 (모델 로드 후 / 전사 후 최대 RSS)
+3) 기준 백엔드 대비 텍스트 일치도 (_postprocess 후처리 = 의심 세그먼트 제거 + _domain_replace 이후)
+를 비교합니다.
+
+메모리를 따로 재기 위해 백엔드마다 별도 프로세스에서 실행합니다.
+모든 백엔드에 같은 디코딩 옵션(beam_size, best_of)을 넘기므로 엔진/양자화 차이만 비교됩니다.
+백엔드 지정 형식: "{backend}:{model}[:{compute_type}]"
+
+사용법:
+    # 기본 (openai-whisper large 기준, faster-whisper large-v3/small int8 비교, 클립 40개)
+    uv run python src/scripts/benchmark_stt_backends.py
+
+    # 백엔드/클립 수 지정 (첫 번째가 일치도 기준)
+    uv run python src/scripts/benchmark_stt_backends.py \
+        --backends openai-whisper:large faster-whisper:large-v3:int8 faster-whisper:medium:int8 \
+        --limit 100
+
+    # CPU 강제
+    uv run python src/scripts/benchmark_stt_backends.py --device cpu
+
+    # 빔 서치로 비교 (기본은 STT_BEAM_SIZE / STT_BEST_OF)
+    uv run python src/scripts/benchmark_stt_backends.py --beam-size 5
+"""
+
+import sys
+import argparse
+import difflib
+import multiprocessing
+import resource
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# src 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.audio.stt_backends import SAMPLE_RATE, STT_BEAM_SIZE, STT_BEST_OF, create_stt_backend
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_DIRS = [PROJECT_ROOT / "audio_logs", PROJECT_ROOT / "uploads"]
+DEFAULT_BACKENDS = [
+    "openai-whisper:large",
+    "faster-whisper:large-v3:int8",
+    "faster-whisper:small:int8",
+]
+
+
+def collect_clips(dirs: List[Path], limit: int) -> List[Path]:
+    """wav 파일 수집 (경로순 정렬 후 limit개)"""
+    clips = []
+    for d in dirs:
+        if d.exists():
+            clips.extend(sorted(d.rglob("*.wav")))
+    return clips[:limit] if limit > 0 else clips
+
+
+def max_rss_mb() -> float:
+    """현재 프로세스 최대 RSS (MB, Linux 기준 ru_maxrss는 KB)"""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 if sys.platform != "darwin" else rss / (1024 * 1024)
+
+
+def parse_spec(spec: str) -> Dict[str, str]:
+    parts = spec.split(":")
+    parsed = {"backend": parts[0], "model_size": parts[1] if len(parts) > 1 else "large"}
+    if len(parts) > 2:
+        parsed["compute_type"] = parts[2]
+    return parsed
+
+
+def run_backend(spec: str, device: str, clips: List[str], decoding: Dict[str, Optional[int]]) -> dict:
+    """백엔드 하나를 로드해서 모든 클립 전사 (자식 프로세스에서 실행)"""
+    kwargs = parse_spec(spec)
+    backend_name = kwargs.pop("backend")
+    model_size = kwargs.pop("model_size")
+    kwargs.update(decoding)
+    if device:
+        kwargs["device"] = device
+
+    base_rss = max_rss_mb()
+    backend = create_stt_backend(backend_name, model_size, **kwargs)
+
+    t = time.perf_counter()
+    backend.load()
+    load_time = time.perf_counter() - t
+    backend.warmup()
+    load_rss = max_rss_mb()
+
+    rows = []
+    for path in clips:
+        # 파일 디코딩(ffmpeg)은 측정에서 제외
+        audio = backend.load_audio(path)
+        t = time.perf_counter()
+        result = backend.transcribe(audio, language="ko")
+        rows.append(
+            {
+                "path": path,
+                "duration": len(audio) / SAMPLE_RATE,
+                "elapsed": time.perf_counter() - t,
+                "result": {"segments": result.get("segments", [])},
+            }
+        )
+
+    return {
+        "spec": spec,
+        "label": backend.label,
+        "device": backend.device,
+        "load_time": load_time,
+        "base_rss": base_rss,
+        "load_rss": load_rss,
+        "peak_rss": max_rss_mb(),
+        "rows": rows,
+    }
+
+
+def run_isolated(spec: str, device: str, clips: List[str], decoding: Dict[str, Optional[int]]) -> dict:
+    """별도 프로세스에서 실행 (백엔드별 메모리 측정 분리)"""
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(1) as pool:
+        return pool.apply(run_backend, (spec, device, clips, decoding))
+
+
+def similarity(a: str, b: str) -> float:
+    """공백 무시 문자 단위 유사도 (0~1)"""
+    a = "".join(a.split())
+    b = "".join(b.split())
+    if not a and not b:
+        return 1.0
+    return difflib.SequenceMatcher(None, a, b).ratio()
+
+
+def percentile(values: List[float], p: float) -> float:
+    """p 백분위수 (0~100)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * p / 100
+    lower = int(k)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="STT 백엔드 비교 벤치마크")
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=DEFAULT_BACKENDS,
+        help='비교할 백엔드 "{backend}:{model}[:{compute_type}]" (첫 번째가 기준)',
+    )
+    parser.add_argument(
+        "--dirs", nargs="+", type=Path, default=DEFAULT_DIRS, help="wav 클립 디렉토리"
+    )
+    parser.add_argument("--limit", type=int, default=40, help="클립 수 (0이면 전부)")
+    parser.add_argument("--device", default="", help="cpu | cuda (기본: 자동)")
+    parser.add_argument("--beam-size", type=int, default=STT_BEAM_SIZE, help="빔 크기 (1이면 greedy)")
+    parser.add_argument("--best-of", type=int, default=STT_BEST_OF, help="temperature fallback 샘플링 후보 수 (기본 없음 = 1개)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="기준과 다른 문장 출력")
+    args = parser.parse_args()
+
+    # 후처리는 실제 STT 엔드포인트와 같은 함수 사용
+    from api.common_router import _postprocess
+
+    clips = [str(p) for p in collect_clips(args.dirs, args.limit)]
+    if not clips:
+        print("[ERROR] wav 클립이 없습니다")
+        return
+    decoding = {"beam_size": args.beam_size, "best_of": args.best_of}
+    print(
+        f"[INFO] 클립 {len(clips)}개, 백엔드 {len(args.backends)}개, "
+        f"beam_size={args.beam_size} best_of={args.best_of}"
+    )
+
+    reports = []
+    for spec in args.backends:
+        print(f"[INFO] {spec} 실행 중...")
+        try:
+            report = run_isolated(spec, args.device, clips, decoding)
+        except Exception as e:
+            print(f"[WARN] {spec} 실패: {e}")
+            continue
+        for row in report["rows"]:
+            row["text"], row["is_valid"] = _postprocess(row["result"])
+        reports.append(report)
+
+    if not reports:
+        return
+
+    reference = reports[0]
+    total_audio = sum(r["duration"] for r in reference["rows"])
+
+    print("\n" + "=" * 100)
+    print(
+        f"STT 백엔드 비교 (클립 {len(clips)}개, 총 {total_audio:.1f}s, 기준: {reference['label']}, "
+        f"beam_size={args.beam_size} best_of={args.best_of})"
+    )
+    print("=" * 100)
+    print(
+        f"  {'백엔드':<34} {'장치':>5} {'로드':>7} {'RTF':>6} {'p50':>8} {'p95':>8} "
+        f"{'RSS(로드)':>10} {'RSS(최대)':>10} {'일치도':>7} {'동일':>6}"
+    )
+
+    for report in reports:
+        rows = report["rows"]
+        elapsed = [r["elapsed"] for r in rows]
+        rtf = sum(elapsed) / total_audio if total_audio else 0.0
+        sims = [similarity(r["text"], ref["text"]) for r, ref in zip(rows, reference["rows"])]
+        exact = sum(r["text"] == ref["text"] for r, ref in zip(rows, reference["rows"])) / len(rows)
+
+        print(
+            f"  {report['label']:<34} {report['device']:>5} {report['load_time']:>6.1f}s "
+            f"{rtf:>6.3f} {percentile(elapsed, 50) * 1000:>6.0f}ms {percentile(elapsed, 95) * 1000:>6.0f}ms "
+            f"{report['load_rss'] - report['base_rss']:>8.0f}MB {report['peak_rss']:>8.0f}MB "
+            f"{statistics.mean(sims):>7.1%} {exact:>6.1%}"
+        )
+
+    if args.verbose:
+        for report in reports[1:]:
+            print(f"\n[기준과 다른 문장: {report['label']}]")
+            for row, ref in zip(report["rows"], reference["rows"]):
+                if row["text"] != ref["text"]:
+                    print(f"  {Path(row['path']).name}")
+                    print(f"    기준: {ref['text']}")
+                    print(f"    결과: {row['text']}")
+
+
+if __name__ == "__main__":
+    main()
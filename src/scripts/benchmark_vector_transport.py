@@ -0,0 +1,162 @@
+"""
+pgvector 파라미터 전송 방식 비교 마이크로 벤치마크
+
+1) 텍스트: str(embedding) + CAST(:embedding AS vector)  (기존 방식)
+2) 바이너리: pgvector asyncpg 코덱 + float32 배열     (db/vector_codec.py)
+
+임시 테이블(ON COMMIT DROP)에 INSERT / 유사도 검색을 반복하며
+건당 지연시간을 비교합니다. 실제 테이블은 건드리지 않습니다.
+
+사용법:
+    # 기본 (INSERT 200건, 검색 200건, 1536차원)
+    uv run python src/scripts/benchmark_vector_transport.py
+
+    # 반복 횟수 지정
+    uv run python src/scripts/benchmark_vector_transport.py --inserts 500 --searches 500
+"""
+
+import sys
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, List
+
+# src 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from db.config import CONNECTION_URL
+from db.async_engine import to_async_url
+from db.vector_codec import register_vector_codec, to_vector_param
+
+
+def random_vectors(count: int, dim: int) -> List[List[float]]:
+    """정규화된 랜덤 벡터 생성 (OpenAI 임베딩과 비슷한 분포)"""
+    vectors = []
+    for _ in range(count):
+        v = [random.gauss(0, 1) for _ in range(dim)]
+        norm = sum(x * x for x in v) ** 0.5
+        vectors.append([x / norm for x in v])
+    return vectors
+
+
+def make_engine() -> AsyncEngine:
+    """벤치마크 전용 엔진 (커넥션 1개)"""
+    return create_async_engine(
+        to_async_url(CONNECTION_URL),
+        pool_size=1,
+        max_overflow=0,
+        connect_args={"statement_cache_size": 0},
+    )
+
+
+async def run_case(
+    engine: AsyncEngine,
+    encode: Callable,
+    vectors: List[List[float]],
+    queries: List[List[float]],
+    dim: int,
+) -> dict:
+    """한 가지 인코딩으로 INSERT / 검색 지연시간 측정"""
+    insert_times = []
+    search_times = []
+
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        await conn.execute(
+            text(
+                f"""
+                CREATE TEMP TABLE bench_vectors (
+                    id SERIAL PRIMARY KEY,
+                    embedding vector({dim})
+                ) ON COMMIT DROP
+                """
+            )
+        )
+
+        insert_sql = text(
+            "INSERT INTO bench_vectors (embedding) VALUES (CAST(:embedding AS vector))"
+        )
+        for v in vectors:
+            t = time.perf_counter()
+            await conn.execute(insert_sql, {"embedding": encode(v)})
+            insert_times.append(time.perf_counter() - t)
+
+        search_sql = text(
+            """
+            SELECT id, 1 - (embedding <=> CAST(:embedding AS vector)) AS similarity
+            FROM bench_vectors
+            ORDER BY embedding <=> CAST(:embedding AS vector)
+            LIMIT 5
+            """
+        )
+        for q in queries:
+            t = time.perf_counter()
+            result = await conn.execute(search_sql, {"embedding": encode(q)})
+            result.fetchall()
+            search_times.append(time.perf_counter() - t)
+
+        await trans.rollback()
+
+    return {"insert": insert_times, "search": search_times}
+
+
+def summarize(label: str, times: List[float]) -> None:
+    ordered = sorted(times)
+    p95 = ordered[int(len(ordered) * 0.95) - 1] if ordered else 0.0
+    print(
+        f"  {label:<8} 평균 {statistics.mean(times) * 1000:7.3f}ms | "
+        f"p50 {statistics.median(times) * 1000:7.3f}ms | "
+        f"p95 {p95 * 1000:7.3f}ms"
+    )
+
+
+async def run_benchmark(args) -> None:
+    random.seed(42)
+    vectors = random_vectors(args.inserts, args.dim)
+    queries = random_vectors(args.searches, args.dim)
+
+    text_engine = make_engine()
+    binary_engine = register_vector_codec(make_engine())
+
+    try:
+        cases = {
+            "텍스트 (str)": await run_case(text_engine, str, vectors, queries, args.dim),
+            "바이너리 (float32)": await run_case(
+                binary_engine, to_vector_param, vectors, queries, args.dim
+            ),
+        }
+    finally:
+        await text_engine.dispose()
+        await binary_engine.dispose()
+
+    print("\n" + "=" * 60)
+    print(f"pgvector 전송 방식 비교 (dim={args.dim})")
+    print("=" * 60)
+    for name, result in cases.items():
+        print(f"\n[{name}]")
+        summarize("INSERT", result["insert"])
+        summarize("SEARCH", result["search"])
+
+    print(f"\n텍스트 파라미터 크기: {len(str(vectors[0])):,} bytes")
+    print(f"바이너리 파라미터 크기: {4 + 4 * args.dim:,} bytes")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="pgvector 파라미터 전송 방식 비교")
+    parser.add_argument("--inserts", type=int, default=200, help="INSERT 횟수 (기본: 200)")
+    parser.add_argument("--searches", type=int, default=200, help="검색 횟수 (기본: 200)")
+    parser.add_argument("--dim", type=int, default=1536, help="벡터 차원 (기본: 1536)")
+
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+이벤트 선택지 매칭 평가 스크립트 (로컬 매칭 기준값 보정용)
+
+tests/dungeon/choice_eval/event_choice_eval.json 평가셋으로
+1) 로컬 매칭 (문자열 유사도 + 적대 키워드 + BGE-M3 임베딩, ChoiceMatcher)
+2) LLM 분류 (classify_with_llm, 기존 /event/select 분류 프롬프트)
+3) 결합 (로컬이 확신하면 사용, 애매하면 LLM)
+의 정확도를 비교합니다.
+
+임베딩 유사도는 한 번만 계산하고 threshold / margin / reject 조합을 바꿔가며
+"로컬 처리 비율 / 로컬 정확도 / 돌발 행동 오매칭 / 결합 정확도"를 출력하므로
+EVENT_CHOICE_EMBED_THRESHOLD, EVENT_CHOICE_EMBED_MARGIN, EVENT_CHOICE_EMBED_REJECT 값을 정할 때 사용합니다.
+돌발 행동 오매칭(선택지와 관계없는 입력이 선택지로 처리되어 보상까지 받는 경우)이 0에 가까워야 합니다.
+
+사용법:
+    # 기본 (현재 환경변수 기준값 + 기본 탐색 범위)
+    uv run python src/scripts/eval_event_choice.py
+
+    # 기준값 지정, LLM 호출 생략 (로컬만)
+    uv run python src/scripts/eval_event_choice.py --thresholds 0.7 0.8 --margins 0.03 0.05 --skip-llm
+"""
+
+import sys
+import argparse
+import json
+import statistics
+import time
+from collections import Counter
+from itertools import product
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# src 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.dungeon.event.choice_matcher import (
+    EVENT_CHOICE_EMBED_MARGIN,
+    EVENT_CHOICE_EMBED_REJECT,
+    EVENT_CHOICE_EMBED_THRESHOLD,
+    HOSTILE_KEYWORDS,
+    HOSTILE_LEXICAL_CEILING,
+    ChoiceMatcher,
+    classify_with_llm,
+    lexical_similarity,
+    normalize_choice_text,
+)
+
+EVAL_PATH = (
+    Path(__file__).parent.parent / "tests" / "dungeon" / "choice_eval" / "event_choice_eval.json"
+)
+
+UNEXPECTED = "unexpected"
+
+
+def label_index(label) -> Optional[int]:
+    return None if label == UNEXPECTED else int(label)
+
+
+def run_local(matcher: ChoiceMatcher, questions: List[dict], events: Dict[str, dict]) -> List[dict]:
+    """문자열 판정 + 선택지별 임베딩 유사도 (임베딩은 기준값과 관계없이 항상 계산)"""
+    matcher.embedding_scores("워밍업", ["워밍업"])  # 모델 로드 시간은 제외
+
+    rows = []
+    for q in questions:
+        actions = events[q["event"]]["actions"]
+        choice_norm = normalize_choice_text(q["text"])
+        lexical = [lexical_similarity(choice_norm, normalize_choice_text(a)) for a in actions]
+        best = max(range(len(actions)), key=lambda i: lexical[i])
+
+        t = time.perf_counter()
+        sims = matcher.embedding_scores(q["text"], actions)
+        rows.append(
+            {
+                "lexical_index": best if lexical[best] >= matcher.lexical_threshold else None,
+                "hostile": lexical[best] < HOSTILE_LEXICAL_CEILING
+                and any(kw in choice_norm for kw in HOSTILE_KEYWORDS),
+                "sims": sims,
+                "latency": time.perf_counter() - t,
+            }
+        )
+    return rows
+
+
+def run_llm(questions: List[dict], events: Dict[str, dict]) -> List[dict]:
+    """LLM 분류: 문항마다 순차 호출"""
+    rows = []
+    for q in questions:
+        event = events[q["event"]]
+        t = time.perf_counter()
+        index = classify_with_llm(event["scenario_narrative"], q["text"], event["actions"])
+        rows.append({"index": index, "latency": time.perf_counter() - t})
+    return rows
+
+
+def local_decision(row: dict, threshold: float, margin: float, reject: float) -> dict:
+    """ChoiceMatcher.match와 같은 순서의 판정 (임베딩 기준값만 바꿔서)"""
+    if row["lexical_index"] is not None:
+        return {"index": row["lexical_index"], "method": "lexical"}
+    if row["hostile"]:
+        return {"index": None, "method": "hostile"}
+    return ChoiceMatcher.decide_embedding(row["sims"], threshold, margin, reject)
+
+
+def print_similarity_summary(rows: List[dict], labels: List[Optional[int]]) -> None:
+    """라벨별 1위 임베딩 유사도 분포 (threshold / reject 후보를 고를 때 참고)"""
+    matched = [float(r["sims"].max()) for r, y in zip(rows, labels) if y is not None]
+    unexpected = [float(r["sims"].max()) for r, y in zip(rows, labels) if y is None]
+    for label, values in (("선택지", matched), ("돌발 행동", unexpected)):
+        if values:
+            ordered = sorted(values)
+            print(
+                f"  {label:<8} min {ordered[0]:.3f} | p50 {statistics.median(ordered):.3f} | max {ordered[-1]:.3f}"
+            )
+
+
+def run_eval(args) -> None:
+    data = json.loads(EVAL_PATH.read_text(encoding="utf-8"))
+    events = {e["id"]: e for e in data["events"]}
+    questions = data["questions"]
+    labels = [label_index(q["label"]) for q in questions]
+    total = len(questions)
+    print(
+        f"[INFO] 평가 문항: {total}개 "
+        f"{dict(Counter('unexpected' if y is None else 'choice' for y in labels))}"
+    )
+
+    matcher = ChoiceMatcher()
+    t = time.perf_counter()
+    local_rows = run_local(matcher, questions, events)
+    print(f"[INFO] 로컬 점수 계산 완료 ({time.perf_counter() - t:.1f}s, 모델 로드 포함)")
+
+    llm_rows: List[dict] = []
+    if not args.skip_llm:
+        llm_rows = run_llm(questions, events)
+
+    print("\n" + "=" * 70)
+    print("이벤트 선택지 매칭 평가")
+    print("=" * 70)
+
+    print("\n[1위 임베딩 유사도 분포]")
+    print_similarity_summary(local_rows, labels)
+
+    if llm_rows:
+        llm_acc = sum(r["index"] == y for r, y in zip(llm_rows, labels)) / total
+        print(f"\n[LLM 단독 정확도] {llm_acc:.1%}")
+        print(
+            f"  지연 평균 {statistics.mean(r['latency'] for r in llm_rows) * 1000:.1f}ms"
+        )
+
+    print("\n[기준값별 결과]")
+    header = (
+        f"  {'thresh':>6} {'margin':>6} {'reject':>6} | {'로컬 비율':>8} | {'로컬 정확도':>10} | "
+        f"{'돌발 오매칭':>10} | {'선택지 놓침':>10}"
+    )
+    if llm_rows:
+        header += f" | {'결합 정확도':>10}"
+    print(header)
+
+    for threshold, margin, reject in product(args.thresholds, args.margins, args.rejects):
+        decided = [local_decision(r, threshold, margin, reject) for r in local_rows]
+        answered = [(d, y) for d, y in zip(decided, labels) if d["method"] != "ambiguous"]
+        coverage = len(answered) / total
+        answered_acc = (
+            sum(d["index"] == y for d, y in answered) / len(answered) if answered else 0.0
+        )
+        # 돌발 행동인데 선택지로 처리 (보상 오지급) / 선택지인데 돌발 행동 처리 (패널티 오부여)
+        false_match = sum(1 for d, y in answered if y is None and d["index"] is not None)
+        missed = sum(1 for d, y in answered if y is not None and d["index"] is None)
+        line = (
+            f"  {threshold:>6.2f} {margin:>6.3f} {reject:>6.2f} | {coverage:>8.1%} | "
+            f"{answered_acc:>10.1%} | {false_match:>10d} | {missed:>10d}"
+        )
+        if llm_rows:
+            combined = [
+                d["index"] if d["method"] != "ambiguous" else llm["index"]
+                for d, llm in zip(decided, llm_rows)
+            ]
+            combined_acc = sum(c == y for c, y in zip(combined, labels)) / total
+            line += f" | {combined_acc:>10.1%}"
+        print(line)
+
+    if args.verbose:
+        print("\n[로컬 오판 (현재 기준값)]")
+        for q, r, y in zip(questions, local_rows, labels):
+            d = local_decision(
+                r, EVENT_CHOICE_EMBED_THRESHOLD, EVENT_CHOICE_EMBED_MARGIN, EVENT_CHOICE_EMBED_REJECT
+            )
+            if d["method"] != "ambiguous" and d["index"] != y:
+                print(
+                    f"  {q['id']} '{q['text']}' 정답={q['label']} 예측={d['index']} "
+                    f"method={d['method']} top={float(r['sims'].max()):.3f}"
+                )
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="이벤트 선택지 매칭 평가")
+    parser.add_argument(
+        "--thresholds",
+        type=float,
+        nargs="+",
+        default=sorted({0.6, 0.7, 0.75, 0.8, 0.85, 0.9, EVENT_CHOICE_EMBED_THRESHOLD}),
+        help="비교할 임베딩 매칭 기준 목록",
+    )
+    parser.add_argument(
+        "--margins",
+        type=float,
+        nargs="+",
+        default=sorted({0.02, 0.05, 0.08, EVENT_CHOICE_EMBED_MARGIN}),
+        help="비교할 1, 2위 차이 목록",
+    )
+    parser.add_argument(
+        "--rejects",
+        type=float,
+        nargs="+",
+        default=[EVENT_CHOICE_EMBED_REJECT],
+        help="비교할 돌발 행동 기준 목록",
+    )
+    parser.add_argument("--skip-llm", action="store_true", help="LLM 분류 생략")
+    parser.add_argument("-v", "--verbose", action="store_true", help="로컬 오판 문항 출력")
+
+    args = parser.parse_args()
+    run_eval(args)
+
+
+if __name__ == "__main__":
+    main()
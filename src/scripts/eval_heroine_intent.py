@@ -0,0 +1,200 @@
+"""
+히로인 의도 분류 평가 스크립트 (로컬 빠른 경로 vs LLM)
+
+tests/npc/intent_eval/heroine_intent_eval.json 평가셋으로
+1) 빠른 경로 (HeroineIntentFastClassifier, 로컬 BGE-M3)
+2) LLM 경로 (HeroineIntentClassifier.classify_with_llm)
+3) 결합 (빠른 경로가 확신하면 사용, 아니면 LLM)
+의 정확도와 지연시간을 비교합니다.
+
+빠른 경로 점수는 한 번만 계산하고 margin 값을 바꿔가며
+"빠른 경로 처리 비율 / 빠른 경로 정확도 / 결합 정확도"를 함께 출력하므로
+HEROINE_INTENT_FAST_MARGIN 값을 정할 때 사용합니다.
+
+사용법:
+    # 기본 (margin 0.02 ~ 0.08)
+    uv run python src/scripts/eval_heroine_intent.py
+
+    # margin 지정, LLM 호출 생략 (빠른 경로만)
+    uv run python src/scripts/eval_heroine_intent.py --margins 0.03 0.05 --skip-llm
+"""
+
+import sys
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# src 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from langchain.chat_models import init_chat_model
+
+from agents.npc.heroine_intent_classifier import HeroineIntentClassifier
+from agents.npc.heroine_intent_fast_classifier import HeroineIntentFastClassifier
+from enums.LLM import LLM
+
+EVAL_PATH = (
+    Path(__file__).parent.parent / "tests" / "npc" / "intent_eval" / "heroine_intent_eval.json"
+)
+
+
+def percentile(values: List[float], p: float) -> float:
+    """p 백분위수 (0~100)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * p / 100
+    lower = int(k)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
+
+
+def print_latency(label: str, times: List[float]) -> None:
+    if not times:
+        return
+    print(
+        f"  {label:<10} 평균 {statistics.mean(times) * 1000:8.1f}ms | "
+        f"p50 {percentile(times, 50) * 1000:8.1f}ms | "
+        f"p95 {percentile(times, 95) * 1000:8.1f}ms"
+    )
+
+
+def run_fast(fast: HeroineIntentFastClassifier, questions: List[dict]) -> List[dict]:
+    """빠른 경로: 의도별 유사도와 지연시간 측정"""
+    fast.scores("워밍업")  # 모델/프로토타입 로드 시간은 제외
+
+    rows = []
+    for q in questions:
+        t = time.perf_counter()
+        scores = fast.scores(q["text"])
+        elapsed = time.perf_counter() - t
+
+        ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        rows.append(
+            {
+                "best": ranked[0][0],
+                "margin": ranked[0][1] - ranked[1][1],
+                "needs_context": fast.needs_context(
+                    q["text"], q.get("recently_unlocked")
+                ),
+                "latency": elapsed,
+            }
+        )
+    return rows
+
+
+async def run_llm(classifier: HeroineIntentClassifier, questions: List[dict]) -> List[dict]:
+    """LLM 경로: 문항마다 순차 호출"""
+    rows = []
+    for q in questions:
+        t = time.perf_counter()
+        intent = await classifier.classify_with_llm(
+            user_message=q["text"],
+            conversation_buffer=q.get("conversation_buffer", []),
+            recently_unlocked=q.get("recently_unlocked"),
+        )
+        rows.append({"intent": intent, "latency": time.perf_counter() - t})
+    return rows
+
+
+def fast_decision(row: dict, margin: float) -> Optional[str]:
+    if row["needs_context"] or row["margin"] < margin:
+        return None
+    return row["best"]
+
+
+async def run_eval(args) -> None:
+    questions = json.loads(EVAL_PATH.read_text(encoding="utf-8"))["questions"]
+    labels = [q["intent"] for q in questions]
+    total = len(questions)
+    print(f"[INFO] 평가 문항: {total}개 {dict(Counter(labels))}")
+
+    fast = HeroineIntentFastClassifier()
+    t = time.perf_counter()
+    fast_rows = run_fast(fast, questions)
+    print(f"[INFO] 빠른 경로 완료 ({time.perf_counter() - t:.1f}s, 모델 로드 포함)")
+
+    llm_rows: List[dict] = []
+    if not args.skip_llm:
+        intent_llm = init_chat_model(model=args.model, temperature=0, max_tokens=20)
+        classifier = HeroineIntentClassifier(intent_llm, fast_classifier=fast)
+        llm_rows = await run_llm(classifier, questions)
+
+    print("\n" + "=" * 70)
+    print("히로인 의도 분류 평가")
+    print("=" * 70)
+
+    fast_acc = sum(r["best"] == y for r, y in zip(fast_rows, labels)) / total
+    print(f"\n[정확도]")
+    print(f"  빠른 경로(전부 강제)  {fast_acc:.1%}")
+    if llm_rows:
+        llm_acc = sum(r["intent"] == y for r, y in zip(llm_rows, labels)) / total
+        print(f"  LLM                  {llm_acc:.1%}")
+
+    print(f"\n[지연시간]")
+    print_latency("빠른 경로", [r["latency"] for r in fast_rows])
+    print_latency("LLM", [r["latency"] for r in llm_rows])
+
+    print(f"\n[margin별 결합 결과]")
+    header = f"  {'margin':>6} | {'빠른경로 비율':>12} | {'빠른경로 정확도':>14}"
+    if llm_rows:
+        header += f" | {'결합 정확도':>10} | {'결합 평균지연':>12}"
+    print(header)
+
+    for margin in args.margins:
+        decided = [fast_decision(r, margin) for r in fast_rows]
+        answered = [(d, y) for d, y in zip(decided, labels) if d is not None]
+        coverage = len(answered) / total
+        answered_acc = (
+            sum(d == y for d, y in answered) / len(answered) if answered else 0.0
+        )
+        line = f"  {margin:>6.3f} | {coverage:>12.1%} | {answered_acc:>14.1%}"
+
+        if llm_rows:
+            combined = [
+                d if d is not None else llm["intent"]
+                for d, llm in zip(decided, llm_rows)
+            ]
+            combined_acc = sum(c == y for c, y in zip(combined, labels)) / total
+            combined_latency = statistics.mean(
+                fr["latency"] + (0.0 if d is not None else llm["latency"])
+                for d, fr, llm in zip(decided, fast_rows, llm_rows)
+            )
+            line += f" | {combined_acc:>10.1%} | {combined_latency * 1000:>10.1f}ms"
+        print(line)
+
+    if args.verbose:
+        print(f"\n[오분류 (빠른 경로)]")
+        for q, r in zip(questions, fast_rows):
+            if r["best"] != q["intent"]:
+                print(
+                    f"  {q['id']} '{q['text']}' 정답={q['intent']} "
+                    f"예측={r['best']} margin={r['margin']:.3f}"
+                )
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="히로인 의도 분류 평가")
+    parser.add_argument(
+        "--margins",
+        type=float,
+        nargs="+",
+        default=[0.02, 0.03, 0.04, 0.05, 0.06, 0.08],
+        help="비교할 margin 목록",
+    )
+    parser.add_argument("--model", default=LLM.GROK_4_1_FAST_NON_REASONING, help="LLM 모델")
+    parser.add_argument("--skip-llm", action="store_true", help="LLM 경로 생략")
+    parser.add_argument("-v", "--verbose", action="store_true", help="오분류 문항 출력")
+
+    args = parser.parse_args()
+    asyncio.run(run_eval(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+정령 KoBERT 의도 모델 ONNX 변형 미리 만들기
+
+MODEL_CACHE_DIR에 받은 체크포인트(던전/인터렉션)를 ONNX로 내보내고
+ONNX Runtime 동적 int8 양자화 모델까지 INTENT_MODEL_CACHE_DIR에 저장합니다.
+(만들어 두지 않으면 FAIRY_INTENT_VARIANT=onnx 로 처음 로드할 때 생성)
+
+torch int8(동적 양자화) 변형은 로드 시 바로 변환하므로 파일이 없습니다.
+
+사용법:
+    # 두 모델 모두 (onnx + onnx-int8)
+    uv run python src/scripts/export_kobert_variants.py
+
+    # 기존 파일 덮어쓰기
+    uv run python src/scripts/export_kobert_variants.py --force
+"""
+
+import sys
+import argparse
+import time
+from pathlib import Path
+
+# src 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import torch
+
+from agents.fairy.ai_data_schema.kobert_variants import build_onnx, onnx_path
+from core.model_registry import hf_download
+
+REPO_ID = "JINSUP/ProjectML-Models"
+CHECKPOINTS = [
+    "fairy_dungeon_intent_kobert_model.pt",
+    "fairy_interaction_intent_kobert_classifier.pt",
+]
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="KoBERT 의도 모델 ONNX 변형 생성")
+    parser.add_argument("--force", action="store_true", help="기존 ONNX 파일 덮어쓰기")
+    args = parser.parse_args()
+
+    for filename in CHECKPOINTS:
+        weight_path = hf_download(REPO_ID, filename)
+        checkpoint = torch.load(weight_path, map_location="cpu")
+
+        if args.force:
+            for variant in ("onnx-int8", "onnx"):
+                onnx_path(weight_path, variant).unlink(missing_ok=True)
+
+        for variant in ("onnx", "onnx-int8"):
+            t = time.perf_counter()
+            path = build_onnx(checkpoint, weight_path, variant)
+            size_mb = path.stat().st_size / (1024 * 1024)
+            print(
+                f"[INFO] {filename} -> {path.name} "
+                f"({size_mb:.1f}MB, {time.perf_counter() - t:.1f}s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
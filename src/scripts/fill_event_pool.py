@@ -0,0 +1,79 @@
+"""
+던전 이벤트 풀 미리 채우기
+
+(event_code, heroine_id, memory_bucket) 키마다 재고를 목표 개수까지 생성합니다.
+배포 전 / 콘텐츠(이벤트, 히로인 기억) 변경 후 한 번 실행해 두면
+입장 시 LLM 호출 없이 이벤트가 배정됩니다.
+
+dungeon_event_pool_schema.sql이 적용된 DB에서 실행해야 합니다.
+(python -m src.db.migrations.create_dungeon_event_pool)
+
+사용법:
+    # 전체 키 (히로인 1~3 x 기억 구간 x 이벤트 10종) 키당 3개
+    uv run python src/scripts/fill_event_pool.py
+
+    # 히로인 / 이벤트 코드 / 목표 개수 지정
+    uv run python src/scripts/fill_event_pool.py --heroines 1 --codes BLACK_FIGURE --target 5
+
+    # 기존 재고 삭제 후 다시 채우기 (이벤트 문구를 수정했을 때)
+    uv run python src/scripts/fill_event_pool.py --reset
+"""
+
+import sys
+import argparse
+import time
+from pathlib import Path
+
+# src 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from agents.dungeon.event.event_pool import (
+    EVENT_POOL_TARGET_STOCK,
+    all_memory_buckets,
+    event_pool,
+)
+from agents.dungeon.event.main_event_scenarios import MAIN_EVENT_SCENARIOS
+from db.RDBRepository import get_engine
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="던전 이벤트 풀 채우기")
+    parser.add_argument("--target", type=int, default=EVENT_POOL_TARGET_STOCK, help="키별 목표 재고")
+    parser.add_argument("--heroines", type=int, nargs="+", default=[1, 2, 3], help="히로인 ID")
+    parser.add_argument("--codes", nargs="+", default=None, help="이벤트 코드 (기본: 전체)")
+    parser.add_argument("--reset", action="store_true", help="대상 히로인의 기존 재고 삭제")
+    args = parser.parse_args()
+
+    codes = args.codes or [e["event_code"] for e in MAIN_EVENT_SCENARIOS]
+
+    if args.reset:
+        with get_engine().begin() as conn:
+            deleted = conn.execute(
+                text("DELETE FROM dungeon_event_pool WHERE heroine_id = ANY(:heroines)"),
+                {"heroines": args.heroines},
+            ).rowcount
+        print(f"[INFO] 기존 재고 {deleted}개 삭제")
+
+    keys = [
+        (code, heroine_id, bucket)
+        for heroine_id in args.heroines
+        for bucket in all_memory_buckets(heroine_id)
+        for code in codes
+    ]
+    print(f"[INFO] 키 {len(keys)}개, 키별 목표 {args.target}개")
+
+    start = time.perf_counter()
+    total = 0
+    for i, key in enumerate(keys, start=1):
+        created = event_pool.refill(key, target=args.target)
+        total += created
+        print(f"  [{i}/{len(keys)}] {key}: +{created}")
+
+    print(f"[INFO] 생성 {total}개 ({time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
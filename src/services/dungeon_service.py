@@ -4,15 +4,21 @@ fairy_service.py 구조를 따라 던전 밸런싱을 통합 관리
 """
 
 import json
+import os
+import threading
+import time
 from typing import Dict, Any, List, Optional
 from sqlalchemy import text
 from db.RDBRepository import RDBRepository
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from src.agents.dungeon.event import event_rewards_penalties as er
 from agents.dungeon.event.event_rewards_penalties import (
     normalize_reward_payload,
     normalize_penalty_payload,
 )
+from agents.dungeon.event.event_pool import event_pool
+from agents.dungeon.event.choice_matcher import choice_matcher, find_choice_outcome
+from core.graph_registry import graph_registry
 
 
 # ============================================================
@@ -110,17 +116,56 @@ def _remove_message_recursive(obj: Any) -> Any:
         return obj
 
 
-_dungeon_graph = None
+def _event_rooms(normalized_raw_map: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """맵에서 이벤트 방 목록"""
+    return [
+        room
+        for room in normalized_raw_map.get("rooms", [])
+        if room.get("room_type") == "event" or room.get("event_type", 0) != 0
+    ]
 
 
-def get_dungeon_graph():
-    """Lazy initialization으로 Super Agent Graph 반환"""
-    global _dungeon_graph
-    if _dungeon_graph is None:
-        from agents.dungeon.super.dungeon_agent import create_super_dungeon_graph
+# ============================================================
+# 입장 이벤트 생성 백그라운드 작업 (층 단위)
+# ============================================================
+# asyncEvents 입장에서 동시에 이벤트를 생성하는 층 수 (서버 전체 공용 풀)
+# 층 작업 하나가 이벤트 방 수만큼(최대 8) LLM 호출 스레드를 추가로 쓰므로
+# 비동기 입장의 LLM 동시 호출은 최대 약 ENTRANCE_EVENT_WORKERS x 8
+# 응답을 기다리는 동기 입장은 요청마다 전용 스레드를 써서 이 풀이 차 있어도 기다리지 않음
+ENTRANCE_EVENT_WORKERS = int(os.getenv("ENTRANCE_EVENT_WORKERS", "8"))
+# 상태 조회용으로 보관하는 완료된 작업 수
+ENTRANCE_EVENT_JOB_HISTORY = 512
+
+_event_job_executor = ThreadPoolExecutor(
+    max_workers=ENTRANCE_EVENT_WORKERS, thread_name_prefix="dungeon-event"
+)
+_event_jobs: Dict[int, Future] = {}  # floor_id -> 작업
+_event_jobs_lock = threading.Lock()
+
 
-        _dungeon_graph = create_super_dungeon_graph()
-    return _dungeon_graph
+def _submit_floor_event_job(
+    floor_id: int, fn, *args, executor: Optional[ThreadPoolExecutor] = None
+) -> Future:
+    """층 이벤트 생성 작업 등록 (기본은 공용 풀, 오래된 완료 작업은 정리)"""
+    future = (executor or _event_job_executor).submit(fn, *args)
+    with _event_jobs_lock:
+        if len(_event_jobs) >= ENTRANCE_EVENT_JOB_HISTORY:
+            for done_id in [fid for fid, f in _event_jobs.items() if f.done()]:
+                del _event_jobs[done_id]
+        _event_jobs[floor_id] = future
+    future.add_done_callback(_log_floor_event_job_error)
+    return future
+
+
+def _log_floor_event_job_error(future: Future) -> None:
+    error = future.exception()
+    if error is not None:
+        print(f"[ERROR] 입장 이벤트 저장 실패: {error}")
+
+
+def get_dungeon_graph():
+    """Super Agent Graph 반환 (graph_registry에서 프로세스당 한 번 컴파일)"""
+    return graph_registry.get("super_dungeon")
 
 
 class DungeonService:
@@ -155,219 +200,434 @@ class DungeonService:
         raw_maps: List[Dict[str, Any]],  # 여러 층 raw_map
         heroine_data: Optional[List] = None,
         used_events: Optional[List[Any]] = None,
+        wait_for_events: bool = True,
     ) -> Dict[str, Any]:
-        events_list = []
-        floor_ids = []
+        """
+        던전 입장 (2단계)
+
+        1) 맵 저장: 이전 미완료 던전 완료 처리 + 1, 2층 row 생성 후 바로 커밋
+        2) 이벤트 코드 선택: 층끼리 겹치지 않게 모든 층의 이벤트 코드를 먼저 고름 (LLM 호출 없음)
+        3) 이벤트 생성: 층별 작업을 백그라운드 풀에서 동시에 실행하고, 끝나면 각 층 row에 저장
+           (LLM 호출 동안 DB 연결/트랜잭션을 잡고 있지 않음)
+
+        wait_for_events=False면 3)을 공용 풀에 맡기고 floor_ids만 반환합니다.
+        이벤트 준비 여부는 get_entrance_events(first_player_id, floor)로 조회합니다.
+        wait_for_events=True면 이 요청 전용 스레드에서 생성하고 기다립니다.
+        """
+        # heroine_data가 int 리스트면 dict로 변환
+        normalized_heroines = []
+        if heroine_data:
+            if all(isinstance(h, int) for h in heroine_data):
+                for hid, mp in zip(heroine_ids, heroine_data):
+                    normalized_heroines.append(
+                        {"heroine_id": hid, "memory_progress": mp}
+                    )
+            elif isinstance(heroine_data, list):
+                for h in heroine_data:
+                    normalized_heroines.append(_normalize_heroine_data(h))
+            else:
+                normalized_heroines.append(_normalize_heroine_data(heroine_data))
+
         try:
-            with self.repo.engine.begin() as conn:
-                # heroine_data가 int 리스트면 dict로 변환
-                normalized_heroines = []
-                if heroine_data:
-                    if all(isinstance(h, int) for h in heroine_data):
-                        for hid, mp in zip(heroine_ids, heroine_data):
-                            normalized_heroines.append(
-                                {"heroine_id": hid, "memory_progress": mp}
-                            )
-                    elif isinstance(heroine_data, list):
-                        for h in heroine_data:
-                            normalized_heroines.append(_normalize_heroine_data(h))
-                    else:
-                        normalized_heroines.append(
-                            _normalize_heroine_data(heroine_data)
+            floors = self._persist_entrance_maps(player_ids, heroine_ids, raw_maps)
+        except Exception as e:
+            print(f"[ERROR] entrance 트랜잭션 실패: {e}")
+            raise
+
+        used_events_snapshot = list(used_events) if used_events else []
+        # 두 층을 동시에 생성하므로 코드 선택만 먼저 순서대로 (앞 층 코드는 다음 층에서 제외)
+        event_codes = self._pick_entrance_event_codes(
+            floors, normalized_heroines, used_events_snapshot
+        )
+        # 동기 입장은 전용 풀 (비동기 입장 작업이 공용 풀을 채워도 응답이 밀리지 않도록)
+        executor = (
+            ThreadPoolExecutor(
+                max_workers=max(1, len(floors)), thread_name_prefix="dungeon-event-sync"
+            )
+            if wait_for_events
+            else None
+        )
+        futures = [
+            _submit_floor_event_job(
+                floor_id,
+                self._run_floor_event_job,
+                floor_id,
+                floor_num,
+                normalized_raw_map,
+                player_ids,
+                normalized_heroines,
+                used_events_snapshot,
+                event_codes.get(floor_id),
+                executor=executor,
+            )
+            for floor_id, floor_num, normalized_raw_map in floors
+        ]
+
+        result = {
+            "first_player_id": player_ids[0] if player_ids else 0,
+            "floor_ids": [floor_id for floor_id, _, _ in floors],
+            "events": [],
+            "events_ready": False,
+        }
+        if not wait_for_events:
+            return result
+
+        try:
+            events_list = []
+            for fut in futures:
+                events_list.extend(fut.result())
+        finally:
+            executor.shutdown(wait=False)
+        result["events"] = events_list
+        result["events_ready"] = True
+        return _remove_message_recursive(result)
+
+    def _pick_entrance_event_codes(
+        self,
+        floors: List[tuple],
+        normalized_heroines: List[Dict[str, Any]],
+        used_events: List[Any],
+    ) -> Dict[int, List[str]]:
+        """입장 층들의 이벤트 방 코드를 한 번에 선택 (층끼리 중복 없음)
+
+        Returns:
+            {floor_id: 이벤트 방 순서대로 event_code 목록}
+        """
+        if not normalized_heroines:
+            return {}
+        stock = event_pool.host_stock(normalized_heroines)
+        excluded = list(used_events)
+        codes_by_floor = {}
+        for floor_id, _, normalized_raw_map in floors:
+            room_count = len(_event_rooms(normalized_raw_map))
+            if not room_count:
+                continue
+            codes = event_pool.pick_event_codes(room_count, excluded, stock)
+            codes_by_floor[floor_id] = codes
+            excluded.extend({"event_code": code} for code in codes)
+        return codes_by_floor
+
+    def _persist_entrance_maps(
+        self,
+        player_ids: List[str],
+        heroine_ids: List[int],
+        raw_maps: List[Dict[str, Any]],
+    ) -> List[tuple]:
+        """입장 1단계: 1, 2층 맵 저장 (짧은 트랜잭션)
+
+        Returns:
+            [(floor_id, floor_num, normalized_raw_map), ...]
+        """
+        floors = []
+        with self.repo.engine.begin() as conn:
+            # 동일 플레이어로 재입장 시 이전 미완료 던전이 DB에 남아있으면
+            # 충돌을 방지하기 위해 모두 완료 처리(is_finishing = TRUE) 합니다.
+            if player_ids:
+                for _pid in player_ids:
+                    try:
+                        conn.execute(
+                            text(
+                                """
+                                UPDATE dungeon
+                                SET is_finishing = TRUE
+                                WHERE is_finishing = FALSE
+                                AND id IN (
+                                    SELECT dungeon_id FROM dungeon_players
+                                    WHERE player_id = :pid AND is_finishing = FALSE
+                                )
+                                """
+                            ),
+                            {"pid": str(_pid)},
+                        )
+                    except Exception as e:
+                        # 실패 시 로그만 남기고 진행 (DB 상태에 따라 다르게 처리 가능)
+                        print(
+                            f"[WARN] failed to mark previous dungeons finished for pid={_pid}: {e}"
                         )
-                # 동일 플레이어로 재입장 시 이전 미완료 던전이 DB에 남아있으면
-                # 충돌을 방지하기 위해 모두 완료 처리(is_finishing = TRUE) 합니다.
+            for idx, raw_map in enumerate(raw_maps):
+                floor_num = idx + 1
+                if floor_num > 2:
+                    break  # 1,2층만 생성
+                normalized_raw_map = _normalize_room_keys(raw_map)
+                normalized_raw_map["floor"] = floor_num
+                # playerIds, heroineIds를 모든 층 raw_map에 주입
+                normalized_raw_map["player_ids"] = player_ids
+                normalized_raw_map["heroine_ids"] = heroine_ids
+
+                check_sql = text(
+                    """
+                    SELECT id, event FROM dungeon WHERE floor = :floor AND is_finishing = FALSE AND id IN (
+                        SELECT dungeon_id FROM dungeon_players
+                        WHERE player_id = :player_id AND floor = :floor AND is_finishing = FALSE
+                    )
+                """
+                )
+                # Try to find an existing dungeon row for any provided player id (normalize to str)
+                row = None
                 if player_ids:
-                    for _pid in player_ids:
+                    for pid in player_ids:
                         try:
-                            conn.execute(
-                                text(
-                                    """
-                                    UPDATE dungeon
-                                    SET is_finishing = TRUE
-                                    WHERE is_finishing = FALSE
-                                    AND (player1 = :pid OR player2 = :pid OR player3 = :pid OR player4 = :pid)
-                                    """
-                                ),
-                                {"pid": str(_pid)},
-                            )
-                        except Exception as e:
-                            # 실패 시 로그만 남기고 진행 (DB 상태에 따라 다르게 처리 가능)
-                            print(
-                                f"[WARN] failed to mark previous dungeons finished for pid={_pid}: {e}"
+                            pid_str = str(pid) if pid is not None else None
+                            res = conn.execute(
+                                check_sql,
+                                {"floor": floor_num, "player_id": pid_str},
                             )
-                for idx, raw_map in enumerate(raw_maps):
-                    floor_num = idx + 1
-                    if floor_num > 2:
-                        break  # 1,2층만 생성
-                    normalized_raw_map = _normalize_room_keys(raw_map)
-                    normalized_raw_map["floor"] = floor_num
-                    # playerIds, heroineIds를 모든 층 raw_map에 주입
-                    normalized_raw_map["player_ids"] = player_ids
-                    normalized_raw_map["heroine_ids"] = heroine_ids
-
-                    check_sql = text(
-                        """
-                        SELECT id, event FROM dungeon WHERE floor = :floor AND is_finishing = FALSE AND (
-                            player1 = :player_id OR player2 = :player_id OR player3 = :player_id OR player4 = :player_id
-                        )
-                    """
+                            row = res.fetchone()
+                            if row:
+                                break
+                        except Exception as _e:
+                            print(f"[WARN] entrance select failed for pid={pid}: {_e}")
+                if row:
+                    floor_id = row[0]
+                else:
+                    floor_id = self._insert_dungeon_in_transaction(
+                        conn, floor=floor_num, raw_map=normalized_raw_map
                     )
-                    # Try to find an existing dungeon row for any provided player id (normalize to str)
-                    row = None
-                    if player_ids:
-                        for pid in player_ids:
-                            try:
-                                pid_str = str(pid) if pid is not None else None
-                                res = conn.execute(
-                                    check_sql,
-                                    {"floor": floor_num, "player_id": pid_str},
-                                )
-                                row = res.fetchone()
-                                if row:
-                                    break
-                            except Exception as _e:
-                                print(
-                                    f"[WARN] entrance select failed for pid={pid}: {_e}"
-                                )
-                    if row:
-                        floor_id = row[0]
-                        existing_event = row[1]
-                    else:
-                        floor_id = self._insert_dungeon_in_transaction(
-                            conn, floor=floor_num, raw_map=normalized_raw_map
-                        )
-                        existing_event = None
-                    floor_ids.append(floor_id)
-
-                    # Always generate events for this floor (do not prefer existing DB event)
-                    events_for_this_floor = []
-                    # 이벤트 생성 (이벤트 방이 있는 경우에만)
-                    event_rooms = [
-                        room
-                        for room in normalized_raw_map.get("rooms", [])
-                        if room.get("room_type") == "event"
-                        or room.get("event_type", 0) != 0
-                    ]
-                    # 병렬 생성: 메인 이벤트들을 병렬로 요청한 뒤,
-                    # 필요 시 각 플레이어에 대해 개인화 이벤트를 병렬로 생성합니다.
-                    used_events_snapshot = list(used_events) if used_events else []
-                    max_workers_main = min(8, max(1, len(event_rooms)))
-                    with ThreadPoolExecutor(max_workers=max_workers_main) as ex:
-                        fut_to_room = {
-                            ex.submit(
+
+                # 이벤트는 2단계에서 다시 생성 -> 생성 전까지 event = NULL (pending)
+                conn.execute(
+                    text(
+                        """
+                        UPDATE dungeon
+                        SET event = NULL, event_status = 'pending', summary_info = :summary_info
+                        WHERE id = :id
+                        """
+                    ),
+                    {
+                        "summary_info": self._generate_raw_map_summary(
+                            normalized_raw_map
+                        ),
+                        "id": floor_id,
+                    },
+                )
+                floors.append((floor_id, floor_num, normalized_raw_map))
+        return floors
+
+    def _run_floor_event_job(
+        self,
+        floor_id: int,
+        floor_num: int,
+        normalized_raw_map: Dict[str, Any],
+        player_ids: List[str],
+        normalized_heroines: List[Dict[str, Any]],
+        used_events_snapshot: List[Any],
+        event_codes: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """입장 3단계: 한 층의 이벤트 생성 후 저장 (백그라운드 풀에서 실행)
+
+        생성이 실패하면 event_status = 'failed'와 빈 목록을 저장합니다.
+        (pending으로 남지 않고, 상태 조회에서는 ready와 구분됨)
+        """
+        start = time.perf_counter()
+        status = "ready"
+        try:
+            events_for_this_floor = self._generate_floor_events(
+                floor_num,
+                normalized_raw_map,
+                player_ids,
+                normalized_heroines,
+                used_events_snapshot,
+                event_codes,
+            )
+        except Exception as e:
+            print(f"[ERROR] {floor_num}층 이벤트 생성 실패 (floor_id={floor_id}): {e}")
+            events_for_this_floor = []
+            status = "failed"
+
+        with self.repo.engine.begin() as conn:
+            conn.execute(
+                text("UPDATE dungeon SET event = :event, event_status = :status WHERE id = :id"),
+                {"event": json.dumps(events_for_this_floor), "status": status, "id": floor_id},
+            )
+        print(
+            f"[TIMING] {floor_num}층 이벤트 생성 (floor_id={floor_id}, "
+            f"{len(events_for_this_floor)}개): {time.perf_counter() - start:.3f}s"
+        )
+        return events_for_this_floor
+
+    def _generate_floor_events(
+        self,
+        floor_num: int,
+        normalized_raw_map: Dict[str, Any],
+        player_ids: List[str],
+        normalized_heroines: List[Dict[str, Any]],
+        used_events_snapshot: List[Any],
+        event_codes: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """한 층의 이벤트 방마다 이벤트 생성 (room_id 순 정렬, applied_actions 제거)
+
+        event_codes: 방마다 미리 고른 이벤트 코드 (없으면 used_events_snapshot 기준으로 선택)
+        """
+        events_for_this_floor = []
+        # 이벤트 생성 (이벤트 방이 있는 경우에만)
+        event_rooms = _event_rooms(normalized_raw_map)
+        if not event_rooms:
+            return events_for_this_floor
+
+        if event_pool.enabled:
+            # 미리 생성한 이벤트 풀에서 배정 (재고가 없는 항목만 생성)
+            events_for_this_floor = event_pool.assign_floor_events(
+                floor_num,
+                event_rooms,
+                player_ids,
+                normalized_heroines,
+                used_events_snapshot,
+                event_codes,
+            )
+        else:
+            events_for_this_floor = self._generate_floor_events_with_graph(
+                floor_num,
+                event_rooms,
+                player_ids,
+                normalized_heroines,
+                used_events_snapshot,
+                event_codes,
+            )
+
+        # 정렬: room_id가 작은 순서대로 반환하도록 정렬
+        events_for_this_floor = sorted(
+            events_for_this_floor, key=lambda e: e.get("room_id", 0)
+        )
+        # 알파: 정렬된 이벤트에 대해 인메모리로 적용 결과를 단순화하여 첨부합니다 (DB에 저장하지 않음)
+        try:
+            self._attach_in_memory_applications(events_for_this_floor)
+        except Exception as _e:
+            print(f"[WARN] attach_in_memory_applications failed: {_e}")
+        # Strip transient applied_actions before persisting
+        try:
+            self._strip_applied_actions(events_for_this_floor)
+        except Exception:
+            pass
+        return events_for_this_floor
+
+    def _generate_floor_events_with_graph(
+        self,
+        floor_num: int,
+        event_rooms: List[Dict[str, Any]],
+        player_ids: List[str],
+        normalized_heroines: List[Dict[str, Any]],
+        used_events_snapshot: List[Any],
+        event_codes: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """이벤트 풀을 쓰지 않을 때: 방마다 이벤트 그래프 실행 (EVENT_POOL_ENABLED=false)
+
+        event_codes가 있으면 방마다 그 코드로 메인 이벤트를 고정합니다.
+        """
+        if event_codes is None or len(event_codes) != len(event_rooms):
+            event_codes = [None] * len(event_rooms)
+        events_for_this_floor = []
+        # 병렬 생성: 메인 이벤트들을 병렬로 요청한 뒤,
+        # 필요 시 각 플레이어에 대해 개인화 이벤트를 병렬로 생성합니다.
+        max_workers_main = min(8, max(1, len(event_rooms)))
+        with ThreadPoolExecutor(max_workers=max_workers_main) as ex:
+            fut_to_room = {
+                ex.submit(
+                    self._create_event_for_floor,
+                    heroine_data=normalized_heroines[0],
+                    player_id=player_ids[0] if player_ids else None,
+                    next_floor=floor_num,
+                    used_events=used_events_snapshot,
+                    room_id=room.get("room_id"),
+                    event_code=code,
+                ): (room, code)
+                for room, code in zip(event_rooms, event_codes)
+            }
+
+            for fut in as_completed(fut_to_room):
+                room, code = fut_to_room[fut]
+                try:
+                    main_event_data = fut.result()
+                except Exception as e:
+                    print(f"[WARN] main event future failed: {e}")
+                    continue
+                if not main_event_data:
+                    continue
+                main_event_data["floor"] = floor_num
+
+                # 개인화 이벤트가 필요하면 각 플레이어에 대해 병렬 생성
+                if main_event_data.get("is_personal", False) and player_ids:
+                    heroine_narratives = []
+                    workers = min(4, max(1, len(player_ids)))
+                    with ThreadPoolExecutor(max_workers=workers) as ex2:
+                        fut2_to_info = {
+                            ex2.submit(
                                 self._create_event_for_floor,
-                                heroine_data=normalized_heroines[0],
-                                player_id=player_ids[0] if player_ids else None,
+                                heroine_data=h,
+                                player_id=pid,
                                 next_floor=floor_num,
                                 used_events=used_events_snapshot,
                                 room_id=room.get("room_id"),
-                            ): room
-                            for room in event_rooms
+                                event_code=code,
+                            ): (pid, h)
+                            for pid, h in zip(player_ids, normalized_heroines)
                         }
-
-                        for fut in as_completed(fut_to_room):
-                            room = fut_to_room[fut]
+                        for f2 in as_completed(fut2_to_info):
+                            pid, h = fut2_to_info[f2]
                             try:
-                                main_event_data = fut.result()
+                                indiv_event = f2.result()
                             except Exception as e:
-                                print(f"[WARN] main event future failed: {e}")
-                                continue
-                            if not main_event_data:
-                                continue
-                            main_event_data["floor"] = floor_num
-
-                            # 개인화 이벤트가 필요하면 각 플레이어에 대해 병렬 생성
-                            if main_event_data.get("is_personal", False) and player_ids:
-                                heroine_narratives = []
-                                workers = min(4, max(1, len(player_ids)))
-                                with ThreadPoolExecutor(max_workers=workers) as ex2:
-                                    fut2_to_info = {
-                                        ex2.submit(
-                                            self._create_event_for_floor,
-                                            heroine_data=h,
-                                            player_id=pid,
-                                            next_floor=floor_num,
-                                            used_events=used_events_snapshot,
-                                            room_id=room.get("room_id"),
-                                        ): (pid, h)
-                                        for pid, h in zip(
-                                            player_ids, normalized_heroines
-                                        )
+                                print(f"[WARN] individual event future failed: {e}")
+                                indiv_event = None
+                            if indiv_event:
+                                heroine_narratives.append(
+                                    {
+                                        "playerId": pid,
+                                        "heroineId": h.get("heroine_id"),
+                                        "memoryProgress": h.get("memory_progress"),
+                                        "narrative": indiv_event.get(
+                                            "scenario_narrative", ""
+                                        ),
                                     }
-                                    for f2 in as_completed(fut2_to_info):
-                                        pid, h = fut2_to_info[f2]
-                                        try:
-                                            indiv_event = f2.result()
-                                        except Exception as e:
-                                            print(
-                                                f"[WARN] individual event future failed: {e}"
-                                            )
-                                            indiv_event = None
-                                        if indiv_event:
-                                            heroine_narratives.append(
-                                                {
-                                                    "playerId": pid,
-                                                    "heroineId": h.get("heroine_id"),
-                                                    "memoryProgress": h.get(
-                                                        "memory_progress"
-                                                    ),
-                                                    "narrative": indiv_event.get(
-                                                        "scenario_narrative", ""
-                                                    ),
-                                                }
-                                            )
-                                main_event_data["heroineNarratives"] = (
-                                    heroine_narratives
                                 )
+                    main_event_data["heroineNarratives"] = heroine_narratives
 
-                            events_for_this_floor.append(main_event_data)
-                            used_events.append(main_event_data)
+                events_for_this_floor.append(main_event_data)
+        return events_for_this_floor
 
-                    # 정렬: room_id가 작은 순서대로 반환하도록 정렬
-                    events_for_this_floor = sorted(
-                        events_for_this_floor, key=lambda e: e.get("room_id", 0)
-                    )
-                    # 알파: 정렬된 이벤트에 대해 인메모리로 적용 결과를 단순화하여 첨부합니다 (DB에 저장하지 않음)
-                    try:
-                        self._attach_in_memory_applications(events_for_this_floor)
-                    except Exception as _e:
-                        print(f"[WARN] attach_in_memory_applications failed: {_e}")
-                    summary_info_value = self._generate_raw_map_summary(
-                        normalized_raw_map
-                    )
-                    # Always overwrite the stored event with the newly generated events_for_this_floor
-                    # Strip transient applied_actions before persisting
-                    try:
-                        self._strip_applied_actions(events_for_this_floor)
-                    except Exception:
-                        pass
-                    conn.execute(
-                        text(
-                            "UPDATE dungeon SET event = :event, summary_info = :summary_info WHERE id = :id"
-                        ),
-                        {
-                            "event": json.dumps(events_for_this_floor),
-                            "summary_info": summary_info_value,
-                            "id": floor_id,
-                        },
+    def get_entrance_events(self, first_player_id: str, floor: int = 1) -> Dict[str, Any]:
+        """
+        입장 후 이벤트 생성 상태 조회 (비동기 입장용)
+
+        Returns:
+            {"status": "pending" | "ready" | "failed" | "not_found",
+             "floor_id": int | None, "events": list}
+        """
+        with self.repo.engine.connect() as conn:
+            row = conn.execute(
+                text(
+                    """
+                    SELECT id, event, event_status FROM dungeon WHERE floor = :floor AND is_finishing = FALSE AND id IN (
+                        SELECT dungeon_id FROM dungeon_players
+                        WHERE player_id = :player_id AND floor = :floor AND is_finishing = FALSE
                     )
-                    events_list.extend(events_for_this_floor)
-        except Exception as e:
-            print(f"[ERROR] entrance 트랜잭션 실패: {e}")
-            raise
-        result = {
-            "first_player_id": player_ids[0] if player_ids else 0,
-            "floor_ids": floor_ids,
-            "events": events_list,
-        }
-        return _remove_message_recursive(result)
-        result = {
-            "first_player_id": player_ids[0] if player_ids else 0,
-            "floor_ids": floor_ids,
-            "events": events_list,
+                    ORDER BY id DESC
+                    LIMIT 1
+                    """
+                ),
+                {"floor": floor, "player_id": str(first_player_id)},
+            ).fetchone()
+
+        if not row:
+            return {"status": "not_found", "floor_id": None, "events": []}
+
+        floor_id, event_value, event_status = row[0], row[1], row[2]
+        if event_status == "failed":
+            return {"status": "failed", "floor_id": floor_id, "events": []}
+        if event_value is None:
+            # 결과 저장 자체가 실패한 경우 (이 프로세스에서 실행한 작업만 알 수 있음)
+            job = _event_jobs.get(floor_id)
+            if job is not None and job.done() and job.exception() is not None:
+                return {"status": "failed", "floor_id": floor_id, "events": []}
+            return {"status": "pending", "floor_id": floor_id, "events": []}
+
+        events = json.loads(event_value) if isinstance(event_value, str) else event_value
+        if isinstance(events, dict):
+            events = [events]
+        return {
+            "status": "ready",
+            "floor_id": floor_id,
+            "events": _remove_message_recursive(events or []),
         }
-        return _remove_message_recursive(result)
 
     def next_floor_entrance(
         self,
@@ -396,8 +656,9 @@ class DungeonService:
 
                 check_sql = text(
                     """
-                    SELECT id, event FROM dungeon WHERE floor = :floor AND is_finishing = FALSE AND (
-                        player1 = :player_id OR player2 = :player_id OR player3 = :player_id OR player4 = :player_id
+                    SELECT id, event FROM dungeon WHERE floor = :floor AND is_finishing = FALSE AND id IN (
+                        SELECT dungeon_id FROM dungeon_players
+                        WHERE player_id = :player_id AND floor = :floor AND is_finishing = FALSE
                     )
                     """
                 )
@@ -453,15 +714,6 @@ class DungeonService:
                     print(f"[DEBUG] next_floor_entrance: inserted floor_id={floor_id}")
                     existing_event = None
 
-                # 이벤트 생성 (이벤트 방이 있는 경우에만)
-                event_rooms = [
-                    room
-                    for room in normalized_raw_map.get("rooms", [])
-                    if room.get("room_type") == "event"
-                    or room.get("event_type", 0) != 0
-                ]
-                print(f"[DEBUG] next_floor_entrance: event_rooms={event_rooms}")
-                events_for_this_floor = []
                 # 멀티 히로인/플레이어 지원: 각 이벤트룸마다 매칭되는 히로인/플레이어 데이터 사용
                 normalized_heroines = []
                 if heroine_data:
@@ -487,99 +739,22 @@ class DungeonService:
                     raise ValueError(
                         "heroineData가 비어 있거나 유효하지 않습니다. (nextfloor)"
                     )
-                # 병렬 생성: 메인 이벤트들을 병렬로 요청한 뒤,
-                # 필요 시 각 플레이어에 대해 개인화 이벤트를 병렬로 생성합니다.
                 used_events_snapshot = list(used_events) if used_events else []
-                max_workers_main = min(8, max(1, len(event_rooms)))
-                with ThreadPoolExecutor(max_workers=max_workers_main) as ex:
-                    fut_to_room = {
-                        ex.submit(
-                            self._create_event_for_floor,
-                            heroine_data=normalized_heroines[0],
-                            player_id=player_ids[0] if player_ids else None,
-                            next_floor=floor_num,
-                            used_events=used_events_snapshot,
-                            room_id=room.get("room_id"),
-                        ): room
-                        for room in event_rooms
-                    }
-
-                    for fut in as_completed(fut_to_room):
-                        room = fut_to_room[fut]
-                        try:
-                            main_event_data = fut.result()
-                        except Exception as e:
-                            print(f"[WARN] next_floor main event future failed: {e}")
-                            continue
-                        if not main_event_data:
-                            continue
-                        main_event_data["floor"] = floor_num
-
-                        # 개인화 이벤트가 필요하면 각 플레이어에 대해 병렬 생성
-                        if main_event_data.get("is_personal", False) and player_ids:
-                            heroine_narratives = []
-                            workers = min(4, max(1, len(player_ids)))
-                            with ThreadPoolExecutor(max_workers=workers) as ex2:
-                                fut2_to_info = {
-                                    ex2.submit(
-                                        self._create_event_for_floor,
-                                        heroine_data=h,
-                                        player_id=pid,
-                                        next_floor=floor_num,
-                                        used_events=used_events_snapshot,
-                                        room_id=room.get("room_id"),
-                                    ): (pid, h)
-                                    for pid, h in zip(player_ids, normalized_heroines)
-                                }
-                                for f2 in as_completed(fut2_to_info):
-                                    pid, h = fut2_to_info[f2]
-                                    try:
-                                        indiv_event = f2.result()
-                                    except Exception as e:
-                                        print(
-                                            f"[WARN] next_floor individual event future failed: {e}"
-                                        )
-                                        indiv_event = None
-                                    if indiv_event:
-                                        heroine_narratives.append(
-                                            {
-                                                "playerId": pid,
-                                                "heroineId": h.get("heroine_id"),
-                                                "memoryProgress": h.get(
-                                                    "memory_progress"
-                                                ),
-                                                "narrative": indiv_event.get(
-                                                    "scenario_narrative", ""
-                                                ),
-                                            }
-                                        )
-                            main_event_data["heroineNarratives"] = heroine_narratives
-
-                        events_for_this_floor.append(main_event_data)
-                        used_events.append(main_event_data)
-
-                # 정렬: room_id가 작은 순서대로 반환하도록 정렬
-                events_for_this_floor = sorted(
-                    events_for_this_floor, key=lambda e: e.get("room_id", 0)
+                events_for_this_floor = self._generate_floor_events(
+                    floor_num,
+                    normalized_raw_map,
+                    player_ids,
+                    normalized_heroines,
+                    used_events_snapshot,
                 )
-                # 알파: 정렬된 이벤트에 대해 인메모리로 적용 결과를 단순화하여 첨부합니다 (DB에 저장하지 않음)
-                try:
-                    self._attach_in_memory_applications(events_for_this_floor)
-                except Exception as _e:
-                    print(f"[WARN] attach_in_memory_applications failed: {_e}")
+                used_events.extend(events_for_this_floor)
                 summary_info_value = self._generate_raw_map_summary(normalized_raw_map)
 
-                # Strip transient applied_actions before persisting
-                try:
-                    self._strip_applied_actions(events_for_this_floor)
-                except Exception:
-                    pass
-
                 # Always update the dungeon.row with generated events and summary_info
                 if row:
                     conn.execute(
                         text(
-                            "UPDATE dungeon SET event = :event, summary_info = :summary_info WHERE id = :id"
+                            "UPDATE dungeon SET event = :event, event_status = 'ready', summary_info = :summary_info WHERE id = :id"
                         ),
                         {
                             "event": json.dumps(
@@ -711,8 +886,9 @@ class DungeonService:
                 # 해당 플레이어의 진행 중인 던전 중 floor에 해당하는 row 찾기
                 sql = text(
                     """
-                    SELECT id FROM dungeon WHERE floor = :floor AND is_finishing = FALSE AND (
-                        player1 = :player_id OR player2 = :player_id OR player3 = :player_id OR player4 = :player_id
+                    SELECT id FROM dungeon WHERE floor = :floor AND is_finishing = FALSE AND id IN (
+                        SELECT dungeon_id FROM dungeon_players
+                        WHERE player_id = :player_id AND floor = :floor AND is_finishing = FALSE
                     )
                     """
                 )
@@ -1082,8 +1258,9 @@ class DungeonService:
                         SELECT id FROM dungeon
                         WHERE floor = :next_floor
                         AND is_finishing = FALSE
-                        AND (
-                            player1 = :pid OR player2 = :pid OR player3 = :pid OR player4 = :pid
+                        AND id IN (
+                            SELECT dungeon_id FROM dungeon_players
+                            WHERE player_id = :pid AND floor = :next_floor AND is_finishing = FALSE
                         )
                         LIMIT 1
                     """
@@ -1344,8 +1521,12 @@ class DungeonService:
                 next_dungeon_query = """
                     SELECT id FROM dungeon 
                     WHERE floor = :next_floor 
-                    AND player1 = :player1
                     AND is_finishing = FALSE
+                    AND id IN (
+                        SELECT dungeon_id FROM dungeon_players
+                        WHERE player_id = :player1 AND slot = 1
+                        AND floor = :next_floor AND is_finishing = FALSE
+                    )
                     LIMIT 1
                 """
                 next_result = conn.execute(
@@ -1361,12 +1542,23 @@ class DungeonService:
 
                 next_floor_id = next_result[0]
 
-                # 3. 다음 층 이벤트 생성 및 저장
-                events = self._create_event_for_floor(
-                    heroine_data=heroine_data,
-                    next_floor=next_floor,
-                    used_events=used_events or [],
-                )
+                # 3. 다음 층 이벤트 생성 및 저장 (이벤트 풀 우선)
+                events = None
+                if event_pool.enabled:
+                    assigned = event_pool.assign_floor_events(
+                        next_floor,
+                        [{"room_id": 0}],
+                        [first_player_id],
+                        [_normalize_heroine_data(heroine_data)],
+                        used_events or [],
+                    )
+                    events = assigned[0] if assigned else None
+                if not events:
+                    events = self._create_event_for_floor(
+                        heroine_data=heroine_data,
+                        next_floor=next_floor,
+                        used_events=used_events or [],
+                    )
 
                 if events:
                     try:
@@ -1374,7 +1566,7 @@ class DungeonService:
                     except Exception:
                         pass
                     conn.execute(
-                        text("UPDATE dungeon SET event = :event WHERE id = :id"),
+                        text("UPDATE dungeon SET event = :event, event_status = 'ready' WHERE id = :id"),
                         {"event": json.dumps(events), "id": next_floor_id},
                     )
 
@@ -1562,13 +1754,10 @@ class DungeonService:
                     "error": f"Room {room_id}에 해당하는 이벤트를 찾을 수 없습니다 (Loaded: {loaded_room_ids})",
                 }
 
-            # 4. 선택지에 따른 결과 도출 (LLM 사용)
-            from langchain.chat_models import init_chat_model
-            from enums.LLM import LLM
-            from langchain_core.messages import HumanMessage, SystemMessage
-
-            llm = init_chat_model(model=LLM.GPT5_MINI, temperature=0.7)
-
+            # 4. 선택지에 따른 결과 도출
+            # 선택지 매칭은 로컬(문자열/임베딩), 임베딩으로 애매한 입력만 기존 LLM 분류.
+            # 결과 서술은 이벤트 생성 때 만든 outcome 사용, LLM은 돌발 행동(또는 outcome이 없는 이전 이벤트)일 때만 호출
+            select_start = time.perf_counter()
             scenario_narrative = target_event.get("scenario_narrative", "")
             choices = target_event.get("choices", [])
             # If choices missing but expected_outcome present, try to parse it into choices
@@ -1602,155 +1791,42 @@ class DungeonService:
             is_unexpected = False
             reward_id: Optional[str] = None
             penalty_id: Optional[str] = None
+            outcome = ""
 
-            # 선택지가 있는 경우 분류 로직 수행
-            if choices:
-                options_text = ""
-                actions = []
-                for idx, c in enumerate(choices):
-                    act = c.get("action", "")
-                    actions.append(act)
-                    options_text += f"{idx}. {act}\n"
-
-                import difflib, re
-
-                def _norm(s: str) -> str:
-                    return re.sub(r"\s+", " ", (s or "").strip().lower())
-
-                choice_norm = _norm(choice)
-                best_idx = None
-                best_ratio = 0.0
-                for i, act in enumerate(actions):
-                    r = difflib.SequenceMatcher(None, choice_norm, _norm(act)).ratio()
-                    if r > best_ratio:
-                        best_ratio = r
-                        best_idx = i
-
-                # Hostile / clearly out-of-scope keywords (Korean only)
-                hostile_kw = [
-                    "공격",
-                    "죽",
-                    "찔",
-                    "불태",
-                    "파괴",
-                    "살해",
-                    "도둑",
-                    "훔치",
-                    "팬다",
-                    "좆",
-                    "썅",
-                ]
-
-                contains_hostile = any(kw in choice_norm for kw in hostile_kw)
-
-                if best_ratio >= 0.60 and best_idx is not None:
-                    idx = best_idx
-                    selected = choices[idx]
-                    print(
-                        f"[DEBUG] FUZZY_SELECTED idx={idx} ratio={best_ratio}: {selected}"
-                    )
-                    matched_action = selected.get("action")
-                    r = (
-                        selected.get("reward_id")
-                        or selected.get("rewardId")
-                        or selected.get("reward")
-                    )
-                    reward_id = r
-                    p = (
-                        selected.get("penalty_id")
-                        or selected.get("penaltyId")
-                        or selected.get("penalty")
-                    )
-                    penalty_id = p
-                elif best_ratio < 0.35 and contains_hostile:
-                    # clearly out-of-scope / hostile: unexpected
-                    is_unexpected = True
-                else:
-                    # use LLM fallback for ambiguous cases
-                    classification_prompt = f"""
-                    [상황]
-                    {scenario_narrative}
-
-                    [가능한 선택지]
-                    {options_text}
-
-                    [플레이어 입력]
-                    {choice}
-
-                    플레이어의 입력이 위 [가능한 선택지] 중 어느 것과 가장 유사한지 판단해.
-                    1. 선택지와 의미가 유사하면 해당 번호(0, 1, 2...)를 반환해.
-                    2. 만약 선택지에 없는 돌발 행동이거나, 적대적인 행동, 혹은 전혀 다른 행동이라면 "UNEXPECTED"라고 반환해.
-
-                    오직 숫자 혹은 "UNEXPECTED" 만 출력해.
-                    """
-                    try:
-                        class_response = llm.invoke(
-                            [HumanMessage(content=classification_prompt)]
-                        )
-                        class_result = class_response.content.strip()
-                        print(f"[DEBUG] Event Classification Result: {class_result}")
-
-                        if class_result.isdigit():
-                            idx = int(class_result)
-                            if 0 <= idx < len(choices):
-                                selected = choices[idx]
-                                print(
-                                    f"[DEBUG] SELECTED_CHOICE (idx={idx}): {selected}"
-                                )
-                                matched_action = selected.get("action")
-                                r = (
-                                    selected.get("reward_id")
-                                    or selected.get("rewardId")
-                                    or selected.get("reward")
-                                )
-                                print(f"[DEBUG] EXTRACTED_REWARD_RAW: {r}")
-                                reward_id = r
-                                p = (
-                                    selected.get("penalty_id")
-                                    or selected.get("penaltyId")
-                                    or selected.get("penalty")
-                                )
-                                print(f"[DEBUG] EXTRACTED_PENALTY_RAW: {p}")
-                                penalty_id = p
-                            else:
-                                is_unexpected = True
-                        else:
-                            is_unexpected = True
-                    except Exception as e:
-                        print(f"[ERROR] 분류 중 오류 발생: {e}")
-                        is_unexpected = True
-
-            # 결과 서술 생성
-            if is_unexpected:
-                # 돌발 행동에 대한 패널티 및 서술
-                penalty_id = "penalty_unexpected_action"  # 기본 패널티 ID 부여
-                prompt = f"""
-                [상황]
-                {scenario_narrative}
-
-                [플레이어 돌발 행동]
-                {choice}
-
-                플레이어가 예상치 못한 행동을 했습니다. 
-                이 행동은 상황에 맞지 않거나 위험한 행동일 수 있습니다.
-                이에 대한 부정적인 결과나 당황스러운 상황을 2~3문장으로 묘사해줘.
-                플레이어에게 직접 이야기하듯이 서술해.
-                """
+            actions = [c.get("action", "") for c in choices]
+            match = choice_matcher.match_or_classify(choice, actions, scenario_narrative)
+            if match["index"] is not None:
+                selected = choices[match["index"]]
+                print(
+                    f"[DEBUG] SELECTED_CHOICE idx={match['index']} method={match['method']} score={match['score']:.3f}: {selected}"
+                )
+                matched_action = selected.get("action")
+                reward_id = (
+                    selected.get("reward_id")
+                    or selected.get("rewardId")
+                    or selected.get("reward")
+                )
+                penalty_id = (
+                    selected.get("penalty_id")
+                    or selected.get("penaltyId")
+                    or selected.get("penalty")
+                )
+                outcome = find_choice_outcome(selected)
             else:
-                # 매칭된 행동에 대한 서술
-                prompt = f"""
-                [상황]
-                {scenario_narrative}
-
-                [플레이어 선택]
-                {choice} (의도: {matched_action})
-
-                위 상황에서 플레이어가 선택한 행동에 대한 결과를 2~3문장으로 묘사해줘. 
-                플레이어에게 직접 이야기하듯이 서술해. (예: "당신은 ~했습니다. 그 결과...")
-                """
-
-            response = llm.invoke([HumanMessage(content=prompt)])
-            outcome = response.content
+                is_unexpected = True
+                # 돌발 행동에 대한 패널티 (기본 패널티 ID 부여)
+                penalty_id = "penalty_unexpected_action"
+
+            outcome_source = "precomputed"
+            if not outcome:
+                outcome_source = "llm"
+                outcome = self._narrate_event_outcome(
+                    scenario_narrative, choice, matched_action, is_unexpected
+                )
+            print(
+                f"[TIMING] select_event room={room_id} match={match['method']} "
+                f"outcome={outcome_source}: {time.perf_counter() - select_start:.3f}s"
+            )
 
             # If reward/penalty ids are missing, attempt to extract tokens from the matched action text
             if (reward_id is None or penalty_id is None) and matched_action:
@@ -1859,6 +1935,50 @@ class DungeonService:
                 "error": str(e),
             }
 
+    def _narrate_event_outcome(
+        self,
+        scenario_narrative: str,
+        choice: str,
+        matched_action: str,
+        is_unexpected: bool,
+    ) -> str:
+        """선택 결과 서술 LLM 호출 (돌발 행동 / outcome이 없는 이벤트)"""
+        from langchain.chat_models import init_chat_model
+        from enums.LLM import LLM
+        from langchain_core.messages import HumanMessage
+
+        llm = init_chat_model(model=LLM.GPT5_MINI, temperature=0.7)
+
+        if is_unexpected:
+            # 돌발 행동에 대한 서술
+            prompt = f"""
+                [상황]
+                {scenario_narrative}
+
+                [플레이어 돌발 행동]
+                {choice}
+
+                플레이어가 예상치 못한 행동을 했습니다. 
+                이 행동은 상황에 맞지 않거나 위험한 행동일 수 있습니다.
+                이에 대한 부정적인 결과나 당황스러운 상황을 2~3문장으로 묘사해줘.
+                플레이어에게 직접 이야기하듯이 서술해.
+                """
+        else:
+            # 매칭된 행동에 대한 서술
+            prompt = f"""
+                [상황]
+                {scenario_narrative}
+
+                [플레이어 선택]
+                {choice} (의도: {matched_action})
+
+                위 상황에서 플레이어가 선택한 행동에 대한 결과를 2~3문장으로 묘사해줘. 
+                플레이어에게 직접 이야기하듯이 서술해. (예: "당신은 ~했습니다. 그 결과...")
+                """
+
+        response = llm.invoke([HumanMessage(content=prompt)])
+        return response.content
+
     # ============================================================
     # 7. 이벤트 생성 및 저장 헬퍼 메서드
     # ============================================================
@@ -1869,16 +1989,30 @@ class DungeonService:
         next_floor: int = 1,
         used_events: List[Any] = None,
         room_id: int = 0,
+        event_code: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         특정 층에 대한 이벤트 생성
+
+        event_code가 있으면 그 메인 이벤트로 고정 (랜덤 선택 노드만 건너뛰고 같은 노드 실행)
         """
 
         try:
+            if event_code:
+                from agents.dungeon.event.dungeon_event_agent import generate_event_variant
+
+                return generate_event_variant(
+                    event_code,
+                    heroine_data,
+                    room_id=room_id,
+                    next_floor=next_floor,
+                    player_id=player_id,
+                )
+
             print(
                 f"[DEBUG] _create_event_for_floor: player_id={player_id}, heroine_data={heroine_data}"
             )
-            from agents.dungeon.event.dungeon_event_agent import graph_builder
+            from agents.dungeon.event.dungeon_event_agent import build_event_json
             from agents.dungeon.dungeon_state import DungeonEventState
 
             # 이벤트 에이전트 실행
@@ -1895,50 +2029,14 @@ class DungeonService:
                 "final_answer": "",
             }
             print(f"[DEBUG] event_state: {event_state}")
-            event_graph = graph_builder.compile()
+            event_graph = graph_registry.get("dungeon_event")
             event_result = event_graph.invoke(event_state)
             print(f"[DEBUG] _create_event_for_floor - event_result: {event_result}")
 
             # 전체 이벤트 JSON 구성
-            main_event = event_result.get("selected_main_event", {})
-            sub_event = event_result.get("sub_event", {})
-
-            # sub_event가 dict가 아닐 수 있음 (문자열일 경우 처리)
-            scenario_narrative = ""
-            choices = []
-            expected_outcome = ""
-
-            if isinstance(sub_event, dict):
-                scenario_narrative = sub_event.get("narrative", "")
-                choices = sub_event.get("choices", [])
-                expected_outcome = sub_event.get("expected_outcome", "")
-
-            if not isinstance(sub_event, dict) or not choices:
-                print(
-                    f"[WARN] _create_event_for_floor - missing sub_event or empty choices for room {room_id}, main_event={main_event}"
-                )
-                scenario_narrative = scenario_narrative or main_event.get(
-                    "scenario_text", ""
-                )
-
-                choices = [
-                    {"action": "조용히 관찰한다", "reward": None, "penalty": None},
-                    {"action": "상호작용을 시도한다", "reward": None, "penalty": None},
-                ]
-
-            event_json = {
-                "room_id": room_id,
-                "event_type": main_event.get("event_id", 0),
-                "event_title": main_event.get("title", ""),
-                "event_code": main_event.get("event_code", ""),
-                "scenario_text": main_event.get("scenario_text", ""),
-                "scenario_narrative": scenario_narrative,
-                "choices": choices,
-                "expected_outcome": expected_outcome,
-                "player_id": player_id,
-                "is_personal": main_event.get("is_personal", False),
-                "floor": next_floor,
-            }
+            event_json = build_event_json(
+                event_result, room_id=room_id, player_id=player_id, next_floor=next_floor
+            )
 
             return event_json
 
@@ -1972,7 +2070,7 @@ class DungeonService:
 
             with self.repo.engine.begin() as conn:
                 conn.execute(
-                    text("UPDATE dungeon SET event = :event WHERE id = :id"),
+                    text("UPDATE dungeon SET event = :event, event_status = 'ready' WHERE id = :id"),
                     {"event": event_json_str, "id": dungeon_id},
                 )
 
@@ -1,10 +1,6 @@
 from typing import List, Optional
 
-from agents.fairy.guild.fairy_guild_agent import graph_builder as guild_builder
-from agents.fairy.dungeon.fairy_dungeon_agent import graph_builder as dungeon_builder
-from agents.fairy.interaction.fairy_interaction_agent import (
-    graph_builder as interaction_builder,
-)
+from core.graph_registry import graph_registry
 from langgraph.checkpoint.memory import MemorySaver
 from agents.fairy.util import add_human_message
 from agents.fairy.fairy_state import DungeonPlayerState
@@ -13,8 +9,6 @@ from core.game_dto.WeaponData import WeaponData
 from core.game_dto.StatData import StatData
 from agents.fairy.memory_messages import get_fairy_messages_dungeon
 
-dungeon_graph = dungeon_builder.compile()
-guild_graph = guild_builder.compile()
 
 async def fairy_dungeon_talk(
     dungeon_player: DungeonPlayerState,
@@ -31,6 +25,7 @@ async def fairy_dungeon_talk(
     memories = get_fairy_messages_dungeon(
         player_id=playerId, heroine_id=dungeon_player.heroineId, limit=4
     )
+    dungeon_graph = graph_registry.get("fairy_dungeon")
     response = await dungeon_graph.ainvoke(
         {
             "messages": memories + [add_human_message(content=question)],
@@ -79,6 +74,7 @@ def fairy_guild_talk(
         }
     }
 
+    guild_graph = graph_registry.get("fairy_guild")
     response = guild_graph.ainvoke(
         {"messages": [add_human_message(question)]},
         config=config,
@@ -91,9 +87,6 @@ def fairy_guild_talk(
     return result
 
 
-interaction_graph = interaction_builder.compile()
-
-
 def fairy_interaction(
     player_id:str,
     heroine_id:int,
@@ -106,6 +99,7 @@ def fairy_interaction(
             player_id=player_id, heroine_id=heroine_id, limit=4
     )
     myInventory = inventory
+    interaction_graph = graph_registry.get("fairy_interaction")
     response = interaction_graph.invoke(
         {   
 
@@ -1,8 +1,10 @@
 from typing import List, Optional
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from langchain_openai import OpenAIEmbeddings
 
-from db.config import CONNECTION_URL
+from db.async_engine import get_async_engine
+from db.embedding_cache import CachedQueryEmbeddings
+from db.vector_codec import to_vector_param
 
 
 # 동의어 사전 (쿼리 확장용)
@@ -30,8 +32,12 @@ class HeroineScenarioService:
     """히로인 시나리오 검색 서비스"""
 
     def __init__(self):
-        self.engine = create_engine(CONNECTION_URL, pool_pre_ping=True)
-        self.embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
+        # 공용 비동기 풀 (채팅 그래프의 async 노드에서만 호출됨)
+        self.async_engine = get_async_engine()
+        # 쿼리 임베딩은 프로세스 공용 캐시를 거침 (db/embedding_cache.py)
+        self.embeddings = CachedQueryEmbeddings(
+            OpenAIEmbeddings(model="text-embedding-3-small")
+        )
 
     def _expand_query(self, query: str) -> str:
         """쿼리 확장 - 동의어 추가
@@ -55,7 +61,7 @@ class HeroineScenarioService:
         print(f"[DEBUG] 쿼리 확장: {query} -> {expanded_query}")
         return expanded_query
 
-    def search_scenarios(
+    async def search_scenarios(
         self, query: str, heroine_id: int, max_memory_progress: int, limit: int = 3
     ) -> List[dict]:
         """해금된 시나리오 검색
@@ -73,7 +79,7 @@ class HeroineScenarioService:
         expanded_query = self._expand_query(query)
 
         # 확장된 쿼리 임베딩
-        query_embedding = self.embeddings.embed_query(expanded_query)
+        query_embedding = await self.embeddings.aembed_query(expanded_query)
 
         # 벡터 검색 SQL
         sql = text(
@@ -88,11 +94,11 @@ class HeroineScenarioService:
         """
         )
 
-        with self.engine.connect() as conn:
-            result = conn.execute(
+        async with self.async_engine.connect() as conn:
+            result = await conn.execute(
                 sql,
                 {
-                    "embedding": str(query_embedding),
+                    "embedding": to_vector_param(query_embedding),
                     "heroine_id": heroine_id,
                     "max_progress": max_memory_progress,
                     "limit": limit,
@@ -112,7 +118,7 @@ class HeroineScenarioService:
 
             return scenarios
 
-    def search_scenarios_hybrid(
+    async def search_scenarios_hybrid(
         self, query: str, heroine_id: int, max_memory_progress: int, limit: int = 3
     ) -> List[dict]:
         """BM25 + Vector 하이브리드 검색
@@ -132,7 +138,7 @@ class HeroineScenarioService:
         expanded_query = self._expand_query(query)
 
         # 확장된 쿼리 임베딩
-        query_embedding = self.embeddings.embed_query(expanded_query)
+        query_embedding = await self.embeddings.aembed_query(expanded_query)
 
         # 하이브리드 검색 SQL (BM25 + Vector)
         sql = text(
@@ -171,12 +177,12 @@ class HeroineScenarioService:
         """
         )
 
-        with self.engine.connect() as conn:
-            result = conn.execute(
+        async with self.async_engine.connect() as conn:
+            result = await conn.execute(
                 sql,
                 {
                     "query": expanded_query,
-                    "embedding": str(query_embedding),
+                    "embedding": to_vector_param(query_embedding),
                     "heroine_id": heroine_id,
                     "max_progress": max_memory_progress,
                     "bm25_weight": BM25_WEIGHT,
@@ -201,7 +207,7 @@ class HeroineScenarioService:
 
             return scenarios
 
-    def search_scenarios_with_keywords(
+    async def search_scenarios_with_keywords(
         self, query: str, heroine_id: int, max_memory_progress: int, limit: int = 3
     ) -> List[dict]:
         """키워드 메타데이터 기반 검색 (BM25 인덱스 없을 때 대안)
@@ -219,7 +225,7 @@ class HeroineScenarioService:
         """
         # 쿼리 확장
         expanded_query = self._expand_query(query)
-        query_embedding = self.embeddings.embed_query(expanded_query)
+        query_embedding = await self.embeddings.aembed_query(expanded_query)
 
         # 쿼리에서 키워드 추출 (공백으로 분리)
         keywords = expanded_query.split()
@@ -257,12 +263,12 @@ class HeroineScenarioService:
         """
         )
 
-        with self.engine.connect() as conn:
-            result = conn.execute(
+        async with self.async_engine.connect() as conn:
+            result = await conn.execute(
                 sql,
                 {
                     "keywords": keywords,
-                    "embedding": str(query_embedding),
+                    "embedding": to_vector_param(query_embedding),
                     "heroine_id": heroine_id,
                     "max_progress": max_memory_progress,
                     "bm25_weight": BM25_WEIGHT,
@@ -287,7 +293,7 @@ class HeroineScenarioService:
 
             return scenarios
 
-    def search_scenarios_pgroonga(
+    async def search_scenarios_pgroonga(
         self, query: str, heroine_id: int, max_memory_progress: int, limit: int = 3
     ) -> List[dict]:
         """PGroonga + Vector 하이브리드 검색 (Supabase용)
@@ -306,7 +312,7 @@ class HeroineScenarioService:
         """
         # 쿼리 확장 (동의어 추가)
         expanded_query = self._expand_query(query)
-        query_embedding = self.embeddings.embed_query(expanded_query)
+        query_embedding = await self.embeddings.aembed_query(expanded_query)
 
         # PGroonga + Vector 하이브리드 검색
         # PGroonga는 &@~ 연산자로 full text search 수행
@@ -345,12 +351,12 @@ class HeroineScenarioService:
         """
         )
 
-        with self.engine.connect() as conn:
-            result = conn.execute(
+        async with self.async_engine.connect() as conn:
+            result = await conn.execute(
                 sql,
                 {
                     "query": query,
-                    "embedding": str(query_embedding),
+                    "embedding": to_vector_param(query_embedding),
                     "heroine_id": heroine_id,
                     "max_progress": max_memory_progress,
                     "bm25_weight": BM25_WEIGHT,
@@ -375,7 +381,7 @@ class HeroineScenarioService:
 
             return scenarios
 
-    def get_scenarios_by_progress(
+    async def get_scenarios_by_progress(
         self, heroine_id: int, memory_progress: int
     ) -> List[dict]:
         """특정 진척도의 시나리오 조회"""
@@ -389,14 +395,14 @@ class HeroineScenarioService:
         """
         )
 
-        with self.engine.connect() as conn:
-            result = conn.execute(
+        async with self.async_engine.connect() as conn:
+            result = await conn.execute(
                 sql, {"heroine_id": heroine_id, "progress": memory_progress}
             )
 
             return [dict(row._mapping) for row in result]
 
-    def get_all_unlocked_scenarios(
+    async def get_all_unlocked_scenarios(
         self, heroine_id: int, max_memory_progress: int
     ) -> List[dict]:
         """해금된 모든 시나리오 조회"""
@@ -410,14 +416,14 @@ class HeroineScenarioService:
         """
         )
 
-        with self.engine.connect() as conn:
-            result = conn.execute(
+        async with self.async_engine.connect() as conn:
+            result = await conn.execute(
                 sql, {"heroine_id": heroine_id, "max_progress": max_memory_progress}
             )
 
             return [dict(row._mapping) for row in result]
 
-    def get_latest_unlocked_scenario(
+    async def get_latest_unlocked_scenario(
         self, heroine_id: int, max_memory_progress: int
     ) -> Optional[dict]:
         """가장 최근에 해금된 시나리오 조회
@@ -443,8 +449,8 @@ class HeroineScenarioService:
         """
         )
 
-        with self.engine.connect() as conn:
-            result = conn.execute(
+        async with self.async_engine.connect() as conn:
+            result = await conn.execute(
                 sql, {"heroine_id": heroine_id, "max_progress": max_memory_progress}
             )
             row = result.fetchone()
@@ -453,7 +459,7 @@ class HeroineScenarioService:
                 return dict(row._mapping)
             return None
 
-    def get_scenario_by_exact_progress(
+    async def get_scenario_by_exact_progress(
         self, heroine_id: int, memory_progress: int
     ) -> Optional[dict]:
         """정확한 임계값의 시나리오 조회
@@ -478,8 +484,8 @@ class HeroineScenarioService:
         """
         )
 
-        with self.engine.connect() as conn:
-            result = conn.execute(
+        async with self.async_engine.connect() as conn:
+            result = await conn.execute(
                 sql, {"heroine_id": heroine_id, "progress": memory_progress}
             )
             row = result.fetchone()
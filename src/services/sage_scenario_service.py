@@ -3,6 +3,8 @@ from sqlalchemy import create_engine, text
 from langchain_openai import OpenAIEmbeddings
 
 from db.config import CONNECTION_URL
+from db.embedding_cache import CachedQueryEmbeddings
+from db.vector_codec import register_vector_codec, to_vector_param
 
 # 하이브리드 검색 가중치
 BM25_WEIGHT = 0.4
@@ -13,8 +15,13 @@ class SageScenarioService:
     """대현자 시나리오 검색 서비스"""
 
     def __init__(self):
-        self.engine = create_engine(CONNECTION_URL, pool_pre_ping=True)
-        self.embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
+        self.engine = register_vector_codec(
+            create_engine(CONNECTION_URL, pool_pre_ping=True)
+        )
+        # 쿼리 임베딩은 프로세스 공용 캐시를 거침 (db/embedding_cache.py)
+        self.embeddings = CachedQueryEmbeddings(
+            OpenAIEmbeddings(model="text-embedding-3-small")
+        )
 
     def search_scenarios(
         self, query: str, max_scenario_level: int, limit: int = 3
@@ -48,7 +55,7 @@ class SageScenarioService:
             result = conn.execute(
                 sql,
                 {
-                    "embedding": str(query_embedding),
+                    "embedding": to_vector_param(query_embedding),
                     "max_level": max_scenario_level,
                     "limit": limit,
                 },
@@ -151,7 +158,7 @@ class SageScenarioService:
                 sql,
                 {
                     "query": query,
-                    "embedding": str(query_embedding),
+                    "embedding": to_vector_param(query_embedding),
                     "max_level": max_scenario_level,
                     "bm25_weight": BM25_WEIGHT,
                     "vector_weight": VECTOR_WEIGHT,
@@ -231,7 +238,7 @@ class SageScenarioService:
                 sql,
                 {
                     "keywords": keywords,
-                    "embedding": str(query_embedding),
+                    "embedding": to_vector_param(query_embedding),
                     "max_level": max_scenario_level,
                     "bm25_weight": BM25_WEIGHT,
                     "vector_weight": VECTOR_WEIGHT,
@@ -311,7 +318,7 @@ class SageScenarioService:
                 sql,
                 {
                     "query": query,
-                    "embedding": str(query_embedding),
+                    "embedding": to_vector_param(query_embedding),
                     "max_level": max_scenario_level,
                     "bm25_weight": BM25_WEIGHT,
                     "vector_weight": VECTOR_WEIGHT,
@@ -0,0 +1,132 @@
+"""
+정령 KoBERT 의도 모델 경량 변형 parity 테스트
+
+fp32 모델과 int8 / onnx / onnx-int8 변형이 고정된 한국어 질문 세트에서
+같은 라벨을 내는지 확인하고, 속도 향상과 메모리(RSS) 감소량을 출력합니다.
+
+사용법:
+    uv run pytest src/tests/fairy/test_intent_model_variants.py -s
+"""
+
+import gc
+import os
+import time
+
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("kobert_transformers")
+
+from agents.fairy.dungeon.fairy_dungeon_model_logics import FairyDungeonIntentModel
+from agents.fairy.interaction.fairy_interaction_model_logics import FairyInteractionIntentModel
+
+# 라벨이 완전히 같은 질문 비율 하한
+MIN_AGREEMENT = 0.95
+
+QUERIES = [
+    # 던전 / 몬스터
+    "이 방에 있는 몬스터 약점이 뭐야?",
+    "스켈레톤은 어떻게 잡아?",
+    "저주받은 고사지 공략법 좀 알려줘",
+    "다음 방에는 뭐가 있어?",
+    "보스 패턴 알려줘",
+    "지금 몇 번째 방이야?",
+    "거미는 무슨 공격을 해?",
+    "이 던전 지도 보여줘",
+    "남은 방이 몇 개야?",
+    "여기서 어디로 가야 돼?",
+    # 아이템 / 상호작용
+    "고급 쌍검으로 바꿔줘",
+    "불 좀 켜줄래?",
+    "불 꺼줘",
+    "인벤토리에 있는 제일 센 무기 장착해",
+    "레어 숏소드 써줘",
+    "회복의 반지 착용해",
+    "방이 너무 어두워",
+    "그 무기 써줘",
+    "장비 능력치 알려줘",
+    "이 무기 드랍률은 어떻게 돼?",
+    # 잡담 / 기타
+    "안녕 오늘 기분 어때?",
+    "배고프다",
+    "너 이름이 뭐야?",
+    "피곤해 좀 쉬자",
+    "고마워",
+    "레티아는 어디 갔어?",
+    "스킬 쿨타임 얼마야?",
+    "내 체력 얼마나 남았어?",
+    "경험치는 어떻게 얻어?",
+    "기억의 조각은 어디에 써?",
+]
+
+MODEL_CLASSES = [FairyDungeonIntentModel, FairyInteractionIntentModel]
+VARIANTS = ["int8", "onnx", "onnx-int8"]
+
+
+def _rss_mb() -> float:
+    """현재 프로세스 RSS (MB, Linux)"""
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def _load(model_cls, variant: str):
+    """모델 로드 + RSS 증가량"""
+    gc.collect()
+    before = _rss_mb()
+    model = model_cls(variant=variant)
+    model.predict_batch(["워밍업"])
+    gc.collect()
+    return model, _rss_mb() - before
+
+
+def _run(model):
+    """질문을 하나씩(요청 경로와 같은 batch 1) 추론 -> (라벨 목록, 평균 지연 ms)"""
+    labels = []
+    t = time.perf_counter()
+    for query in QUERIES:
+        (result_labels, _), = model.predict_batch([query])
+        labels.append(sorted(result_labels))
+    return labels, (time.perf_counter() - t) / len(QUERIES) * 1000
+
+
+_references = {}
+
+
+def _reference(model_cls):
+    """fp32 기준 결과 (모델 클래스별 1회)"""
+    if model_cls not in _references:
+        model, rss = _load(model_cls, "fp32")
+        labels, latency = _run(model)
+        _references[model_cls] = {"labels": labels, "latency": latency, "rss": rss}
+        del model
+    return _references[model_cls]
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("model_cls", MODEL_CLASSES, ids=lambda c: c.__name__)
+def test_variant_parity(model_cls, variant):
+    if variant.startswith("onnx"):
+        pytest.importorskip("onnxruntime")
+
+    ref = _reference(model_cls)
+    model, rss = _load(model_cls, variant)
+    labels, latency = _run(model)
+
+    mismatches = [
+        (query, expected, actual)
+        for query, expected, actual in zip(QUERIES, ref["labels"], labels)
+        if expected != actual
+    ]
+    agreement = 1 - len(mismatches) / len(QUERIES)
+
+    print(
+        f"\n[{model_cls.__name__} / {variant}] "
+        f"일치 {agreement:.1%} | "
+        f"지연 {ref['latency']:.1f}ms -> {latency:.1f}ms (x{ref['latency'] / latency:.2f}) | "
+        f"RSS {ref['rss']:.0f}MB -> {rss:.0f}MB ({ref['rss'] - rss:+.0f}MB 감소)"
+    )
+    for query, expected, actual in mismatches:
+        print(f"  불일치: '{query}' fp32={expected} {variant}={actual}")
+
+    assert agreement >= MIN_AGREEMENT
@@ -0,0 +1,106 @@
+"""
+쿼리 임베딩 캐시 single-flight 테스트 (API 호출 없음)
+
+같은 키를 비동기 요청이 계산하는 중에 이벤트 루프 스레드에서 동기 embed_query가
+들어와도 멈추지 않는지, 동시 비동기 miss는 한 번만 계산하는지 확인합니다.
+
+사용법:
+    uv run pytest src/tests/npc/test_embedding_cache.py
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from db.embedding_cache import CachedQueryEmbeddings, EmbeddingCache
+
+# 교착이면 이 시간 안에 끝나지 않음
+DEADLOCK_TIMEOUT_SEC = 5
+
+
+class FakeEmbeddings:
+    """aembed_query는 release가 set될 때까지 대기"""
+
+    model = "fake-embedding"
+
+    def __init__(self):
+        self.release = None
+        self.sync_calls = 0
+        self.async_calls = 0
+
+    def embed_query(self, text):
+        self.sync_calls += 1
+        return [1.0, 2.0, 3.0]
+
+    async def aembed_query(self, text):
+        self.async_calls += 1
+        await self.release.wait()
+        return [1.0, 2.0, 3.0]
+
+
+def _run_with_timeout(coro_fn):
+    """코루틴을 별도 스레드의 이벤트 루프에서 실행 (시간 안에 끝나지 않으면 실패)"""
+    result = {}
+
+    def _target():
+        result["value"] = asyncio.run(coro_fn())
+
+    thread = threading.Thread(target=_target, daemon=True)
+    thread.start()
+    thread.join(DEADLOCK_TIMEOUT_SEC)
+    assert not thread.is_alive(), "이벤트 루프가 멈춤 (동기 호출이 in-flight Future를 기다림)"
+    return result["value"]
+
+
+def test_sync_call_on_loop_does_not_wait_for_async_leader():
+    fake = FakeEmbeddings()
+    embeddings = CachedQueryEmbeddings(fake, cache=EmbeddingCache(use_redis=False))
+
+    async def scenario():
+        fake.release = asyncio.Event()
+        leader = asyncio.create_task(embeddings.aembed_query("고향 얘기 해줘"))
+        await asyncio.sleep(0)  # leader가 계산을 맡고 대기
+
+        # SageScenarioService처럼 루프 스레드에서 동기 호출
+        vector = embeddings.embed_query("고향 얘기 해줘")
+
+        fake.release.set()
+        return vector, await leader
+
+    sync_vector, async_vector = _run_with_timeout(scenario)
+    assert list(sync_vector) == [1.0, 2.0, 3.0]
+    assert list(async_vector) == [1.0, 2.0, 3.0]
+    assert fake.sync_calls == 1
+    assert fake.async_calls == 1
+
+
+def test_concurrent_async_misses_compute_once():
+    fake = FakeEmbeddings()
+    cache = EmbeddingCache(use_redis=False)
+    embeddings = CachedQueryEmbeddings(fake, cache=cache)
+
+    async def scenario():
+        fake.release = asyncio.Event()
+        tasks = [asyncio.create_task(embeddings.aembed_query("  고향   얘기 해줘 ")) for _ in range(5)]
+        await asyncio.sleep(0)
+        fake.release.set()
+        return await asyncio.gather(*tasks)
+
+    vectors = _run_with_timeout(scenario)
+    assert all(list(v) == [1.0, 2.0, 3.0] for v in vectors)
+    assert fake.async_calls == 1
+    assert cache.stats()["shared"] == 4
+
+
+def test_cached_vector_is_read_only_float32():
+    fake = FakeEmbeddings()
+    embeddings = CachedQueryEmbeddings(fake, cache=EmbeddingCache(use_redis=False))
+
+    vector = embeddings.embed_query("안녕")
+    assert vector.dtype.name == "float32"
+    assert not vector.flags.writeable
+    assert embeddings.embed_query("안녕") is vector
+    assert fake.sync_calls == 1
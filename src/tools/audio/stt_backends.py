@@ -0,0 +1,267 @@
+"""
+STT 백엔드 (교체 가능한 음성 인식 엔진)
+
+stt_worker는 백엔드 인터페이스(load / transcribe)만 사용하므로
+환경변수로 엔진과 모델 크기를 바꿀 수 있습니다.
+
+백엔드:
+- openai-whisper (기본): 기존 whisper 패키지 (PyTorch, CPU에서는 fp32)
+- faster-whisper: CTranslate2 기반. CPU int8 양자화로 메모리/지연시간 감소
+  (pip install faster-whisper 필요)
+
+두 백엔드 모두 whisper transcribe와 같은 형식의 결과를 반환합니다.
+    {"text": str, "segments": [{"start", "end", "text", "avg_logprob",
+                                "no_speech_prob", "compression_ratio"}, ...]}
+따라서 _is_suspicious_segment 같은 후처리는 백엔드와 무관하게 동작합니다.
+
+환경변수:
+- STT_BACKEND: openai-whisper | faster-whisper (기본 openai-whisper)
+- STT_MODEL: 모델 크기 tiny | base | small | medium | large | large-v3 ... (기본 large)
+- STT_DEVICE: cpu | cuda (기본: cuda 사용 가능하면 cuda)
+- STT_COMPUTE_TYPE: faster-whisper 연산 타입 int8 | int8_float16 | float16 | float32 (기본 int8)
+- STT_CPU_THREADS: faster-whisper CPU 스레드 수 (기본 0 = 자동)
+- STT_BEAM_SIZE: 빔 크기 (기본 1 = greedy, openai-whisper transcribe 기본 동작)
+- STT_BEST_OF: temperature fallback 샘플링 후보 수 (기본 없음 = 후보 1개, openai-whisper transcribe 기본 동작)
+  5는 whisper CLI 기본값으로, 지정하면 fallback 디코딩 비용이 그만큼 늘어납니다.
+  두 값은 모든 백엔드에 똑같이 전달합니다. faster-whisper transcribe 자체 기본값은 beam 5 / best_of 5라서
+  따로 지정하지 않으면 백엔드끼리 디코딩 방식이 달라져 속도/정확도 비교가 맞지 않습니다.
+
+사용 예시:
+    backend = create_stt_backend()
+    backend.load()
+    result = backend.transcribe(audio_float32, language="ko")
+"""
+
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+STT_BACKEND = os.getenv("STT_BACKEND", "openai-whisper").lower()
+STT_MODEL = os.getenv("STT_MODEL", "large")
+STT_DEVICE = os.getenv("STT_DEVICE", "")
+STT_COMPUTE_TYPE = os.getenv("STT_COMPUTE_TYPE", "int8")
+STT_CPU_THREADS = int(os.getenv("STT_CPU_THREADS", "0"))
+STT_BEAM_SIZE = int(os.getenv("STT_BEAM_SIZE", "1"))
+STT_BEST_OF = int(os.getenv("STT_BEST_OF")) if os.getenv("STT_BEST_OF") else None
+
+SAMPLE_RATE = 16000
+# whisper 입력 창 길이 (이보다 짧은 클립만 배치 디코딩)
+MAX_BATCH_SAMPLES = 30 * SAMPLE_RATE
+
+
+def _default_device() -> str:
+    if STT_DEVICE:
+        return STT_DEVICE
+    try:
+        import torch
+
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    except ImportError:
+        return "cpu"
+
+
+class STTBackend(ABC):
+    """STT 백엔드 기본 클래스
+
+    워커 스레드 하나가 인스턴스 하나를 전담하므로 스레드 안전할 필요는 없습니다.
+    """
+
+    name = "base"
+    supports_batch = False
+
+    def __init__(
+        self,
+        model_size: str = STT_MODEL,
+        device: Optional[str] = None,
+        beam_size: int = STT_BEAM_SIZE,
+        best_of: Optional[int] = STT_BEST_OF,
+    ):
+        self.model_size = model_size
+        self.device = device or _default_device()
+        self.beam_size = beam_size
+        self.best_of = best_of
+        self.model = None
+
+    @property
+    def label(self) -> str:
+        return f"{self.name}:{self.model_size}"
+
+    @abstractmethod
+    def load(self) -> None:
+        """모델 로드"""
+
+    @abstractmethod
+    def transcribe(self, audio: Union[str, np.ndarray], language: str = "ko") -> Dict[str, Any]:
+        """음성 인식
+
+        Args:
+            audio: 오디오 파일 경로 또는 16kHz mono float32 배열
+            language: 언어 코드
+
+        Returns:
+            whisper transcribe 결과 형식의 딕셔너리
+        """
+
+    def decode_batch(self, arrays: List[np.ndarray], language: str = "ko") -> List[Dict[str, Any]]:
+        """30초 이하 클립 여러 개를 한 번에 디코딩 (supports_batch인 백엔드만)"""
+        raise NotImplementedError
+
+    def load_audio(self, path: str) -> np.ndarray:
+        """오디오 파일 -> 16kHz mono float32 배열"""
+        import whisper
+
+        return whisper.load_audio(path)
+
+    def warmup(self) -> None:
+        """첫 호출의 초기화 비용 제거"""
+        self.transcribe(np.zeros(SAMPLE_RATE, dtype=np.float32), language="ko")
+
+
+class OpenAIWhisperBackend(STTBackend):
+    """openai-whisper 백엔드 (기존 구현)"""
+
+    name = "openai-whisper"
+    supports_batch = True
+
+    def load(self) -> None:
+        import whisper
+
+        self.model = whisper.load_model(self.model_size, device=self.device)
+
+    def transcribe(self, audio: Union[str, np.ndarray], language: str = "ko") -> Dict[str, Any]:
+        options = {}
+        if self.best_of is not None:
+            options["best_of"] = self.best_of
+        return self.model.transcribe(
+            audio,
+            language=language,
+            # openai-whisper는 beam_size=None이 greedy
+            beam_size=self.beam_size if self.beam_size > 1 else None,
+            **options,
+        )
+
+    def decode_batch(self, arrays: List[np.ndarray], language: str = "ko") -> List[Dict[str, Any]]:
+        """transcribe와 같은 형태로 반환하며, 클립 하나가 세그먼트 하나가 됩니다."""
+        import torch
+        import whisper
+
+        model = self.model
+        mels = torch.stack(
+            [
+                whisper.log_mel_spectrogram(
+                    whisper.pad_or_trim(torch.from_numpy(a)), model.dims.n_mels
+                )
+                for a in arrays
+            ]
+        ).to(model.device)
+
+        # temperature 0 한 번만 디코딩하므로 best_of(샘플링 후보 수)는 해당 없음
+        options = whisper.DecodingOptions(
+            language=language,
+            beam_size=self.beam_size if self.beam_size > 1 else None,
+            without_timestamps=True,
+            fp16=model.device.type == "cuda",
+        )
+        decoded = whisper.decode(model, mels, options)
+
+        results = []
+        for d, a in zip(decoded, arrays):
+            segment = {
+                "start": 0.0,
+                "end": len(a) / SAMPLE_RATE,
+                "text": d.text,
+                "avg_logprob": d.avg_logprob,
+                "no_speech_prob": d.no_speech_prob,
+                "compression_ratio": d.compression_ratio,
+            }
+            results.append({"text": d.text, "segments": [segment], "language": language})
+        return results
+
+
+class FasterWhisperBackend(STTBackend):
+    """faster-whisper (CTranslate2) 백엔드
+
+    CPU에서는 int8 양자화 가중치로 실행하여 openai-whisper fp32 대비
+    메모리 사용량과 추론 시간이 크게 줄어듭니다.
+    """
+
+    name = "faster-whisper"
+
+    def __init__(
+        self,
+        model_size: str = STT_MODEL,
+        device: Optional[str] = None,
+        compute_type: str = STT_COMPUTE_TYPE,
+        cpu_threads: int = STT_CPU_THREADS,
+        beam_size: int = STT_BEAM_SIZE,
+        best_of: Optional[int] = STT_BEST_OF,
+    ):
+        super().__init__(model_size, device, beam_size, best_of)
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+
+    @property
+    def label(self) -> str:
+        return f"{self.name}:{self.model_size}:{self.compute_type}"
+
+    def load(self) -> None:
+        from faster_whisper import WhisperModel
+
+        self.model = WhisperModel(
+            self.model_size,
+            device=self.device,
+            compute_type=self.compute_type,
+            cpu_threads=self.cpu_threads,
+        )
+
+    def load_audio(self, path: str) -> np.ndarray:
+        from faster_whisper import decode_audio
+
+        return decode_audio(path, sampling_rate=SAMPLE_RATE)
+
+    def transcribe(self, audio: Union[str, np.ndarray], language: str = "ko") -> Dict[str, Any]:
+        segments, _ = self.model.transcribe(
+            audio,
+            language=language,
+            beam_size=self.beam_size,
+            # 지정하지 않으면 openai-whisper 기본(best_of=None)과 같은 후보 1개
+            best_of=self.best_of or 1,
+        )
+        # segments는 제너레이터 (순회할 때 실제 디코딩이 진행됨)
+        converted = [
+            {
+                "start": seg.start,
+                "end": seg.end,
+                "text": seg.text,
+                "avg_logprob": seg.avg_logprob,
+                "no_speech_prob": seg.no_speech_prob,
+                "compression_ratio": seg.compression_ratio,
+            }
+            for seg in segments
+        ]
+        return {
+            "text": "".join(seg["text"] for seg in converted),
+            "segments": converted,
+            "language": language,
+        }
+
+
+STT_BACKENDS = {
+    OpenAIWhisperBackend.name: OpenAIWhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend,
+}
+
+
+def create_stt_backend(
+    backend: str = STT_BACKEND, model_size: str = STT_MODEL, **kwargs
+) -> STTBackend:
+    """이름으로 백엔드 생성 (모델 로드는 load()에서)"""
+    try:
+        backend_cls = STT_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(
+            f"알 수 없는 STT_BACKEND: {backend} (사용 가능: {', '.join(STT_BACKENDS)})"
+        )
+    return backend_cls(model_size=model_size, **kwargs)
@@ -0,0 +1,351 @@
+"""
+STT 결과 도메인 단어 보정
+
+whisper가 게임 고유명사(아이템/몬스터/스킬/히로인 이름)를 자주 잘못 알아듣기 때문에
+인식 결과를 두 단계로 보정합니다.
+
+1) 치환 사전 (data/stt_domain_replace.json)
+   - 모든 키를 길이 내림차순 정규식 하나(alternation)로 컴파일하여 한 번에 치환
+     (키가 늘어나도 문장당 스캔은 1회, 겹치는 키는 긴 쪽 우선)
+   - 파일이 바뀌면 재시작 없이 다시 읽음 (mtime 확인, STT_DOMAIN_MAP_CHECK_SEC 간격)
+
+2) 퍼지 매칭 (사전에 없는 새로운 오인식 대응)
+   - 실제 게임 데이터의 이름 목록(z_cache_data.cache_items, fairy/cache_data의 몬스터/스킬/히로인)과
+     어절 1~3개 구간을 자모 단위 유사도로 비교하여 기준 이상이면 정식 이름으로 교체
+   - 조사/문장부호는 떼고 비교한 뒤 다시 붙임 ("고급 드로크를?" -> "고급 드워프의 망치를?"처럼)
+   - 짧은 이름(3글자 이하)은 일반 단어와 헷갈리기 쉬워 더 높은 기준 사용
+
+환경변수:
+- STT_DOMAIN_MAP_PATH: 치환 사전 경로 (기본 src/data/stt_domain_replace.json)
+- STT_DOMAIN_MAP_CHECK_SEC: 사전 파일 변경 확인 간격 (기본 2초)
+- STT_FUZZY_CORRECTION: "false"면 퍼지 매칭 비활성화 (기본 true)
+- STT_FUZZY_THRESHOLD: 퍼지 매칭 유사도 기준 (기본 0.8)
+- STT_FUZZY_SHORT_THRESHOLD: 3글자 이하 이름의 유사도 기준 (기본 0.9)
+
+사용 예시:
+    text = domain_corrector.correct("고급 등기 어디 있어?")
+    # -> "고급 둔기 어디 있어?"
+"""
+
+import difflib
+import json
+import os
+import re
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+STT_DOMAIN_MAP_PATH = Path(
+    os.getenv(
+        "STT_DOMAIN_MAP_PATH",
+        str(Path(__file__).parent.parent.parent / "data" / "stt_domain_replace.json"),
+    )
+)
+STT_DOMAIN_MAP_CHECK_SEC = float(os.getenv("STT_DOMAIN_MAP_CHECK_SEC", "2"))
+STT_FUZZY_CORRECTION = os.getenv("STT_FUZZY_CORRECTION", "true").lower() == "true"
+STT_FUZZY_THRESHOLD = float(os.getenv("STT_FUZZY_THRESHOLD", "0.8"))
+STT_FUZZY_SHORT_THRESHOLD = float(os.getenv("STT_FUZZY_SHORT_THRESHOLD", "0.9"))
+
+# 퍼지 매칭 최소 길이 (공백 제외). "거미", "공포"처럼 짧은 이름은 오탐이 많아 제외
+FUZZY_MIN_CHARS = 3
+# 비교할 최대 어절 수 ("저주받은 고사지", "천번 찔린 언데드")
+FUZZY_MAX_WORDS = 3
+
+# 아이템 이름 앞의 등급 (등급을 뗀 무기 이름도 사전에 추가)
+RARITY_PREFIXES = ["일반", "고급", "레어", "레전드"]
+
+# 이름 뒤에 붙는 조사 (긴 것부터 검사)
+JOSA = sorted(
+    [
+        "으로", "에게", "한테", "이랑", "에서", "까지", "부터", "처럼", "보다", "하고",
+        "을", "를", "이", "가", "은", "는", "로", "의", "도", "랑", "와", "과", "에", "만", "좀",
+    ],
+    key=len,
+    reverse=True,
+)
+_TRAILING_PUNCT = re.compile(r"[.,?!~…\"')\]]+$")
+
+# 한글 자모 분해 (초성 19, 중성 21, 종성 28)
+_CHO = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+
+
+@lru_cache(maxsize=4096)
+def to_jamo(text: str) -> str:
+    """한글 음절을 자모로 분해 ("숏소드" -> "ㅅㅛㅅㅅㅗㄷㅡ"). 한글이 아닌 문자는 그대로"""
+    out = []
+    for ch in text:
+        code = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            out.append(_CHO[code // 588])
+            out.append(_JUNG[(code % 588) // 28])
+            if code % 28:
+                out.append(_JONG[code % 28])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def load_game_vocabulary() -> List[str]:
+    """게임 데이터의 고유명사 목록 (아이템/무기/몬스터/스킬/히로인)"""
+    from agents.fairy.cache_data import HEROINE_INFOS, MONSTER_INFOS, SKILL_INFOS
+    from core.game_dto.z_cache_data import cache_items
+
+    names = set()
+    for item in cache_items:
+        names.add(item.itemName)
+        for prefix in RARITY_PREFIXES:
+            if item.itemName.startswith(prefix + " "):
+                names.add(item.itemName[len(prefix) + 1:])
+    names.update(m["monsterName"] for m in MONSTER_INFOS)
+    names.update(s["skillName"] for s in SKILL_INFOS)
+    names.update(h["name"] for h in HEROINE_INFOS)
+    return sorted(n for n in names if n)
+
+
+class DomainCorrector:
+    """치환 사전 + 퍼지 매칭 보정기
+
+    컴파일된 정규식/사전은 (pattern, mapping) 튜플로 한 번에 교체하므로
+    요청 처리 중에 다시 읽어도 락 없이 읽을 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        map_path: Path = STT_DOMAIN_MAP_PATH,
+        fuzzy: bool = STT_FUZZY_CORRECTION,
+        threshold: float = STT_FUZZY_THRESHOLD,
+        short_threshold: float = STT_FUZZY_SHORT_THRESHOLD,
+        vocabulary: Optional[List[str]] = None,
+    ):
+        self.map_path = Path(map_path)
+        self.fuzzy = fuzzy
+        self.threshold = threshold
+        self.short_threshold = short_threshold
+
+        self._compiled: Tuple[Optional[re.Pattern], Dict[str, str]] = (None, {})
+        self._mtime: Optional[float] = None
+        self._next_check = 0.0
+        self._reload_lock = threading.Lock()
+
+        self._vocabulary = vocabulary
+        # (정식 이름, 공백 제거 이름, 자모) 목록
+        self._vocab_entries: Optional[List[Tuple[str, str, str]]] = None
+        self._vocab_compact: Dict[str, str] = {}
+        # 구간 -> (이름, 유사도) 캐시 (같은 표현이 반복해서 들어옴)
+        self._match_cache: Dict[str, Tuple[Optional[str], float]] = {}
+
+        self.reloads = 0
+        self.exact_hits = 0
+        self.fuzzy_hits = 0
+
+    # ============================================
+    # 치환 사전
+    # ============================================
+
+    def _read_map(self) -> Dict[str, str]:
+        """사전 파일 읽기. {"분류": {"오인식": "정답"}} 또는 평평한 {"오인식": "정답"} 모두 허용"""
+        raw = json.loads(self.map_path.read_text(encoding="utf-8"))
+        mapping = {}
+        for key, value in raw.items():
+            if isinstance(value, dict):
+                mapping.update(value)
+            else:
+                mapping[key] = value
+        return {src: dst for src, dst in mapping.items() if src}
+
+    def _compile(self, mapping: Dict[str, str]) -> None:
+        if not mapping:
+            self._compiled = (None, {})
+            return
+        # 긴 키를 먼저 두어야 "9급 둔기"가 "9급"보다 먼저 매칭됨
+        keys = sorted(mapping, key=len, reverse=True)
+        pattern = re.compile("|".join(re.escape(k) for k in keys))
+        self._compiled = (pattern, mapping)
+
+    def reload(self) -> None:
+        """사전 파일 다시 읽기 (실패하면 기존 사전 유지)"""
+        try:
+            mtime = self.map_path.stat().st_mtime
+            self._compile(self._read_map())
+            self._mtime = mtime
+            self.reloads += 1
+            print(f"[INFO] STT 치환 사전 로드: {len(self._compiled[1])}개 ({self.map_path.name})")
+        except FileNotFoundError:
+            if self._mtime is not None:
+                print(f"[WARN] STT 치환 사전 없음, 기존 사전 유지: {self.map_path}")
+            self._mtime = self._mtime or 0.0
+        except Exception as e:
+            print(f"[ERROR] STT 치환 사전 로드 실패, 기존 사전 유지: {e}")
+            self._mtime = self._mtime or 0.0
+
+    def _maybe_reload(self) -> None:
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        with self._reload_lock:
+            if now < self._next_check:
+                return
+            self._next_check = now + STT_DOMAIN_MAP_CHECK_SEC
+            try:
+                mtime = self.map_path.stat().st_mtime
+            except FileNotFoundError:
+                mtime = None
+            if self._mtime is None or (mtime is not None and mtime != self._mtime):
+                self.reload()
+
+    def replace_exact(self, text: str) -> str:
+        """치환 사전 적용 (한 번의 스캔, 긴 키 우선)"""
+        self._maybe_reload()
+        pattern, mapping = self._compiled
+        if pattern is None:
+            return text
+
+        def _sub(match: re.Match) -> str:
+            self.exact_hits += 1
+            return mapping[match.group(0)]
+
+        return pattern.sub(_sub, text)
+
+    # ============================================
+    # 퍼지 매칭
+    # ============================================
+
+    def _ensure_vocabulary(self) -> None:
+        if self._vocab_entries is not None:
+            return
+        names = self._vocabulary
+        if names is None:
+            try:
+                names = load_game_vocabulary()
+            except Exception as e:
+                print(f"[WARN] 게임 이름 목록 로드 실패, 퍼지 보정 비활성화: {e}")
+                names = []
+        entries = []
+        for name in names:
+            compact = name.replace(" ", "")
+            if len(compact) < FUZZY_MIN_CHARS:
+                continue
+            entries.append((name, compact, to_jamo(compact)))
+            self._vocab_compact[compact] = name
+        self._vocab_entries = entries
+
+    @staticmethod
+    def _split_suffix(token: str) -> Tuple[str, str]:
+        """어절 -> (본체, 뒤에 붙은 문장부호)"""
+        match = _TRAILING_PUNCT.search(token)
+        if not match:
+            return token, ""
+        return token[: match.start()], match.group(0)
+
+    @staticmethod
+    def _strip_josa(core: str) -> List[Tuple[str, str]]:
+        """(이름 후보, 조사) 목록. 조사를 떼지 않은 경우도 포함"""
+        candidates = [(core, "")]
+        for josa in JOSA:
+            if core.endswith(josa) and len(core) > len(josa):
+                candidates.append((core[: -len(josa)], josa))
+                break
+        return candidates
+
+    def _best_match(self, compact: str) -> Tuple[Optional[str], float]:
+        """공백 제거 구간과 가장 비슷한 이름 (정확히 같으면 유사도 1.0)"""
+        if compact in self._vocab_compact:
+            return self._vocab_compact[compact], 1.0
+        if len(compact) < FUZZY_MIN_CHARS:
+            return None, 0.0
+
+        cached = self._match_cache.get(compact)
+        if cached is not None:
+            return cached
+
+        jamo = to_jamo(compact)
+        best, best_ratio = None, 0.0
+        for name, name_compact, name_jamo in self._vocab_entries:
+            if abs(len(name_jamo) - len(jamo)) > max(2, len(name_jamo) * 0.3):
+                continue
+            limit = max(
+                self.short_threshold if len(name_compact) <= 3 else self.threshold,
+                best_ratio,
+            )
+            matcher = difflib.SequenceMatcher(None, jamo, name_jamo)
+            # 상한값으로 먼저 거르고 정확한 ratio는 후보만 계산
+            if matcher.real_quick_ratio() < limit or matcher.quick_ratio() < limit:
+                continue
+            ratio = matcher.ratio()
+            if ratio >= limit and ratio > best_ratio:
+                best, best_ratio = name, ratio
+
+        if len(self._match_cache) >= 4096:
+            self._match_cache.clear()
+        self._match_cache[compact] = (best, best_ratio)
+        return best, best_ratio
+
+    def replace_fuzzy(self, text: str) -> str:
+        """게임 고유명사 목록과 어절 구간을 비교해서 교체
+
+        각 위치에서 (어절 수, 조사 분리) 조합 중 "유사도 x 이름 길이"가 가장 큰 것을 고릅니다.
+        ("스켈레톤 석공병"은 "스켈레톤" 정확 일치보다 "스켈레톤 석궁병" 유사 일치가 우선,
+         "마법사에 반지 어때"는 같은 이름이면 유사도가 높은 "마법사에 반지" 구간이 우선)
+        """
+        self._ensure_vocabulary()
+        tokens = text.split()
+        out = []
+        i = 0
+        while i < len(tokens):
+            best = None  # (score, ratio, n, name, josa, punct)
+            for n in range(1, min(FUZZY_MAX_WORDS, len(tokens) - i) + 1):
+                window = tokens[i : i + n]
+                last_core, punct = self._split_suffix(window[-1])
+                head = "".join(window[:-1])
+
+                for stem, josa in self._strip_josa(last_core):
+                    name, ratio = self._best_match(head + stem)
+                    if name is None:
+                        continue
+                    score = ratio * len(name.replace(" ", ""))
+                    if best is None or score > best[0]:
+                        best = (score, ratio, n, name, josa, punct)
+
+            if best is None:
+                out.append(tokens[i])
+                i += 1
+                continue
+
+            _, ratio, n, name, josa, punct = best
+            if ratio < 1.0:
+                self.fuzzy_hits += 1
+            out.append(name + josa + punct)
+            i += n
+        return " ".join(out)
+
+    # ============================================
+    # 공개 메서드
+    # ============================================
+
+    def correct(self, text: str) -> str:
+        """치환 사전 -> 퍼지 매칭 순서로 보정"""
+        if not text:
+            return ""
+        text = self.replace_exact(text)
+        if self.fuzzy:
+            try:
+                text = self.replace_fuzzy(text)
+            except Exception as e:
+                print(f"[WARN] STT 퍼지 보정 실패: {e}")
+        return text
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._compiled[1]),
+            "reloads": self.reloads,
+            "exact_hits": self.exact_hits,
+            "fuzzy_hits": self.fuzzy_hits,
+        }
+
+
+# 싱글톤 인스턴스
+domain_corrector = DomainCorrector()
@@ -0,0 +1,346 @@
+"""
+Whisper STT 추론 워커
+
+whisper의 transcribe는 수 초간 CPU를 점유하는 동기 함수라서
+async 핸들러 안에서 바로 호출하면 이벤트 루프 전체(채팅/던전 API)가 멈춥니다.
+
+이 모듈은 전용 스레드에서 모델을 돌리고, 엔드포인트는 결과만 await 합니다.
+
+- 대기열 길이 제한: STT_MAX_QUEUE를 넘으면 STTBusyError (엔드포인트에서 503 응답)
+  취소된 요청도 워커가 실제로 버리거나 끝낼 때까지는 자리를 차지함
+- 취소된 요청(클라이언트 연결 끊김, 부분 인식 취소 등)은 디코딩 전에 버림
+- 워커 수: STT_WORKERS (워커마다 모델을 따로 로드. whisper 모델은 동시 호출에 안전하지 않음)
+- 모델 로드 실패: 모든 워커가 실패하면 대기 중인 요청을 STTUnavailableError로 끝내고,
+  STT_LOAD_RETRY_SEC 동안은 새 요청도 바로 실패. 그 뒤 첫 요청에서 워커를 다시 시작
+- 마이크로 배치(선택): 30초 이하 짧은 클립이 동시에 쌓이면 한 번에 디코딩
+  (STT_MICRO_BATCH=true, STT_BATCH_SIZE, STT_BATCH_WAIT_MS, openai-whisper 백엔드만)
+- 엔진/모델 크기는 stt_backends.py 참고 (STT_BACKEND, STT_MODEL, STT_COMPUTE_TYPE ...)
+
+환경변수:
+- STT_WORKERS: 워커 스레드 수 (기본 1)
+- STT_MAX_QUEUE: 처리 중 + 대기 중 요청 최대 수 (기본 8)
+- STT_MICRO_BATCH: "true"면 마이크로 배치 사용 (기본 false)
+- STT_BATCH_SIZE: 배치 최대 크기 (기본 4)
+- STT_BATCH_WAIT_MS: 배치를 모으기 위해 기다리는 시간 (기본 30)
+- STT_LOAD_RETRY_SEC: 모델 로드 실패 후 재시도까지 기다리는 시간 (기본 30)
+
+사용 예시:
+    result = await stt_worker.transcribe(audio_float32)
+    segments = result["segments"]
+"""
+
+import asyncio
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from tools.audio.stt_backends import (
+    MAX_BATCH_SAMPLES,
+    STT_BACKEND,
+    STT_MODEL,
+    STTBackend,
+    create_stt_backend,
+)
+
+STT_WORKERS = int(os.getenv("STT_WORKERS", "1"))
+STT_MAX_QUEUE = int(os.getenv("STT_MAX_QUEUE", "8"))
+STT_MICRO_BATCH = os.getenv("STT_MICRO_BATCH", "false").lower() == "true"
+STT_BATCH_SIZE = int(os.getenv("STT_BATCH_SIZE", "4"))
+STT_BATCH_WAIT_MS = int(os.getenv("STT_BATCH_WAIT_MS", "30"))
+STT_LOAD_RETRY_SEC = float(os.getenv("STT_LOAD_RETRY_SEC", "30"))
+
+
+class STTBusyError(Exception):
+    """STT 대기열이 가득 찼을 때 발생 (엔드포인트에서 503으로 변환)"""
+
+
+class STTUnavailableError(Exception):
+    """STT 모델 로드에 실패해 요청을 처리할 워커가 없을 때 발생 (엔드포인트에서 503으로 변환)"""
+
+
+@dataclass
+class _Job:
+    audio: Union[str, np.ndarray]  # 파일 경로 또는 16kHz float32 배열
+    language: str
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class WhisperSTTWorker:
+    """Whisper 추론 전용 워커 풀
+
+    asyncio 쪽에서는 transcribe()만 호출하고,
+    실제 모델 호출은 워커 스레드에서 실행됩니다.
+    """
+
+    def __init__(
+        self,
+        backend: str = STT_BACKEND,
+        model_name: str = STT_MODEL,
+        num_workers: int = STT_WORKERS,
+        max_queue: int = STT_MAX_QUEUE,
+        micro_batch: bool = STT_MICRO_BATCH,
+        batch_size: int = STT_BATCH_SIZE,
+        batch_wait_ms: int = STT_BATCH_WAIT_MS,
+    ):
+        self.backend = backend
+        self.model_name = model_name
+        self.num_workers = max(1, num_workers)
+        self.max_queue = max_queue
+        self.micro_batch = micro_batch
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait_ms / 1000
+
+        self._queue: "queue.Queue[_Job]" = queue.Queue()
+        # 모델을 로드 중이거나 로드에 성공한 워커 (실패한 워커는 스스로 빠짐)
+        self._threads: List[threading.Thread] = []
+        self._ready = threading.Event()  # 워커 하나 이상 로드 완료
+        self._settled = threading.Event()  # 첫 로드 시도 끝남 (성공 또는 전체 실패)
+        self._start_lock = threading.Lock()
+
+        self.load_error: Optional[str] = None
+        self._failed_at = 0.0
+
+        # 처리 중 + 대기 중 요청 수 (이벤트 루프 스레드에서만 증감)
+        # 워커가 요청을 끝내거나 버릴 때 줄어듦 (await 쪽 취소로는 줄지 않음)
+        self._inflight = 0
+
+        self.processed = 0
+        self.batches = 0
+        self.rejected = 0
+        self.dropped = 0
+
+    # ============================================
+    # 워커 관리
+    # ============================================
+
+    def start(self, wait: bool = False) -> None:
+        """워커 스레드 시작 (이미 시작했으면 무시, 모든 워커가 로드에 실패했으면 재시도)
+
+        Args:
+            wait: True면 첫 모델 로드가 끝날 때까지 대기 (앱 시작시 워밍업용)
+
+        Raises:
+            STTUnavailableError: 로드 실패 후 STT_LOAD_RETRY_SEC가 지나지 않은 경우
+        """
+        with self._start_lock:
+            if not self._threads:
+                if self.load_error and time.monotonic() - self._failed_at < STT_LOAD_RETRY_SEC:
+                    raise STTUnavailableError(f"STT 모델 로드 실패: {self.load_error}")
+                self._settled.clear()
+                for idx in range(self.num_workers):
+                    thread = threading.Thread(
+                        target=self._run, args=(idx,), name=f"stt-worker-{idx}", daemon=True
+                    )
+                    thread.start()
+                    self._threads.append(thread)
+        if wait:
+            self._settled.wait()
+
+    def _load_model(self, idx: int) -> STTBackend:
+        t0 = time.perf_counter()
+        model = create_stt_backend(self.backend, self.model_name)
+        model.load()
+        # 워밍업 (첫 호출의 초기화 비용 제거)
+        model.warmup()
+        print(
+            f"[INFO] STT 워커 {idx}: {model.label} 로드 "
+            f"{time.perf_counter() - t0:.1f}s"
+        )
+        return model
+
+    def _run(self, idx: int) -> None:
+        try:
+            model = self._load_model(idx)
+        except Exception as e:
+            self._on_load_failed(idx, e)
+            return
+
+        with self._start_lock:
+            self.load_error = None
+        self._ready.set()
+        self._settled.set()
+
+        while True:
+            jobs = [self._queue.get()]
+            if self.micro_batch:
+                jobs.extend(self._collect_batch())
+            self._process(model, jobs)
+
+    def _on_load_failed(self, idx: int, error: Exception) -> None:
+        """로드에 실패한 워커 정리. 마지막 워커였으면 대기 중인 요청을 모두 실패 처리"""
+        print(f"[ERROR] STT 워커 {idx}: 모델 로드 실패: {error}")
+        pending = []
+        with self._start_lock:
+            self._threads.remove(threading.current_thread())
+            self.load_error = f"{type(error).__name__}: {error}"
+            self._failed_at = time.monotonic()
+            if not self._threads:
+                # 큐에 넣기는 워커가 있을 때만 락 안에서 하므로 여기서 비우면 남는 요청이 없음
+                while True:
+                    try:
+                        pending.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+        if pending:
+            print(f"[ERROR] STT 워커 없음, 대기 중인 요청 {len(pending)}건 실패 처리")
+        for job in pending:
+            self._resolve(job, error=STTUnavailableError(f"STT 모델 로드 실패: {self.load_error}"))
+        if not self._threads:
+            self._settled.set()
+
+    def _collect_batch(self) -> List[_Job]:
+        """배치 대기 시간 동안 추가 요청 수집"""
+        extra = []
+        deadline = time.perf_counter() + self.batch_wait
+        while len(extra) + 1 < self.batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                extra.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return extra
+
+    # ============================================
+    # 추론
+    # ============================================
+
+    def _drop_cancelled(self, jobs: List[_Job]) -> List[_Job]:
+        """결과를 기다리는 쪽이 이미 취소된 요청은 디코딩하지 않고 버림"""
+        live = []
+        for job in jobs:
+            if job.future.done():
+                self.dropped += 1
+                self._resolve(job)
+            else:
+                live.append(job)
+        return live
+
+    def _process(self, model: STTBackend, jobs: List[_Job]) -> None:
+        jobs = self._drop_cancelled(jobs)
+        arrays = []
+        for job in jobs:
+            try:
+                audio = job.audio
+                if isinstance(audio, str):
+                    audio = model.load_audio(audio)
+                arrays.append(audio)
+            except Exception as e:
+                arrays.append(None)
+                self._resolve(job, error=e)
+
+        ready = [(job, audio) for job, audio in zip(jobs, arrays) if audio is not None]
+
+        # 짧은 클립이 2개 이상이면 배치 디코딩, 나머지는 개별 transcribe
+        short = [(j, a) for j, a in ready if len(a) <= MAX_BATCH_SAMPLES]
+        if self.micro_batch and model.supports_batch and len(short) >= 2:
+            try:
+                results = model.decode_batch([a for _, a in short], short[0][0].language)
+                for (job, _), result in zip(short, results):
+                    self._resolve(job, result=result)
+                self.batches += 1
+            except Exception as e:
+                print(f"[WARN] STT 배치 디코딩 실패, 개별 처리로 전환: {e}")
+                short = []
+            ready = [(j, a) for j, a in ready if all(j is not s for s, _ in short)]
+
+        for job, audio in ready:
+            # 앞 요청을 디코딩하는 동안 취소됐을 수 있음
+            if not self._drop_cancelled([job]):
+                continue
+            try:
+                result = model.transcribe(audio, language=job.language)
+                self._resolve(job, result=result)
+            except Exception as e:
+                self._resolve(job, error=e)
+
+    def _resolve(self, job: _Job, result: Optional[Dict[str, Any]] = None, error: Exception = None) -> None:
+        """워커 스레드 -> 이벤트 루프로 결과 전달 + 대기열 자리 반환 (요청마다 한 번)"""
+
+        def _set():
+            self._inflight -= 1
+            if job.future.done():
+                return
+            if error is not None:
+                job.future.set_exception(error)
+            else:
+                job.future.set_result(result)
+
+        if error is None and result is not None:
+            self.processed += 1
+        job.loop.call_soon_threadsafe(_set)
+
+    # ============================================
+    # 공개 메서드
+    # ============================================
+
+    async def transcribe(
+        self, audio: Union[str, np.ndarray], language: str = "ko"
+    ) -> Dict[str, Any]:
+        """음성 인식 (워커에서 실행, 결과만 await)
+
+        Args:
+            audio: 오디오 파일 경로 또는 16kHz mono float32 배열
+            language: 언어 코드
+
+        Returns:
+            whisper transcribe 결과 형식의 딕셔너리 ({"text", "segments", ...})
+
+        Raises:
+            STTBusyError: 대기열이 가득 찬 경우
+            STTUnavailableError: 모델 로드에 실패해 처리할 워커가 없는 경우
+        """
+        if self._inflight >= self.max_queue:
+            self.rejected += 1
+            raise STTBusyError(f"STT 대기열 초과 ({self._inflight}/{self.max_queue})")
+
+        self.start()
+        loop = asyncio.get_running_loop()
+        job = _Job(audio=audio, language=language, loop=loop, future=loop.create_future())
+
+        with self._start_lock:
+            # 시작 직후 모든 워커가 로드에 실패했으면 큐에 넣어도 처리할 워커가 없음
+            if not self._threads:
+                raise STTUnavailableError(f"STT 모델 로드 실패: {self.load_error}")
+            self._queue.put(job)
+            # 워커의 _resolve가 루프 스레드에서 되돌림 (이 코루틴이 양보하기 전에 증가)
+            self._inflight += 1
+
+        return await job.future
+
+    @property
+    def status(self) -> str:
+        """idle | loading | ready | failed"""
+        if self._threads:
+            return "ready" if self._ready.is_set() else "loading"
+        return "failed" if self.load_error else "idle"
+
+    def stats(self) -> Dict[str, Any]:
+        """대기열/처리 통계"""
+        return {
+            "backend": self.backend,
+            "model": self.model_name,
+            "workers": self.num_workers,
+            "status": self.status,
+            "load_error": self.load_error,
+            "ready": self._ready.is_set(),
+            "inflight": self._inflight,
+            "max_queue": self.max_queue,
+            "processed": self.processed,
+            "batches": self.batches,
+            "rejected": self.rejected,
+            "dropped": self.dropped,
+        }
+
+
+# 싱글톤 인스턴스
+stt_worker = WhisperSTTWorker()
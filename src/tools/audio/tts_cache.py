@@ -0,0 +1,240 @@
+"""
+TTS 결과 캐시 (내용 주소 기반)
+
+정령 되묻기 질문, 자주 쓰는 인사처럼 같은 대사가 반복해서 합성되므로
+(모델, voice_id, 감정 프리셋, 감정 강도, 전처리된 텍스트)의 해시를 키로
+wav 바이트를 저장해 두고 재사용합니다.
+
+백엔드:
+- disk (기본): TTS_CACHE_DIR 아래 {hash}.wav 파일. 총 용량이 넘으면
+  가장 오래 사용하지 않은 파일부터 삭제 (LRU, 파일 mtime을 접근 시각으로 사용)
+- redis: 기존 redis_manager 연결 풀 재사용. TTL + 최대 개수 초과 시 오래된 것부터 삭제
+- off: 캐시 사용 안 함
+
+환경변수:
+- TTS_CACHE_BACKEND: disk | redis | off (기본 disk)
+- TTS_CACHE_DIR: 디스크 캐시 경로 (기본 프로젝트 루트/tts_cache)
+- TTS_CACHE_MAX_MB: 디스크 캐시 최대 용량 MB (기본 512)
+- TTS_CACHE_MAX_ENTRIES: Redis 캐시 최대 개수 (기본 5000)
+- TTS_CACHE_TTL: Redis 캐시 유효 시간(초) (기본 7일)
+
+사용 예시:
+    key = tts_audio_cache.make_key("ssfm-v21", voice_id, "happy", 1.0, text)
+    audio = await tts_audio_cache.aget(key)
+    if audio is None:
+        audio = ...  # 합성
+        await tts_audio_cache.aset(key, audio)
+"""
+
+import asyncio
+import base64
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+TTS_CACHE_BACKEND = os.getenv("TTS_CACHE_BACKEND", "disk").lower()
+TTS_CACHE_DIR = Path(
+    os.getenv(
+        "TTS_CACHE_DIR",
+        str(Path(__file__).parent.parent.parent.parent / "tts_cache"),
+    )
+)
+TTS_CACHE_MAX_MB = int(os.getenv("TTS_CACHE_MAX_MB", "512"))
+TTS_CACHE_MAX_ENTRIES = int(os.getenv("TTS_CACHE_MAX_ENTRIES", "5000"))
+TTS_CACHE_TTL = int(os.getenv("TTS_CACHE_TTL", str(7 * 24 * 3600)))
+
+
+class TTSAudioCache:
+    """TTS wav 바이트 캐시
+
+    디스크 백엔드는 여러 요청이 동시에 쓰므로 용량 계산을 락으로 보호합니다.
+    """
+
+    def __init__(
+        self,
+        backend: str = TTS_CACHE_BACKEND,
+        cache_dir: Path = TTS_CACHE_DIR,
+        max_bytes: int = TTS_CACHE_MAX_MB * 1024 * 1024,
+        max_entries: int = TTS_CACHE_MAX_ENTRIES,
+        ttl: int = TTS_CACHE_TTL,
+    ):
+        self.backend = backend
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None  # 디스크 사용량 (처음 쓸 때 계산)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend in ("disk", "redis")
+
+    @staticmethod
+    def make_key(
+        model: str,
+        voice_id: str,
+        emotion_preset: str,
+        emotion_intensity: float,
+        text: str,
+    ) -> str:
+        """캐시 키 (sha256). 강도는 소수 둘째 자리까지만 구분"""
+        raw = f"{model}|{voice_id}|{emotion_preset}|{emotion_intensity:.2f}|{text}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    # ============================================
+    # 디스크 백엔드
+    # ============================================
+
+    def _path(self, key: str) -> Path:
+        # 파일이 한 디렉토리에 몰리지 않도록 앞 2글자로 분산
+        return self.cache_dir / key[:2] / f"{key}.wav"
+
+    def _scan_total_bytes(self) -> int:
+        if not self.cache_dir.exists():
+            return 0
+        return sum(p.stat().st_size for p in self.cache_dir.glob("*/*.wav"))
+
+    def _disk_get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            audio = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        # 접근 시각 갱신 (LRU)
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return audio
+
+    def _disk_set(self, key: str, audio: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 임시 파일에 쓴 뒤 교체 (동시 읽기 시 잘린 파일 방지)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(audio)
+
+        with self._lock:
+            # 같은 키를 덮어쓰면 기존 파일 크기만큼 빼야 용량 계산이 맞음
+            try:
+                old_size = path.stat().st_size
+            except FileNotFoundError:
+                old_size = 0
+            os.replace(tmp, path)
+
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total_bytes()
+            else:
+                self._total_bytes += len(audio) - old_size
+            if self._total_bytes > self.max_bytes:
+                self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """용량의 90% 이하가 될 때까지 오래된 파일 삭제 (락 안에서 호출)"""
+        files = []
+        for p in self.cache_dir.glob("*/*.wav"):
+            try:
+                stat = p.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, p))
+        files.sort()
+
+        total = sum(size for _, size, _ in files)
+        target = int(self.max_bytes * 0.9)
+        for _, size, p in files:
+            if total <= target:
+                break
+            try:
+                p.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            self.evictions += 1
+        self._total_bytes = total
+
+    # ============================================
+    # Redis 백엔드
+    # ============================================
+
+    def _redis_get(self, key: str) -> Optional[bytes]:
+        from db.redis_manager import redis_manager
+
+        encoded = redis_manager.load_tts_audio(key)
+        return base64.b64decode(encoded) if encoded else None
+
+    def _redis_set(self, key: str, audio: bytes) -> None:
+        from db.redis_manager import redis_manager
+
+        encoded = base64.b64encode(audio).decode("ascii")
+        self.evictions += redis_manager.save_tts_audio(
+            key, encoded, self.ttl, self.max_entries
+        )
+
+    # ============================================
+    # 공개 메서드
+    # ============================================
+
+    def get(self, key: str) -> Optional[bytes]:
+        """캐시 조회. 없거나 실패하면 None"""
+        if not self.enabled:
+            return None
+        try:
+            audio = self._redis_get(key) if self.backend == "redis" else self._disk_get(key)
+        except Exception as e:
+            print(f"[WARN] TTS 캐시 조회 실패: {e}")
+            audio = None
+
+        if audio is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return audio
+
+    def set(self, key: str, audio: bytes) -> None:
+        """캐시 저장 (실패해도 예외를 올리지 않음)"""
+        if not self.enabled or not audio:
+            return
+        try:
+            if self.backend == "redis":
+                self._redis_set(key, audio)
+            else:
+                self._disk_set(key, audio)
+        except Exception as e:
+            print(f"[WARN] TTS 캐시 저장 실패: {e}")
+
+    async def aget(self, key: str) -> Optional[bytes]:
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, audio: bytes) -> None:
+        if not self.enabled:
+            return
+        await asyncio.to_thread(self.set, key, audio)
+
+    def stats(self) -> Dict[str, float]:
+        """hit/miss 통계"""
+        total = self.hits + self.misses
+        return {
+            "backend": self.backend,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+            "disk_bytes": self._total_bytes or 0,
+        }
+
+
+# 싱글톤 인스턴스
+tts_audio_cache = TTSAudioCache()
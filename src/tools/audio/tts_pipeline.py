@@ -0,0 +1,182 @@
+"""
+문장 단위 파이프라인 TTS
+
+LLM 응답이 스트리밍으로 들어오는 동안 완성된 문장부터 바로 TTS를 요청합니다.
+전체 응답 생성 + 전체 TTS를 기다리는 대신,
+첫 음성까지의 시간이 "첫 문장 생성 + 짧은 TTS 1회"로 줄어듭니다.
+
+- SentenceSplitter: 텍스트 조각을 받아 완성된 문장만 잘라냄
+- SentenceTTSPipeline: 문장별 TTS를 동시에 실행하고, 결과는 문장 순서대로 내보냄
+
+사용 예시:
+    pipeline = SentenceTTSPipeline(npc_id=1)
+    pipeline.set_emotion(1, 1.2)
+    pipeline.feed("안녕! 오늘은 ")
+    pipeline.feed("날씨가 좋네.")
+    pipeline.close()
+
+    async for chunk in pipeline.audio_chunks():
+        print(chunk["index"], chunk["text"], len(chunk["audio"]))
+"""
+
+import asyncio
+import os
+import re
+import time
+from typing import AsyncIterator, Dict, List, Optional
+
+from tools.audio.tts_typecast import typecast_tts_service
+
+# 문장별 TTS 동시 요청 수
+TTS_PIPELINE_CONCURRENCY = int(os.getenv("TTS_PIPELINE_CONCURRENCY", "3"))
+
+# 이보다 짧은 문장은 다음 문장과 합쳐서 요청 (너무 잦은 짧은 호출 방지)
+MIN_SENTENCE_CHARS = 8
+
+# 문장 끝: 종결 부호 묶음(..., ?!, ~ 등) 뒤에 공백이 오는 위치, 또는 줄바꿈
+_SENTENCE_END = re.compile(r"[.!?…~]+[\"')\]」』]*(?=\s)|\n")
+
+
+class SentenceSplitter:
+    """스트리밍 텍스트에서 완성된 문장을 잘라냅니다.
+
+    종결 부호 바로 뒤에 공백이 와야 문장이 끝난 것으로 봅니다.
+    ("...별로야"처럼 부호 뒤에 글자가 이어지면 자르지 않음)
+    """
+
+    def __init__(self, min_chars: int = MIN_SENTENCE_CHARS):
+        self.min_chars = min_chars
+        self._buffer = ""
+
+    def feed(self, delta: str) -> List[str]:
+        """텍스트 조각 추가 후 완성된 문장 목록 반환"""
+        self._buffer += delta
+        sentences = []
+        start = 0
+
+        for match in _SENTENCE_END.finditer(self._buffer):
+            end = match.end()
+            sentence = self._buffer[start:end].strip()
+            if len(sentence) < self.min_chars:
+                continue
+            sentences.append(sentence)
+            start = end
+
+        self._buffer = self._buffer[start:]
+        return sentences
+
+    def flush(self) -> List[str]:
+        """남은 텍스트를 마지막 문장으로 반환"""
+        rest = self._buffer.strip()
+        self._buffer = ""
+        return [rest] if rest else []
+
+
+class SentenceTTSPipeline:
+    """문장 단위 TTS 파이프라인
+
+    감정(emotion)이 정해지기 전에 완성된 문장은 대기했다가
+    set_emotion() 또는 close() 시점에 한꺼번에 요청합니다.
+    """
+
+    def __init__(
+        self,
+        npc_id: int,
+        tts_service=typecast_tts_service,
+        max_concurrency: int = TTS_PIPELINE_CONCURRENCY,
+    ):
+        self.npc_id = npc_id
+        self.tts_service = tts_service
+        self.splitter = SentenceSplitter()
+
+        self.emotion: Optional[int] = None
+        self.emotion_intensity = 1.0
+        self.fed_chars = 0
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._pending: List[str] = []
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._index = 0
+        self._start = time.time()
+
+    def set_emotion(self, emotion: int, emotion_intensity: float = 1.0) -> None:
+        """TTS 감정 설정 후 대기 중인 문장 요청"""
+        self.emotion = emotion
+        self.emotion_intensity = emotion_intensity
+        self._dispatch_pending()
+
+    def feed(self, delta: str) -> None:
+        """LLM 텍스트 조각 추가 (완성된 문장은 바로 TTS 요청)"""
+        self.fed_chars += len(delta)
+        self._pending.extend(self.splitter.feed(delta))
+        self._dispatch_pending()
+
+    def close(
+        self,
+        emotion: Optional[int] = None,
+        emotion_intensity: Optional[float] = None,
+    ) -> None:
+        """입력 종료. 남은 텍스트를 요청하고 audio_chunks()를 끝냄
+
+        Args:
+            emotion: 아직 감정이 정해지지 않았을 때 사용할 최종 감정
+            emotion_intensity: 최종 감정 강도
+        """
+        if self.emotion is None:
+            self.emotion = emotion if emotion is not None else 0
+            if emotion_intensity is not None:
+                self.emotion_intensity = emotion_intensity
+
+        self._pending.extend(self.splitter.flush())
+        self._dispatch_pending()
+        self._queue.put_nowait(None)
+
+    def _dispatch_pending(self) -> None:
+        if self.emotion is None:
+            return
+        for sentence in self._pending:
+            task = asyncio.create_task(self._synthesize(sentence))
+            self._queue.put_nowait((self._index, sentence, task))
+            self._index += 1
+        self._pending = []
+
+    async def _synthesize(self, sentence: str) -> Optional[bytes]:
+        async with self._semaphore:
+            try:
+                return await self.tts_service.text_to_speech(
+                    text=sentence,
+                    npc_id=self.npc_id,
+                    emotion=self.emotion,
+                    emotion_intensity=self.emotion_intensity,
+                )
+            except Exception as e:
+                print(f"[WARN] 문장 TTS 실패: {e} (text={sentence!r})")
+                return None
+
+    async def audio_chunks(self) -> AsyncIterator[Dict]:
+        """문장 순서대로 오디오 반환 (close() 호출 후 모든 문장이 끝나면 종료)
+
+        Yields:
+            {"index": int, "text": str, "audio": bytes}
+            TTS에 실패한 문장은 건너뜁니다.
+        """
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                break
+
+            index, sentence, task = item
+            audio = await task
+            if audio is None:
+                continue
+
+            if index == 0:
+                print(f"[TIMING] 첫 음성: {time.time() - self._start:.3f}s")
+            yield {"index": index, "text": sentence, "audio": audio}
+
+    def cancel(self) -> None:
+        """진행 중인 TTS 요청 취소 (클라이언트 연결 종료 시)"""
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None:
+                item[2].cancel()
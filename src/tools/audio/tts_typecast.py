@@ -5,13 +5,28 @@ Typecast API를 사용하여 텍스트를 음성으로 변환합니다.
 NPC별로 다른 목소리를 사용하고, 감정에 따라 음성 톤을 조절합니다.
 
 SDK 문서: https://github.com/neosapience/typecast-python
+
+AsyncTypecast 클라이언트는 한 번 열어서 계속 재사용하고(HTTP 연결 유지),
+동시 요청 수는 TYPECAST_MAX_CONCURRENCY로 제한합니다.
+합성 결과는 tts_audio_cache(tools/audio/tts_cache.py)에 저장해 같은 대사를 재사용합니다.
 """
 
+import asyncio
 import os
 import re
+import time
+from typing import Optional
+
 from typecast.async_client import AsyncTypecast
 from typecast.models import TTSRequest, LanguageCode
 
+from tools.audio.tts_cache import tts_audio_cache
+
+TTS_MODEL = "ssfm-v21"
+
+# Typecast 동시 요청 수 제한
+TYPECAST_MAX_CONCURRENCY = int(os.getenv("TYPECAST_MAX_CONCURRENCY", "8"))
+
 
 def sanitize_text_for_tts(text: str) -> str:
     """TTS용 텍스트 전처리
@@ -50,12 +65,19 @@ class TypecastTTSService:
     텍스트를 음성(wav 바이트)으로 변환합니다.
     """
 
-    def __init__(self):
+    def __init__(self, max_concurrency: int = TYPECAST_MAX_CONCURRENCY):
         """초기화
 
         환경변수 TYPECAST_API_KEY에서 API 키를 가져옵니다.
         """
         self.api_key = os.getenv("TYPECAST_API_KEY")
+        self.cache = tts_audio_cache
+
+        # 공용 클라이언트 (첫 요청 때 생성, close()로 정리)
+        self._client: Optional[AsyncTypecast] = None
+        self._client_lock: Optional[asyncio.Lock] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.max_concurrency = max_concurrency
 
         # NPC ID -> Typecast voice_id 매핑
         # voice_id는 find_typecast_voices.py 스크립트로 조회 후 설정
@@ -96,6 +118,8 @@ class TypecastTTSService:
     ) -> bytes:
         """텍스트를 음성(wav)으로 변환합니다.
 
+        같은 (voice, 감정, 강도, 텍스트) 조합은 캐시된 결과를 반환합니다.
+
         Args:
             text: 변환할 텍스트
             npc_id: NPC ID (0=사트라, 1=레티아, 2=루파메스, 3=로코)
@@ -124,21 +148,74 @@ class TypecastTTSService:
         if not text:
             raise ValueError("TTS 입력 텍스트가 비어있습니다.")
 
-        # Typecast SDK 사용
-        async with AsyncTypecast(api_key=self.api_key) as client:
-            response = await client.text_to_speech(
-                TTSRequest(
-                    text=text,
-                    model="ssfm-v21",
-                    voice_id=voice_id,
-                    language=LanguageCode.KOR,
-                    emotion=emotion_preset,
-                    emotion_intensity=emotion_intensity,
-                    audio_format="wav",
+        cache_key = self.cache.make_key(
+            TTS_MODEL, voice_id, emotion_preset, emotion_intensity, text
+        )
+        cached = await self.cache.aget(cache_key)
+        if cached is not None:
+            return cached
+
+        t = time.time()
+        async with self._get_semaphore():
+            client = await self._get_client()
+            try:
+                response = await client.text_to_speech(
+                    TTSRequest(
+                        text=text,
+                        model=TTS_MODEL,
+                        voice_id=voice_id,
+                        language=LanguageCode.KOR,
+                        emotion=emotion_preset,
+                        emotion_intensity=emotion_intensity,
+                        audio_format="wav",
+                    )
                 )
-            )
-
-            return response.audio_data
+            except Exception:
+                # 연결이 깨졌을 수 있으므로 다음 요청에서 새로 연결
+                await self._reset_client(client)
+                raise
+        print(f"[TIMING] Typecast 합성: {time.time() - t:.3f}s ({len(text)}자)")
+
+        await self.cache.aset(cache_key, response.audio_data)
+        return response.audio_data
+
+    # ============================================
+    # 공용 클라이언트 관리
+    # ============================================
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 이벤트 루프 안에서 처음 쓸 때 생성
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _get_client(self) -> AsyncTypecast:
+        """공용 AsyncTypecast 클라이언트 반환 (없으면 생성)"""
+        if self._client is not None:
+            return self._client
+
+        if self._client_lock is None:
+            self._client_lock = asyncio.Lock()
+        async with self._client_lock:
+            if self._client is None:
+                client = AsyncTypecast(api_key=self.api_key)
+                await client.__aenter__()
+                self._client = client
+        return self._client
+
+    async def _reset_client(self, client: AsyncTypecast) -> None:
+        if self._client is not client:
+            return
+        self._client = None
+        try:
+            await client.__aexit__(None, None, None)
+        except Exception as e:
+            print(f"[WARN] Typecast 클라이언트 정리 실패: {e}")
+
+    async def close(self) -> None:
+        """공용 클라이언트 종료 (앱 종료시 호출)"""
+        if self._client is not None:
+            await self._reset_client(self._client)
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,137 @@
+"""
+에너지 기반 음성 구간 검출 (VAD)
+
+게임 마이크 스트림(16kHz, int16, mono)을 프레임(30ms) 단위로 받아
+말소리 구간의 시작/끝을 판단합니다. 별도 의존성 없이 numpy만 사용합니다.
+
+- 프레임 RMS가 (배경 소음 추정치 * ratio) 이상이면 말소리 프레임
+- 말소리 프레임이 start_frames개 연속되면 구간 시작 (직전 padding 포함)
+- 무음이 silence_ms 이상 이어지거나 구간이 max_segment_ms를 넘으면 구간 종료
+- 배경 소음 추정치는 무음 프레임에서 천천히 갱신
+
+사용 예시:
+    vad = EnergyVAD()
+    for segment in vad.feed(pcm_bytes):
+        ...  # 닫힌 구간 (float32 배열)
+    current = vad.current_segment()  # 진행 중인 구간 (부분 인식용)
+    rest = vad.flush()  # 스트림 종료시 남은 구간
+"""
+
+from collections import deque
+from typing import List, Optional
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+
+class EnergyVAD:
+    """스트리밍 에너지 VAD"""
+
+    def __init__(
+        self,
+        frame_ms: int = 30,
+        start_frames: int = 3,
+        silence_ms: int = 600,
+        padding_ms: int = 300,
+        max_segment_ms: int = 15000,
+        ratio: float = 3.0,
+        min_rms: float = 0.01,
+    ):
+        self.frame_size = SAMPLE_RATE * frame_ms // 1000
+        self.start_frames = start_frames
+        self.silence_frames = silence_ms // frame_ms
+        self.max_segment_frames = max_segment_ms // frame_ms
+        self.ratio = ratio
+        self.min_rms = min_rms
+
+        self.noise_floor = min_rms / ratio
+        self._remainder = np.zeros(0, dtype=np.float32)
+        # 홀수 길이 프레임의 남은 1바이트 (다음 프레임 앞에 붙임)
+        self._odd_byte = b""
+        # 구간 시작 전 프레임 (앞부분 잘림 방지용 padding)
+        self._pre_frames: deque = deque(maxlen=max(padding_ms // frame_ms, start_frames))
+        self._speech_run = 0
+        self._silence_run = 0
+        self._segment: Optional[List[np.ndarray]] = None
+
+    @property
+    def in_speech(self) -> bool:
+        return self._segment is not None
+
+    def _is_speech(self, frame: np.ndarray) -> bool:
+        rms = float(np.sqrt(np.mean(frame * frame)))
+        threshold = max(self.min_rms, self.noise_floor * self.ratio)
+        if rms < threshold and not self.in_speech:
+            # 무음 프레임으로 배경 소음 추정치 갱신
+            self.noise_floor = 0.95 * self.noise_floor + 0.05 * rms
+        return rms >= threshold
+
+    def _close(self) -> np.ndarray:
+        # 끝부분 무음은 silence_ms 중 padding만 남기고 제거
+        frames = self._segment
+        trim = max(0, self._silence_run - self._pre_frames.maxlen)
+        if trim:
+            frames = frames[:-trim]
+        self._segment = None
+        self._speech_run = 0
+        self._silence_run = 0
+        self._pre_frames.clear()
+        return np.concatenate(frames)
+
+    def feed(self, pcm: bytes) -> List[np.ndarray]:
+        """PCM 바이트 추가 후 닫힌 구간 목록 반환
+
+        Args:
+            pcm: int16 little-endian 16kHz mono 바이트 (프레임 경계가 샘플 중간이어도 됨)
+
+        Returns:
+            이번에 닫힌 구간들 (float32, -1.0~1.0)
+        """
+        pcm = self._odd_byte + pcm
+        if len(pcm) % 2:
+            self._odd_byte, pcm = pcm[-1:], pcm[:-1]
+        else:
+            self._odd_byte = b""
+        samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+        audio = np.concatenate([self._remainder, samples])
+
+        closed = []
+        n_frames = len(audio) // self.frame_size
+        for i in range(n_frames):
+            frame = audio[i * self.frame_size:(i + 1) * self.frame_size]
+            speech = self._is_speech(frame)
+
+            if self._segment is None:
+                self._pre_frames.append(frame)
+                self._speech_run = self._speech_run + 1 if speech else 0
+                if self._speech_run >= self.start_frames:
+                    self._segment = list(self._pre_frames)
+                    self._silence_run = 0
+                continue
+
+            self._segment.append(frame)
+            self._silence_run = 0 if speech else self._silence_run + 1
+            if (
+                self._silence_run >= self.silence_frames
+                or len(self._segment) >= self.max_segment_frames
+            ):
+                closed.append(self._close())
+
+        self._remainder = audio[n_frames * self.frame_size:]
+        return closed
+
+    def current_segment(self) -> Optional[np.ndarray]:
+        """진행 중인 구간 (없으면 None)"""
+        if self._segment is None:
+            return None
+        return np.concatenate(self._segment)
+
+    def flush(self) -> Optional[np.ndarray]:
+        """스트림 종료: 진행 중인 구간을 닫아서 반환"""
+        if self._segment is None:
+            return None
+        if len(self._remainder):
+            self._segment.append(self._remainder)
+            self._remainder = np.zeros(0, dtype=np.float32)
+        return self._close()